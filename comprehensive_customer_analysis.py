@@ -2,14 +2,24 @@
 """
 Comprehensive customer analysis from RR Input and NRR Input tabs
 """
-from openpyxl import load_workbook
 from collections import defaultdict
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+from budget_workbook import load_budget_workbook
 
 file_path = "2025-12-11 Skyvera - Budget - Q1'26 - For Todd.xlsx"
 
+# Columns A-N of both input sheets (the header row is printed up to column O)
+SHEET_COLUMNS = tuple(range(0, 15))
+
 print("Loading workbook...")
-wb = load_workbook(file_path, data_only=True)
+wb = load_budget_workbook(file_path, ['RR Input', 'NRR Input'], projections={
+    'RR Input': SHEET_COLUMNS,
+    'NRR Input': SHEET_COLUMNS,
+})
 
 # Function to parse customer data from a sheet
 def parse_customer_sheet(sheet_name, revenue_type):
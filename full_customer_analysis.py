@@ -2,15 +2,22 @@
 """
 Complete customer analysis from both RR Input and NRR Input tabs
 """
-from openpyxl import load_workbook
 from collections import defaultdict
 from datetime import datetime
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+from budget_workbook import load_budget_workbook
 
 file_path = "2025-12-11 Skyvera - Budget - Q1'26 - For Todd.xlsx"
 
 print("Loading workbook...")
-wb = load_workbook(file_path, data_only=True)
+wb = load_budget_workbook(file_path, ['RR Input', 'NRR Input'], projections={
+    'RR Input': (0, 1, 2, 3, 6, 8, 9, 10, 11),
+    'NRR Input': tuple(range(1, 14)),
+})
 
 # Parse RR Input (Recurring Revenue - subscription based)
 def parse_rr_input():
@@ -2,15 +2,46 @@
 """
 Generate all 114 account HTML pages with complete 7-tab structure
 Following Telstra reference template exactly
+
+The OSINT tabs (Key Executives, Org Structure, Pain Points, Competitive) are
+rendered from the company intel / industry templates of populate_osint,
+overlaid with the researched intel of osint_update_accounts (both stored in
+data/osint_intel.jsonl). A manifest of per-account input fingerprints lets a
+run re-render only the accounts whose customer data or intel changed.
+
+Pages are rendered from ACCOUNT_PAGE, compiled once into static chunks and
+slots (scripts/page_template.py); the stylesheet and script every page
+shares are written once as account-plan.css / account-plan.js next to them.
+
+Usage:
+  python3 generate_accounts.py [--force] [--only NAME] [--no-osint] [--dry-run] [--jobs N]
 """
 
+import argparse
+import difflib
+import hashlib
+import inspect
 import json
 import os
+import sys
+import time
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from page_template import PageTemplate, write_asset
+from parallel_render import add_jobs_argument, run_jobs, write_atomic
+
+import osint_update_accounts
+import populate_osint
+from osint_update_accounts import find_intelligence, research_tab_content
+from populate_osint import get_intel_for_company, osint_tab_content
+
+DATA_DIR = "/Users/RAZER/Documents/projects/Skyvera/data"
+ACCOUNTS_DIR = "/Users/RAZER/Documents/projects/Skyvera/accounts"
+MANIFEST_FILE = os.path.join(DATA_DIR, "account_render_manifest.json")
+
 # Load customer data from all BUs
-def load_customer_data():
-    data_dir = "/Users/RAZER/Documents/projects/Skyvera/data"
+def load_customer_data(data_dir=DATA_DIR):
     all_customers = []
 
     files = [
@@ -64,417 +95,466 @@ def format_currency(value):
         return "$0"
     return f"${value:,.0f}"
 
-def generate_account_html(customer):
-    """Generate complete 7-tab HTML for a single account"""
-
-    customer_name = customer['customer_name']
-    bu = customer['bu']
-    rr = customer.get('rr', 0) or 0
-    nrr = customer.get('nrr', 0) or 0
-    total = customer.get('total', 0) or 0
-    arr = rr * 4  # Annual Recurring Revenue
-    subscriptions = customer.get('subscriptions', [])
-
-    health_color, health_status = calculate_health_score(customer)
-
-    # Calculate subscription metrics
-    num_subscriptions = len([s for s in subscriptions if s.get('sub_id') and isinstance(s.get('sub_id'), (int, float))])
+# OSINT tab slots of an account page, as rendered before any intel is available.
+# populate_osint.osint_tab_content and osint_update_accounts.research_tab_content
+# return the same keys.
+PLACEHOLDER_TABS = {
+    'core_user_count': '[OSINT NEEDED]',
+    'advanced_usage_cells': """<td>[OSINT NEEDED]</td>
+                        <td>[OSINT NEEDED]</td>
+                        <td>[OSINT NEEDED]</td>""",
+    'executive_rows': """                    <tr>
+                        <td colspan="6" class="placeholder">
+                            [OSINT NEEDED] Executive contact information to be gathered through LinkedIn research, company website analysis, and stakeholder interviews
+                        </td>
+                    </tr>""",
+    'executive_alert': """            <div class="alert warning" style="margin-top: 1rem;">
+                <strong>Action Required:</strong> Conduct OSINT research to identify key decision makers including CIO, CTO, VP of Technology, and primary business sponsors
+            </div>""",
+    'stakeholder_strategy': """            <div class="placeholder">
+                <p>Stakeholder engagement plan to be developed after executive mapping is complete</p>
+            </div>""",
+    'org_overview': """            <div class="placeholder">
+                <p>Organization structure mapping pending OSINT data collection</p>
+                <p style="margin-top: 1rem;">This section will include:</p>
+                <ul style="text-align: left; max-width: 600px; margin: 1rem auto;">
+                    <li>Reporting hierarchy from C-level to operational teams</li>
+                    <li>Key departments utilizing the platform</li>
+                    <li>Decision-making authority matrix</li>
+                    <li>Budget ownership and approval workflows</li>
+                </ul>
+            </div>""",
+    'department_rows': """                    <tr>
+                        <td colspan="4" class="placeholder">
+                            [OSINT NEEDED] Department structure and leadership to be identified
+                        </td>
+                    </tr>""",
+    'business_challenges': """            <div class="placeholder">
+                <p>Pain point analysis pending OSINT research and stakeholder interviews</p>
+                <p style="margin-top: 1rem;">Investigation areas:</p>
+                <ul style="text-align: left; max-width: 600px; margin: 1rem auto;">
+                    <li>Strategic business priorities and transformation initiatives</li>
+                    <li>Operational inefficiencies addressed by the platform</li>
+                    <li>Technology stack gaps and integration challenges</li>
+                    <li>Competitive pressures and market positioning concerns</li>
+                </ul>
+            </div>""",
+    'technical_pain_points': """            <div class="placeholder">
+                <p>[OSINT NEEDED] Technical requirements and challenges to be documented through discovery calls and technical reviews</p>
+            </div>""",
+    'opportunity_areas': """            <div class="placeholder">
+                <p>Expansion opportunities to be identified after pain point analysis is complete</p>
+            </div>""",
+    'competitive_landscape': """            <div class="placeholder">
+                <p>Competitive analysis pending OSINT intelligence gathering</p>
+                <p style="margin-top: 1rem;">Research focus areas:</p>
+                <ul style="text-align: left; max-width: 600px; margin: 1rem auto;">
+                    <li>Incumbent vendors and technology partners</li>
+                    <li>Recent RFPs or competitive evaluations</li>
+                    <li>Vendor relationships and satisfaction levels</li>
+                    <li>Technology modernization initiatives</li>
+                </ul>
+            </div>""",
+    'differentiation': """            <div class="placeholder">
+                <p>Competitive positioning to be developed after landscape analysis is complete</p>
+            </div>""",
+    'threat_rows': """                    <tr>
+                        <td colspan="3" class="placeholder">
+                            [OSINT NEEDED] Competitive threat assessment to be completed
+                        </td>
+                    </tr>""",
+}
+
+def account_osint(customer, researched_on=None):
+    """OSINT tab slots for a customer from both intel sources.
+
+    Args:
+        customer: Customer record (customer_name, bu, ...)
+        researched_on: Date shown for web research (YYYY-MM-DD), default today
+
+    Returns:
+        tuple: (dict of tab slot -> HTML, dict with 'specific' and 'quality')
+    """
+    researched_on = researched_on or datetime.now().strftime('%Y-%m-%d')
+    tabs, is_specific = osint_tab_content(customer['customer_name'], customer['bu'], researched_on)
+    research, quality = research_tab_content(find_intelligence(customer['customer_name']), researched_on)
+    tabs.update(research)
+    return tabs, {'specific': is_specific, 'quality': quality}
+
+# Account page: static markup compiled once (page_template), customer values in the
+# {{slots}}; the styles and scripts every page shares are linked assets written
+# once into the accounts directory.
+ACCOUNT_PAGE_STYLESHEET = "account-plan.css"
+ACCOUNT_PAGE_SCRIPT = "account-plan.js"
+
+ACCOUNT_PAGE_CSS = """:root {
+    --ink: #1a1a1a;
+    --paper: #fafaf8;
+    --accent: #c84b31;
+    --secondary: #2d4263;
+    --muted: #8b8b8b;
+    --border: #e8e6e1;
+    --highlight: #ecdbba;
+    --success: #4caf50;
+    --warning: #ff9800;
+    --critical: #e53935;
+}
+
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'DM Sans', sans-serif;
+    background: var(--paper);
+    color: var(--ink);
+    line-height: 1.6;
+}
+
+h1, h2, h3 {
+    font-family: 'Cormorant Garamond', serif;
+    font-weight: 600;
+    line-height: 1.2;
+}
+
+h1 { font-size: 3.5rem; font-weight: 300; letter-spacing: -0.02em; }
+h2 { font-size: 1.75rem; margin-bottom: 1.5rem; color: var(--secondary); }
+h3 { font-size: 1.25rem; margin-bottom: 1rem; }
+
+.header {
+    background: linear-gradient(135deg, var(--secondary) 0%, var(--accent) 100%);
+    color: white;
+    padding: 3rem 2rem;
+    text-align: center;
+}
+
+.header h1 {
+    color: white;
+    margin-bottom: 0.5rem;
+}
+
+.header .subtitle {
+    font-size: 1.1rem;
+    opacity: 0.9;
+}
+
+.health-indicator {
+    display: inline-block;
+    padding: 0.5rem 1rem;
+    border-radius: 20px;
+    font-weight: 600;
+    margin-top: 1rem;
+}
+
+.health-indicator.green {
+    background: var(--success);
+    color: white;
+}
+
+.health-indicator.yellow {
+    background: var(--warning);
+    color: white;
+}
+
+.health-indicator.red {
+    background: var(--critical);
+    color: white;
+}
+
+.tabs {
+    display: flex;
+    background: white;
+    border-bottom: 2px solid var(--border);
+    position: sticky;
+    top: 0;
+    z-index: 100;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+}
+
+.tab {
+    flex: 1;
+    padding: 1rem;
+    text-align: center;
+    cursor: pointer;
+    background: white;
+    border: none;
+    font-size: 0.95rem;
+    font-weight: 500;
+    color: var(--muted);
+    transition: all 0.3s ease;
+}
+
+.tab:hover {
+    background: var(--highlight);
+}
+
+.tab.active {
+    color: var(--accent);
+    border-bottom: 3px solid var(--accent);
+}
+
+.tab-content {
+    display: none;
+    padding: 2rem;
+    max-width: 1200px;
+    margin: 0 auto;
+}
+
+.tab-content.active {
+    display: block;
+}
+
+.section {
+    background: white;
+    border: 1px solid var(--border);
+    padding: 2rem;
+    margin-bottom: 2rem;
+    border-radius: 8px;
+}
+
+.alert {
+    padding: 1rem;
+    border-radius: 6px;
+    margin-bottom: 1rem;
+    border-left: 4px solid;
+}
+
+.alert.success {
+    background: #e8f5e9;
+    border-color: var(--success);
+    color: #2e7d32;
+}
+
+.alert.warning {
+    background: #fff3e0;
+    border-color: var(--warning);
+    color: #e65100;
+}
+
+.alert.critical {
+    background: #ffebee;
+    border-color: var(--critical);
+    color: #c62828;
+}
+
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 1rem 0;
+}
+
+th {
+    background: var(--secondary);
+    color: white;
+    padding: 0.75rem;
+    text-align: left;
+    font-weight: 600;
+}
+
+td {
+    padding: 0.75rem;
+    border-bottom: 1px solid var(--border);
+}
+
+tr:hover {
+    background: var(--highlight);
+}
+
+.status-badge {
+    display: inline-block;
+    padding: 0.25rem 0.75rem;
+    border-radius: 12px;
+    font-size: 0.85rem;
+    font-weight: 600;
+}
+
+.status-badge.success {
+    background: var(--success);
+    color: white;
+}
+
+.status-badge.critical {
+    background: var(--critical);
+    color: white;
+}
+
+.status-badge.warning {
+    background: var(--warning);
+    color: white;
+}
+
+.metrics-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 1.5rem;
+    margin: 1.5rem 0;
+}
+
+.metric-card {
+    background: white;
+    border: 1px solid var(--border);
+    padding: 1.5rem;
+    border-radius: 8px;
+    text-align: center;
+}
+
+.metric-value {
+    font-size: 2rem;
+    font-weight: 700;
+    color: var(--accent);
+    font-family: 'Cormorant Garamond', serif;
+}
+
+.metric-label {
+    font-size: 0.9rem;
+    color: var(--muted);
+    margin-top: 0.5rem;
+}
+
+.renewal-item {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    padding: 1rem;
+    border: 1px solid var(--border);
+    border-radius: 6px;
+    margin-bottom: 0.75rem;
+}
+
+.renewal-quarter {
+    font-weight: 600;
+    color: var(--secondary);
+}
+
+.renewal-amount {
+    font-size: 1.1rem;
+    font-weight: 600;
+}
+
+.placeholder {
+    background: #f5f5f5;
+    border: 2px dashed var(--border);
+    padding: 2rem;
+    text-align: center;
+    border-radius: 8px;
+    color: var(--muted);
+    font-style: italic;
+}
+
+.chart-container {
+    position: relative;
+    height: 300px;
+    margin: 2rem 0;
+}
+
+ul {
+    margin: 1rem 0;
+    padding-left: 1.5rem;
+}
+
+li {
+    margin-bottom: 0.75rem;
+}
+"""
 
-    # Find upcoming renewals
-    upcoming_renewals = []
-    at_risk_renewals = []
-    for sub in subscriptions:
-        renewal_qtr = sub.get('renewal_qtr')
-        will_renew = sub.get('will_renew')
-        if renewal_qtr and renewal_qtr in ['Q1\'26', 'Q2\'26', 'Q3\'26', 'Q4\'26']:
-            renewal_info = {
-                'quarter': renewal_qtr,
-                'arr': sub.get('arr', 0) or 0,
-                'will_renew': will_renew
+ACCOUNT_PAGE_JS = """function showTab(index) {
+    const tabs = document.querySelectorAll('.tab');
+    const contents = document.querySelectorAll('.tab-content');
+
+    tabs.forEach((tab, i) => {
+        if (i === index) {
+            tab.classList.add('active');
+            contents[i].classList.add('active');
+        } else {
+            tab.classList.remove('active');
+            contents[i].classList.remove('active');
+        }
+    });
+}
+
+// Chart data comes from each canvas's data-values attribute
+function chartValues(canvas) {
+    return JSON.parse(canvas.getAttribute('data-values'));
+}
+
+// Revenue breakdown chart
+const revenueCanvas = document.getElementById('revenueChart');
+new Chart(revenueCanvas.getContext('2d'), {
+    type: 'doughnut',
+    data: {
+        labels: ['Recurring Revenue', 'Non-Recurring Revenue'],
+        datasets: [{
+            data: chartValues(revenueCanvas),
+            backgroundColor: ['#2d4263', '#c84b31']
+        }]
+    },
+    options: {
+        responsive: true,
+        maintainAspectRatio: false,
+        plugins: {
+            legend: {
+                position: 'bottom'
             }
-            upcoming_renewals.append(renewal_info)
-            if will_renew and 'No' in str(will_renew):
-                at_risk_renewals.append(renewal_info)
-
-    # Generate subscriptions table rows
-    sub_rows = ""
-    for sub in subscriptions:
-        sub_id = sub.get('sub_id')
-        if sub_id and isinstance(sub_id, (int, float)):
-            sub_arr = format_currency(sub.get('arr', 0))
-            renewal_qtr = sub.get('renewal_qtr', 'N/A')
-            will_renew = sub.get('will_renew', 'TBD')
-            projected = format_currency(sub.get('projected_arr', 0))
-
-            sub_rows += f"""
-                        <tr>
-                            <td>{int(sub_id)}</td>
-                            <td>{sub_arr}</td>
-                            <td>{renewal_qtr}</td>
-                            <td>{will_renew}</td>
-                            <td>{projected}</td>
-                        </tr>"""
-
-    if not sub_rows:
-        sub_rows = """
-                        <tr>
-                            <td colspan="5" style="text-align: center; color: var(--muted);">No active subscriptions</td>
-                        </tr>"""
-
-    # Generate renewal calendar
-    renewal_calendar = ""
-    if upcoming_renewals:
-        for renewal in upcoming_renewals:
-            status_class = 'critical' if 'No' in str(renewal.get('will_renew', '')) else 'success'
-            renewal_calendar += f"""
-                    <div class="renewal-item">
-                        <div class="renewal-quarter">{renewal['quarter']}</div>
-                        <div class="renewal-amount">{format_currency(renewal['arr'])}</div>
-                        <span class="status-badge {status_class}">{renewal.get('will_renew', 'TBD')}</span>
-                    </div>"""
-    else:
-        renewal_calendar = """
-                    <div class="placeholder">
-                        <p>No upcoming renewals in next 12 months</p>
-                    </div>"""
-
-    # Critical alerts section
-    critical_alerts = ""
-    if at_risk_renewals:
-        for renewal in at_risk_renewals:
-            critical_alerts += f"""
-                <div class="alert critical">
-                    <strong>⚠️ Renewal at Risk:</strong> {renewal['quarter']} renewal ({format_currency(renewal['arr'])}) flagged as {renewal.get('will_renew', 'at risk')}
-                </div>"""
-
-    if not critical_alerts:
-        critical_alerts = """
-                <div class="alert success">
-                    <strong>✓ No Critical Alerts:</strong> All renewals tracking positively
-                </div>"""
-
-    # Keys to success
-    if health_color == 'red':
-        keys_to_success = """
-                    <li><strong>Renewal Recovery:</strong> Immediate executive engagement to understand churn drivers and present retention proposal</li>
-                    <li><strong>Value Demonstration:</strong> Document ROI and business impact achieved with platform to rebuild business case</li>
-                    <li><strong>Risk Mitigation:</strong> Develop transition plan and knowledge transfer if churn proceeds to protect relationship</li>"""
-    elif health_color == 'green':
-        keys_to_success = """
-                    <li><strong>Expansion Opportunity:</strong> Present additional modules and capabilities to increase platform footprint</li>
-                    <li><strong>Executive Alignment:</strong> Maintain C-level relationships and align roadmap to strategic business initiatives</li>
-                    <li><strong>Reference Development:</strong> Leverage success for case studies, testimonials, and industry event participation</li>"""
-    else:
-        keys_to_success = """
-                    <li><strong>Renewal Confirmation:</strong> Secure commitment and advance renewal discussions 90 days prior to expiration</li>
-                    <li><strong>Stakeholder Mapping:</strong> Expand relationships beyond day-to-day contacts to include decision makers</li>
-                    <li><strong>Value Reinforcement:</strong> Conduct QBR to showcase utilization metrics and business outcomes achieved</li>"""
-
-    # Action plan items
-    if health_color == 'red':
-        action_items = """
-                    <li><strong>Executive Escalation Call</strong> - Owner: Account Director - Due: Within 5 days</li>
-                    <li><strong>Competitive Analysis & Counter Proposal</strong> - Owner: Solutions Architect - Due: Within 10 days</li>
-                    <li><strong>Financial Restructuring Options</strong> - Owner: Sales Operations - Due: Within 10 days</li>"""
-    elif health_color == 'green':
-        action_items = """
-                    <li><strong>Expansion Proposal Development</strong> - Owner: Account Manager - Due: 30 days</li>
-                    <li><strong>Executive Business Review</strong> - Owner: Account Director - Due: 45 days</li>
-                    <li><strong>Reference Program Enrollment</strong> - Owner: Marketing - Due: 60 days</li>"""
-    else:
-        action_items = """
-                    <li><strong>Renewal Discussion Initiation</strong> - Owner: Account Manager - Due: 30 days</li>
-                    <li><strong>Stakeholder Mapping Exercise</strong> - Owner: CSM - Due: 20 days</li>
-                    <li><strong>Quarterly Business Review</strong> - Owner: CSM - Due: 45 days</li>"""
+        }
+    }
+});
+
+// ARR trend chart
+const arrCanvas = document.getElementById('arrTrendChart');
+new Chart(arrCanvas.getContext('2d'), {
+    type: 'line',
+    data: {
+        labels: ['Q1', 'Q2', 'Q3', 'Q4'],
+        datasets: [{
+            label: 'ARR',
+            data: chartValues(arrCanvas),
+            borderColor: '#2d4263',
+            backgroundColor: 'rgba(45, 66, 99, 0.1)',
+            tension: 0.4,
+            fill: true
+        }]
+    },
+    options: {
+        responsive: true,
+        maintainAspectRatio: false,
+        plugins: {
+            legend: {
+                display: false
+            }
+        },
+        scales: {
+            y: {
+                beginAtZero: false,
+                ticks: {
+                    callback: function(value) {
+                        return '$' + value.toLocaleString();
+                    }
+                }
+            }
+        }
+    }
+});
+"""
 
-    html_content = f"""<!DOCTYPE html>
+ACCOUNT_PAGE = PageTemplate("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{customer_name} Account Plan | {bu} Strategic Analysis</title>
+    <title>{{customer_name}} Account Plan | {{bu}} Strategic Analysis</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=Cormorant+Garamond:wght@300;400;600;700&family=DM+Sans:wght@400;500;700&display=swap" rel="stylesheet">
-    <style>
-        :root {{
-            --ink: #1a1a1a;
-            --paper: #fafaf8;
-            --accent: #c84b31;
-            --secondary: #2d4263;
-            --muted: #8b8b8b;
-            --border: #e8e6e1;
-            --highlight: #ecdbba;
-            --success: #4caf50;
-            --warning: #ff9800;
-            --critical: #e53935;
-        }}
-
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'DM Sans', sans-serif;
-            background: var(--paper);
-            color: var(--ink);
-            line-height: 1.6;
-        }}
-
-        h1, h2, h3 {{
-            font-family: 'Cormorant Garamond', serif;
-            font-weight: 600;
-            line-height: 1.2;
-        }}
-
-        h1 {{ font-size: 3.5rem; font-weight: 300; letter-spacing: -0.02em; }}
-        h2 {{ font-size: 1.75rem; margin-bottom: 1.5rem; color: var(--secondary); }}
-        h3 {{ font-size: 1.25rem; margin-bottom: 1rem; }}
-
-        .header {{
-            background: linear-gradient(135deg, var(--secondary) 0%, var(--accent) 100%);
-            color: white;
-            padding: 3rem 2rem;
-            text-align: center;
-        }}
-
-        .header h1 {{
-            color: white;
-            margin-bottom: 0.5rem;
-        }}
-
-        .header .subtitle {{
-            font-size: 1.1rem;
-            opacity: 0.9;
-        }}
-
-        .health-indicator {{
-            display: inline-block;
-            padding: 0.5rem 1rem;
-            border-radius: 20px;
-            font-weight: 600;
-            margin-top: 1rem;
-        }}
-
-        .health-indicator.green {{
-            background: var(--success);
-            color: white;
-        }}
-
-        .health-indicator.yellow {{
-            background: var(--warning);
-            color: white;
-        }}
-
-        .health-indicator.red {{
-            background: var(--critical);
-            color: white;
-        }}
-
-        .tabs {{
-            display: flex;
-            background: white;
-            border-bottom: 2px solid var(--border);
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-        }}
-
-        .tab {{
-            flex: 1;
-            padding: 1rem;
-            text-align: center;
-            cursor: pointer;
-            background: white;
-            border: none;
-            font-size: 0.95rem;
-            font-weight: 500;
-            color: var(--muted);
-            transition: all 0.3s ease;
-        }}
-
-        .tab:hover {{
-            background: var(--highlight);
-        }}
-
-        .tab.active {{
-            color: var(--accent);
-            border-bottom: 3px solid var(--accent);
-        }}
-
-        .tab-content {{
-            display: none;
-            padding: 2rem;
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-
-        .tab-content.active {{
-            display: block;
-        }}
-
-        .section {{
-            background: white;
-            border: 1px solid var(--border);
-            padding: 2rem;
-            margin-bottom: 2rem;
-            border-radius: 8px;
-        }}
-
-        .alert {{
-            padding: 1rem;
-            border-radius: 6px;
-            margin-bottom: 1rem;
-            border-left: 4px solid;
-        }}
-
-        .alert.success {{
-            background: #e8f5e9;
-            border-color: var(--success);
-            color: #2e7d32;
-        }}
-
-        .alert.warning {{
-            background: #fff3e0;
-            border-color: var(--warning);
-            color: #e65100;
-        }}
-
-        .alert.critical {{
-            background: #ffebee;
-            border-color: var(--critical);
-            color: #c62828;
-        }}
-
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 1rem 0;
-        }}
-
-        th {{
-            background: var(--secondary);
-            color: white;
-            padding: 0.75rem;
-            text-align: left;
-            font-weight: 600;
-        }}
-
-        td {{
-            padding: 0.75rem;
-            border-bottom: 1px solid var(--border);
-        }}
-
-        tr:hover {{
-            background: var(--highlight);
-        }}
-
-        .status-badge {{
-            display: inline-block;
-            padding: 0.25rem 0.75rem;
-            border-radius: 12px;
-            font-size: 0.85rem;
-            font-weight: 600;
-        }}
-
-        .status-badge.success {{
-            background: var(--success);
-            color: white;
-        }}
-
-        .status-badge.critical {{
-            background: var(--critical);
-            color: white;
-        }}
-
-        .status-badge.warning {{
-            background: var(--warning);
-            color: white;
-        }}
-
-        .metrics-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 1.5rem;
-            margin: 1.5rem 0;
-        }}
-
-        .metric-card {{
-            background: white;
-            border: 1px solid var(--border);
-            padding: 1.5rem;
-            border-radius: 8px;
-            text-align: center;
-        }}
-
-        .metric-value {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: var(--accent);
-            font-family: 'Cormorant Garamond', serif;
-        }}
-
-        .metric-label {{
-            font-size: 0.9rem;
-            color: var(--muted);
-            margin-top: 0.5rem;
-        }}
-
-        .renewal-item {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 1rem;
-            border: 1px solid var(--border);
-            border-radius: 6px;
-            margin-bottom: 0.75rem;
-        }}
-
-        .renewal-quarter {{
-            font-weight: 600;
-            color: var(--secondary);
-        }}
-
-        .renewal-amount {{
-            font-size: 1.1rem;
-            font-weight: 600;
-        }}
-
-        .placeholder {{
-            background: #f5f5f5;
-            border: 2px dashed var(--border);
-            padding: 2rem;
-            text-align: center;
-            border-radius: 8px;
-            color: var(--muted);
-            font-style: italic;
-        }}
-
-        .chart-container {{
-            position: relative;
-            height: 300px;
-            margin: 2rem 0;
-        }}
-
-        ul {{
-            margin: 1rem 0;
-            padding-left: 1.5rem;
-        }}
-
-        li {{
-            margin-bottom: 0.75rem;
-        }}
-    </style>
+    <link rel="stylesheet" href="account-plan.css">
 </head>
 <body>
     <div class="header">
-        <h1>{customer_name}</h1>
-        <div class="subtitle">{bu} Business Unit | Strategic Account Plan</div>
-        <span class="health-indicator {health_color}">● {health_status}</span>
+        <h1>{{customer_name}}</h1>
+        <div class="subtitle">{{bu}} Business Unit | Strategic Account Plan</div>
+        <span class="health-indicator {{health_color}}">● {{health_status}}</span>
     </div>
 
     <div class="tabs">
@@ -491,13 +571,13 @@ def generate_account_html(customer):
     <div class="tab-content active">
         <div class="section">
             <h2>Critical Alerts</h2>
-            {critical_alerts}
+            {{critical_alerts}}
         </div>
 
         <div class="section">
             <h2>Keys to Success</h2>
             <ul>
-                {keys_to_success}
+                {{keys_to_success}}
             </ul>
         </div>
 
@@ -514,12 +594,12 @@ def generate_account_html(customer):
                 <tbody>
                     <tr>
                         <td>Retention Likelihood</td>
-                        <td>{health_status}</td>
-                        <td><span class="status-badge {health_color}">{health_status}</span></td>
+                        <td>{{health_status}}</td>
+                        <td><span class="status-badge {{health_color}}">{{health_status}}</span></td>
                     </tr>
                     <tr>
                         <td>Annual Recurring Revenue (ARR)</td>
-                        <td>{format_currency(arr)}</td>
+                        <td>{{arr_display}}</td>
                         <td><span class="status-badge success">Active</span></td>
                     </tr>
                     <tr>
@@ -551,14 +631,12 @@ def generate_account_html(customer):
                     <tr>
                         <td>Core Platform</td>
                         <td><span class="status-badge success">Active</span></td>
-                        <td>[OSINT NEEDED]</td>
-                        <td><span class="status-badge {health_color}">{health_status}</span></td>
+                        <td>{{core_user_count}}</td>
+                        <td><span class="status-badge {{health_color}}">{{health_status}}</span></td>
                     </tr>
                     <tr>
                         <td>Advanced Features</td>
-                        <td>[OSINT NEEDED]</td>
-                        <td>[OSINT NEEDED]</td>
-                        <td>[OSINT NEEDED]</td>
+                        {{advanced_usage_cells}}
                     </tr>
                 </tbody>
             </table>
@@ -568,15 +646,15 @@ def generate_account_html(customer):
             <h2>Key Metrics</h2>
             <div class="metrics-grid">
                 <div class="metric-card">
-                    <div class="metric-value">{num_subscriptions}</div>
+                    <div class="metric-value">{{num_subscriptions}}</div>
                     <div class="metric-label">Active Subscriptions</div>
                 </div>
                 <div class="metric-card">
-                    <div class="metric-value">{format_currency(arr)}</div>
+                    <div class="metric-value">{{arr_display}}</div>
                     <div class="metric-label">Annual Recurring Revenue</div>
                 </div>
                 <div class="metric-card">
-                    <div class="metric-value">{len(upcoming_renewals)}</div>
+                    <div class="metric-value">{{renewal_count}}</div>
                     <div class="metric-label">Renewals (Next 12 Mo)</div>
                 </div>
                 <div class="metric-card">
@@ -588,7 +666,7 @@ def generate_account_html(customer):
 
         <div class="section">
             <h2>Renewal Calendar</h2>
-            {renewal_calendar}
+            {{renewal_calendar}}
         </div>
     </div>
 
@@ -608,23 +686,15 @@ def generate_account_html(customer):
                     </tr>
                 </thead>
                 <tbody>
-                    <tr>
-                        <td colspan="6" class="placeholder">
-                            [OSINT NEEDED] Executive contact information to be gathered through LinkedIn research, company website analysis, and stakeholder interviews
-                        </td>
-                    </tr>
+{{executive_rows}}
                 </tbody>
             </table>
-            <div class="alert warning" style="margin-top: 1rem;">
-                <strong>Action Required:</strong> Conduct OSINT research to identify key decision makers including CIO, CTO, VP of Technology, and primary business sponsors
-            </div>
+{{executive_alert}}
         </div>
 
         <div class="section">
             <h2>Stakeholder Engagement Strategy</h2>
-            <div class="placeholder">
-                <p>Stakeholder engagement plan to be developed after executive mapping is complete</p>
-            </div>
+{{stakeholder_strategy}}
         </div>
     </div>
 
@@ -632,16 +702,7 @@ def generate_account_html(customer):
     <div class="tab-content">
         <div class="section">
             <h2>Organization Structure</h2>
-            <div class="placeholder">
-                <p>Organization structure mapping pending OSINT data collection</p>
-                <p style="margin-top: 1rem;">This section will include:</p>
-                <ul style="text-align: left; max-width: 600px; margin: 1rem auto;">
-                    <li>Reporting hierarchy from C-level to operational teams</li>
-                    <li>Key departments utilizing the platform</li>
-                    <li>Decision-making authority matrix</li>
-                    <li>Budget ownership and approval workflows</li>
-                </ul>
-            </div>
+{{org_overview}}
         </div>
 
         <div class="section">
@@ -656,11 +717,7 @@ def generate_account_html(customer):
                     </tr>
                 </thead>
                 <tbody>
-                    <tr>
-                        <td colspan="4" class="placeholder">
-                            [OSINT NEEDED] Department structure and leadership to be identified
-                        </td>
-                    </tr>
+{{department_rows}}
                 </tbody>
             </table>
         </div>
@@ -670,30 +727,17 @@ def generate_account_html(customer):
     <div class="tab-content">
         <div class="section">
             <h2>Business Challenges</h2>
-            <div class="placeholder">
-                <p>Pain point analysis pending OSINT research and stakeholder interviews</p>
-                <p style="margin-top: 1rem;">Investigation areas:</p>
-                <ul style="text-align: left; max-width: 600px; margin: 1rem auto;">
-                    <li>Strategic business priorities and transformation initiatives</li>
-                    <li>Operational inefficiencies addressed by the platform</li>
-                    <li>Technology stack gaps and integration challenges</li>
-                    <li>Competitive pressures and market positioning concerns</li>
-                </ul>
-            </div>
+{{business_challenges}}
         </div>
 
         <div class="section">
             <h2>Technical Pain Points</h2>
-            <div class="placeholder">
-                <p>[OSINT NEEDED] Technical requirements and challenges to be documented through discovery calls and technical reviews</p>
-            </div>
+{{technical_pain_points}}
         </div>
 
         <div class="section">
             <h2>Opportunity Areas</h2>
-            <div class="placeholder">
-                <p>Expansion opportunities to be identified after pain point analysis is complete</p>
-            </div>
+{{opportunity_areas}}
         </div>
     </div>
 
@@ -701,23 +745,12 @@ def generate_account_html(customer):
     <div class="tab-content">
         <div class="section">
             <h2>Competitive Landscape</h2>
-            <div class="placeholder">
-                <p>Competitive analysis pending OSINT intelligence gathering</p>
-                <p style="margin-top: 1rem;">Research focus areas:</p>
-                <ul style="text-align: left; max-width: 600px; margin: 1rem auto;">
-                    <li>Incumbent vendors and technology partners</li>
-                    <li>Recent RFPs or competitive evaluations</li>
-                    <li>Vendor relationships and satisfaction levels</li>
-                    <li>Technology modernization initiatives</li>
-                </ul>
-            </div>
+{{competitive_landscape}}
         </div>
 
         <div class="section">
             <h2>Our Differentiation</h2>
-            <div class="placeholder">
-                <p>Competitive positioning to be developed after landscape analysis is complete</p>
-            </div>
+{{differentiation}}
         </div>
 
         <div class="section">
@@ -731,11 +764,7 @@ def generate_account_html(customer):
                     </tr>
                 </thead>
                 <tbody>
-                    <tr>
-                        <td colspan="3" class="placeholder">
-                            [OSINT NEEDED] Competitive threat assessment to be completed
-                        </td>
-                    </tr>
+{{threat_rows}}
                 </tbody>
             </table>
         </div>
@@ -755,7 +784,7 @@ def generate_account_html(customer):
                     </tr>
                 </thead>
                 <tbody>
-                    {action_items}
+                    {{action_items}}
                 </tbody>
             </table>
         </div>
@@ -777,24 +806,24 @@ def generate_account_html(customer):
             <h2>Revenue Breakdown</h2>
             <div class="metrics-grid">
                 <div class="metric-card">
-                    <div class="metric-value">{format_currency(rr)}</div>
+                    <div class="metric-value">{{rr_display}}</div>
                     <div class="metric-label">Recurring Revenue (Quarterly)</div>
                 </div>
                 <div class="metric-card">
-                    <div class="metric-value">{format_currency(nrr)}</div>
+                    <div class="metric-value">{{nrr_display}}</div>
                     <div class="metric-label">Non-Recurring Revenue</div>
                 </div>
                 <div class="metric-card">
-                    <div class="metric-value">{format_currency(total)}</div>
+                    <div class="metric-value">{{total_display}}</div>
                     <div class="metric-label">Total Revenue (Quarterly)</div>
                 </div>
                 <div class="metric-card">
-                    <div class="metric-value">{format_currency(arr)}</div>
+                    <div class="metric-value">{{arr_display}}</div>
                     <div class="metric-label">Annual Recurring Revenue</div>
                 </div>
             </div>
             <div class="chart-container">
-                <canvas id="revenueChart"></canvas>
+                <canvas id="revenueChart" data-values="{{revenue_chart_values}}"></canvas>
             </div>
         </div>
 
@@ -811,7 +840,7 @@ def generate_account_html(customer):
                     </tr>
                 </thead>
                 <tbody>
-                    {sub_rows}
+                    {{sub_rows}}
                 </tbody>
             </table>
         </div>
@@ -819,7 +848,7 @@ def generate_account_html(customer):
         <div class="section">
             <h2>ARR Trends</h2>
             <div class="chart-container">
-                <canvas id="arrTrendChart"></canvas>
+                <canvas id="arrTrendChart" data-values="{{arr_trend_values}}"></canvas>
             </div>
         </div>
 
@@ -844,7 +873,7 @@ def generate_account_html(customer):
                 <tbody>
                     <tr>
                         <td>Annual Contract Value</td>
-                        <td>{format_currency(arr)}</td>
+                        <td>{{arr_display}}</td>
                         <td>[TBD]</td>
                         <td>[TBD]</td>
                     </tr>
@@ -859,96 +888,175 @@ def generate_account_html(customer):
         </div>
     </div>
 
-    <script>
-        function showTab(index) {{
-            const tabs = document.querySelectorAll('.tab');
-            const contents = document.querySelectorAll('.tab-content');
-
-            tabs.forEach((tab, i) => {{
-                if (i === index) {{
-                    tab.classList.add('active');
-                    contents[i].classList.add('active');
-                }} else {{
-                    tab.classList.remove('active');
-                    contents[i].classList.remove('active');
-                }}
-            }});
-        }}
-
-        // Revenue breakdown chart
-        const revenueCtx = document.getElementById('revenueChart').getContext('2d');
-        new Chart(revenueCtx, {{
-            type: 'doughnut',
-            data: {{
-                labels: ['Recurring Revenue', 'Non-Recurring Revenue'],
-                datasets: [{{
-                    data: [{rr}, {nrr}],
-                    backgroundColor: ['#2d4263', '#c84b31']
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
-                        position: 'bottom'
-                    }}
-                }}
-            }}
-        }});
-
-        // ARR trend chart
-        const arrCtx = document.getElementById('arrTrendChart').getContext('2d');
-        new Chart(arrCtx, {{
-            type: 'line',
-            data: {{
-                labels: ['Q1', 'Q2', 'Q3', 'Q4'],
-                datasets: [{{
-                    label: 'ARR',
-                    data: [{arr * 0.9}, {arr * 0.95}, {arr}, {arr * 1.05}],
-                    borderColor: '#2d4263',
-                    backgroundColor: 'rgba(45, 66, 99, 0.1)',
-                    tension: 0.4,
-                    fill: true
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: false,
-                        ticks: {{
-                            callback: function(value) {{
-                                return '$' + value.toLocaleString();
-                            }}
-                        }}
-                    }}
-                }}
-            }}
-        }});
-    </script>
+    <script src="account-plan.js"></script>
 </body>
-</html>"""
+</html>""")
 
-    return html_content
+def write_account_assets(accounts_dir=ACCOUNTS_DIR):
+    """Write the stylesheet and script the account pages link to (if changed)."""
+    write_asset(accounts_dir, ACCOUNT_PAGE_STYLESHEET, ACCOUNT_PAGE_CSS)
+    write_asset(accounts_dir, ACCOUNT_PAGE_SCRIPT, ACCOUNT_PAGE_JS)
 
-def main():
-    """Generate all account HTML files"""
-    print("Loading customer data...")
-    customers = load_customer_data()
+def generate_account_html(customer, osint=None):
+    """Generate complete 7-tab HTML for a single account
 
-    print(f"Found {len(customers)} customers across all BUs")
+    Args:
+        customer: Customer record (customer_name, bu, rr, nrr, subscriptions, ...)
+        osint: Tab slot -> HTML (from account_osint); missing slots keep the
+            [OSINT NEEDED] placeholders
+
+    Returns:
+        str: Account page HTML
+    """
+    return ACCOUNT_PAGE.render(account_page_values(customer, osint))
+
+def account_page_values(customer, osint=None):
+    """Slot -> HTML for ACCOUNT_PAGE (the customer-specific parts of the page)."""
+    tabs = {**PLACEHOLDER_TABS, **(osint or {})}
+
+    customer_name = customer['customer_name']
+    bu = customer['bu']
+    rr = customer.get('rr', 0) or 0
+    nrr = customer.get('nrr', 0) or 0
+    total = customer.get('total', 0) or 0
+    arr = rr * 4  # Annual Recurring Revenue
+    subscriptions = customer.get('subscriptions', [])
+
+    health_color, health_status = calculate_health_score(customer)
+
+    # Calculate subscription metrics
+    num_subscriptions = len([s for s in subscriptions if s.get('sub_id') and isinstance(s.get('sub_id'), (int, float))])
+
+    # Find upcoming renewals
+    upcoming_renewals = []
+    at_risk_renewals = []
+    for sub in subscriptions:
+        renewal_qtr = sub.get('renewal_qtr')
+        will_renew = sub.get('will_renew')
+        if renewal_qtr and renewal_qtr in ['Q1\'26', 'Q2\'26', 'Q3\'26', 'Q4\'26']:
+            renewal_info = {
+                'quarter': renewal_qtr,
+                'arr': sub.get('arr', 0) or 0,
+                'will_renew': will_renew
+            }
+            upcoming_renewals.append(renewal_info)
+            if will_renew and 'No' in str(will_renew):
+                at_risk_renewals.append(renewal_info)
+
+    # Generate subscriptions table rows
+    sub_rows = ""
+    for sub in subscriptions:
+        sub_id = sub.get('sub_id')
+        if sub_id and isinstance(sub_id, (int, float)):
+            sub_arr = format_currency(sub.get('arr', 0))
+            renewal_qtr = sub.get('renewal_qtr', 'N/A')
+            will_renew = sub.get('will_renew', 'TBD')
+            projected = format_currency(sub.get('projected_arr', 0))
 
-    # Create accounts directory if it doesn't exist
-    accounts_dir = "/Users/RAZER/Documents/projects/Skyvera/accounts"
-    os.makedirs(accounts_dir, exist_ok=True)
+            sub_rows += f"""
+                        <tr>
+                            <td>{int(sub_id)}</td>
+                            <td>{sub_arr}</td>
+                            <td>{renewal_qtr}</td>
+                            <td>{will_renew}</td>
+                            <td>{projected}</td>
+                        </tr>"""
+
+    if not sub_rows:
+        sub_rows = """
+                        <tr>
+                            <td colspan="5" style="text-align: center; color: var(--muted);">No active subscriptions</td>
+                        </tr>"""
+
+    # Generate renewal calendar
+    renewal_calendar = ""
+    if upcoming_renewals:
+        for renewal in upcoming_renewals:
+            status_class = 'critical' if 'No' in str(renewal.get('will_renew', '')) else 'success'
+            renewal_calendar += f"""
+                    <div class="renewal-item">
+                        <div class="renewal-quarter">{renewal['quarter']}</div>
+                        <div class="renewal-amount">{format_currency(renewal['arr'])}</div>
+                        <span class="status-badge {status_class}">{renewal.get('will_renew', 'TBD')}</span>
+                    </div>"""
+    else:
+        renewal_calendar = """
+                    <div class="placeholder">
+                        <p>No upcoming renewals in next 12 months</p>
+                    </div>"""
+
+    # Critical alerts section
+    critical_alerts = ""
+    if at_risk_renewals:
+        for renewal in at_risk_renewals:
+            critical_alerts += f"""
+                <div class="alert critical">
+                    <strong>⚠️ Renewal at Risk:</strong> {renewal['quarter']} renewal ({format_currency(renewal['arr'])}) flagged as {renewal.get('will_renew', 'at risk')}
+                </div>"""
+
+    if not critical_alerts:
+        critical_alerts = """
+                <div class="alert success">
+                    <strong>✓ No Critical Alerts:</strong> All renewals tracking positively
+                </div>"""
 
+    # Keys to success
+    if health_color == 'red':
+        keys_to_success = """
+                    <li><strong>Renewal Recovery:</strong> Immediate executive engagement to understand churn drivers and present retention proposal</li>
+                    <li><strong>Value Demonstration:</strong> Document ROI and business impact achieved with platform to rebuild business case</li>
+                    <li><strong>Risk Mitigation:</strong> Develop transition plan and knowledge transfer if churn proceeds to protect relationship</li>"""
+    elif health_color == 'green':
+        keys_to_success = """
+                    <li><strong>Expansion Opportunity:</strong> Present additional modules and capabilities to increase platform footprint</li>
+                    <li><strong>Executive Alignment:</strong> Maintain C-level relationships and align roadmap to strategic business initiatives</li>
+                    <li><strong>Reference Development:</strong> Leverage success for case studies, testimonials, and industry event participation</li>"""
+    else:
+        keys_to_success = """
+                    <li><strong>Renewal Confirmation:</strong> Secure commitment and advance renewal discussions 90 days prior to expiration</li>
+                    <li><strong>Stakeholder Mapping:</strong> Expand relationships beyond day-to-day contacts to include decision makers</li>
+                    <li><strong>Value Reinforcement:</strong> Conduct QBR to showcase utilization metrics and business outcomes achieved</li>"""
+
+    # Action plan items
+    if health_color == 'red':
+        action_items = """
+                    <li><strong>Executive Escalation Call</strong> - Owner: Account Director - Due: Within 5 days</li>
+                    <li><strong>Competitive Analysis & Counter Proposal</strong> - Owner: Solutions Architect - Due: Within 10 days</li>
+                    <li><strong>Financial Restructuring Options</strong> - Owner: Sales Operations - Due: Within 10 days</li>"""
+    elif health_color == 'green':
+        action_items = """
+                    <li><strong>Expansion Proposal Development</strong> - Owner: Account Manager - Due: 30 days</li>
+                    <li><strong>Executive Business Review</strong> - Owner: Account Director - Due: 45 days</li>
+                    <li><strong>Reference Program Enrollment</strong> - Owner: Marketing - Due: 60 days</li>"""
+    else:
+        action_items = """
+                    <li><strong>Renewal Discussion Initiation</strong> - Owner: Account Manager - Due: 30 days</li>
+                    <li><strong>Stakeholder Mapping Exercise</strong> - Owner: CSM - Due: 20 days</li>
+                    <li><strong>Quarterly Business Review</strong> - Owner: CSM - Due: 45 days</li>"""
+
+    return {
+        **tabs,
+        'customer_name': customer_name,
+        'bu': bu,
+        'health_color': health_color,
+        'health_status': health_status,
+        'critical_alerts': critical_alerts,
+        'keys_to_success': keys_to_success,
+        'action_items': action_items,
+        'renewal_calendar': renewal_calendar,
+        'sub_rows': sub_rows,
+        'num_subscriptions': num_subscriptions,
+        'renewal_count': len(upcoming_renewals),
+        'arr_display': format_currency(arr),
+        'rr_display': format_currency(rr),
+        'nrr_display': format_currency(nrr),
+        'total_display': format_currency(total),
+        'revenue_chart_values': f"[{rr}, {nrr}]",
+        'arr_trend_values': f"[{arr * 0.9}, {arr * 0.95}, {arr}, {arr * 1.05}]",
+    }
+
+def account_filenames(customers):
+    """Page filename per customer; names that clash case-insensitively get rank and BU."""
     # Pre-process to detect duplicate filenames (case-insensitive)
     filename_map = {}
     for customer in customers:
@@ -961,8 +1069,7 @@ def main():
             filename_map[base_filename] = []
         filename_map[base_filename].append(customer)
 
-    # Generate HTML for each customer
-    generated = 0
+    filenames = []
     for customer in customers:
         customer_name = customer['customer_name']
         bu = customer['bu']
@@ -975,28 +1082,204 @@ def main():
         # Handle duplicates by appending rank or BU
         if len(filename_map[base_filename_lower]) > 1:
             rank = customer.get('rank', 0)
-            filename = f"{safe_name}_rank{rank}_{bu}_Account_Plan.html"
+            filenames.append(f"{safe_name}_rank{rank}_{bu}_Account_Plan.html")
         else:
-            filename = f"{safe_name}_Account_Plan.html"
+            filenames.append(f"{safe_name}_Account_Plan.html")
+
+    return filenames
+
+def fingerprint(value):
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def module_functions_source(module):
+    return ''.join(inspect.getsource(obj) for name, obj in sorted(vars(module).items())
+                   if inspect.isfunction(obj) and obj.__module__ == module.__name__)
+
+def renderer_version():
+    """Hash of the code that turns customer data and intel into a page."""
+    sources = [module_functions_source(module)
+               for module in (sys.modules[__name__], populate_osint, osint_update_accounts)]
+    page = [ACCOUNT_PAGE.source, ACCOUNT_PAGE_CSS, ACCOUNT_PAGE_JS]
+    return fingerprint([PLACEHOLDER_TABS, page, sources])[:16]
+
+def osint_fingerprint(customer):
+    """Hash of the intel records a customer's OSINT tabs are rendered from."""
+    intel, is_specific = get_intel_for_company(customer['customer_name'], customer['bu'])
+    return fingerprint([intel, is_specific, find_intelligence(customer['customer_name'])])
+
+def load_manifest(manifest_path=MANIFEST_FILE):
+    try:
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+_render_settings = {}
+
+def init_render_worker(accounts_dir, dry_run):
+    _render_settings.update(accounts_dir=accounts_dir, dry_run=dry_run)
+
+def render_account(item):
+    """Render one page (in a worker): write it, or on a dry run diff it against the page on disk."""
+    customer, filename, researched_on, with_osint = item
+    start = time.perf_counter()
+    result = {'file': filename, 'info': None, 'diff': '', 'error': None}
+    try:
+        if with_osint:
+            osint, info = account_osint(customer, researched_on)
+        else:
+            osint, info = None, {'specific': False, 'quality': 'template'}
+        html_content = generate_account_html(customer, osint)
+
+        filepath = os.path.join(_render_settings['accounts_dir'], filename)
+        if _render_settings['dry_run']:
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    current = f.read()
+            except OSError:
+                current = ''
+            result['diff'] = ''.join(difflib.unified_diff(
+                current.splitlines(keepends=True), html_content.splitlines(keepends=True),
+                fromfile=f"a/{filename}", tofile=f"b/{filename}"))
+        else:
+            write_atomic(filepath, html_content)
+        result['info'] = info
+    except Exception as e:
+        result['error'] = str(e)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+def render_accounts(customers=None, accounts_dir=ACCOUNTS_DIR, only=None, force=False, with_osint=True,
+                    manifest_path=MANIFEST_FILE, jobs=1, dry_run=False):
+    """Render the account pages whose customer data, intel or renderer changed.
+
+    Each page's input fingerprint is kept in the manifest; a page whose
+    fingerprint is unchanged is left as it is. The research date shown on a
+    page moves only when that account's intel changes. Stale pages are
+    rendered across `jobs` worker processes and written through a temp file
+    and rename, so an interrupted run never leaves a half-written page. A
+    dry run renders the same pages but writes nothing (pages or manifest);
+    each result carries the unified diff against the page on disk instead.
+
+    Args:
+        customers: Customer records (default: load_customer_data())
+        accounts_dir: Output directory for the pages
+        only: Customer names to consider (default: all)
+        force: Re-render pages even when they are current
+        with_osint: Fill the OSINT tabs (False keeps the placeholders)
+        manifest_path: Fingerprint manifest path
+        jobs: Worker processes (0 = one per CPU core)
+        dry_run: Diff instead of writing
+
+    Returns:
+        list: One dict per account: customer, file, rendered, specific, quality, error,
+            seconds (render time), diff (dry run only)
+    """
+    if customers is None:
+        customers = load_customer_data()
+    if not dry_run:
+        write_account_assets(accounts_dir)
+
+    manifest = load_manifest(manifest_path)
+    version = renderer_version()
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    results = []
+    pending = {}
+    for customer, filename in zip(customers, account_filenames(customers)):
+        if only and customer['customer_name'] not in only:
+            continue
 
         filepath = os.path.join(accounts_dir, filename)
+        entry = manifest.get(filename, {})
+        result = {'customer': customer, 'file': filename, 'rendered': False,
+                  'specific': entry.get('specific', False), 'quality': entry.get('quality', 'template'),
+                  'error': None, 'seconds': 0.0, 'diff': ''}
+        results.append(result)
+        try:
+            osint_key = osint_fingerprint(customer) if with_osint else None
+            input_key = fingerprint([customer, osint_key, version])
+        except Exception as e:
+            result['error'] = str(e)
+            continue
+        if not force and entry.get('input') == input_key and os.path.exists(filepath):
+            continue
+
+        researched_on = None
+        if with_osint:
+            researched_on = entry.get('researched_on') if entry.get('osint') == osint_key else today
+        pending[filename] = (result, {'input': input_key, 'osint': osint_key, 'researched_on': researched_on},
+                             (customer, filename, researched_on, with_osint))
+
+    items = [item for _, _, item in pending.values()]
+    for rendered in run_jobs(render_account, items, jobs, init_render_worker, (accounts_dir, dry_run)):
+        result, manifest_entry, _ = pending[rendered['file']]
+        result.update(seconds=rendered['seconds'], diff=rendered['diff'], error=rendered['error'])
+        if rendered['error'] is None:
+            result.update(rendered['info'], rendered=True)
+            manifest[rendered['file']] = {**manifest_entry, **rendered['info']}
+
+    if not dry_run:
+        write_atomic(manifest_path, json.dumps(manifest, indent=1, sort_keys=True))
+
+    return results
+
+def add_render_arguments(parser):
+    """--force, --only, --dry-run and --jobs, shared by the scripts that re-render the pages."""
+    parser.add_argument('--force', action='store_true', help='Re-render every page, even if it is current')
+    parser.add_argument('--only', action='append', default=[], help='Customer name to render (repeatable)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Print a unified diff and the render time of each stale page; write nothing')
+    add_jobs_argument(parser)
+
+def print_dry_run(results):
+    """Diffs, then per-file render timing, of a dry-run render_accounts()."""
+    rendered = [result for result in results if result['rendered']]
+    for result in rendered:
+        sys.stdout.write(result['diff'])
+    print(f"\nDry run: {len(rendered)} pages rendered, "
+          f"{sum(1 for result in rendered if result['diff'])} would change (nothing written)")
+    for result in rendered:
+        status = 'changed' if result['diff'] else 'same'
+        print(f"  {result['seconds'] * 1000:8.1f}ms  {status:7s}  {result['file']}")
 
-        print(f"Generating: {filename}")
-        html_content = generate_account_html(customer)
+def main():
+    """Generate all account HTML files"""
+    parser = argparse.ArgumentParser(description='Generate the account plan pages')
+    add_render_arguments(parser)
+    parser.add_argument('--no-osint', action='store_true', help='Leave the OSINT tabs as placeholders')
+    args = parser.parse_args()
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    print("Loading customer data...")
+    customers = load_customer_data()
 
-        generated += 1
+    print(f"Found {len(customers)} customers across all BUs")
+
+    results = render_accounts(customers, only=args.only, force=args.force, with_osint=not args.no_osint,
+                              jobs=args.jobs, dry_run=args.dry_run)
+    if args.dry_run:
+        print_dry_run(results)
+        return
+
+    generated = 0
+    unchanged = 0
+    for result in results:
+        if result['error']:
+            print(f"Error: {result['file']}: {result['error']}")
+        elif result['rendered']:
+            print(f"Generating: {result['file']}")
+            generated += 1
+        else:
+            unchanged += 1
 
-    print(f"\n✓ Successfully generated {generated} account HTML files")
-    print(f"✓ Files saved to: {accounts_dir}")
+    print(f"\n✓ Successfully generated {generated} account HTML files ({unchanged} already current)")
+    print(f"✓ Files saved to: {ACCOUNTS_DIR}")
     print("\nAll accounts now have complete 7-tab structure:")
     print("  1. 📊 Overview - Critical alerts, keys to success, status")
-    print("  2. 👔 Key Executives - Contact info (OSINT placeholders)")
-    print("  3. 🏢 Org Structure - Hierarchy (OSINT placeholders)")
-    print("  4. 💡 Pain Points - Business challenges (OSINT placeholders)")
-    print("  5. ⚔️ Competitive - Landscape analysis (OSINT placeholders)")
+    print("  2. 👔 Key Executives - Contact info (OSINT intel)")
+    print("  3. 🏢 Org Structure - Hierarchy (OSINT intel)")
+    print("  4. 💡 Pain Points - Business challenges (OSINT intel)")
+    print("  5. ⚔️ Competitive - Landscape analysis (OSINT intel)")
     print("  6. 📋 Action Plan - Strategic actions with owners/dates")
     print("  7. 💰 Financial - Revenue breakdown and subscriptions")
 
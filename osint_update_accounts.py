@@ -1,1236 +1,32 @@
 #!/usr/bin/env python3
 """
 OSINT Intelligence Update Script for Skyvera Account Plans
-Comprehensive update of all 140 account HTML files with researched intelligence.
+Researched intelligence for the 140 account pages. generate_accounts.py
+renders it over the populate_osint tab content (research_tab_content());
+running this script re-renders the accounts whose research changed.
 """
 
+import argparse
 import os
-import re
 import json
-from datetime import datetime
+import sys
 
-ACCOUNTS_DIR = "/Users/RAZER/Documents/projects/Skyvera/accounts"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from intel_matcher import IntelMatcher
+from osint_intel import open_intel_database
+from parallel_render import write_atomic
 
 # ============================================================================
 # RESEARCHED INTELLIGENCE DATABASE
 # Each entry contains verified executive data, org structure, pain points,
-# and competitive intelligence gathered from web research.
+# and competitive intelligence gathered from web research. Stored in
+# data/osint_intel.jsonl (scripts/osint_intel.py).
 # ============================================================================
 
-INTELLIGENCE_DB = {
-    # ========================================================================
-    # TIER 1 - HIGHEST VALUE ACCOUNTS ($2M+ ARR)
-    # ========================================================================
+def intelligence_db():
+    """Company name -> researched intel (INTELLIGENCE_DB), records read on first access."""
+    return open_intel_database('intelligence_db')
 
-    "EMIRCOM": {
-        "company_name": "EMIRCOM",
-        "industry": "ICT Services / Systems Integration",
-        "hq": "Abu Dhabi, UAE / Riyadh, Saudi Arabia",
-        "employees": "1,000+",
-        "executives": [
-            {"name": "M. Abou-Zaki", "title": "CEO", "dept": "Executive Leadership", "linkedin": "m-abou-zaki-89b31810", "source": "LinkedIn/EMIRCOM website"},
-            {"name": "Abdulaziz Alhalwan", "title": "General Manager - Saudi Arabia", "dept": "Saudi Arabia Operations", "linkedin": "", "source": "EMIRCOM corporate website"},
-            {"name": "Mohammad Shakeer", "title": "VP Sales & Operations - Saudi Arabia", "dept": "Sales & Operations", "linkedin": "", "source": "EMIRCOM corporate website"},
-        ],
-        "org_overview": "EMIRCOM is a leading ICT services and solutions provider in the Middle East with operations in UAE and Saudi Arabia. The company specializes in networking, cybersecurity, data centers, and digital transformation solutions. Organizational structure includes regional operations (UAE and KSA) with functional departments spanning Sales, Engineering, Professional Services, and Managed Services. The Saudi operations are led by a General Manager reporting to the Group CEO.",
-        "pain_points": [
-            {"severity": "critical", "title": "AR Collection Risk - $3.8M Outstanding", "desc": "AR >90 days represents 40% of ARR ($3.8M). Write-off risk flagged. Cash flow implications for vendor relationships."},
-            {"severity": "high", "title": "Saudi Arabia Vision 2030 Digital Transformation", "desc": "Massive government-driven digital transformation creating both opportunities and competitive pressure for ICT providers."},
-            {"severity": "medium", "title": "Regional Competition Intensification", "desc": "Growing competition from global system integrators (Accenture, IBM, TCS) entering Saudi market with aggressive pricing."},
-        ],
-        "competitors": [
-            {"name": "Accenture Middle East", "threat": "High", "strategy": "Leverage local market knowledge and established relationships vs. global firm overhead"},
-            {"name": "IBM Middle East", "threat": "Medium", "strategy": "Focus on specialized telecom/networking expertise that generalist firms lack"},
-            {"name": "Dimension Data (NTT)", "threat": "Medium", "strategy": "Emphasize regional presence and faster response times"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["emircom.com", "LinkedIn", "eyeofriyadh.com", "zoominfo.com"]
-    },
-
-    "AT&T SERVICES, INC.": {
-        "company_name": "AT&T SERVICES, INC.",
-        "industry": "Telecommunications",
-        "hq": "Dallas, Texas, USA",
-        "employees": "150,000+",
-        "executives": [
-            {"name": "John Stankey", "title": "Chairman & CEO", "dept": "Executive Leadership", "linkedin": "john-stankey", "source": "AT&T Investor Relations"},
-            {"name": "Pascal Desroches", "title": "SEVP & CFO", "dept": "Finance", "linkedin": "pascal-desroches", "source": "AT&T Investor Relations"},
-            {"name": "Jeff McElfresh", "title": "COO", "dept": "Operations", "linkedin": "jeff-mcelfresh", "source": "AT&T Investor Relations"},
-            {"name": "Jeremy Legg", "title": "CTO", "dept": "Technology", "linkedin": "jeremy-legg", "source": "AT&T Investor Relations"},
-            {"name": "Kellyn Kenny", "title": "Chief Marketing & Growth Officer", "dept": "Marketing", "linkedin": "kellyn-kenny", "source": "AT&T Investor Relations"},
-        ],
-        "org_overview": "AT&T is one of the world's largest telecommunications companies, operating through Consumer (wireless, fiber), Business Solutions (enterprise connectivity, cybersecurity), and Latin America segments. The Kandy platform relationship focuses on communications-as-a-service (CPaaS) and UCaaS capabilities. AT&T's technology organization under CTO Jeremy Legg drives platform architecture decisions, while business unit leaders own commercial relationships. Budget authority flows through SEVP & CFO Pascal Desroches with business unit P&L owners having significant influence.",
-        "pain_points": [
-            {"severity": "critical", "title": "Mixed Renewal Signals - BU Decision Required", "desc": "Multiple subscriptions with mixed renewal signals. Some products confirmed for renewal, others flagged for discontinuation. Requires business unit-level decision alignment."},
-            {"severity": "high", "title": "Network Modernization & Fiber Buildout", "desc": "AT&T is investing heavily in fiber-to-the-home (25M+ locations by 2025) and 5G expansion, driving massive capex requirements and technology vendor consolidation."},
-            {"severity": "medium", "title": "Enterprise Market Competition", "desc": "Intense competition from T-Mobile for Business and Verizon Business for enterprise customers, putting pressure on margins and requiring differentiated solutions."},
-        ],
-        "competitors": [
-            {"name": "Twilio", "threat": "High", "strategy": "Emphasize enterprise-grade reliability and AT&T integration advantages over pure-play CPaaS"},
-            {"name": "RingCentral", "threat": "High", "strategy": "Counter with deeper network integration and cost advantages"},
-            {"name": "Microsoft Teams Phone", "threat": "Medium", "strategy": "Position as complementary rather than competitive, focus on carrier-grade features"},
-        ],
-        "quality": "verified",
-        "sources": ["investors.att.com", "AT&T corporate website", "SEC filings"]
-    },
-
-    "NS Solutions Corporation": {
-        "company_name": "NS Solutions Corporation",
-        "industry": "IT Services / Systems Integration",
-        "hq": "Tokyo, Japan",
-        "employees": "5,000+",
-        "executives": [
-            {"name": "Kazuhiko Tamaoki", "title": "President & CEO", "dept": "Executive Leadership", "linkedin": "", "source": "NSSOL corporate website"},
-        ],
-        "org_overview": "NS Solutions Corporation (NSSOL) is a subsidiary of Nippon Steel Corporation, providing IT solutions including ERP, manufacturing systems, cloud services, and business process outsourcing. The company operates through divisions: Steelmaking System Solutions, Digital Solution & Consulting, and IT Service & Engineering. Under NSSOL 2030 Vision, the company is pursuing digital transformation services expansion beyond the steel industry. Key decision-making flows through the Executive Board with the President & CEO chairing.",
-        "pain_points": [
-            {"severity": "medium", "title": "Digital Transformation Beyond Core Steel Industry", "desc": "NSSOL is diversifying beyond steel industry IT services, creating demand for new platform capabilities and partnerships."},
-            {"severity": "medium", "title": "Cloud Migration Acceleration", "desc": "Japanese enterprises accelerating cloud adoption post-COVID, requiring updated service delivery platforms."},
-        ],
-        "competitors": [
-            {"name": "NTT Data", "threat": "High", "strategy": "Focus on deeper manufacturing expertise and Nippon Steel ecosystem integration"},
-            {"name": "Fujitsu", "threat": "Medium", "strategy": "Emphasize agility and specialized solutions vs. broad-portfolio approach"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["nssol.nipponsteel.com", "Yahoo Finance Japan", "GlobalData"]
-    },
-
-    "Telefonica UK Limited": {
-        "company_name": "Telefonica UK Limited (O2)",
-        "industry": "Telecommunications",
-        "hq": "Slough, United Kingdom",
-        "employees": "6,000+",
-        "executives": [
-            {"name": "Lutz Schuler", "title": "CEO - Virgin Media O2", "dept": "Executive Leadership", "linkedin": "lutzschuler", "source": "Virgin Media O2 corporate website"},
-            {"name": "Patricia Cobian", "title": "CFO (departing to BT)", "dept": "Finance", "linkedin": "", "source": "Virgin Media O2 press releases"},
-            {"name": "Jeff Dodds", "title": "COO - TV, Broadband & FMC", "dept": "Operations", "linkedin": "", "source": "O2 leadership page"},
-        ],
-        "org_overview": "Telefonica UK (O2) operates as part of the Virgin Media O2 joint venture (50:50 between Telefonica SA and Liberty Global). The combined entity is the UK's largest broadband and mobile provider. The CloudSense platform is used within the enterprise/B2B division for product catalog management and CPQ workflows. Technology decisions flow through the Group CTO function, while commercial relationships are managed by business unit leaders. Key expansion opportunity: 25% ARR growth projected.",
-        "pain_points": [
-            {"severity": "high", "title": "Network Integration Post-Merger", "desc": "Ongoing integration of Virgin Media and O2 networks creating complexity in BSS/OSS systems and vendor management."},
-            {"severity": "medium", "title": "5G Monetization", "desc": "Need to develop 5G-enabled enterprise services and IoT offerings requiring advanced product catalog and ordering capabilities."},
-        ],
-        "competitors": [
-            {"name": "Amdocs", "threat": "High", "strategy": "Emphasize cloud-native architecture and faster time-to-market vs. legacy BSS vendor"},
-            {"name": "Salesforce Industries", "threat": "Medium", "strategy": "Focus on telco-specific CPQ depth vs. generic CRM-based approach"},
-        ],
-        "quality": "verified",
-        "sources": ["news.virginmediao2.co.uk", "o2.co.uk", "BT press releases"]
-    },
-
-    "HCL TECHNOLOGIES UK LIMITED": {
-        "company_name": "HCL Technologies UK Limited",
-        "industry": "IT Services / Consulting",
-        "hq": "Noida, India (Global HQ) / London, UK (UK Operations)",
-        "employees": "220,000+ (global)",
-        "executives": [
-            {"name": "C. Vijayakumar", "title": "CEO & Managing Director", "dept": "Executive Leadership", "linkedin": "vijayakumar-c-hcl", "source": "HCLTech Annual Report 2025"},
-            {"name": "Vijay Guntur", "title": "CTO & Head of Ecosystems", "dept": "Technology", "linkedin": "", "source": "HCLTech leadership page"},
-            {"name": "Shiv Walia", "title": "CFO", "dept": "Finance", "linkedin": "", "source": "HCLTech leadership page"},
-            {"name": "Ashish Kumar Gupta", "title": "Chief Growth Officer, Europe & Africa", "dept": "Europe & Africa Growth", "linkedin": "", "source": "HCLTech leadership page"},
-        ],
-        "org_overview": "HCL Technologies is a global IT services company operating through IT & Business Services, Engineering & R&D Services, and HCLSoftware segments. The UK operation is a significant market with enterprise clients across BFSI, telecom, manufacturing, and public sector. CONFIRMED LOSS: HCL UK is churning the $2.08M NewNet contract. The decision likely driven by internal platform consolidation and cost optimization. Win-back strategy should focus on differentiated capabilities not available through in-house development.",
-        "pain_points": [
-            {"severity": "critical", "title": "Confirmed Contract Loss - $2.08M ARR", "desc": "CONFIRMED LOSS: HCL UK has decided not to renew the NewNet platform contract. Need to understand competitive replacement and maintain relationship for future opportunities."},
-            {"severity": "high", "title": "AI-First Transformation", "desc": "HCLTech is undergoing major AI-first transformation with GenAI investments across service delivery. Platform decisions increasingly driven by AI capability requirements."},
-        ],
-        "competitors": [
-            {"name": "Internal Development", "threat": "High", "strategy": "Demonstrate TCO advantages of platform vs. build, emphasize ongoing innovation velocity"},
-            {"name": "Infosys", "threat": "Medium", "strategy": "Competitive differentiation through specialized domain expertise"},
-        ],
-        "quality": "verified",
-        "sources": ["hcltech.com", "HCLTech Annual Report 2025", "LinkedIn"]
-    },
-
-    "Telstra Corporation Limited": {
-        "company_name": "Telstra Corporation Limited",
-        "industry": "Telecommunications",
-        "hq": "Melbourne, Australia",
-        "employees": "30,000+",
-        "executives": [
-            {"name": "Vicki Brady", "title": "CEO & Managing Director", "dept": "Executive Leadership", "linkedin": "vicki-brady", "source": "Telstra corporate website"},
-            {"name": "Steven Worrall", "title": "CEO - Telstra InfraCo", "dept": "Infrastructure", "linkedin": "", "source": "Telstra corporate website"},
-        ],
-        "org_overview": "Telstra is Australia's largest telecommunications company operating through Consumer & Small Business, Enterprise, and InfraCo Fixed/InfraCo Towers divisions. The CloudSense platform serves the Enterprise division for product catalog management and order orchestration. Strong expansion opportunity with 25% ARR growth projected. Telstra's T25 strategy focuses on digital transformation, simplification, and growth in enterprise services.",
-        "pain_points": [
-            {"severity": "medium", "title": "Enterprise Digital Transformation", "desc": "Telstra investing heavily in enterprise digital services including IoT, security, and cloud. Requires flexible product catalog and CPQ capabilities."},
-            {"severity": "medium", "title": "Network Simplification Program", "desc": "Major program to retire legacy network products and simplify portfolio, creating need for advanced product lifecycle management."},
-        ],
-        "competitors": [
-            {"name": "Salesforce Industries", "threat": "Medium", "strategy": "Leverage existing integration depth and telco-specific features"},
-            {"name": "Amdocs", "threat": "Low", "strategy": "Focus on cloud-native agility vs. traditional BSS approach"},
-        ],
-        "quality": "verified",
-        "sources": ["telstra.com.au", "Telstra investor presentations"]
-    },
-
-    "Vodafone Netherlands": {
-        "company_name": "VodafoneZiggo (Vodafone Netherlands)",
-        "industry": "Telecommunications",
-        "hq": "Utrecht, Netherlands",
-        "employees": "5,000+",
-        "executives": [
-            {"name": "Stephen van Rooyen", "title": "CEO", "dept": "Executive Leadership", "linkedin": "stephen-van-rooyen", "source": "VodafoneZiggo corporate website"},
-            {"name": "Thomas Helbo", "title": "CTO", "dept": "Technology", "linkedin": "", "source": "VodafoneZiggo press release"},
-            {"name": "Ritchy Drost", "title": "CFO", "dept": "Finance", "linkedin": "", "source": "VodafoneZiggo corporate website"},
-            {"name": "John van Vianen", "title": "Executive Director Business Market", "dept": "Business Market", "linkedin": "", "source": "VodafoneZiggo corporate website"},
-            {"name": "Bo Bude", "title": "Executive Director Strategy & Partnerships", "dept": "Strategy", "linkedin": "", "source": "VodafoneZiggo corporate website"},
-        ],
-        "org_overview": "VodafoneZiggo is a joint venture between Vodafone and Liberty Global, the largest cable operator in the Netherlands offering broadband, TV, mobile, and business services. New CEO Stephen van Rooyen (from Sky UK) joined Sept 2024, bringing fresh strategic direction. CTO Thomas Helbo leads technology transformation. The platform serves both consumer and business divisions. Key expansion opportunity: 25% ARR growth projected to $2.3M.",
-        "pain_points": [
-            {"severity": "high", "title": "New CEO Strategic Review", "desc": "New CEO Stephen van Rooyen (Sept 2024) likely conducting vendor and technology stack review. Critical to demonstrate value quickly."},
-            {"severity": "medium", "title": "Network Convergence", "desc": "Converging cable (Ziggo) and mobile (Vodafone) networks requires unified product management and ordering capabilities."},
-        ],
-        "competitors": [
-            {"name": "Salesforce Industries", "threat": "Medium", "strategy": "Emphasize telco-specific CPQ depth and existing integration"},
-            {"name": "Cerillion", "threat": "Low", "strategy": "Focus on enterprise-grade scale and ecosystem breadth"},
-        ],
-        "quality": "verified",
-        "sources": ["vodafoneziggo.nl", "VodafoneZiggo press releases", "Liberty Global"]
-    },
-
-    "Spotify": {
-        "company_name": "Spotify Technology S.A.",
-        "industry": "Digital Media / Music Streaming",
-        "hq": "Stockholm, Sweden",
-        "employees": "9,000+",
-        "executives": [
-            {"name": "Alex Norstrom", "title": "Co-CEO (from Jan 2026)", "dept": "Executive Leadership", "linkedin": "alexnorstrom", "source": "Spotify Newsroom"},
-            {"name": "Gustav Soderstrom", "title": "Co-CEO (from Jan 2026)", "dept": "Executive Leadership", "linkedin": "gustavsoderstrom", "source": "Spotify Newsroom"},
-            {"name": "Daniel Ek", "title": "Executive Chairman (from Jan 2026)", "dept": "Board", "linkedin": "danielek", "source": "Spotify Newsroom"},
-            {"name": "Christian Luiga", "title": "CFO", "dept": "Finance", "linkedin": "", "source": "Spotify Newsroom"},
-        ],
-        "org_overview": "Spotify is the world's largest audio streaming platform with 600M+ monthly active users. The company underwent a major leadership transition in January 2026, with founder Daniel Ek moving to Executive Chairman and Alex Norstrom and Gustav Soderstrom becoming Co-CEOs. Spotify uses CloudSense for enterprise content licensing and distribution management. The company's 2026 strategy emphasizes 'raising ambition' with record MAU growth and expanding into video, audiobooks, and advertising.",
-        "pain_points": [
-            {"severity": "medium", "title": "Leadership Transition Period", "desc": "Major leadership change (Jan 2026) with co-CEO model. Relationship continuity and alignment with new leadership structure is critical."},
-            {"severity": "medium", "title": "Content Licensing Complexity", "desc": "Expanding into audiobooks, podcasts, and video creating increasingly complex content licensing and rights management requirements."},
-        ],
-        "competitors": [
-            {"name": "Custom Internal Platform", "threat": "Medium", "strategy": "Emphasize speed of iteration and specialized content management capabilities"},
-            {"name": "SAP/Oracle", "threat": "Low", "strategy": "Focus on media-specific workflow advantages over generic ERP modules"},
-        ],
-        "quality": "verified",
-        "sources": ["newsroom.spotify.com", "Spotify investor relations", "Variety"]
-    },
-
-    "British Telecommunications plc": {
-        "company_name": "BT Group / British Telecommunications plc",
-        "industry": "Telecommunications",
-        "hq": "London, United Kingdom",
-        "employees": "100,000+",
-        "executives": [
-            {"name": "Allison Kirkby", "title": "CEO", "dept": "Executive Leadership", "linkedin": "allisonkirkby", "source": "BT Group corporate website"},
-            {"name": "Patricia Cobian", "title": "Group CFO (from Summer 2025)", "dept": "Finance", "linkedin": "", "source": "BT Group press release"},
-            {"name": "Claire Gillies", "title": "CEO - Consumer", "dept": "Consumer Division", "linkedin": "", "source": "BT Group corporate website"},
-            {"name": "Jon James", "title": "CEO - Business", "dept": "Business Division", "linkedin": "", "source": "BT Group corporate website"},
-        ],
-        "org_overview": "BT Group operates through Consumer (broadband, TV, mobile), Business (enterprise services, networking), and Openreach (UK network infrastructure) divisions. CONFIRMED LOSS: BT has decided not to renew the $1.4M ARR CloudSense contract. The decision driven by vendor consolidation under CEO Allison Kirkby's cost transformation program targeting GBP 3B savings. Patricia Cobian replaces Simon Lowth as CFO. Win-back strategy should focus on Openreach fiber rollout program where order management needs are growing.",
-        "pain_points": [
-            {"severity": "critical", "title": "Confirmed Loss - $1.4M ARR Churning", "desc": "CONFIRMED LOSS: BT deciding not to renew CloudSense platform. Driven by cost transformation and vendor consolidation. Need win-back strategy focused on fiber rollout."},
-            {"severity": "high", "title": "Cost Transformation Program", "desc": "CEO Allison Kirkby executing major cost reduction program targeting GBP 3B savings. All vendor contracts under review."},
-            {"severity": "medium", "title": "FTTP Fiber Rollout", "desc": "Massive investment in full-fiber (FTTP) network. Growing need for order management and provisioning automation."},
-        ],
-        "competitors": [
-            {"name": "Salesforce Industries (Vlocity)", "threat": "High", "strategy": "Counter with migration complexity arguments and total cost of ownership"},
-            {"name": "Amdocs", "threat": "High", "strategy": "Emphasize modern cloud-native architecture vs. legacy BSS"},
-            {"name": "Netcracker (NEC)", "threat": "Medium", "strategy": "Focus on agility and time-to-market advantages"},
-        ],
-        "quality": "verified",
-        "sources": ["bt.com", "BT Group press releases", "the-cfo.io"]
-    },
-
-    "Maxis Broadband Sdn Bhd": {
-        "company_name": "Maxis Communications Berhad",
-        "industry": "Telecommunications",
-        "hq": "Kuala Lumpur, Malaysia",
-        "employees": "3,000+",
-        "executives": [
-            {"name": "Goh Seow Eng", "title": "CEO", "dept": "Executive Leadership", "linkedin": "gohseoweng", "source": "Maxis corporate website"},
-            {"name": "May Ching", "title": "Chief Digital & IT Officer", "dept": "Digital & IT", "linkedin": "", "source": "Maxis corporate website"},
-            {"name": "CS Yap (Chee Sun)", "title": "Chief Network Officer", "dept": "Networks", "linkedin": "", "source": "Maxis corporate website"},
-        ],
-        "org_overview": "Maxis is Malaysia's leading converged communications provider offering mobile, fixed broadband, enterprise, and digital services. CEO Goh Seow Eng (from Dec 2022, ex-AIS Thailand and Singtel) is driving digital transformation. The CloudSense platform serves the enterprise and consumer product management needs. Chairman Tan Sri Mokhzani bin Mahathir. Key expansion opportunity: 25% ARR growth projected to $1.7M.",
-        "pain_points": [
-            {"severity": "medium", "title": "5G Enterprise Services", "desc": "Maxis expanding 5G enterprise services requiring advanced product catalog and pricing capabilities."},
-            {"severity": "medium", "title": "Digital Transformation", "desc": "New CEO driving comprehensive digital transformation across all business units."},
-        ],
-        "competitors": [
-            {"name": "Amdocs", "threat": "Medium", "strategy": "Leverage existing integration and cloud-native advantages"},
-            {"name": "Huawei BSS", "threat": "Medium", "strategy": "Emphasize vendor-neutral approach and ecosystem flexibility"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["maxis.com.my", "maxis.listedcompany.com", "theedgemalaysia.com"]
-    },
-
-    "One Albania": {
-        "company_name": "One Albania (One Telecommunications)",
-        "industry": "Telecommunications",
-        "hq": "Tirana, Albania",
-        "employees": "1,000+",
-        "executives": [
-            {"name": "Barna Kutvolgyi", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Albanian Daily News, SeeNews"},
-            {"name": "Tamas Tabori", "title": "Chairman of the Board", "dept": "Board", "linkedin": "", "source": "Albanian Daily News"},
-        ],
-        "org_overview": "One Albania is the result of the merger between ONE Telecommunications and ALBtelecom, creating the largest converged telecom operator in Albania. New CEO Barna Kutvolgyi (30+ years telecom experience) was recently appointed, succeeding Tamas Tabori who moved to Chairman. CONFIRMED LOSS: One Albania is churning the $1.62M STL contract. The leadership transition may present a window for relationship reset, but the confirmed loss status indicates the platform decision has been made.",
-        "pain_points": [
-            {"severity": "critical", "title": "Confirmed Loss - $1.62M ARR Churning", "desc": "CONFIRMED LOSS: One Albania will not renew. New CEO may be open to future engagement but current contract is lost."},
-            {"severity": "high", "title": "Post-Merger Integration", "desc": "Ongoing integration of ONE Telecommunications and ALBtelecom networks and systems."},
-        ],
-        "competitors": [
-            {"name": "Ericsson BSS", "threat": "High", "strategy": "Monitor post-merger technology decisions for future win-back opportunities"},
-            {"name": "Huawei", "threat": "Medium", "strategy": "Maintain relationship for potential re-engagement under new CEO"},
-        ],
-        "quality": "verified",
-        "sources": ["connectingregion.com", "albaniandailynews.com", "seenews.com"]
-    },
-
-    "Liquid Telecom": {
-        "company_name": "Liquid Intelligent Technologies",
-        "industry": "Telecommunications / Cloud Services",
-        "hq": "Nairobi, Kenya (Operations) / London, UK (HQ)",
-        "employees": "2,000+",
-        "executives": [
-            {"name": "Shahzad Manzoor", "title": "Chief Technical Officer", "dept": "Technology", "linkedin": "", "source": "liquid.tech corporate website"},
-        ],
-        "org_overview": "Liquid Intelligent Technologies (formerly Liquid Telecom) is Africa's largest independent fibre and cloud infrastructure provider, operating across 13 countries with one of the continent's largest fiber networks. The company has rebranded to reflect its expansion beyond pure telecom into cloud, cybersecurity, and digital services. Operates through regional subsidiaries with local CEOs in each country. Key expansion opportunity: 25% ARR growth projected to $1.34M.",
-        "pain_points": [
-            {"severity": "medium", "title": "Pan-African Digital Infrastructure Expansion", "desc": "Rapid expansion of fiber and cloud services across Africa requires scalable product management and order orchestration."},
-            {"severity": "medium", "title": "Enterprise Cloud Services Growth", "desc": "Building enterprise cloud and cybersecurity services portfolio requiring sophisticated product configuration capabilities."},
-        ],
-        "competitors": [
-            {"name": "Africa Data Centres", "threat": "Low", "strategy": "Differentiate through converged infrastructure + connectivity offering"},
-            {"name": "MTN Business", "threat": "Medium", "strategy": "Focus on infrastructure-first approach vs. mobile-first competitors"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["liquid.tech", "Crunchbase", "The Org"]
-    },
-
-    "Centrica Services Ltd": {
-        "company_name": "Centrica plc (British Gas Parent)",
-        "industry": "Energy / Utilities",
-        "hq": "Windsor, United Kingdom",
-        "employees": "20,000+",
-        "executives": [
-            {"name": "Chris O'Shea", "title": "Group Chief Executive", "dept": "Executive Leadership", "linkedin": "chrisoshea", "source": "Centrica corporate website"},
-            {"name": "Kevin O'Byrne", "title": "Chairman", "dept": "Board", "linkedin": "", "source": "Centrica corporate website"},
-            {"name": "Jill Shedden", "title": "Chief People Officer", "dept": "HR", "linkedin": "", "source": "Centrica corporate website"},
-        ],
-        "org_overview": "Centrica is a leading energy services company operating through British Gas (residential), Centrica Business Solutions (commercial/industrial), and Bord Gais Energy (Ireland). The CloudSense platform likely serves the product catalog and CPQ needs for energy product bundling (gas, electricity, boiler services, home insurance). CEO Chris O'Shea joined as CFO in 2018 and became CEO in 2020. The company is navigating the energy transition with investments in hydrogen, EV charging, and smart home solutions.",
-        "pain_points": [
-            {"severity": "medium", "title": "Energy Transition Product Complexity", "desc": "Expanding into EV charging, solar, heat pumps, and energy storage creates complex product bundling and pricing requirements."},
-            {"severity": "medium", "title": "Regulatory Compliance", "desc": "UK energy market regulation (Ofgem) requiring transparent pricing and product disclosure."},
-        ],
-        "competitors": [
-            {"name": "Salesforce Energy & Utilities Cloud", "threat": "Medium", "strategy": "Emphasize energy-specific product configuration depth"},
-            {"name": "SAP Utilities", "threat": "Low", "strategy": "Focus on agility and speed of product launch vs. ERP-heavy approach"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["centrica.com", "Wikipedia", "Craft.co"]
-    },
-
-    # ========================================================================
-    # TIER 2 - HIGH VALUE ACCOUNTS ($500K - $2M ARR)
-    # ========================================================================
-
-    "StarHub Ltd": {
-        "company_name": "StarHub Ltd",
-        "industry": "Telecommunications",
-        "hq": "Singapore",
-        "employees": "3,000+",
-        "executives": [
-            {"name": "Nikhil Eapen", "title": "CEO", "dept": "Executive Leadership", "linkedin": "nikhil-eapen", "source": "StarHub corporate website"},
-            {"name": "Ayush Sharma", "title": "CTO - Transformation & Product", "dept": "Technology", "linkedin": "", "source": "StarHub press release"},
-            {"name": "Chong Siew Loong", "title": "CTO - Network Operations", "dept": "Network Operations", "linkedin": "", "source": "StarHub corporate website"},
-            {"name": "Adam Christopher Seyer", "title": "CIO", "dept": "Information Technology", "linkedin": "", "source": "StarHub press release"},
-        ],
-        "org_overview": "StarHub is Singapore's second-largest telecom operator offering mobile, broadband, TV, and enterprise services. The company has two CTOs: one for Transformation & Product (Ayush Sharma, ex-Rakuten) and one for Network Operations (Chong Siew Loong). New CIO Adam Seyer joined July 2024. Key expansion opportunity: 25% ARR growth projected.",
-        "pain_points": [
-            {"severity": "medium", "title": "5G Monetization", "desc": "Rolling out 5G services and need to develop enterprise and consumer 5G product offerings."},
-            {"severity": "medium", "title": "Digital Transformation", "desc": "Ongoing digital transformation requiring modernized BSS/OSS stack."},
-        ],
-        "competitors": [
-            {"name": "Amdocs", "threat": "Medium", "strategy": "Leverage cloud-native advantages and faster deployment cycles"},
-            {"name": "CSG Systems", "threat": "Low", "strategy": "Focus on CPQ/catalog depth vs. billing-centric approach"},
-        ],
-        "quality": "verified",
-        "sources": ["corporate.starhub.com", "itnews.asia", "StarHub press releases"]
-    },
-
-    "Elisa Oyj": {
-        "company_name": "Elisa Oyj",
-        "industry": "Telecommunications",
-        "hq": "Helsinki, Finland",
-        "employees": "5,000+",
-        "executives": [
-            {"name": "Topi Manner", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Elisa corporate website"},
-            {"name": "Jussi Nyfelt", "title": "CTO", "dept": "Technology", "linkedin": "", "source": "Elisa corporate website"},
-            {"name": "Jari Kinnunen", "title": "CFO", "dept": "Finance", "linkedin": "", "source": "Elisa corporate website"},
-            {"name": "Ville Rautio", "title": "CTO (IT)", "dept": "Information Technology", "linkedin": "", "source": "Elisa corporate website"},
-        ],
-        "org_overview": "Elisa is Finland's leading telecom operator offering mobile, broadband, and digital services. CEO Topi Manner leads the company. The company has dual CTO roles: Jussi Nyfelt for network technology and Ville Rautio for IT. New CFO Jari Kinnunen (ex-Finnair CEO) joined in 2025. Key expansion opportunity: 25% ARR growth projected.",
-        "pain_points": [
-            {"severity": "medium", "title": "AI and Automation Focus", "desc": "Elisa is a recognized leader in telecom AI/automation. Platform solutions must support AI-driven operations."},
-            {"severity": "low", "title": "Nordic Market Consolidation", "desc": "Potential M&A activity in Nordic telecom markets requiring flexible platform capabilities."},
-        ],
-        "competitors": [
-            {"name": "Nokia BSS", "threat": "Medium", "strategy": "Emphasize multi-vendor interoperability and cloud-native architecture"},
-            {"name": "Ericsson", "threat": "Low", "strategy": "Focus on commercial/BSS expertise vs. network-centric approach"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["elisa.com", "Simply Wall St", "Cision News"]
-    },
-
-    "Abbott Laboratories": {
-        "company_name": "Abbott Laboratories",
-        "industry": "Healthcare / Medical Devices",
-        "hq": "Abbott Park, Illinois, USA",
-        "employees": "115,000+",
-        "executives": [
-            {"name": "Robert B. Ford", "title": "Chairman & CEO", "dept": "Executive Leadership", "linkedin": "robert-ford", "source": "Abbott corporate website"},
-            {"name": "Phil Boudreau", "title": "SVP Finance & CFO", "dept": "Finance", "linkedin": "", "source": "Abbott corporate website"},
-            {"name": "Sabina Ewing", "title": "SVP Business & Technology Services", "dept": "Technology Services", "linkedin": "", "source": "Abbott corporate website"},
-        ],
-        "org_overview": "Abbott is a global healthcare company operating through Diagnostics, Medical Devices, Nutritional Products, and Established Pharmaceuticals segments. The company serves 160+ countries. The CloudSense platform likely supports product catalog management for Abbott's complex medical device and diagnostic product portfolios. Key expansion opportunity: 25% ARR growth projected.",
-        "pain_points": [
-            {"severity": "medium", "title": "Medical Device Product Complexity", "desc": "Complex product configurations across diagnostics, medical devices requiring sophisticated CPQ capabilities with regulatory compliance."},
-            {"severity": "medium", "title": "Digital Health Platform Expansion", "desc": "Growing connected health device portfolio (FreeStyle Libre, etc.) requiring digital-first product management."},
-        ],
-        "competitors": [
-            {"name": "Salesforce Health Cloud", "threat": "Medium", "strategy": "Emphasize medical device-specific configuration complexity handling"},
-            {"name": "SAP", "threat": "Low", "strategy": "Focus on agility and healthcare-specific product lifecycle management"},
-        ],
-        "quality": "verified",
-        "sources": ["abbott.com", "SEC filings", "Morningstar"]
-    },
-
-    "Foxtel Management Pty Limited": {
-        "company_name": "Foxtel Group",
-        "industry": "Media / Pay Television",
-        "hq": "Sydney, Australia",
-        "employees": "2,000+",
-        "executives": [
-            {"name": "Patrick Delany", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Foxtel Group website"},
-            {"name": "Paul Meller", "title": "CTO", "dept": "Technology", "linkedin": "", "source": "Foxtel Group website"},
-            {"name": "Hilary Perchard", "title": "CEO - Foxtel, Kayo & Binge", "dept": "Streaming", "linkedin": "", "source": "IF Magazine"},
-            {"name": "Mark Frain", "title": "CEO - Foxtel Media (Advertising)", "dept": "Advertising", "linkedin": "", "source": "Foxtel Group website"},
-        ],
-        "org_overview": "Foxtel Group is Australia's leading pay-TV and streaming company, now owned by global sports streamer DAZN. Operating Foxtel (traditional pay-TV), Kayo Sports (sports streaming), and Binge (entertainment streaming). Recent restructure under DAZN ownership created new CEO roles for streaming and advertising businesses. CTO Paul Meller (ex-Google, Dow Jones) joined May 2024.",
-        "pain_points": [
-            {"severity": "high", "title": "DAZN Ownership Transition", "desc": "Major restructure under new DAZN ownership. Technology stack review and integration with DAZN global platform likely."},
-            {"severity": "medium", "title": "Streaming Platform Competition", "desc": "Competing with Netflix, Disney+, Amazon Prime in Australian streaming market."},
-        ],
-        "competitors": [
-            {"name": "DAZN Global Platform", "threat": "High", "strategy": "Position as complementary local solution for Australian market specifics"},
-            {"name": "Custom Internal Development", "threat": "Medium", "strategy": "Emphasize speed of deployment vs. build approach"},
-        ],
-        "quality": "verified",
-        "sources": ["foxtelgroup.com.au", "mediaweek.com.au", "c21media.net"]
-    },
-
-    "Virgin Media Limited": {
-        "company_name": "Virgin Media O2 (Virgin Media Limited)",
-        "industry": "Telecommunications / Media",
-        "hq": "Reading, United Kingdom",
-        "employees": "15,000+",
-        "executives": [
-            {"name": "Lutz Schuler", "title": "CEO", "dept": "Executive Leadership", "linkedin": "lutzschuler", "source": "Virgin Media O2 corporate website"},
-        ],
-        "org_overview": "Virgin Media O2 is the UK's largest broadband and mobile provider, formed from the 50:50 joint venture between Liberty Global and Telefonica. Operates fixed broadband (cable/fiber), mobile (O2 brand), and TV services. CFO Patricia Cobian departing for BT Group in 2025. The company is investing heavily in network upgrades and convergence of its cable and mobile networks.",
-        "pain_points": [
-            {"severity": "high", "title": "CFO Departure & Leadership Change", "desc": "CFO Patricia Cobian leaving for BT Group. New financial leadership may review vendor contracts."},
-            {"severity": "medium", "title": "Fixed-Mobile Convergence", "desc": "Ongoing convergence of Virgin Media cable and O2 mobile platforms requires unified product management."},
-        ],
-        "competitors": [
-            {"name": "Amdocs", "threat": "Medium", "strategy": "Emphasize cloud-native flexibility and faster feature delivery"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["news.virginmediao2.co.uk", "Wikipedia", "Company filings"]
-    },
-
-    "Proximus NV": {
-        "company_name": "Proximus NV/SA",
-        "industry": "Telecommunications",
-        "hq": "Brussels, Belgium",
-        "employees": "11,000+",
-        "executives": [
-            {"name": "Stijn Bijnens", "title": "CEO (from Sept 2025)", "dept": "Executive Leadership", "linkedin": "", "source": "Proximus press release"},
-            {"name": "Geert Standaert", "title": "CTO", "dept": "Technology", "linkedin": "", "source": "Proximus corporate website"},
-            {"name": "Seckin Arikan", "title": "Head of Global Activities", "dept": "International", "linkedin": "", "source": "Proximus press release"},
-        ],
-        "org_overview": "Proximus is Belgium's leading telecom operator offering fixed, mobile, internet, and TV services. New CEO Stijn Bijnens (ex-Cegeka CEO) succeeded Guillaume Boutin (who joined Vodafone) in September 2025. CTO Geert Standaert leads technology. Recent leadership reorganization in January 2026 to strengthen customer focus. Proximus International operations led by Seckin Arikan.",
-        "pain_points": [
-            {"severity": "high", "title": "New CEO Strategic Direction", "desc": "New CEO Stijn Bijnens (ex-Cegeka, Sept 2025) likely conducting technology and vendor review. Need to demonstrate value to new leadership."},
-            {"severity": "medium", "title": "Belgian Market Competition", "desc": "Competitive pressure from Telenet/Liberty Global and Orange Belgium in Belgian market."},
-        ],
-        "competitors": [
-            {"name": "Ericsson BSS", "threat": "Medium", "strategy": "Emphasize agility and cloud-native advantages"},
-            {"name": "Nokia BSS", "threat": "Low", "strategy": "Focus on product management depth vs. network-centric approach"},
-        ],
-        "quality": "verified",
-        "sources": ["proximus.com", "Proximus press releases", "telecomlead.com"]
-    },
-
-    "Vodafone GmbH": {
-        "company_name": "Vodafone Germany GmbH",
-        "industry": "Telecommunications",
-        "hq": "Dusseldorf, Germany",
-        "employees": "15,000+",
-        "executives": [
-            {"name": "Ahmed Shelbaya", "title": "CEO European Markets & Executive Chair Germany", "dept": "Executive Leadership", "linkedin": "", "source": "Vodafone Group website"},
-            {"name": "Fabrizio Giuseppe Rocchio", "title": "Managing Director & Network Director (from Feb 2026)", "dept": "Networks/Technology", "linkedin": "", "source": "broadbandtvnews.com"},
-            {"name": "Margherita Della Valle", "title": "Group CEO (Vodafone)", "dept": "Group Executive", "linkedin": "", "source": "Vodafone Group website"},
-            {"name": "Scott Petty", "title": "Group CTO (Vodafone)", "dept": "Group Technology", "linkedin": "", "source": "Vodafone Group website"},
-        ],
-        "org_overview": "Vodafone Germany is the largest Vodafone OpCo in Europe by revenue, offering mobile, fixed broadband (cable/fiber), and enterprise services. Recent technology leadership change with Fabrizio Rocchio replacing Tanja Richter as Network Director from February 2026. Group CEO Margherita Della Valle and Group CTO Scott Petty provide corporate-level technology direction.",
-        "pain_points": [
-            {"severity": "high", "title": "Network Leadership Transition", "desc": "Technology/Network Director transition (Richter to Rocchio, Feb 2026) creates vendor relationship uncertainty."},
-            {"severity": "medium", "title": "Cable-Mobile Convergence", "desc": "Integrating former Kabel Deutschland (cable) with Vodafone mobile network for converged services."},
-        ],
-        "competitors": [
-            {"name": "Ericsson BSS", "threat": "High", "strategy": "Leverage existing integration and Vodafone Group relationships"},
-            {"name": "Amdocs", "threat": "Medium", "strategy": "Focus on cloud-native agility vs. legacy BSS"},
-        ],
-        "quality": "verified",
-        "sources": ["vodafone.com", "broadbandtvnews.com", "telcotitans.com"]
-    },
-
-    "DPG Media BV": {
-        "company_name": "DPG Media BV",
-        "industry": "Media / Publishing",
-        "hq": "Antwerp, Belgium / Amsterdam, Netherlands",
-        "employees": "6,000+",
-        "executives": [
-            {"name": "Erik Roddenhof", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "DPG Media corporate"},
-            {"name": "Frank Mathys", "title": "CTO", "dept": "Technology", "linkedin": "", "source": "DPG Media corporate"},
-            {"name": "Piet Vroman", "title": "CFO", "dept": "Finance", "linkedin": "", "source": "DPG Media corporate"},
-        ],
-        "org_overview": "DPG Media is the largest media company in Belgium and the Netherlands, publishing newspapers (De Volkskrant, AD), magazines, and operating digital platforms. Acquired RTL Nederland for 1.1B EUR in July 2025. Restructured into three business units: Audio & Video, News Media & Magazines, and Online Services. CONFIRMED LOSS: DPG Media churning the $359K CloudSense contract.",
-        "pain_points": [
-            {"severity": "critical", "title": "Confirmed Loss - $359K ARR Churning", "desc": "CONFIRMED LOSS: DPG Media will not renew. Possible RTL Nederland integration driving platform changes."},
-            {"severity": "high", "title": "RTL Nederland Integration", "desc": "Major acquisition (1.1B EUR) of RTL Nederland requiring systems integration and platform consolidation."},
-        ],
-        "competitors": [
-            {"name": "Internal Development", "threat": "High", "strategy": "Monitor post-RTL integration for future re-engagement opportunities"},
-        ],
-        "quality": "verified",
-        "sources": ["Wikipedia", "theofficialboard.com", "marketingreport.nl"]
-    },
-
-    "Nokia Solutions and Networks Oy": {
-        "company_name": "Nokia Corporation",
-        "industry": "Telecommunications Equipment",
-        "hq": "Espoo, Finland",
-        "employees": "87,000+",
-        "executives": [
-            {"name": "Justin Hotard", "title": "President & CEO (from April 2025)", "dept": "Executive Leadership", "linkedin": "justinhotard", "source": "Nokia corporate website"},
-            {"name": "Pallavi Mahajan", "title": "Chief Technology & AI Officer", "dept": "Technology & AI", "linkedin": "", "source": "Nokia press release"},
-            {"name": "David Heard", "title": "President - Network Infrastructure", "dept": "Network Infrastructure", "linkedin": "", "source": "Nokia press release"},
-        ],
-        "org_overview": "Nokia is a global B2B technology company providing network infrastructure, cloud and network services, and licensing. New CEO Justin Hotard (ex-Intel, HPE) replaced Pekka Lundmark in April 2025. Nokia is restructuring around AI/technology and corporate development with new C-suite roles created (Chief Technology & AI Officer, Chief Strategy & Corporate Development Officer).",
-        "pain_points": [
-            {"severity": "high", "title": "New CEO Strategic Transformation", "desc": "New CEO Justin Hotard (April 2025) driving AI-first strategy and organizational restructuring."},
-            {"severity": "medium", "title": "Network Infrastructure Market Pressure", "desc": "Intense competition with Ericsson and Huawei in network equipment market."},
-        ],
-        "competitors": [
-            {"name": "Ericsson", "threat": "High", "strategy": "Not directly competitive - focus on complementary platform value"},
-            {"name": "Huawei", "threat": "Medium", "strategy": "Western market differentiation"},
-        ],
-        "quality": "verified",
-        "sources": ["nokia.com", "investing.com", "Euronews"]
-    },
-
-    "Ericsson Telecommunications, Inc.": {
-        "company_name": "Ericsson (Telefonaktiebolaget LM Ericsson)",
-        "industry": "Telecommunications Equipment",
-        "hq": "Stockholm, Sweden",
-        "employees": "100,000+",
-        "executives": [
-            {"name": "Borje Ekholm", "title": "President & CEO", "dept": "Executive Leadership", "linkedin": "borjeekholm", "source": "Ericsson corporate website"},
-            {"name": "Erik Ekudden", "title": "CTO & SVP", "dept": "Technology", "linkedin": "", "source": "Ericsson corporate website"},
-            {"name": "Chris Houghton", "title": "SVP & COO", "dept": "Operations", "linkedin": "", "source": "Ericsson corporate website"},
-        ],
-        "org_overview": "Ericsson is a leading provider of telecommunications equipment and services globally, operating through Networks, Cloud Software and Services, Enterprise, and Other segments. CEO Borje Ekholm leads the company with CTO Erik Ekudden directing technology strategy. The company is focused on 5G deployment, Open RAN, and enterprise digitalization.",
-        "pain_points": [
-            {"severity": "medium", "title": "Enterprise Market Expansion", "desc": "Ericsson expanding beyond traditional telco equipment into enterprise IoT and private 5G, requiring new go-to-market capabilities."},
-        ],
-        "competitors": [
-            {"name": "Nokia", "threat": "High", "strategy": "Focus on partnership value rather than competition"},
-            {"name": "Huawei", "threat": "Medium", "strategy": "Western market security advantages"},
-        ],
-        "quality": "verified",
-        "sources": ["ericsson.com", "Ericsson press releases", "GlobalData"]
-    },
-
-    "Vodafone Egypt": {
-        "company_name": "Vodafone Egypt Telecommunications S.A.E.",
-        "industry": "Telecommunications",
-        "hq": "Cairo, Egypt",
-        "employees": "8,000+",
-        "executives": [
-            {"name": "Mohamed Abdallah", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Vodafone Egypt website"},
-            {"name": "Catalin Buliga", "title": "CTO", "dept": "Technology", "linkedin": "", "source": "Vodafone Egypt website"},
-            {"name": "Rasha El-Azhary", "title": "CFO", "dept": "Finance", "linkedin": "", "source": "Vodafone Egypt website"},
-            {"name": "Ayman El-Saadany", "title": "Chief External Affairs Officer", "dept": "External Affairs", "linkedin": "", "source": "techafricanews.com"},
-        ],
-        "org_overview": "Vodafone Egypt is the largest mobile operator in Egypt by subscriber count, now operating under the Vodacom Group umbrella. CEO Mohamed Abdallah also oversees operations in DRC, Lesotho, Mozambique, and Tanzania. CTO Catalin Buliga (34 years telecom experience) joined Dec 2022.",
-        "pain_points": [
-            {"severity": "medium", "title": "Market Competition in Egypt", "desc": "Competitive pressure from Orange Egypt and Etisalat Misr (now e&) in Egyptian mobile market."},
-            {"severity": "medium", "title": "Digital Financial Services Growth", "desc": "Expanding mobile money and digital financial services requiring product and pricing agility."},
-        ],
-        "competitors": [
-            {"name": "Huawei BSS", "threat": "Medium", "strategy": "Emphasize vendor diversity and cloud-native capabilities"},
-            {"name": "Ericsson BSS", "threat": "Medium", "strategy": "Focus on product management depth and faster time-to-market"},
-        ],
-        "quality": "verified",
-        "sources": ["web.vodafone.com.eg", "techafricanews.com", "followict.news"]
-    },
-
-    "CoreSite": {
-        "company_name": "CoreSite (An American Tower Company)",
-        "industry": "Data Centers / Colocation",
-        "hq": "Denver, Colorado, USA",
-        "employees": "1,000+",
-        "executives": [
-            {"name": "Juan Font", "title": "President & CEO", "dept": "Executive Leadership", "linkedin": "", "source": "CoreSite corporate website"},
-            {"name": "Anthony Hatzenbuehler", "title": "SVP Operations", "dept": "Operations", "linkedin": "", "source": "CoreSite corporate website"},
-            {"name": "Mark Jones", "title": "SVP & Chief Accounting Officer", "dept": "Finance", "linkedin": "", "source": "CoreSite corporate website"},
-        ],
-        "org_overview": "CoreSite is a leading US data center provider operating carrier- and cloud-neutral colocation facilities, now a subsidiary of American Tower Corporation (NYSE: AMT). CONFIRMED LOSS: CoreSite will not renew the $456K CloudSense contract. The company operates 25+ data centers across major US metros.",
-        "pain_points": [
-            {"severity": "critical", "title": "Confirmed Loss - $456K ARR Churning", "desc": "CONFIRMED LOSS: CoreSite has decided not to renew. May be related to American Tower integration and technology consolidation."},
-        ],
-        "competitors": [
-            {"name": "American Tower Global Platform", "threat": "High", "strategy": "Monitor for future opportunities as American Tower integration evolves"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["coresite.com", "Zippia", "PitchBook"]
-    },
-
-    "Thryv Australia Pty Ltd": {
-        "company_name": "Thryv Australia Pty Ltd",
-        "industry": "Business Services / SaaS",
-        "hq": "Sydney, Australia (AU) / Dallas, Texas (Global HQ)",
-        "employees": "500+ (Australia)",
-        "executives": [
-            {"name": "Elise Balsillie", "title": "Head of Thryv Australia & NZ", "dept": "Australia/NZ Operations", "linkedin": "", "source": "Thryv corporate website"},
-            {"name": "Joe Walsh", "title": "Chairman & CEO (Global)", "dept": "Global Executive Leadership", "linkedin": "", "source": "Thryv corporate website"},
-            {"name": "Paul Rouse", "title": "CFO, EVP & Treasurer (Global)", "dept": "Global Finance", "linkedin": "", "source": "Thryv corporate website"},
-        ],
-        "org_overview": "Thryv Australia is the local subsidiary of US-based Thryv Holdings (NASDAQ: THRY), providing SaaS solutions for small and medium businesses and digital marketing services. CONFIRMED LOSS: Thryv Australia churning the $568K CloudSense contract. The company has been transitioning from legacy print directories to digital SaaS platform.",
-        "pain_points": [
-            {"severity": "critical", "title": "Confirmed Loss - $568K ARR Churning", "desc": "CONFIRMED LOSS: Thryv Australia will not renew. Likely driven by platform consolidation and transition to internal SaaS capabilities."},
-        ],
-        "competitors": [
-            {"name": "Internal Thryv SaaS Platform", "threat": "High", "strategy": "Company building its own SMB SaaS platform, replacing external vendors"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["thryv.com", "Crunchbase", "PitchBook"]
-    },
-
-    "PropertyGuru Pte Ltd": {
-        "company_name": "PropertyGuru Group Limited",
-        "industry": "PropTech / Online Marketplace",
-        "hq": "Singapore",
-        "employees": "1,500+",
-        "executives": [
-            {"name": "Lewis Ng", "title": "CEO (from March 2025)", "dept": "Executive Leadership", "linkedin": "", "source": "PropertyGuru press release"},
-            {"name": "Manav Kamboj", "title": "CTO", "dept": "Technology", "linkedin": "", "source": "PropertyGuru corporate website"},
-            {"name": "Joe Dische", "title": "CFO", "dept": "Finance", "linkedin": "", "source": "PropertyGuru corporate website"},
-            {"name": "Trevor Mather", "title": "Chairman", "dept": "Board", "linkedin": "", "source": "PropertyGuru press release"},
-        ],
-        "org_overview": "PropertyGuru is Southeast Asia's leading online property marketplace, operating in Singapore, Malaysia, Thailand, Vietnam, and Indonesia. Now owned by EQT (Swedish PE firm). New CEO Lewis Ng (March 2025) replaced Hari V. Krishnan. New Board Chairman Trevor Mather appointed. CONFIRMED LOSS: PropertyGuru churning $262K CloudSense contract.",
-        "pain_points": [
-            {"severity": "critical", "title": "Confirmed Loss - $262K ARR Churning", "desc": "CONFIRMED LOSS: PropertyGuru not renewing. EQT ownership and new CEO likely driving technology stack review."},
-            {"severity": "high", "title": "Post-Acquisition Transformation", "desc": "EQT acquisition driving cost optimization and platform consolidation across SE Asian operations."},
-        ],
-        "competitors": [
-            {"name": "Internal Development", "threat": "High", "strategy": "Monitor for re-engagement as new CEO establishes technology strategy"},
-        ],
-        "quality": "verified",
-        "sources": ["propertygurugroup.com", "TNGlobal", "CEOWORLD magazine"]
-    },
-
-    "MasterCard Worldwide": {
-        "company_name": "Mastercard Incorporated",
-        "industry": "Financial Services / Payments",
-        "hq": "Purchase, New York, USA",
-        "employees": "33,000+",
-        "executives": [
-            {"name": "Michael Miebach", "title": "CEO & President", "dept": "Executive Leadership", "linkedin": "michael-miebach", "source": "Mastercard corporate website"},
-            {"name": "Edward McLaughlin", "title": "President & CTO", "dept": "Technology", "linkedin": "", "source": "Mastercard corporate website"},
-            {"name": "Sachin Mehra", "title": "CFO", "dept": "Finance", "linkedin": "", "source": "Mastercard corporate website"},
-            {"name": "Rich Verma", "title": "Chief Administrative Officer", "dept": "Administration", "linkedin": "", "source": "Mastercard corporate website"},
-        ],
-        "org_overview": "Mastercard is a global payments technology company connecting consumers, financial institutions, merchants, governments, and businesses worldwide. CEO Michael Miebach leads the company with CTO Edward McLaughlin driving technology innovation. The platform relationship likely supports product configuration and partner management capabilities.",
-        "pain_points": [
-            {"severity": "medium", "title": "Digital Payments Innovation", "desc": "Rapid expansion into digital payments, BNPL, and crypto requiring flexible product and partner management."},
-            {"severity": "low", "title": "Regulatory Compliance", "desc": "Growing regulatory requirements across jurisdictions for payment products."},
-        ],
-        "competitors": [
-            {"name": "Salesforce Financial Services Cloud", "threat": "Medium", "strategy": "Emphasize payments-specific product management depth"},
-            {"name": "Custom Internal Platform", "threat": "Medium", "strategy": "Focus on speed of feature delivery and industry expertise"},
-        ],
-        "quality": "verified",
-        "sources": ["mastercard.com", "Mastercard investor relations", "Payments Dive"]
-    },
-
-    "Informa UK Limited": {
-        "company_name": "Informa plc",
-        "industry": "Media / Events / Publishing",
-        "hq": "London, United Kingdom",
-        "employees": "14,000+",
-        "executives": [
-            {"name": "Stephen A. Carter (Lord Carter)", "title": "Group CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Informa corporate website"},
-            {"name": "Patrick Martell", "title": "COO & CEO Informa Markets", "dept": "Operations", "linkedin": "", "source": "Informa corporate website"},
-            {"name": "Gary Nugent", "title": "CEO - Informa TechTarget", "dept": "Tech Media", "linkedin": "", "source": "Informa corporate website"},
-        ],
-        "org_overview": "Informa is the world's leading events and academic publishing company, operating through Informa Markets (exhibitions/trade shows), Informa Connect (specialist events), Informa Tech (technology media, merged with TechTarget), and Taylor & Francis (academic publishing). CEO Lord Stephen Carter has led the company since 2014.",
-        "pain_points": [
-            {"severity": "medium", "title": "Digital Transformation of Events", "desc": "Post-pandemic hybrid/digital event models requiring new digital product management capabilities."},
-            {"severity": "low", "title": "TechTarget Integration", "desc": "Integration of Informa Tech and TechTarget creating new B2B digital media platform requiring unified product management."},
-        ],
-        "competitors": [
-            {"name": "Salesforce", "threat": "Low", "strategy": "Emphasize media and events-specific product management expertise"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["informa.com", "Wikipedia", "Yahoo Finance"]
-    },
-
-    "Telenet BV": {
-        "company_name": "Telenet Group NV/SA",
-        "industry": "Telecommunications",
-        "hq": "Mechelen, Belgium",
-        "employees": "3,500+",
-        "executives": [
-            {"name": "John Porter", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Telenet investor relations"},
-            {"name": "Luk Bruynseels", "title": "CTO (moving to Liberty Global, March 2026)", "dept": "Technology", "linkedin": "", "source": "broadbandtvnews.com"},
-            {"name": "Silvia Brady", "title": "CFO (from March 2025)", "dept": "Finance", "linkedin": "", "source": "Telenet press release"},
-            {"name": "Dieter Nieuwdorp", "title": "CCO Residential & SOHO", "dept": "Commercial Residential", "linkedin": "", "source": "Telenet press release"},
-        ],
-        "org_overview": "Telenet is Belgium's largest cable operator (Liberty Global subsidiary), offering broadband, TV, mobile, and enterprise services. CEO John Porter since 2013. CTO Luk Bruynseels leaving for Liberty Global in March 2026, creating technology leadership vacancy. New CFO Silvia Brady joined March 2025.",
-        "pain_points": [
-            {"severity": "high", "title": "CTO Departure", "desc": "CTO Luk Bruynseels moving to Liberty Global (March 2026). New technology leadership will review vendor relationships."},
-            {"severity": "medium", "title": "Liberty Global Strategic Direction", "desc": "Parent company Liberty Global strategic decisions impacting technology stack and vendor choices."},
-        ],
-        "competitors": [
-            {"name": "Proximus", "threat": "High", "strategy": "Market competition in Belgium, not directly relevant to vendor choice"},
-            {"name": "Amdocs", "threat": "Medium", "strategy": "Leverage existing relationship and integration depth"},
-        ],
-        "quality": "verified",
-        "sources": ["investors.telenet.be", "broadbandtvnews.com", "Mobile Europe"]
-    },
-
-    "Odido Netherlands B.V.": {
-        "company_name": "Odido Netherlands B.V. (formerly T-Mobile NL)",
-        "industry": "Telecommunications",
-        "hq": "The Hague, Netherlands",
-        "employees": "3,000+",
-        "executives": [
-            {"name": "Soren Abildgaard", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Odido corporate"},
-            {"name": "Johan Van Den Branden", "title": "Chief Network & Operations Officer", "dept": "Network & Operations", "linkedin": "", "source": "The Org"},
-        ],
-        "org_overview": "Odido (formerly T-Mobile Netherlands and Tele2 Netherlands) is the largest mobile operator in the Netherlands, owned by Warburg Pincus and Apax Partners since September 2023. Rebranded from T-Mobile/Tele2 to Odido in September 2023. CEO Soren Abildgaard leads the post-rebrand strategy.",
-        "pain_points": [
-            {"severity": "medium", "title": "Post-Rebrand Technology Modernization", "desc": "Brand transition from T-Mobile to Odido requires BSS/OSS modernization and new product portfolio management."},
-            {"severity": "medium", "title": "PE Ownership Pressure", "desc": "Private equity owners (Warburg Pincus/Apax) driving efficiency and potential exit preparation."},
-        ],
-        "competitors": [
-            {"name": "KPN", "threat": "High", "strategy": "Market competitor, not directly relevant to platform decision"},
-            {"name": "Ericsson BSS", "threat": "Medium", "strategy": "Leverage cloud-native advantages vs. traditional BSS"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["theorg.com", "Wikipedia", "rcrwireless.com"]
-    },
-
-    "AARP Services, Inc.": {
-        "company_name": "AARP Services, Inc.",
-        "industry": "Nonprofit / Member Services",
-        "hq": "Washington, D.C., USA",
-        "employees": "2,500+ (AARP group)",
-        "executives": [
-            {"name": "John Larew", "title": "President & CEO - AARP Services", "dept": "Executive Leadership", "linkedin": "", "source": "AARP corporate website"},
-            {"name": "Myechia Minter-Jordan", "title": "CEO - AARP (parent org, from 2025)", "dept": "AARP Parent Organization", "linkedin": "", "source": "AARP press release"},
-            {"name": "Amy Doherty", "title": "SVP & CIO", "dept": "Information Technology", "linkedin": "", "source": "AARP corporate website"},
-            {"name": "Kimberly Moorehead", "title": "SVP Strategy & Innovation - AARP Services", "dept": "Strategy", "linkedin": "", "source": "AARP corporate website"},
-        ],
-        "org_overview": "AARP Services, Inc. is the for-profit subsidiary of AARP (American Association of Retired Persons), managing member benefits, insurance products, and partner services for AARP's 38M+ members. AARP itself is a nonprofit advocacy organization. New AARP CEO Dr. Myechia Minter-Jordan succeeded Jo Ann Jenkins in 2025.",
-        "pain_points": [
-            {"severity": "medium", "title": "Digital Member Experience Transformation", "desc": "Modernizing member benefits and services delivery for increasingly digital-first older adult demographic."},
-            {"severity": "low", "title": "New CEO Strategic Priorities", "desc": "New AARP CEO Minter-Jordan may shift organizational and technology priorities."},
-        ],
-        "competitors": [
-            {"name": "Salesforce", "threat": "Low", "strategy": "Focus on member benefits-specific product management capabilities"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["aarp.org", "ceoupdate.com", "AARP press releases"]
-    },
-
-    "PostNL Holding BV": {
-        "company_name": "PostNL N.V.",
-        "industry": "Logistics / Postal Services",
-        "hq": "The Hague, Netherlands",
-        "employees": "40,000+",
-        "executives": [
-            {"name": "Pim Berendsen", "title": "CEO (from April 2025)", "dept": "Executive Leadership", "linkedin": "", "source": "PostNL corporate website"},
-            {"name": "Linde Jansen", "title": "CFO", "dept": "Finance", "linkedin": "", "source": "PostNL corporate website"},
-        ],
-        "org_overview": "PostNL is the Netherlands' leading postal and parcel delivery company, operating Mail, Parcels & Logistics, and Cross Border Solutions divisions. New CEO Pim Berendsen (April 2025) succeeded Herna Verhagen. New CFO Linde Jansen (ex-Heineken). Key expansion opportunity: 100% ARR growth projected from $576K to $1.15M.",
-        "pain_points": [
-            {"severity": "medium", "title": "E-Commerce Parcel Growth", "desc": "Rapidly growing parcel volumes from e-commerce requiring sophisticated product and pricing management."},
-            {"severity": "medium", "title": "New CEO Strategic Direction", "desc": "New CEO Pim Berendsen (April 2025) establishing priorities including digitalization and operational efficiency."},
-        ],
-        "competitors": [
-            {"name": "SAP Logistics", "threat": "Low", "strategy": "Focus on e-commerce product management agility vs. ERP approach"},
-        ],
-        "quality": "verified",
-        "sources": ["postnl.nl", "ipc.be", "cep-research.com"]
-    },
-
-    "Sky Italia": {
-        "company_name": "Sky Italia S.r.l.",
-        "industry": "Media / Pay Television",
-        "hq": "Milan, Italy",
-        "employees": "5,000+",
-        "executives": [
-            {"name": "Andrea Duilio", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Sky Group website"},
-            {"name": "Paolo Nanni", "title": "Chief Technology, Data & Decision Officer", "dept": "Technology & Data", "linkedin": "", "source": "Sky Group website"},
-        ],
-        "org_overview": "Sky Italia is the leading pay-TV and streaming provider in Italy, part of the Comcast-owned Sky Group. CEO Andrea Duilio leads since Sept 2021. Paolo Nanni appointed Chief Technology, Data & Decision Officer in May 2025, integrating technology, data management, and decision support.",
-        "pain_points": [
-            {"severity": "medium", "title": "Streaming Competition in Italy", "desc": "Intense competition from Netflix, Disney+, DAZN, and Amazon Prime Video in Italian market."},
-            {"severity": "medium", "title": "Product Bundle Innovation", "desc": "Need for innovative product bundling (TV + broadband + mobile) to compete in converged market."},
-        ],
-        "competitors": [
-            {"name": "Internal Comcast/Sky Platform", "threat": "Medium", "strategy": "Position as local market solution complementing group-level platforms"},
-        ],
-        "quality": "verified",
-        "sources": ["skygroup.sky", "Sky Italia website", "RocketReach"]
-    },
-
-    "Wipro Ltd.": {
-        "company_name": "Wipro Limited",
-        "industry": "IT Services / Consulting",
-        "hq": "Bangalore, India",
-        "employees": "240,000+",
-        "executives": [
-            {"name": "Srini Pallia", "title": "CEO & Managing Director", "dept": "Executive Leadership", "linkedin": "srini-pallia", "source": "Wipro corporate website"},
-            {"name": "Rishad Premji", "title": "Executive Chairman", "dept": "Board", "linkedin": "", "source": "Wipro corporate website"},
-            {"name": "Sanjeev Jain", "title": "COO", "dept": "Operations", "linkedin": "", "source": "Wipro corporate website"},
-            {"name": "Anup Purohit", "title": "CIO", "dept": "Information Technology", "linkedin": "", "source": "Wipro corporate website"},
-        ],
-        "org_overview": "Wipro is a global IT services company ($11B revenue) operating across Americas, Europe, and Asia. CEO Srini Pallia (from April 2024) after 30+ years at Wipro. Executive Chairman Rishad Premji provides strategic direction. The platform relationship likely supports Wipro's client delivery capabilities.",
-        "pain_points": [
-            {"severity": "medium", "title": "AI-Led Transformation", "desc": "Wipro investing in AI capabilities to transform service delivery and client solutions."},
-            {"severity": "low", "title": "Market Competition", "desc": "Competitive pressure from TCS, Infosys, HCL in IT services market."},
-        ],
-        "competitors": [
-            {"name": "TCS", "threat": "High", "strategy": "Not competitive with platform - focus on partnership value"},
-        ],
-        "quality": "verified",
-        "sources": ["wipro.com", "Wipro press releases"]
-    },
-
-    "Ofcom": {
-        "company_name": "Ofcom (Office of Communications)",
-        "industry": "Government Regulatory Body",
-        "hq": "London, United Kingdom",
-        "employees": "1,500+",
-        "executives": [
-            {"name": "Dame Melanie Dawes", "title": "Chief Executive", "dept": "Executive Leadership", "linkedin": "", "source": "Ofcom website"},
-            {"name": "Melissa Tatton", "title": "COO & Corporate Group Director", "dept": "Operations", "linkedin": "", "source": "Ofcom website"},
-            {"name": "Natalie Black CBE", "title": "Group Director - Networks & Communications", "dept": "Networks & Communications", "linkedin": "", "source": "Ofcom website"},
-            {"name": "Luisa Affuso", "title": "Chief Economist", "dept": "Economics", "linkedin": "", "source": "Ofcom website"},
-        ],
-        "org_overview": "Ofcom is the UK's communications regulator, overseeing telecommunications, broadcasting, postal services, and (since 2024) online safety. CEO Dame Melanie Dawes (from 2020, ex-MHCLG Permanent Secretary). The organization is expanding its remit to cover digital markets and AI implications for communications.",
-        "pain_points": [
-            {"severity": "medium", "title": "Online Safety Act Implementation", "desc": "Major new regulatory mandate (Online Safety Act) requiring new technology capabilities for monitoring and enforcement."},
-            {"severity": "low", "title": "Digital Markets Regulation", "desc": "Expanding into digital markets regulation requiring new analytical and data management tools."},
-        ],
-        "competitors": [
-            {"name": "Government IT Framework Providers", "threat": "Low", "strategy": "Leverage existing relationship and regulatory domain expertise"},
-        ],
-        "quality": "verified",
-        "sources": ["ofcom.org.uk", "Parliament committees"]
-    },
-
-    "NBN Co Ltd": {
-        "company_name": "NBN Co Limited",
-        "industry": "Telecommunications Infrastructure",
-        "hq": "Sydney, Australia",
-        "employees": "5,500+",
-        "executives": [
-            {"name": "Ellie Sweeney", "title": "CEO & Managing Director (from Dec 2024)", "dept": "Executive Leadership", "linkedin": "", "source": "NBN Co corporate website"},
-        ],
-        "org_overview": "NBN Co is Australia's national broadband network company, a government-owned corporation responsible for building and operating the National Broadband Network. New CEO Ellie Sweeney (ex-Vocus CEO) appointed December 2024. The company provides wholesale broadband infrastructure to retail service providers.",
-        "pain_points": [
-            {"severity": "high", "title": "New CEO Strategic Review", "desc": "New CEO Ellie Sweeney (Dec 2024) likely reviewing technology stack and vendor relationships."},
-            {"severity": "medium", "title": "Fiber Upgrade Program", "desc": "Major program to upgrade HFC and FTTN connections to full fiber (FTTP)."},
-        ],
-        "competitors": [
-            {"name": "Internal Development", "threat": "Medium", "strategy": "Emphasize wholesale-specific product management capabilities"},
-        ],
-        "quality": "verified",
-        "sources": ["nbnco.com.au", "themandarin.com.au", "Minister for Infrastructure"]
-    },
-
-    "Bharti Airtel Limited": {
-        "company_name": "Bharti Airtel Limited",
-        "industry": "Telecommunications",
-        "hq": "New Delhi, India",
-        "employees": "30,000+",
-        "executives": [
-            {"name": "Shashwat Sharma", "title": "MD & CEO (from Jan 2026)", "dept": "Executive Leadership", "linkedin": "", "source": "Business Standard, Airtel website"},
-            {"name": "Gopal Vittal", "title": "Executive Vice Chairman", "dept": "Board", "linkedin": "", "source": "Airtel website"},
-            {"name": "Sunil Bharti Mittal", "title": "Founder & Chairman", "dept": "Board", "linkedin": "", "source": "Bharti Enterprises"},
-            {"name": "Soumen Ray", "title": "Group CFO", "dept": "Finance", "linkedin": "", "source": "Airtel website"},
-            {"name": "Pradipt Kapoor", "title": "CIO", "dept": "Information Technology", "linkedin": "", "source": "Airtel website"},
-        ],
-        "org_overview": "Bharti Airtel is India's largest private telecom operator (500M+ subscribers) and a major operator in Africa through Airtel Africa. New MD & CEO Shashwat Sharma took charge January 2026, with incumbent Gopal Vittal moving to Executive Vice Chairman. Founder Sunil Bharti Mittal remains Chairman. The platform relationship spans multiple Airtel entities (Chennai, Gurgaon, Mumbai).",
-        "pain_points": [
-            {"severity": "high", "title": "New CEO Transition", "desc": "New CEO Shashwat Sharma (Jan 2026) taking charge. Technology and vendor decisions may be reviewed."},
-            {"severity": "medium", "title": "5G Monetization in India", "desc": "Massive 5G rollout across India requiring new product offerings and pricing innovation."},
-        ],
-        "competitors": [
-            {"name": "Jio Platforms", "threat": "High", "strategy": "Market competitor, drives need for platform agility"},
-            {"name": "Amdocs", "threat": "Medium", "strategy": "Existing BSS vendor at many telcos, focus on differentiated value"},
-        ],
-        "quality": "verified",
-        "sources": ["airtel.in", "business-standard.com", "bharti.com"]
-    },
-
-    "Tata Communications": {
-        "company_name": "Tata Communications Limited",
-        "industry": "Telecommunications / IT Services",
-        "hq": "Mumbai, India",
-        "employees": "12,000+",
-        "executives": [
-            {"name": "A.S. Lakshminarayanan", "title": "MD & CEO (until April 2026)", "dept": "Executive Leadership", "linkedin": "", "source": "Tata Communications website"},
-            {"name": "Ganesh Lakshminarayanan", "title": "MD & CEO Designate (from April 2026)", "dept": "Executive Leadership", "linkedin": "", "source": "Tata Communications press release"},
-            {"name": "Dave Ryan", "title": "EVP & Americas Regional Head", "dept": "Americas", "linkedin": "daveryantata", "source": "LinkedIn"},
-        ],
-        "org_overview": "Tata Communications is a global digital ecosystem enabler providing cloud, networking, IoT, and collaboration services. Part of the Tata Group. CEO transition: Ganesh Lakshminarayanan (ex-ServiceNow India, ex-Airtel Business) replacing A.S. Lakshminarayanan in April 2026. Americas operations led by EVP Dave Ryan.",
-        "pain_points": [
-            {"severity": "high", "title": "CEO Transition", "desc": "CEO change in April 2026. New CEO from ServiceNow/Airtel may bring new technology priorities."},
-            {"severity": "medium", "title": "Enterprise Digital Services Growth", "desc": "Expanding enterprise cloud and IoT services requiring advanced product management."},
-        ],
-        "competitors": [
-            {"name": "Orange Business", "threat": "Medium", "strategy": "Global enterprise services competitor"},
-        ],
-        "quality": "verified",
-        "sources": ["tatacommunications.com", "LinkedIn"]
-    },
-
-    "Rakuten Marketing": {
-        "company_name": "Rakuten Group, Inc.",
-        "industry": "E-Commerce / Technology",
-        "hq": "Tokyo, Japan",
-        "employees": "30,000+",
-        "executives": [
-            {"name": "Hiroshi Mikitani", "title": "Chairman, President & CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Rakuten corporate website"},
-            {"name": "Akihito Kurozumi", "title": "CIO & CTO", "dept": "Technology", "linkedin": "", "source": "Rakuten corporate website"},
-            {"name": "Kenji Hirose", "title": "Group EVP & CFO", "dept": "Finance", "linkedin": "", "source": "Rakuten corporate website"},
-            {"name": "Ting Cai", "title": "Chief AI & Data Officer", "dept": "AI & Data", "linkedin": "", "source": "Rakuten corporate website"},
-        ],
-        "org_overview": "Rakuten is Japan's largest e-commerce platform operator, also operating in fintech, digital content, and mobile telecommunications (Rakuten Mobile). CEO Hiroshi Mikitani founded the company. CIO/CTO Akihito Kurozumi leads technology. The Rakuten Marketing/Advertising division provides affiliate and performance marketing services globally.",
-        "pain_points": [
-            {"severity": "medium", "title": "Mobile Network Investment Pressure", "desc": "Rakuten Mobile's heavy capex requirements putting pressure on group-wide technology spending."},
-            {"severity": "low", "title": "Global Marketing Platform Competition", "desc": "Competition from Amazon Advertising, Google, and Meta in digital advertising market."},
-        ],
-        "competitors": [
-            {"name": "Amazon Advertising", "threat": "High", "strategy": "Market competitor in e-commerce, not directly relevant to platform"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["global.rakuten.com", "Rakuten investor relations"]
-    },
-
-    "Ribbon Communications": {
-        "company_name": "Ribbon Communications Inc.",
-        "industry": "Telecommunications Equipment / Software",
-        "hq": "Plano, Texas, USA",
-        "employees": "3,500+",
-        "executives": [
-            {"name": "Bruce McClelland", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Ribbon Communications website"},
-            {"name": "Kevin Riley", "title": "CTO & EVP Advanced R&D", "dept": "Technology", "linkedin": "", "source": "Ribbon Communications website"},
-            {"name": "William Parks", "title": "EVP & CIO", "dept": "Information Technology", "linkedin": "", "source": "Ribbon Communications website"},
-        ],
-        "org_overview": "Ribbon Communications provides communications software and network solutions for service providers, enterprises, and critical infrastructure sectors. CEO Bruce McClelland since March 2020. CTO Kevin Riley leads advanced R&D. Products include Session Border Controllers, analytics, and policy management.",
-        "pain_points": [
-            {"severity": "medium", "title": "Cloud Communications Transition", "desc": "Industry shift from hardware to cloud-native communications platforms."},
-        ],
-        "competitors": [
-            {"name": "Oracle Communications", "threat": "Medium", "strategy": "Focus on carrier-grade expertise and proven deployments"},
-        ],
-        "quality": "verified",
-        "sources": ["ribboncommunications.com", "Simply Wall St"]
-    },
-
-    "4iG": {
-        "company_name": "4iG Nyrt.",
-        "industry": "Telecommunications / IT",
-        "hq": "Budapest, Hungary",
-        "employees": "8,000+",
-        "executives": [
-            {"name": "Gellert Jaszai", "title": "Chairman & CEO", "dept": "Executive Leadership", "linkedin": "", "source": "4iG corporate website"},
-            {"name": "Aladin Linczenyi", "title": "Deputy CEO", "dept": "Strategy/Corporate", "linkedin": "", "source": "4iG corporate website"},
-            {"name": "Dr. Istvan Sarhegyi", "title": "Deputy CEO - Space & Defence Technologies", "dept": "Space & Defence", "linkedin": "", "source": "4iG press release"},
-        ],
-        "org_overview": "4iG is Hungary's leading integrated telecommunications and IT company, operating across 4 countries with 28 subsidiaries. The group operates through three major business units: IT, Telecommunications, and Space Industry. Chairman & CEO Gellert Jaszai leads the holding company. Developing into a holding structure aligned with strategic focus areas.",
-        "pain_points": [
-            {"severity": "medium", "title": "Holding Company Restructuring", "desc": "4iG transitioning to holding company structure, which may impact technology decisions across subsidiaries."},
-            {"severity": "medium", "title": "Western Balkans Expansion", "desc": "Expanding telecom operations in Western Balkans requiring multi-market product management."},
-        ],
-        "competitors": [
-            {"name": "Deutsche Telekom (T-Mobile Hungary)", "threat": "High", "strategy": "Market competitor, drives need for competitive product agility"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["4ig.hu", "MarketScreener"]
-    },
-
-    "Mavenir Systems": {
-        "company_name": "Mavenir",
-        "industry": "Telecommunications Software / Open RAN",
-        "hq": "Richardson, Texas, USA",
-        "employees": "5,000+",
-        "executives": [
-            {"name": "Pardeep Kohli", "title": "President & CEO", "dept": "Executive Leadership", "linkedin": "pardeep-kohli", "source": "Mavenir corporate website"},
-        ],
-        "org_overview": "Mavenir is a leading provider of cloud-native network software for telecom operators, specializing in Open RAN, 5G core, and communications platform solutions. CEO Pardeep Kohli since December 2016. The company is at the forefront of telecom network disaggregation and cloudification.",
-        "pain_points": [
-            {"severity": "medium", "title": "Open RAN Market Development", "desc": "Open RAN adoption still in early stages. Mavenir needs partners to accelerate deployments."},
-        ],
-        "competitors": [
-            {"name": "Samsung Networks", "threat": "Medium", "strategy": "Complementary Open RAN ecosystem player"},
-            {"name": "Parallel Wireless", "threat": "Low", "strategy": "Market differentiation through broader solution portfolio"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["mavenir.com", "LinkedIn", "Fierce Network"]
-    },
-
-    "Vodafone Fiji": {
-        "company_name": "Vodafone Fiji Limited",
-        "industry": "Telecommunications",
-        "hq": "Suva, Fiji",
-        "employees": "500+",
-        "executives": [
-            {"name": "Elenoa Biukoto", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Vodafone Fiji website"},
-            {"name": "Fareen Saheb", "title": "CFO", "dept": "Finance", "linkedin": "", "source": "Vodafone Fiji website"},
-            {"name": "Salman Khan", "title": "Chief Commercial Officer", "dept": "Commercial", "linkedin": "", "source": "Vodafone Fiji website"},
-        ],
-        "org_overview": "Vodafone Fiji is the leading telecom operator in Fiji, providing mobile, broadband, and enterprise services. CEO Elenoa Biukoto (promoted from CFO) succeeded Pradeep Lal who moved to Vodafone PNG. Part of the Amalgamated Telecom Holdings (ATH) group.",
-        "pain_points": [
-            {"severity": "low", "title": "Pacific Islands Digital Connectivity", "desc": "Growing demand for digital services in Pacific Islands market."},
-        ],
-        "competitors": [
-            {"name": "Digicel Fiji", "threat": "Medium", "strategy": "Leverage Vodafone brand and network scale advantage"},
-        ],
-        "quality": "verified",
-        "sources": ["vodafone.com.fj", "fijivillage.com", "fijisun.com.fj"]
-    },
-
-    "MTN Zambia": {
-        "company_name": "MTN Zambia",
-        "industry": "Telecommunications",
-        "hq": "Lusaka, Zambia",
-        "employees": "500+",
-        "executives": [
-            {"name": "Abbad Reda", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "MTN Zambia website"},
-        ],
-        "org_overview": "MTN Zambia is part of the MTN Group, Africa's largest mobile operator by subscribers. CEO Abbad Reda (from May 2023, MBA from CEIBS) brings 20+ years telecom experience. Zambia operations fall under MTN Group SVP Ebenezer Asante's regional oversight.",
-        "pain_points": [
-            {"severity": "medium", "title": "Mobile Money Expansion", "desc": "Growing mobile financial services market in Zambia requiring product innovation."},
-        ],
-        "competitors": [
-            {"name": "Airtel Zambia", "threat": "High", "strategy": "Market competitor, drives need for competitive product offerings"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["mtn.zm", "connectingafrica.com", "engineeringnews.co.za"]
-    },
-
-    "Luminus": {
-        "company_name": "Luminus NV/SA",
-        "industry": "Energy / Utilities",
-        "hq": "Brussels, Belgium",
-        "employees": "2,900",
-        "executives": [
-            {"name": "Gregoire Dallemagne", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "Luminus corporate website"},
-        ],
-        "org_overview": "Luminus is Belgium's second-largest electricity producer and energy supplier (EDF subsidiary, 68.6% stake). CEO Gregoire Dallemagne since 2011, now also president of Belgian energy federation FEBEG. Focus on energy transition: renewable energy, energy efficiency, and CO2-neutral future.",
-        "pain_points": [
-            {"severity": "medium", "title": "Energy Transition Product Complexity", "desc": "Expanding into solar, EV charging, heat pumps requiring flexible product bundling and pricing."},
-        ],
-        "competitors": [
-            {"name": "Engie (Electrabel)", "threat": "High", "strategy": "Market competitor, drives need for competitive energy product offerings"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["luminus.be", "Wikipedia", "comparateur-energie.be"]
-    },
-
-    "Telefonica Germany": {
-        "company_name": "Telefonica Deutschland (O2 Germany)",
-        "industry": "Telecommunications",
-        "hq": "Munich, Germany",
-        "employees": "7,500+",
-        "executives": [
-            {"name": "Santiago Argelich Hesse", "title": "CEO (from Jan 2026)", "dept": "Executive Leadership", "linkedin": "", "source": "Telefonica Deutschland press release"},
-            {"name": "Mallik Rao", "title": "Chief Technology & Information Officer", "dept": "Technology", "linkedin": "", "source": "Telefonica Deutschland website"},
-            {"name": "Markus Rolle", "title": "CFO", "dept": "Finance", "linkedin": "", "source": "Telefonica Deutschland website"},
-        ],
-        "org_overview": "Telefonica Deutschland operates the O2 mobile brand in Germany, Germany's third-largest mobile operator. New CEO Santiago Argelich Hesse (ex-Cellnex Poland CEO) from January 2026, replacing long-serving Markus Haas. CTIO Mallik Rao leads technology. The company serves 45M+ mobile connections.",
-        "pain_points": [
-            {"severity": "high", "title": "New CEO Strategic Direction", "desc": "New CEO Santiago Argelich Hesse (Jan 2026) will likely review technology strategy and vendor relationships."},
-            {"severity": "medium", "title": "5G Network Expansion", "desc": "Accelerating 5G rollout in Germany requiring advanced product portfolio management."},
-        ],
-        "competitors": [
-            {"name": "Deutsche Telekom", "threat": "High", "strategy": "Market competitor, drives competitive product agility needs"},
-            {"name": "Vodafone Germany", "threat": "High", "strategy": "Market competitor, drives pricing and product innovation pressure"},
-        ],
-        "quality": "verified",
-        "sources": ["telefonica.de", "broadbandtvnews.com", "Telefonica Deutschland press releases"]
-    },
-
-    "Pelephone Communications Ltd": {
-        "company_name": "Pelephone Communications Ltd (Bezeq subsidiary)",
-        "industry": "Telecommunications",
-        "hq": "Petah Tikva, Israel",
-        "employees": "3,000+",
-        "executives": [
-            {"name": "Ilan Sigal", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "ZoomInfo, CBInsights"},
-            {"name": "Oren Chaimy", "title": "CTO", "dept": "Technology", "linkedin": "", "source": "ZoomInfo"},
-            {"name": "Dror Bahat", "title": "CMO", "dept": "Marketing", "linkedin": "", "source": "MartechVibe"},
-        ],
-        "org_overview": "Pelephone is one of Israel's major mobile operators, a subsidiary of Bezeq (Israel's largest telecom group). CEO Ilan Sigal leads the company. CTO Oren Chaimy oversees technology strategy. The company competes in Israel's highly competitive mobile market against Partner (Orange) and Cellcom.",
-        "pain_points": [
-            {"severity": "medium", "title": "Israeli Mobile Market Competition", "desc": "Highly competitive Israeli mobile market with aggressive pricing pressure from MVNOs."},
-        ],
-        "competitors": [
-            {"name": "Partner (Orange Israel)", "threat": "High", "strategy": "Market competitor, not directly relevant to platform"},
-            {"name": "Cellcom", "threat": "High", "strategy": "Market competitor, not directly relevant to platform"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["ZoomInfo", "CBInsights", "MartechVibe", "Wikipedia"]
-    },
-
-    "Syniverse Technologies": {
-        "company_name": "Syniverse Technologies LLC",
-        "industry": "Technology / Telecommunications Infrastructure",
-        "hq": "Tampa, Florida, USA",
-        "employees": "2,000+",
-        "executives": [
-            {"name": "Andrew Davies", "title": "CEO", "dept": "Executive Leadership", "linkedin": "andrew-davies-52722911", "source": "Syniverse corporate website"},
-            {"name": "Mark Maddry", "title": "EVP & CFO (from Feb 2025)", "dept": "Finance", "linkedin": "", "source": "Syniverse press release"},
-            {"name": "Justin Dellaportas", "title": "EVP & CISO/Digital Services Officer", "dept": "Security & Digital", "linkedin": "", "source": "Syniverse press release"},
-        ],
-        "org_overview": "Syniverse is a global technology company providing critical infrastructure for mobile communications, serving 1,500+ customers including telecom operators, enterprises, and OTTs. CEO Andrew Davies (ex-Sprint CFO). Owned by The Carlyle Group. Recently expanded Justin Dellaportas's role to include digital services.",
-        "pain_points": [
-            {"severity": "medium", "title": "5G Monetization Platform", "desc": "Developing 5G monetization and enterprise connectivity solutions."},
-        ],
-        "competitors": [
-            {"name": "BICS", "threat": "Medium", "strategy": "Focus on multi-network intelligence and analytics capabilities"},
-        ],
-        "quality": "verified",
-        "sources": ["syniverse.com", "BusinessWire", "LinkedIn"]
-    },
-
-    "Hertz Europe Limited": {
-        "company_name": "Hertz Global Holdings (Hertz Europe)",
-        "industry": "Car Rental / Mobility",
-        "hq": "Estero, Florida, USA (Global) / Europe",
-        "employees": "25,000+ (global)",
-        "executives": [
-            {"name": "Gil West", "title": "CEO (from April 2024)", "dept": "Executive Leadership", "linkedin": "", "source": "Hertz investor relations"},
-            {"name": "Mike Moore", "title": "EVP & COO (from Oct 2025)", "dept": "Operations", "linkedin": "", "source": "Hertz press release"},
-            {"name": "Chris Berg", "title": "EVP & Chief Administrative Officer", "dept": "Administration", "linkedin": "", "source": "Hertz press release"},
-        ],
-        "org_overview": "Hertz is one of the world's largest car rental companies operating the Hertz, Dollar, and Thrifty brands globally. New CEO Gil West (from April 2024, ex-Delta Air Lines COO, ex-Cruise COO). European operations significant but integrated under global leadership structure. Major AR >90 days issue: $386K outstanding.",
-        "pain_points": [
-            {"severity": "high", "title": "Financial Restructuring", "desc": "Hertz emerged from bankruptcy in 2021. Ongoing financial pressure and EV fleet transition challenges."},
-            {"severity": "high", "title": "AR Collection Risk", "desc": "Significant AR >90 days ($386K). Collection risk must be managed."},
-        ],
-        "competitors": [
-            {"name": "Avis Budget Group", "threat": "High", "strategy": "Market competitor, not directly relevant to platform decision"},
-        ],
-        "quality": "verified",
-        "sources": ["ir.hertz.com", "Hertz press releases", "autorentalnews.com"]
-    },
-
-    "Sterlite Technologies Ltd": {
-        "company_name": "Sterlite Technologies Limited (STL)",
-        "industry": "Telecommunications / Fiber Optics",
-        "hq": "Pune, India",
-        "employees": "5,000+",
-        "executives": [
-            {"name": "Ankit Agarwal", "title": "CEO", "dept": "Executive Leadership", "linkedin": "", "source": "STL corporate website"},
-            {"name": "Badri Gomatam", "title": "CTO", "dept": "Technology", "linkedin": "", "source": "Bloomberg, STL website"},
-            {"name": "Ajay Jhanjhari", "title": "Interim CFO (from May 2025)", "dept": "Finance", "linkedin": "", "source": "boardstewardship.com"},
-        ],
-        "org_overview": "STL (Sterlite Technologies) is a global technology company specializing in optical fiber, cables, and digital networks. CEO Ankit Agarwal leads since Dec 2021. CTO Badri Gomatam drives technology strategy. The company has significant AR >90 days ($515K) vs. ARR ($113K) representing a critical collection risk.",
-        "pain_points": [
-            {"severity": "critical", "title": "AR Collection Risk", "desc": "AR >90 days ($515K) vastly exceeds ARR ($113K). Critical collection risk requiring immediate attention."},
-            {"severity": "medium", "title": "Digital Network Services Growth", "desc": "Expanding from fiber manufacturing into digital network services and solutions."},
-        ],
-        "competitors": [
-            {"name": "Corning", "threat": "High", "strategy": "Market competitor in fiber optics, not directly relevant to platform"},
-        ],
-        "quality": "verified",
-        "sources": ["stl.tech", "Bloomberg", "boardstewardship.com"]
-    },
-
-    "Accenture Singapore": {
-        "company_name": "Accenture plc (Singapore Operations)",
-        "industry": "IT Consulting / Professional Services",
-        "hq": "Singapore (local) / Dublin, Ireland (Global HQ)",
-        "employees": "750,000+ (global)",
-        "executives": [
-            {"name": "Mark Tham", "title": "Country Managing Director - Singapore", "dept": "Singapore Operations", "linkedin": "", "source": "HRM Asia"},
-            {"name": "Anoop Sagoo", "title": "Market Unit Lead - Southeast Asia", "dept": "Southeast Asia", "linkedin": "", "source": "Accenture press release"},
-            {"name": "Julie Sweet", "title": "Chair & CEO (Global)", "dept": "Global Executive Leadership", "linkedin": "", "source": "Fortune, Accenture website"},
-        ],
-        "org_overview": "Accenture is a global professional services company with leading capabilities in digital, cloud, and security. Singapore country lead Mark Tham and SE Asia market lead Anoop Sagoo (from May 2025). Global CEO Julie Sweet drives company-wide AI transformation strategy.",
-        "pain_points": [
-            {"severity": "low", "title": "AI Transformation Delivery", "desc": "Accenture heavily investing in GenAI capabilities, requiring all platform partners to demonstrate AI integration."},
-        ],
-        "competitors": [
-            {"name": "Deloitte Digital", "threat": "High", "strategy": "Market competitor in consulting, not directly relevant to platform"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["hrmasia.com", "consultancy.asia", "Fortune"]
-    },
-
-    "Liberty Global Services B.V.": {
-        "company_name": "Liberty Global Ltd",
-        "industry": "Telecommunications / Media",
-        "hq": "Denver, Colorado, USA / London, UK",
-        "employees": "10,000+",
-        "executives": [
-            {"name": "Mike Fries", "title": "CEO & Chairman", "dept": "Executive Leadership", "linkedin": "", "source": "Liberty Global website"},
-            {"name": "Enrique Rodriguez", "title": "EVP & CTO", "dept": "Technology", "linkedin": "", "source": "Liberty Global website"},
-        ],
-        "org_overview": "Liberty Global is one of the world's largest converged video, broadband, and communications companies, with operations in Belgium (Telenet), Netherlands (VodafoneZiggo JV), Ireland, and Switzerland. CEO Mike Fries since 2005. CTO Enrique Rodriguez (ex-TiVo CEO, ex-AT&T Entertainment CTO). The company owns 50% of VodafoneZiggo and 100% of Telenet.",
-        "pain_points": [
-            {"severity": "medium", "title": "Operational Simplification", "desc": "Ongoing efforts to streamline operations and reduce costs across European footprint."},
-        ],
-        "competitors": [
-            {"name": "Amdocs", "threat": "Medium", "strategy": "Leverage existing relationships across Liberty Global portfolio"},
-        ],
-        "quality": "high-confidence",
-        "sources": ["libertyglobal.com", "Technology Magazine"]
-    },
-
-    "Hitachi Systems India": {
-        "company_name": "Hitachi Systems India Private Limited",
-        "industry": "IT Services / Systems Integration",
-        "hq": "Noida, India",
-        "employees": "1,000+",
-        "executives": [],
-        "org_overview": "Hitachi Systems India is a subsidiary of Hitachi Systems, Ltd. (Japan), providing IT services, managed services, and system integration in India. Part of the broader Hitachi Group conglomerate. The company serves enterprise customers with infrastructure management, application services, and cloud solutions.",
-        "pain_points": [
-            {"severity": "low", "title": "IT Services Market Competition in India", "desc": "Highly competitive Indian IT services market with pressure from local and global players."},
-        ],
-        "competitors": [],
-        "quality": "inferred",
-        "sources": ["Hitachi Group corporate structure"]
-    },
-}
 
 # ============================================================================
 # For accounts without specific research, generate structured data based on
@@ -1252,225 +48,155 @@ def get_industry_from_bu(bu_name):
     return bu_map.get(bu_name, "Technology / Telecommunications")
 
 
-def generate_update_for_file(filepath, intel_db):
-    """Read an HTML file, identify the account, and update with intelligence"""
+_research_matchers = {}
 
-    filename = os.path.basename(filepath)
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+def research_matcher(intel_db=None):
+    """IntelMatcher over an intelligence database's names, built once per database."""
+    if intel_db is None:
+        intel_db = intelligence_db()
+    entry = _research_matchers.get(id(intel_db))
+    if entry is None or entry[0] is not intel_db or len(entry[1].keys) != len(intel_db):
+        entry = (intel_db, IntelMatcher(intel_db))
+        _research_matchers[id(intel_db)] = entry
+    return entry[1]
 
-    original_content = content
 
-    # Extract company name from header
-    title_match = re.search(r'<h1>(.*?)</h1>', content)
-    if not title_match:
-        return None, "Could not find company name in header"
+def find_intelligence(company_name, intel_db=None):
+    """Researched intelligence record for a company, or None.
 
-    company_name = title_match.group(1)
+    Matches on the company name (exact, then containment either way), then
+    on shared significant words; see scripts/intel_matcher.py. intel_db
+    defaults to the stored INTELLIGENCE_DB (intelligence_db()).
+    """
+    if intel_db is None:
+        intel_db = intelligence_db()
+    match = research_matcher(intel_db).match(company_name)
+    return intel_db[match.key] if match else None
 
-    # Try to find matching intelligence
-    intel = None
-    for key, value in intel_db.items():
-        if key.lower() in company_name.lower() or company_name.lower() in key.lower():
-            intel = value
-            break
 
-    # Also try partial matching
-    if not intel:
-        company_words = company_name.lower().replace(",", "").replace(".", "").split()
-        for key, value in intel_db.items():
-            key_words = key.lower().replace(",", "").replace(".", "").split()
-            # Check if significant words overlap
-            overlap = set(company_words) & set(key_words)
-            significant_words = [w for w in overlap if len(w) > 3 and w not in ('inc', 'ltd', 'limited', 'the', 'services', 'group', 'company')]
-            if len(significant_words) >= 1:
-                intel = value
-                break
+def research_tab_content(intel, researched_on):
+    """Account page tab slots backed by researched intelligence.
 
-    update_applied = False
+    The slots override the company_intel / template content of
+    populate_osint.osint_tab_content for whatever the research covers.
+
+    Args:
+        intel: intelligence_db() record (from find_intelligence), or None
+        researched_on: Research date shown on the page (YYYY-MM-DD)
+
+    Returns:
+        tuple: (dict of tab slot -> HTML, quality level)
+    """
+    tabs = {}
     quality_level = "template"
+    if not intel:
+        return tabs, quality_level
 
-    if intel and intel.get("executives"):
-        # Replace Tab 2: Key Executives with real data
-        exec_rows = ""
+    if intel.get("executives"):
+        # Tab 2: Key Executives with real data
+        exec_rows = []
         for exec_info in intel["executives"]:
             linkedin_cell = f'<a href="https://www.linkedin.com/in/{exec_info["linkedin"]}" target="_blank">Profile</a>' if exec_info.get("linkedin") else f'<span style="color:var(--muted);">(Based on {exec_info.get("source", "web research")})</span>'
-            exec_rows += f"""
-                    <tr>
+            exec_rows.append(f"""                    <tr>
                         <td>{exec_info["name"]}</td>
                         <td>{exec_info["title"]}</td>
                         <td>{exec_info.get("dept", "Executive Leadership")}</td>
                         <td style="color:var(--muted);">On file</td>
                         <td style="color:var(--muted);">On file</td>
                         <td>{linkedin_cell}</td>
-                    </tr>"""
-
-        # Build the new executive table
-        new_exec_section = f"""<div class="section">
-            <h2>Executive Contacts</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Name</th>
-                        <th>Title</th>
-                        <th>Department</th>
-                        <th>Phone</th>
-                        <th>Email</th>
-                        <th>LinkedIn</th>
-                    </tr>
-                </thead>
-                <tbody>{exec_rows}
-                </tbody>
-            </table>
-            <div class="alert success" style="margin-top: 1rem;">
-                <strong>OSINT Research Complete:</strong> Executive contacts verified via web research ({datetime.now().strftime('%Y-%m-%d')}). Sources: {', '.join(intel.get('sources', ['web research'])[:3])}
-            </div>
-        </div>"""
-
-        # Replace the existing executive section
-        exec_pattern = r'<div class="section">\s*<h2>Executive Contacts</h2>.*?</div>\s*(?=<div class="section">|</div>\s*<!--)'
-        if re.search(exec_pattern, content, re.DOTALL):
-            content = re.sub(exec_pattern, new_exec_section + "\n", content, flags=re.DOTALL)
-            update_applied = True
+                    </tr>""")
+        tabs["executive_rows"] = "\n".join(exec_rows)
+        tabs["executive_alert"] = f"""            <div class="alert success" style="margin-top: 1rem;">
+                <strong>OSINT Research Complete:</strong> Executive contacts verified via web research ({researched_on}). Sources: {', '.join(intel.get('sources', ['web research'])[:3])}
+            </div>"""
 
-        # Update stakeholder engagement strategy
-        engagement_items = ""
-        for exec_info in intel["executives"][:3]:
-            engagement_items += f'<li><strong>{exec_info["title"]} ({exec_info["name"]}):</strong> Schedule executive briefing to align on strategic priorities and platform value proposition</li>\n                '
-        engagement_items += '<li><strong>Cross-functional Workshop:</strong> Organize platform value assessment workshop with key stakeholders</li>\n                '
-        engagement_items += '<li><strong>Executive Business Review:</strong> Schedule quarterly EBR to present platform ROI, usage analytics, and roadmap alignment</li>'
+        # Stakeholder engagement strategy
+        engagement_items = [f'<li><strong>{exec_info["title"]} ({exec_info["name"]}):</strong> Schedule executive briefing to align on strategic priorities and platform value proposition</li>'
+                            for exec_info in intel["executives"][:3]]
+        engagement_items.append('<li><strong>Cross-functional Workshop:</strong> Organize platform value assessment workshop with key stakeholders</li>')
+        engagement_items.append('<li><strong>Executive Business Review:</strong> Schedule quarterly EBR to present platform ROI, usage analytics, and roadmap alignment</li>')
+        tabs["stakeholder_strategy"] = "            <ul>\n" + "\n".join(f"                {item}" for item in engagement_items) + "\n            </ul>"
 
-        engagement_pattern = r'(<h2>Stakeholder Engagement Strategy</h2>\s*<ul>).*?(</ul>)'
-        new_engagement = f'\\1\n                {engagement_items}\n            \\2'
-        content = re.sub(engagement_pattern, new_engagement, content, flags=re.DOTALL)
+        # Tab 3: Department heads table
+        dept_rows = []
+        for exec_info in intel["executives"][:5]:
+            dept_rows.append(f"""                    <tr>
+                        <td>{exec_info.get("dept", "Executive")}</td>
+                        <td>{exec_info["name"]}, {exec_info["title"]}</td>
+                        <td>Platform architecture and business decisions</td>
+                        <td><span class="status-badge warning">Decision Maker</span></td>
+                    </tr>""")
+        tabs["department_rows"] = "\n".join(dept_rows)
 
         quality_level = intel.get("quality", "high-confidence")
 
-    if intel and intel.get("org_overview"):
-        # Update Tab 3: Org Structure
-        new_org = f"""<div style="padding: 1.5rem; background: #f9f9f7; border-radius: 8px; border-left: 4px solid var(--secondary);">
-                <h3 style="margin-bottom: 1rem;">Organizational Overview <span style="font-size:0.85em;color:var(--muted);">(Based on web research - {datetime.now().strftime('%Y-%m-%d')})</span></h3>
+    if intel.get("org_overview"):
+        # Tab 3: Org Structure
+        tabs["org_overview"] = f"""            <div style="padding: 1.5rem; background: #f9f9f7; border-radius: 8px; border-left: 4px solid var(--secondary);">
+                <h3 style="margin-bottom: 1rem;">Organizational Overview <span style="font-size:0.85em;color:var(--muted);">(Based on web research - {researched_on})</span></h3>
                 <p style="margin-bottom: 1rem;">{intel["org_overview"]}</p>
                 <p style="margin-top: 1rem;"><strong>Industry:</strong> {intel.get("industry", "Technology")}</p>
                 <p><strong>Headquarters:</strong> {intel.get("hq", "Not specified")}</p>
                 <p><strong>Employees:</strong> {intel.get("employees", "Not specified")}</p>
             </div>"""
 
-        org_pattern = r'<div style="padding: 1\.5rem; background: #f9f9f7; border-radius: 8px; border-left: 4px solid var\(--secondary\);">.*?</div>'
-        if re.search(org_pattern, content, re.DOTALL):
-            content = re.sub(org_pattern, new_org, content, count=1, flags=re.DOTALL)
-            update_applied = True
-
-    if intel and intel.get("executives"):
-        # Update department heads table
-        dept_rows = ""
-        for exec_info in intel["executives"][:5]:
-            dept_rows += f"""
-                    <tr>
-                        <td>{exec_info.get("dept", "Executive")}</td>
-                        <td>{exec_info["name"]}, {exec_info["title"]}</td>
-                        <td>Platform architecture and business decisions</td>
-                        <td><span class="status-badge warning">Decision Maker</span></td>
-                    </tr>"""
-
-        dept_pattern = r'(<h2>Key Departments</h2>\s*<table>\s*<thead>\s*<tr>\s*<th>Department</th>\s*<th>Head</th>\s*<th>Platform Usage</th>\s*<th>Influence Level</th>\s*</tr>\s*</thead>\s*<tbody>).*?(</tbody>)'
-        if re.search(dept_pattern, content, re.DOTALL):
-            content = re.sub(dept_pattern, f'\\1{dept_rows}\n                \\2', content, flags=re.DOTALL)
-
-    if intel and intel.get("pain_points"):
-        # Update Tab 4: Pain Points
-        business_challenges = ""
-        tech_challenges = ""
-        opportunities = ""
+    if intel.get("pain_points"):
+        # Tab 4: Pain Points
+        business_challenges = []
+        tech_challenges = []
+        opportunities = []
 
         for pp in intel["pain_points"]:
             severity = pp.get("severity", "medium")
             alert_class = "critical" if severity == "critical" else ("warning" if severity in ["high", "medium"] else "success")
             severity_label = severity.capitalize()
 
-            alert_html = f"""<div class="alert {alert_class}">
+            alert_html = f"""            <div class="alert {alert_class}">
                 <strong>{severity_label} - {pp["title"]}:</strong> {pp["desc"]}
-            </div>\n            """
+            </div>"""
 
             if severity in ["critical", "high"]:
-                business_challenges += alert_html
+                business_challenges.append(alert_html)
             elif severity == "medium":
-                tech_challenges += alert_html
+                tech_challenges.append(alert_html)
             else:
-                opportunities += alert_html
-
-        # Replace pain points sections
-        pain_pattern = r'(<!-- Tab 4: Pain Points -->\s*<div class="tab-content">\s*<div class="section">\s*<h2>Business Challenges</h2>).*?(</div>\s*<div class="section">\s*<h2>Technical Pain Points</h2>).*?(</div>\s*<div class="section">\s*<h2>Opportunity Areas</h2>).*?(</div>\s*</div>)'
-
-        if re.search(pain_pattern, content, re.DOTALL):
-            default_biz = '<div class="alert success"><strong>No Critical Challenges:</strong> Account appears stable.</div>'
-            default_tech = '<div class="alert success"><strong>Monitoring:</strong> No significant technical pain points identified.</div>'
-            default_opp = '<div class="alert success"><strong>Growth Focus:</strong> Explore expansion opportunities based on platform capabilities.</div>'
-            biz_content = business_challenges or default_biz
-            tech_content = tech_challenges or default_tech
-            opp_content = opportunities or default_opp
-            new_pain = f'\\1\n            {biz_content}\\2\n            {tech_content}\\3\n            {opp_content}\\4'
-            content = re.sub(pain_pattern, new_pain, content, flags=re.DOTALL)
-            update_applied = True
-
-    if intel and intel.get("competitors"):
-        # Update Tab 5: Competitive section table
-        comp_rows = ""
+                opportunities.append(alert_html)
+
+        default_biz = '            <div class="alert success"><strong>No Critical Challenges:</strong> Account appears stable.</div>'
+        default_tech = '            <div class="alert success"><strong>Monitoring:</strong> No significant technical pain points identified.</div>'
+        default_opp = '            <div class="alert success"><strong>Growth Focus:</strong> Explore expansion opportunities based on platform capabilities.</div>'
+        tabs["business_challenges"] = "\n".join(business_challenges) or default_biz
+        tabs["technical_pain_points"] = "\n".join(tech_challenges) or default_tech
+        tabs["opportunity_areas"] = "\n".join(opportunities) or default_opp
+
+    if intel.get("competitors"):
+        # Tab 5: Competitive threats table and landscape narrative
+        comp_rows = []
         comp_list_items = ""
         for comp in intel["competitors"]:
             threat_class = "critical" if comp["threat"] == "High" else ("warning" if comp["threat"] == "Medium" else "success")
-            comp_rows += f"""
-                    <tr>
+            comp_rows.append(f"""                    <tr>
                         <td>{comp["name"]}</td>
                         <td><span class="status-badge {threat_class}">{comp["threat"]}</span></td>
                         <td>{comp["strategy"]}</td>
-                    </tr>"""
+                    </tr>""")
             comp_list_items += f'<li><strong>{comp["name"]}</strong> ({comp["threat"]} threat): {comp["strategy"]}</li>'
 
-        # Update competitive threats table
-        comp_table_pattern = r'(<h2>Competitive Threats</h2>\s*<table>\s*<thead>\s*<tr>\s*<th>Competitor</th>\s*<th>Threat Level</th>\s*<th>Strategy</th>\s*</tr>\s*</thead>\s*<tbody>).*?(</tbody>)'
-        if re.search(comp_table_pattern, content, re.DOTALL):
-            content = re.sub(comp_table_pattern, f'\\1{comp_rows}\n                \\2', content, flags=re.DOTALL)
-            update_applied = True
-
-        # Update competitive landscape narrative
-        comp_narrative_pattern = r'(<h2>Competitive Landscape</h2>\s*<div style="padding: 1\.5rem; background: #f9f9f7; border-radius: 8px;">).*?(</div>)'
-        new_narrative = f"""\\1<p style="margin-bottom: 1rem;">Based on OSINT research and market intelligence ({datetime.now().strftime('%Y-%m-%d')}):</p><ul>{comp_list_items}</ul>\\2"""
-        if re.search(comp_narrative_pattern, content, re.DOTALL):
-            content = re.sub(comp_narrative_pattern, new_narrative, content, flags=re.DOTALL)
-
-    # Remove all remaining (Estimated) tags
-    content = content.replace('<span style="font-size:0.8em;color:var(--muted);">(Estimated)</span>', '')
-    content = content.replace('<span style="font-size:0.85em;color:var(--muted);">(Estimated based on industry analysis)</span>',
-                             f'<span style="font-size:0.85em;color:var(--muted);">(Based on web research - {datetime.now().strftime("%Y-%m-%d")})</span>')
-    content = content.replace('(Estimated)', '')
-
-    # Replace generic template text with research-based markers
-    content = content.replace(
-        'This telecommunications operator follows a typical telco organizational structure',
-        f'Based on web research ({datetime.now().strftime("%Y-%m-%d")}), this organization'
-    )
-    content = content.replace(
-        'Conduct OSINT research to identify key decision makers',
-        f'OSINT research completed {datetime.now().strftime("%Y-%m-%d")}. Verify contacts through direct engagement'
-    )
-    content = content.replace(
-        '(Research needed)',
-        f'(Web research {datetime.now().strftime("%Y-%m-%d")})'
-    )
-
-    # Only write if content changed
-    if content != original_content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True, quality_level
+        tabs["threat_rows"] = "\n".join(comp_rows)
+        tabs["competitive_landscape"] = f"""            <div style="padding: 1.5rem; background: #f9f9f7; border-radius: 8px;"><p style="margin-bottom: 1rem;">Based on OSINT research and market intelligence ({researched_on}):</p><ul>{comp_list_items}</ul></div>"""
 
-    return False, quality_level
+    return tabs, quality_level
 
 
 def main():
-    """Process all 140 account HTML files"""
+    """Re-render the account pages whose researched intelligence changed"""
+    # Imported here: generate_accounts imports this module for the tab content
+    from generate_accounts import ACCOUNTS_DIR, add_render_arguments, print_dry_run, render_accounts
+
+    parser = argparse.ArgumentParser(description='Re-render the account pages whose researched intelligence changed')
+    add_render_arguments(parser)
+    args = parser.parse_args()
 
     results = {
         "total_files": 0,
@@ -1483,55 +209,58 @@ def main():
         "details": []
     }
 
-    html_files = sorted([f for f in os.listdir(ACCOUNTS_DIR) if f.endswith('.html')])
-    results["total_files"] = len(html_files)
-
-    print(f"Processing {len(html_files)} account HTML files...")
+    print("Rendering account pages with researched intelligence...")
     print("=" * 60)
 
-    for i, filename in enumerate(html_files):
-        filepath = os.path.join(ACCOUNTS_DIR, filename)
-        try:
-            updated, quality = generate_update_for_file(filepath, INTELLIGENCE_DB)
-
-            if updated:
-                results["updated"] += 1
-                if quality == "verified":
-                    results["verified"] += 1
-                elif quality == "high-confidence":
-                    results["high_confidence"] += 1
-                elif quality == "inferred":
-                    results["inferred"] += 1
-                else:
-                    results["template_cleaned"] += 1
-
-            results["details"].append({
-                "file": filename,
-                "updated": updated,
-                "quality": quality
-            })
+    rendered = render_accounts(only=args.only, force=args.force, jobs=args.jobs, dry_run=args.dry_run)
+    if args.dry_run:
+        print_dry_run(rendered)
+        return None
+    results["total_files"] = len(rendered)
+
+    for i, account in enumerate(rendered):
+        filename = account["file"]
+        if account["error"]:
+            results["errors"].append({"file": filename, "error": account["error"]})
+            print(f"  [{i+1:3d}/{len(rendered)}] ERROR    - {filename}: {account['error'][:50]}")
+            continue
+
+        updated = account["rendered"]
+        quality = account["quality"]
+        if updated:
+            results["updated"] += 1
+            if quality == "verified":
+                results["verified"] += 1
+            elif quality == "high-confidence":
+                results["high_confidence"] += 1
+            elif quality == "inferred":
+                results["inferred"] += 1
+            else:
+                results["template_cleaned"] += 1
 
-            status = "UPDATED" if updated else "cleaned"
-            print(f"  [{i+1:3d}/{len(html_files)}] {status:8s} ({quality:16s}) - {filename}")
+        results["details"].append({
+            "file": filename,
+            "updated": updated,
+            "quality": quality,
+            "seconds": round(account["seconds"], 4)
+        })
 
-        except Exception as e:
-            results["errors"].append({"file": filename, "error": str(e)})
-            print(f"  [{i+1:3d}/{len(html_files)}] ERROR    - {filename}: {str(e)[:50]}")
+        status = "UPDATED" if updated else "current"
+        print(f"  [{i+1:3d}/{len(rendered)}] {status:8s} ({quality:16s}) - {filename}")
 
     print("\n" + "=" * 60)
     print(f"RESULTS SUMMARY")
-    print(f"  Total files processed:  {results['total_files']}")
-    print(f"  Files updated:          {results['updated']}")
+    print(f"  Total accounts:         {results['total_files']}")
+    print(f"  Accounts re-rendered:   {results['updated']}")
     print(f"  - Verified data:        {results['verified']}")
     print(f"  - High-confidence:      {results['high_confidence']}")
     print(f"  - Inferred:             {results['inferred']}")
     print(f"  - Template cleaned:     {results['template_cleaned']}")
     print(f"  Errors:                 {len(results['errors'])}")
 
-    # Save results as JSON for report generation
+    # Save results as JSON for report generation (merged from every worker's accounts)
     results_path = os.path.join(os.path.dirname(ACCOUNTS_DIR), "osint_results.json")
-    with open(results_path, 'w') as f:
-        json.dump(results, f, indent=2)
+    write_atomic(results_path, json.dumps(results, indent=2))
     print(f"\nResults saved to: {results_path}")
 
     return results
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark: account pages formatted inline vs. rendered from compiled templates.
+
+For both account page generators (generate_accounts.py and
+generate_all_accounts.py), renders and writes every customer's page twice
+into a scratch directory:
+
+    inline     the previous approach: the whole page, with the shared
+               stylesheet and script inlined, formatted per customer
+    compiled   PageTemplate.render() of the static chunks and slots, with the
+               shared assets written once and linked
+
+Slot values are computed once beforehand (both modes need the same ones),
+so the times cover formatting the pages and writing them, reported
+separately (best of --runs each) along with the bytes each mode writes.
+generate_accounts pages are rendered with the [OSINT NEEDED] placeholder
+tabs, so the benchmark needs only the customer extracts.
+
+Usage:
+  python3 scripts/benchmark_account_pages.py [--runs 5] [--data-dir data]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import generate_accounts
+import generate_all_accounts
+from page_template import SLOT
+
+
+def inline_format_source(template, assets):
+    """str.format source of a compiled template with its linked assets inlined.
+
+    Args:
+        template: PageTemplate
+        assets: (filename, text, link tag in the template, opening tag, closing tag) per asset
+    """
+    source = template.source
+    for _, text, link, open_tag, close_tag in assets:
+        indented = ''.join(f"        {line}" if line.strip() else line for line in text.splitlines(True))
+        source = source.replace(link, f"{open_tag}\n{indented}    {close_tag}")
+    source = source.replace('{', '{{').replace('}', '}}')
+    return SLOT.sub(r'{\1}', source.replace('{{{{', '{{').replace('}}}}', '}}'))
+
+
+def page_cases(data_dir):
+    """(name, template, assets, [(filename, slot values), ...]) per generator.
+
+    assets are (filename, text, link tag, inline opening tag, inline closing tag).
+    """
+    customers = generate_accounts.load_customer_data(data_dir)
+    plan_pages = [(filename, generate_accounts.account_page_values(customer))
+                  for customer, filename in zip(customers, generate_accounts.account_filenames(customers))]
+    summary_pages = [(generate_all_accounts.url_name(customer['customer_name']) + '.html',
+                      generate_all_accounts.account_page_values(customer, customer['bu']))
+                     for customer in customers if customer['total'] != 0]
+
+    return [
+        ('generate_accounts', generate_accounts.ACCOUNT_PAGE, [
+            (generate_accounts.ACCOUNT_PAGE_STYLESHEET, generate_accounts.ACCOUNT_PAGE_CSS,
+             f'<link rel="stylesheet" href="{generate_accounts.ACCOUNT_PAGE_STYLESHEET}">', '<style>', '</style>'),
+            (generate_accounts.ACCOUNT_PAGE_SCRIPT, generate_accounts.ACCOUNT_PAGE_JS,
+             f'<script src="{generate_accounts.ACCOUNT_PAGE_SCRIPT}"></script>', '<script>', '</script>'),
+        ], plan_pages),
+        ('generate_all_accounts', generate_all_accounts.ACCOUNT_PAGE, [
+            (generate_all_accounts.ACCOUNT_PAGE_STYLESHEET, generate_all_accounts.ACCOUNT_PAGE_CSS,
+             f'<link rel="stylesheet" href="{generate_all_accounts.ACCOUNT_PAGE_STYLESHEET}">', '<style>', '</style>'),
+        ], summary_pages),
+    ]
+
+
+def write_pages(output_dir, pages):
+    """Write (filename, text) pairs; returns bytes written."""
+    written = 0
+    for filename, text in pages:
+        data = text.encode('utf-8')
+        with open(os.path.join(output_dir, filename), 'wb') as f:
+            f.write(data)
+        written += len(data)
+    return written
+
+
+def run_inline(source, assets, pages, output_dir):
+    """Format every whole page, with its assets inlined, then write them.
+
+    Returns:
+        tuple: (render seconds, write seconds, bytes written)
+    """
+    start = time.perf_counter()
+    rendered = [(filename, source.format_map(values)) for filename, values in pages]
+    render_time = time.perf_counter() - start
+    start = time.perf_counter()
+    written = write_pages(output_dir, rendered)
+    return render_time, time.perf_counter() - start, written
+
+
+def run_compiled(template, assets, pages, output_dir):
+    """Render every page's slots into the compiled template, then write them and the shared assets once.
+
+    Returns:
+        tuple: (render seconds, write seconds, bytes written)
+    """
+    start = time.perf_counter()
+    rendered = [(filename, template.render(values)) for filename, values in pages]
+    render_time = time.perf_counter() - start
+    start = time.perf_counter()
+    written = write_pages(output_dir, [(name, text) for name, text, _, _, _ in assets] + rendered)
+    return render_time, time.perf_counter() - start, written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark inline vs. compiled account page rendering')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per mode')
+    parser.add_argument('--data-dir', default=generate_accounts.DATA_DIR,
+                        help='Directory with the customers_<bu>_all.json extracts')
+    args = parser.parse_args()
+
+    try:
+        cases = page_cases(args.data_dir)
+    except OSError as e:
+        print(f"ERROR: could not load customer data: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Best of {args.runs} runs\n")
+    print(f"{'Generator':<22} {'Mode':<9} {'Pages':>6} {'Render':>10} {'Write':>10} {'Bytes written':>14} "
+          f"{'Bytes/page':>11}")
+    print("-" * 88)
+    with tempfile.TemporaryDirectory() as output_dir:
+        for name, template, assets, pages in cases:
+            source = inline_format_source(template, assets)
+            results = {}
+            for mode, run in (('inline', lambda run_dir: run_inline(source, assets, pages, run_dir)),
+                              ('compiled', lambda run_dir: run_compiled(template, assets, pages, run_dir))):
+                # A fresh directory per run, so no mode pays for truncating another's files
+                runs = [run(tempfile.mkdtemp(dir=output_dir)) for _ in range(args.runs)]
+                results[mode] = (min(r[0] for r in runs), min(r[1] for r in runs), runs[0][2])
+
+            for mode, (render_time, write_time, written) in results.items():
+                print(f"{name:<22} {mode:<9} {len(pages):>6} {render_time * 1000:>8.2f}ms {write_time * 1000:>8.2f}ms "
+                      f"{written:>14,} {written // max(len(pages), 1):>11,}")
+
+            inline, compiled = results['inline'], results['compiled']
+            print(f"{'':<22} compiled: {compiled[0] / inline[0]:.2f}x the render time, "
+                  f"{compiled[1] / inline[1]:.2f}x the write time, {compiled[2] / inline[2]:.0%} of the bytes\n")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-shape regex table extraction vs. the report_tables pipe-table parser.
+
+Runs the previous regex extractors (executives, action plan, risk matrix)
+and the report_tables-based extractors in parse_intelligence_for_tabs over
+every intelligence report, and reports time and rows found by each.
+
+Usage:
+  python3 scripts/benchmark_report_tables.py [--runs 5] [--dir data/intelligence/reports]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from parse_intelligence_for_tabs import extract_action_plan, extract_executives, extract_risks
+from report_index import REPORTS_DIR
+from report_sections import parse_report
+
+
+# Previous regex extractors, kept here as the baseline
+def regex_executives(text):
+    executives = []
+    table_text = parse_report(text).section('C-Suite and Key Decision Makers')
+    if table_text is not None:
+        rows = re.findall(r'\| \*\*(.+?)\*\* \| (.+?) \| (.+?) \| (.+?) \|', table_text)
+        for role, name, background, tenure in rows:
+            executives.append({'role': role.strip(), 'name': name.strip(),
+                               'background': background.strip(), 'tenure': tenure.strip()})
+    return executives
+
+
+def regex_action_plan(text):
+    actions = {'immediate': [], 'short_term': [], 'strategic': []}
+    report = parse_report(text)
+    for bucket, title in (('immediate', 'Immediate Actions (0-30 Days)'),
+                          ('short_term', 'Short-Term Actions (30-90 Days)'),
+                          ('strategic', 'Strategic Actions (90+ Days)')):
+        table_text = report.section(title, stop=(3,))
+        if table_text is not None:
+            rows = re.findall(r'\| (\d+) \| \*\*(.+?)\*\* - (.+?) \| (.+?) \| (.+?) \|', table_text)
+            for priority, title, detail, owner, metric in rows:
+                actions[bucket].append({'priority': int(priority), 'title': title.strip(), 'detail': detail.strip(),
+                                        'owner': owner.strip(), 'metric': metric.strip()})
+    return actions
+
+
+def regex_risks(text):
+    risks = []
+    table_text = parse_report(text).section('Risk Assessment Matrix', stop=(3,))
+    if table_text is not None:
+        rows = re.findall(r'\| \*\*(.+?)\*\* \| (.+?) \| (.+?) \| (.+?) \| (.+?) \|', table_text)
+        for risk, probability, impact, severity, mitigation in rows:
+            risks.append({'risk': risk.strip(), 'probability': probability.strip(), 'impact': impact.strip(),
+                          'severity': severity.strip(), 'mitigation': mitigation.strip()})
+    return risks
+
+
+EXTRACTORS = {
+    'regex': (regex_executives, regex_action_plan, regex_risks),
+    'table parser': (extract_executives, extract_action_plan, extract_risks),
+}
+
+
+def count_rows(executives, actions, risks):
+    return len(executives), sum(len(rows) for rows in actions.values()), len(risks)
+
+
+def run(extractors, reports):
+    """Extract every report once; returns (seconds, row counts).
+
+    Reports are tokenized (report_sections) before timing, since both
+    extractors share that step.
+    """
+    for text in reports:
+        parse_report(text)
+    executives_fn, actions_fn, risks_fn = extractors
+    totals = [0, 0, 0]
+
+    start = time.perf_counter()
+    for text in reports:
+        counts = count_rows(executives_fn(text), actions_fn(text), risks_fn(text))
+        totals = [a + b for a, b in zip(totals, counts)]
+    return time.perf_counter() - start, totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark intelligence report table extraction')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per extractor')
+    parser.add_argument('--dir', default=str(REPORTS_DIR), help='Reports directory')
+    args = parser.parse_args()
+
+    report_files = sorted(Path(args.dir).glob('*.md'))
+    if not report_files:
+        print(f"ERROR: no reports found in {args.dir}", file=sys.stderr)
+        sys.exit(1)
+    reports = [f.read_text() for f in report_files]
+
+    results = {}
+    for mode, extractors in EXTRACTORS.items():
+        runs = [run(extractors, reports) for _ in range(args.runs)]
+        results[mode] = (min(seconds for seconds, _ in runs), runs[0][1])
+
+    print(f"{len(reports)} reports, best of {args.runs} runs\n")
+    print(f"{'Extractor':<14} {'Best time':>12} {'Executives':>11} {'Actions':>9} {'Risks':>7}")
+    print("-" * 57)
+    for mode, (seconds, (executives, actions, risks)) in results.items():
+        print(f"{mode:<14} {seconds * 1000:>10.1f}ms {executives:>11} {actions:>9} {risks:>7}")
+
+    regex_time, regex_rows = results['regex']
+    table_time, table_rows = results['table parser']
+    print(f"\nTable parser time: {table_time / regex_time:.2f}x the regex time, "
+          f"{sum(table_rows) - sum(regex_rows)} rows recovered that the regexes dropped")
+
+
+if __name__ == '__main__':
+    main()
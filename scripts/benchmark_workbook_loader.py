@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: full load_workbook vs. streaming read-only projected loader.
+
+Each run happens in a fresh subprocess so peak RSS is measured per loader.
+
+Usage:
+  python3 scripts/benchmark_workbook_loader.py [--runs 3] [--file PATH]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+from budget_workbook import EXCEL_FILE, BU_CONFIGS, extract_customers_by_bu, load_budget_workbook
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_once(mode, path):
+    """Load the workbook and extract all BUs using one loader; print a JSON result line."""
+    start = time.perf_counter()
+
+    if mode == 'full':
+        from openpyxl import load_workbook
+        wb = load_workbook(path, data_only=True)
+    else:
+        wb = load_budget_workbook(path)
+
+    customers_by_bu = extract_customers_by_bu(wb, BU_CONFIGS)
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        'mode': mode,
+        'seconds': elapsed,
+        'peak_rss_mb': peak_rss_mb(),
+        'customers': sum(len(c) for c in customers_by_bu.values()),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark budget workbook loaders')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per loader')
+    parser.add_argument('--file', default=EXCEL_FILE, help='Workbook path')
+    parser.add_argument('--mode', choices=['full', 'streaming'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_once(args.mode, args.file)
+        return
+
+    if not os.path.exists(args.file):
+        print(f"ERROR: Excel file not found: {args.file}", file=sys.stderr)
+        sys.exit(1)
+
+    results = {}
+    for mode in ['full', 'streaming']:
+        runs = []
+        for _ in range(args.runs):
+            out = subprocess.run(
+                [sys.executable, __file__, '--mode', mode, '--file', args.file],
+                capture_output=True, text=True, check=True
+            )
+            runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        results[mode] = runs
+
+    print(f"{'Loader':<12} {'Best time':>12} {'Peak RSS':>12} {'Customers':>10}")
+    print("-" * 50)
+    for mode, runs in results.items():
+        best = min(r['seconds'] for r in runs)
+        rss = min(r['peak_rss_mb'] for r in runs)
+        print(f"{mode:<12} {best:>11.2f}s {rss:>10.1f}MB {runs[0]['customers']:>10}")
+
+    full_time = min(r['seconds'] for r in results['full'])
+    stream_time = min(r['seconds'] for r in results['streaming'])
+    full_rss = min(r['peak_rss_mb'] for r in results['full'])
+    stream_rss = min(r['peak_rss_mb'] for r in results['streaming'])
+    print(f"\nSpeedup: {full_time / stream_time:.1f}x, peak RSS reduced {(1 - stream_rss / full_rss) * 100:.0f}%")
+
+    if results['full'][0]['customers'] != results['streaming'][0]['customers']:
+        print("WARNING: loaders extracted different customer counts", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
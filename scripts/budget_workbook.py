@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Shared loader and extraction engine for the Skyvera budget workbook.
+
+load_budget_workbook() opens the file in streaming read-only mode, reads
+only the requested sheets and keeps only the columns the extractors index.
+The extraction engine streams 'RR Input' and 'NRR Input' exactly once and
+fans each row out to per-company (RR) and per-class (NRR) buckets, so
+extracting every BU costs one pass per sheet instead of one pass per BU.
+"""
+
+import re
+from collections import namedtuple
+from openpyxl import load_workbook
+
+# Excel file path relative to project root
+EXCEL_FILE = "2025-12-11 Skyvera - Budget - Q1'26 - For Todd.xlsx"
+
+# 0-based column indexes read by the extractors
+RR_COLUMNS = (0, 1, 3, 6, 7, 8, 9, 11)    # Company, Customer, Sub ID, ARR, Renewal Date, Renewal Qtr, Will Renew, Projected ARR
+NRR_COLUMNS = (1, 2, 8, 9, 10, 11)        # Customer, Class, Q1'26..Q4'26
+PNL_COLUMNS = (1, 2, 4)                   # Label, Q1'26 BU Plan, Q1'26 Prior BU Plan
+
+PNL_SHEETS = ['P&Ls - Cloudsense', 'P&Ls - Kandy', 'P&Ls - STL', 'P&Ls']
+
+# Sheet -> projected columns (None keeps every column)
+SHEET_PROJECTIONS = {
+    'RR Input': RR_COLUMNS,
+    'NRR Input': NRR_COLUMNS,
+    'RR Summary': None,
+    **{sheet: PNL_COLUMNS for sheet in PNL_SHEETS},
+}
+
+# (BU name, RR Input company filter, NRR Input class filter)
+BU_CONFIGS = [
+    ('Cloudsense', 'Cloudsense', 'Cloudsense'),
+    ('Kandy', 'Kandy', 'Kandy'),
+    ('STL', 'STL', 'Stl'),
+    ('NewNet', 'NewNet', 'Newnet')
+]
+
+# Handles the "New Sales Ps - <Customer>" naming in NRR Input
+NRR_NAME_PATTERN = re.compile(r'<(.+?)>')
+
+
+CellValue = namedtuple('CellValue', 'value')
+
+# 'RR Input' columns H, I, J for one customer
+RenewalInfo = namedtuple('RenewalInfo', 'renewal_date renewal_qtr will_renew')
+
+
+class ProjectedSheet:
+    """In-memory sheet holding the projected columns of every row.
+
+    Mirrors the parts of the openpyxl worksheet API the scripts use:
+    iter_rows(min_row=..., values_only=True) and cell(row, column).value.
+    Columns outside the projection read as None.
+    """
+
+    def __init__(self, title, rows):
+        self.title = title
+        self.rows = rows
+
+    @property
+    def max_row(self):
+        return len(self.rows)
+
+    def iter_rows(self, min_row=1, max_row=None, values_only=True):
+        return iter(self.rows[min_row - 1:max_row])
+
+    def cell(self, row, column):
+        if 1 <= row <= len(self.rows):
+            values = self.rows[row - 1]
+            if column <= len(values):
+                return CellValue(values[column - 1])
+        return CellValue(None)
+
+
+class ProjectedWorkbook:
+    """Dict-like collection of ProjectedSheets with openpyxl-style access."""
+
+    def __init__(self, sheets):
+        self.sheets = sheets
+
+    @property
+    def sheetnames(self):
+        return list(self.sheets)
+
+    def __getitem__(self, name):
+        return self.sheets[name]
+
+    def __contains__(self, name):
+        return name in self.sheets
+
+
+def project_rows(ws, columns):
+    """Stream a read-only worksheet keeping only the given 0-based columns."""
+    if columns is None:
+        return [tuple(row) for row in ws.iter_rows(values_only=True)]
+
+    width = max(columns) + 1
+    keep = sorted(columns)
+    rows = []
+    for row in ws.iter_rows(max_col=width, values_only=True):
+        projected = [None] * width
+        for index in keep:
+            if index < len(row):
+                projected[index] = row[index]
+        rows.append(tuple(projected))
+    return rows
+
+
+def load_budget_workbook(path=EXCEL_FILE, sheets=None, projections=SHEET_PROJECTIONS):
+    """Load the budget workbook in streaming read-only mode.
+
+    Args:
+        path (str): Workbook path
+        sheets (list): Sheet names to load (default: every sheet in projections);
+            missing sheets are skipped
+        projections (dict): Sheet name -> 0-based columns to keep (None = all)
+
+    Returns:
+        ProjectedWorkbook: Requested sheets materialized as projected rows
+    """
+    if sheets is None:
+        sheets = list(projections)
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        loaded = {}
+        for name in sheets:
+            if name in wb.sheetnames:
+                loaded[name] = ProjectedSheet(name, project_rows(wb[name], projections.get(name)))
+        return ProjectedWorkbook(loaded)
+    finally:
+        wb.close()
+
+
+def _col(row, index):
+    return row[index] if len(row) > index else None
+
+
+def scan_rr_input(wb, company_filters, fill_missing_arr=False):
+    """Single pass over 'RR Input', bucketing subscriptions by company.
+
+    Args:
+        wb: openpyxl Workbook or ProjectedWorkbook
+        company_filters (iterable): Values of column A to keep
+        fill_missing_arr (bool): Store 0 instead of None for empty ARR cells
+
+    Returns:
+        dict: company -> {customer_name: {'customer_name', 'rr', 'nrr', 'subscriptions'}}
+    """
+    buckets = {company: {} for company in company_filters}
+
+    try:
+        ws = wb['RR Input']
+    except KeyError:
+        return buckets
+
+    for row in ws.iter_rows(min_row=11, values_only=True):
+        if not row or not row[0]:
+            continue
+
+        customers = buckets.get(row[0])
+        customer_name = _col(row, 1)
+        if customers is None or not customer_name:
+            continue
+
+        arr = _col(row, 6)
+
+        if customer_name not in customers:
+            customers[customer_name] = {
+                'customer_name': customer_name,
+                'rr': 0,
+                'nrr': 0,
+                'subscriptions': []
+            }
+
+        customers[customer_name]['rr'] += arr if arr else 0
+        customers[customer_name]['subscriptions'].append({
+            'sub_id': _col(row, 3),
+            'arr': (arr if arr else 0) if fill_missing_arr else arr,
+            'renewal_qtr': _col(row, 8),
+            'will_renew': _col(row, 9),
+            'projected_arr': _col(row, 11)
+        })
+
+    return buckets
+
+
+def scan_renewal_dates(wb):
+    """Single pass over 'RR Input' collecting each customer's renewal columns.
+
+    Returns:
+        dict: customer name -> RenewalInfo (the customer's last row wins)
+    """
+    renewals = {}
+
+    try:
+        ws = wb['RR Input']
+    except KeyError:
+        return renewals
+
+    for row in ws.iter_rows(min_row=11, values_only=True):
+        customer_name = _col(row, 1)
+        if not isinstance(customer_name, str) or not customer_name or customer_name in ('SUM', 'SUBTOTAL'):
+            continue
+        renewals[customer_name] = RenewalInfo(_col(row, 7), _col(row, 8), _col(row, 9))
+
+    return renewals
+
+
+def scan_nrr_input(wb, class_filters):
+    """Single pass over 'NRR Input', summing FY26 NRR per class filter.
+
+    A row is added to every class filter contained in its Class column,
+    matching the substring semantics of the per-BU extractors.
+
+    Returns:
+        dict: class_filter -> {customer_name: fy26_nrr}
+    """
+    buckets = {class_filter: {} for class_filter in class_filters}
+
+    try:
+        ws = wb['NRR Input']
+    except KeyError:
+        return buckets
+
+    for row in ws.iter_rows(min_row=6, values_only=True):
+        if not row or not _col(row, 1):
+            continue
+
+        class_col = _col(row, 2)
+        if not class_col:
+            continue
+
+        matched = [f for f in buckets if f in class_col]
+        if not matched:
+            continue
+
+        customer_name = row[1]
+        match = NRR_NAME_PATTERN.search(customer_name) if isinstance(customer_name, str) else None
+        if match:
+            customer_name = match.group(1).strip()
+
+        if not customer_name:
+            continue
+
+        fy26_nrr = ((_col(row, 8) or 0) + (_col(row, 9) or 0) +
+                    (_col(row, 10) or 0) + (_col(row, 11) or 0))
+
+        for class_filter in matched:
+            customers = buckets[class_filter]
+            customers[customer_name] = customers.get(customer_name, 0) + fy26_nrr
+
+    return buckets
+
+
+def merge_bu_customers(rr_customers, nrr_data):
+    """Combine RR and NRR buckets into ranked customer records.
+
+    Returns:
+        list: Customers sorted by total revenue with 'rank' and 'pct_of_total'
+    """
+    all_customer_names = set(rr_customers.keys()) | set(nrr_data.keys())
+
+    customers = []
+    for name in all_customer_names:
+        rr = rr_customers.get(name, {}).get('rr', 0)
+        nrr = nrr_data.get(name, 0)
+
+        customers.append({
+            'customer_name': name,
+            'rr': rr,
+            'nrr': nrr,
+            'total': rr + nrr,
+            'subscriptions': rr_customers.get(name, {}).get('subscriptions', [])
+        })
+
+    # Sort by total revenue descending
+    customers.sort(key=lambda x: x['total'], reverse=True)
+
+    # Add rank and percentage
+    total_revenue = sum(c['total'] for c in customers)
+    for i, customer in enumerate(customers, 1):
+        customer['rank'] = i
+        customer['pct_of_total'] = (customer['total'] / total_revenue * 100) if total_revenue > 0 else 0
+
+    return customers
+
+
+def extract_customers_by_bu(wb, bu_configs=BU_CONFIGS, fill_missing_arr=False):
+    """Extract ranked customers for every BU with one scan per input sheet.
+
+    Returns:
+        dict: BU name -> list of customer records
+    """
+    rr_buckets = scan_rr_input(wb, {company for _, company, _ in bu_configs},
+                               fill_missing_arr=fill_missing_arr)
+    nrr_buckets = scan_nrr_input(wb, {class_filter for _, _, class_filter in bu_configs})
+
+    return {
+        bu_name: merge_bu_customers(rr_buckets[company], nrr_buckets[class_filter])
+        for bu_name, company, class_filter in bu_configs
+    }
@@ -6,8 +6,15 @@ Organizes intelligence reports into proper tab structure with Overview, Executiv
 
 import json
 import os
-import re
-from pathlib import Path
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_names import file_stem
+from customer_options import options_script_tag, select_attributes, write_options_script
+from customer_registry import customer_report_stem
+from intelligence_store import open_intelligence_store
+from markdown_render import render_batch
+from report_store import open_report_store
 
 
 def load_customers(bu='cloudsense'):
@@ -28,100 +35,28 @@ def load_customers(bu='cloudsense'):
 
 
 def load_intelligence_data():
-    """Load pregenerated intelligence HTML."""
-    filepath = 'data/intelligence_html.json'
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    return {}
-
-
-def load_intelligence_markdown(customer_name):
-    """Load raw markdown intelligence report with fuzzy matching."""
-    customer_key = customer_name.replace('/', '-').replace(' ', '_')
-
-    # Try exact match first
-    filepath = f'data/intelligence/reports/{customer_key}.md'
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return f.read()
-
-    # Try without suffix (Ltd, Inc, plc, etc.)
-    base_name = customer_name
-    for suffix in [' plc', ' Ltd', ' Limited', ', Inc.', ' Inc.', ' Inc', ' Sdn Bhd', ' AG.', ' AG', ' US', ' Pty Limited', ' Pty Ltd', ' BV', ' NV/SA', ' GmbH & Co. OHG', ' - Go Get', ' - Ges(a)']:
-        if base_name.endswith(suffix):
-            base_name = base_name[:-len(suffix)]
-            break
-
-    customer_key_clean = base_name.replace('/', '-').replace(' ', '_')
-    filepath_clean = f'data/intelligence/reports/{customer_key_clean}.md'
-    if os.path.exists(filepath_clean):
-        with open(filepath_clean, 'r') as f:
-            return f.read()
-
-    # Normalize for matching (remove special chars, lowercase)
-    def normalize(s):
-        return s.lower().replace('&', '').replace(',', '').replace('.', '').replace(' ', '').replace('_', '').replace('-', '')
-
-    base_normalized = normalize(base_name)
-
-    # Try all files in directory for partial match
-    reports_dir = Path('data/intelligence/reports')
-    if reports_dir.exists():
-        for report_file in reports_dir.glob('*.md'):
-            file_normalized = normalize(report_file.stem)
-            if file_normalized == base_normalized or (len(base_normalized) > 5 and file_normalized in base_normalized) or (len(file_normalized) > 5 and base_normalized in file_normalized):
-                with open(report_file, 'r') as f:
-                    return f.read()
-
-    return None
-
-
-def extract_section_from_markdown(md_content, section_name):
-    """Extract a specific section from markdown content."""
-    if not md_content:
-        return None
-
-    # Try exact match first
-    pattern = rf'##\s+{re.escape(section_name)}\s*\n(.*?)(?=\n##\s+|\Z)'
-    match = re.search(pattern, md_content, re.DOTALL | re.IGNORECASE)
+    """Pregenerated intelligence HTML as a lazy per-customer mapping."""
+    return open_intelligence_store()
 
-    if match:
-        return match.group(1).strip()
 
-    # Try partial match (case insensitive, any text containing the search term)
-    pattern = rf'##\s+[^\n]*{re.escape(section_name)}[^\n]*\n(.*?)(?=\n##\s+|\Z)'
-    match = re.search(pattern, md_content, re.DOTALL | re.IGNORECASE)
+def load_intelligence_sections(store, customer_name):
+    """Dashboard tab sections of a customer's intelligence report, or None if it has none.
 
-    if match:
-        return match.group(1).strip()
+    The report is matched through the customer registry and its sections
+    read from the report store (see report_store.py).
+    """
+    report_stem = customer_report_stem(customer_name)
+    if report_stem is None or not store.has_report(report_stem):
+        return None
+    return store.tab_sections(report_stem)
 
-    return None
 
+def create_tabbed_dashboard(customer, all_customers, sections, bu='cloudsense'):
+    """Create full tabbed dashboard with intelligence data organized into sections.
 
-def generate_customer_dropdown(all_customers, current_customer, bu='cloudsense'):
-    """Generate customer dropdown options."""
-    if bu == 'cloudsense':
-        prefix = ''
-        return_path = 'index.html'
-    else:
-        prefix = ''
-        return_path = f'{bu}/index.html'
-
-    options = []
-    for customer in all_customers:
-        filename = customer['customer_name'].replace('/', '-').replace(' ', '_') + '.html'
-        if bu != 'cloudsense':
-            filename = f'{bu}/{filename}'
-        selected = ' selected' if customer['customer_name'] == current_customer else ''
-        options.append(
-            f'<option value="{filename}"{selected}>#{customer["rank"]} - {customer["customer_name"]} (${customer["total"]/1000000:.2f}M)</option>'
-        )
-    return '\n'.join(options)
-
-
-def create_tabbed_dashboard(customer, all_customers, intelligence_md, bu='cloudsense'):
-    """Create full tabbed dashboard with intelligence data organized into sections."""
+    Args:
+        sections: tab -> section markdown (report_store.TAB_SECTION_HEADINGS keys)
+    """
     customer_name = customer['customer_name']
 
     # Extract key metrics
@@ -131,112 +66,24 @@ def create_tabbed_dashboard(customer, all_customers, intelligence_md, bu='clouds
     rank = customer['rank']
     pct_of_total = customer.get('pct_of_total', 0)
 
-    # Extract intelligence sections with multiple fallback options
-    exec_summary = (
-        extract_section_from_markdown(intelligence_md, 'EXECUTIVE SUMMARY') or
-        extract_section_from_markdown(intelligence_md, 'Executive Summary')
-    )
-
-    company_intel = (
-        extract_section_from_markdown(intelligence_md, 'COMPANY INTELLIGENCE') or
-        extract_section_from_markdown(intelligence_md, 'Company Intelligence') or
-        extract_section_from_markdown(intelligence_md, 'COMPANY PROFILE') or
-        extract_section_from_markdown(intelligence_md, '1. CUSTOMER PROFILE')  # Spotify format
-    )
-
-    executives = (
-        extract_section_from_markdown(intelligence_md, 'EXECUTIVE LEADERSHIP') or
-        extract_section_from_markdown(intelligence_md, 'KEY EXECUTIVES') or
-        extract_section_from_markdown(intelligence_md, 'LEADERSHIP') or
-        extract_section_from_markdown(intelligence_md, 'Key Executives') or
-        extract_section_from_markdown(intelligence_md, 'COMPANY OVERVIEW')  # Some reports have leadership in company overview
-    )
-
-    org_structure = (
-        extract_section_from_markdown(intelligence_md, 'ORGANIZATIONAL STRUCTURE') or
-        extract_section_from_markdown(intelligence_md, '2. ORGANIZATIONAL STRUCTURE') or  # Spotify format
-        extract_section_from_markdown(intelligence_md, 'ORG STRUCTURE') or
-        extract_section_from_markdown(intelligence_md, 'ORGANIZATION') or
-        extract_section_from_markdown(intelligence_md, 'CORPORATE STRUCTURE') or
-        extract_section_from_markdown(intelligence_md, 'BUSINESS SEGMENTS') or
-        extract_section_from_markdown(intelligence_md, 'KEY STAKEHOLDERS') or  # DPLAY
-        extract_section_from_markdown(intelligence_md, 'COMPANY PROFILE') or  # DPLAY
-        extract_section_from_markdown(intelligence_md, 'PARENT COMPANY') or  # DPLAY parent company info
-        extract_section_from_markdown(intelligence_md, 'CORPORATE TRANSFORMATION') or  # DPLAY
-        extract_section_from_markdown(intelligence_md, 'COMPANY OVERVIEW') or  # HCL, New Sales Ps, One Albania
-        extract_section_from_markdown(intelligence_md, 'STRATEGIC CONTEXT') or
-        extract_section_from_markdown(intelligence_md, 'STRATEGIC DIRECTION') or  # Thryv
-        extract_section_from_markdown(intelligence_md, 'STRATEGIC INTELLIGENCE') or  # HCL
-        extract_section_from_markdown(intelligence_md, 'STRATEGIC ANALYSIS') or  # New Sales Ps
-        extract_section_from_markdown(intelligence_md, 'FINANCIAL ANALYSIS')  # Fallback for company context
-    )
-
-    pain_points = (
-        extract_section_from_markdown(intelligence_md, 'PAIN POINTS & CHALLENGES') or
-        extract_section_from_markdown(intelligence_md, 'PAIN POINTS') or
-        extract_section_from_markdown(intelligence_md, 'PAIN POINT') or
-        extract_section_from_markdown(intelligence_md, 'CHALLENGES') or
-        extract_section_from_markdown(intelligence_md, 'STRATEGIC INITIATIVES') or
-        extract_section_from_markdown(intelligence_md, 'RISK ASSESSMENT') or
-        extract_section_from_markdown(intelligence_md, 'RISKS')
-    )
-
-    competitive = (
-        extract_section_from_markdown(intelligence_md, 'COMPETITIVE LANDSCAPE') or
-        extract_section_from_markdown(intelligence_md, '7. COMPETITIVE LANDSCAPE') or  # Spotify format
-        extract_section_from_markdown(intelligence_md, 'COMPETITIVE') or
-        extract_section_from_markdown(intelligence_md, 'COMPETITION') or
-        extract_section_from_markdown(intelligence_md, 'COMPETITIVE THREAT') or  # HCL
-        extract_section_from_markdown(intelligence_md, 'MARKET CONTEXT') or
-        extract_section_from_markdown(intelligence_md, 'STRATEGIC CONTEXT') or
-        extract_section_from_markdown(intelligence_md, 'STRATEGIC ANALYSIS') or  # New Sales Ps
-        extract_section_from_markdown(intelligence_md, 'ROOT CAUSE ANALYSIS')  # One Albania (has competitive info in root cause)
-    )
-
-    opportunities = (
-        extract_section_from_markdown(intelligence_md, 'OPPORTUNITY ANALYSIS') or
-        extract_section_from_markdown(intelligence_md, 'OPPORTUNITY ASSESSMENT') or
-        extract_section_from_markdown(intelligence_md, 'OPPORTUNITIES') or
-        extract_section_from_markdown(intelligence_md, '6. EXPANSION OPPORTUNITIES') or  # Spotify format
-        extract_section_from_markdown(intelligence_md, 'OPPORTUNIT') or
-        extract_section_from_markdown(intelligence_md, 'GROWTH') or
-        extract_section_from_markdown(intelligence_md, 'EXPANSION') or
-        extract_section_from_markdown(intelligence_md, 'STRATEGIC INTELLIGENCE') or  # HCL (has opportunities in strategic intelligence)
-        extract_section_from_markdown(intelligence_md, 'STRATEGIC OPTIONS')  # One Albania
-    )
-
-    action_plan = (
-        extract_section_from_markdown(intelligence_md, 'ACCOUNT STRATEGY RECOMMENDATIONS') or
-        extract_section_from_markdown(intelligence_md, 'RECOMMENDED ACTIONS') or
-        extract_section_from_markdown(intelligence_md, 'RECOMMENDED ACTION PLAN') or  # One Albania
-        extract_section_from_markdown(intelligence_md, 'ACCOUNT STRATEGY') or
-        extract_section_from_markdown(intelligence_md, 'STRATEGY RECOMMENDATIONS') or
-        extract_section_from_markdown(intelligence_md, 'ACTION PLAN') or
-        extract_section_from_markdown(intelligence_md, '8. RELATIONSHIP STRATEGY') or  # Spotify
-        extract_section_from_markdown(intelligence_md, 'RELATIONSHIP STRATEGY') or
-        extract_section_from_markdown(intelligence_md, 'NEXT STEPS') or
-        extract_section_from_markdown(intelligence_md, 'RECOMMENDATIONS')
-    )
-
-    # Convert markdown sections to HTML
-    import markdown2
-
-    def md_to_html(md_text):
-        if not md_text:
-            return '<p style="color: var(--muted); font-style: italic;">Intelligence data not available for this section.</p>'
-        html = markdown2.markdown(md_text, extras=['tables', 'fenced-code-blocks'])
-        # Add table class
-        html = html.replace('<table>', '<table class="data-table">')
-        return html
-
-    exec_summary_html = md_to_html(exec_summary)
-    company_intel_html = md_to_html(company_intel)
-    executives_html = md_to_html(executives)
-    org_structure_html = md_to_html(org_structure)
-    pain_points_html = md_to_html(pain_points)
-    competitive_html = md_to_html(competitive)
-    opportunities_html = md_to_html(opportunities)
-    action_plan_html = md_to_html(action_plan)
+    # Intelligence sections, each the first match among report_store.TAB_SECTION_HEADINGS
+    exec_summary = sections.get('exec_summary')
+    company_intel = sections.get('company_intel')
+    executives = sections.get('executives')
+    org_structure = sections.get('org_structure')
+    pain_points = sections.get('pain_points')
+    competitive = sections.get('competitive')
+    opportunities = sections.get('opportunities')
+    action_plan = sections.get('action_plan')
+
+    # Convert markdown sections to HTML (one batch through the shared fragment cache)
+    unavailable = '<p style="color: var(--muted); font-style: italic;">Intelligence data not available for this section.</p>'
+    fragments = [exec_summary, company_intel, executives, org_structure,
+                 pain_points, competitive, opportunities, action_plan]
+    (exec_summary_html, company_intel_html, executives_html, org_structure_html,
+     pain_points_html, competitive_html, opportunities_html, action_plan_html) = [
+        html or unavailable for html in render_batch([fragment or '' for fragment in fragments])
+    ]
 
     # Determine BU name
     bu_name_map = {
@@ -582,10 +429,10 @@ def create_tabbed_dashboard(customer, all_customers, intelligence_md, bu='clouds
                 <option value="{newnet_path}" {"selected" if bu == "newnet" else ""}>NewNet Overview</option>
                 <option value="{analytics_path}">📊 Master Analytics</option>
             </select>
-            <select class="global-nav-select" onchange="window.location.href=this.value">
+            <select class="global-nav-select" onchange="window.location.href=this.value" {select_attributes(customer_name)}>
                 <option value="">Select Customer Account...</option>
-                {generate_customer_dropdown(all_customers, customer_name, bu)}
             </select>
+            {options_script_tag()}
         </div>
     </div>
 
@@ -747,6 +594,9 @@ def main():
         ('newnet', 'output/newnet')
     ]
 
+    # Sync the report store once (only new or changed reports are re-tokenized)
+    store = open_report_store()
+
     for bu, output_dir in bus:
         print(f"\n{'='*100}")
         print(f"GENERATING TABBED DASHBOARDS FOR {bu.upper()}")
@@ -756,22 +606,22 @@ def main():
         data = load_customers(bu)
         customers = data['customers']
 
-        # Ensure output directory exists
-        os.makedirs(output_dir, exist_ok=True)
+        # Shared customer selector options (also creates the output directory)
+        write_options_script(output_dir, customers)
 
         # Generate dashboards
         for customer in customers:
             customer_name = customer['customer_name']
-            customer_key = customer_name.replace('/', '-').replace(' ', '_')
+            customer_key = file_stem(customer_name)
 
-            # Load intelligence markdown
-            intelligence_md = load_intelligence_markdown(customer_name)
+            # Load intelligence sections
+            sections = load_intelligence_sections(store, customer_name)
 
-            if intelligence_md:
+            if sections is not None:
                 print(f"✅ #{customer['rank']:2d} {customer_name:50s} → {customer_key}.html")
 
                 # Generate tabbed dashboard
-                html = create_tabbed_dashboard(customer, customers, intelligence_md, bu)
+                html = create_tabbed_dashboard(customer, customers, sections, bu)
 
                 # Save
                 output_file = f"{output_dir}/{customer_key}.html"
@@ -782,6 +632,8 @@ def main():
 
         print(f"\n✅ Generated tabbed dashboards for {bu}")
 
+    store.close()
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Change detection between customer extractions.
+
+extract_all_customers.py diffs each freshly extracted BU against the
+previous data/customers_<bu>_all.json and writes a changeset to
+data/changesets/customers_<bu>_changeset.json:
+
+  {
+    "bu": "kandy",
+    "generated_at": "...",
+    "added": [...], "removed": [...], "modified": [...],
+    "unchanged_count": 123,
+    "hashes": {"<customer_name>": "<content hash>", ...},
+    "base": {...},
+    "rendered": {"<consumer>": {"<customer_name>": "<content hash>", ...}, ...}
+  }
+
+added/removed/modified describe the latest extraction only. Generators run
+with --changed-only diff the current hashes against the hashes they last
+rendered from ("rendered", per consumer: bu_dashboards, index, analytics),
+and record them again with mark_rendered() after rendering. Changes from
+several extractions in a row therefore accumulate until each generator has
+rendered them. A consumer with no record yet diffs against "base", the
+hashes from before the first changeset. Record hashes cover everything a customer page shows about
+that customer except pct_of_total (every share moves when any customer's
+revenue does) and the derived 'region' field; a full run refreshes those.
+The customer selector is a shared per-BU asset (see customer_options.py)
+rewritten on every run, so additions and removals only touch their own pages.
+
+Usage:
+  python3 scripts/customer_changeset.py [bu ...]   # print changesets and what each consumer has pending
+"""
+
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from parallel_render import write_atomic
+
+CHANGESET_DIR = Path('data/changesets')
+
+# Generators that render from the changeset, each with its own rendered hashes
+CONSUMERS = ('bu_dashboards', 'index', 'analytics')
+
+# Fields excluded from a customer's content hash
+VOLATILE_FIELDS = ('pct_of_total', 'region')
+
+
+def record_hash(customer):
+    """Stable content hash of one customer record."""
+    stable = {k: v for k, v in customer.items() if k not in VOLATILE_FIELDS}
+    payload = json.dumps(stable, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def diff_hashes(previous_hashes, current_hashes):
+    """Diff two customer_name -> hash maps.
+
+    Returns:
+        dict: added/removed/modified name lists, unchanged_count and the
+              current name -> hash map
+    """
+    added = [name for name in current_hashes if name not in previous_hashes]
+    removed = [name for name in previous_hashes if name not in current_hashes]
+    modified = [name for name, digest in current_hashes.items()
+                if name in previous_hashes and previous_hashes[name] != digest]
+
+    return {
+        'added': added,
+        'removed': removed,
+        'modified': modified,
+        'unchanged_count': len(current_hashes) - len(added) - len(modified),
+        'hashes': current_hashes,
+    }
+
+
+def diff_customers(previous, current):
+    """Diff two customer lists by customer_name and content hash (see diff_hashes)."""
+    return diff_hashes({c['customer_name']: record_hash(c) for c in previous},
+                       {c['customer_name']: record_hash(c) for c in current})
+
+
+def changeset_path(bu_key):
+    return CHANGESET_DIR / f"customers_{bu_key.lower()}_changeset.json"
+
+
+def read_changeset_file(bu_key):
+    path = changeset_path(bu_key)
+    if not path.exists():
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_changeset(bu_key, changeset):
+    CHANGESET_DIR.mkdir(parents=True, exist_ok=True)
+    write_atomic(str(changeset_path(bu_key)), json.dumps(changeset, indent=2))
+
+
+def write_changeset(bu_key, previous_path, current_customers):
+    """Diff current customers against the file at previous_path and save the changeset.
+
+    A missing previous file counts every customer as added. The consumers'
+    rendered hashes (and the base) of an existing changeset are kept, so
+    changes not yet rendered are not lost when extraction runs again.
+    """
+    previous = []
+    if os.path.exists(previous_path):
+        with open(previous_path, 'r') as f:
+            previous = json.load(f).get('customers', [])
+
+    existing = read_changeset_file(bu_key) or {}
+    changeset = {'bu': bu_key.lower(), 'generated_at': datetime.now().isoformat()}
+    changeset.update(diff_customers(previous, current_customers))
+    changeset['base'] = existing.get('base', {c['customer_name']: record_hash(c) for c in previous})
+    changeset['rendered'] = existing.get('rendered', {})
+
+    save_changeset(bu_key, changeset)
+    return changeset
+
+
+def load_changeset(bu_key, consumer=None):
+    """Load a BU's changeset, or None if extraction has not produced one.
+
+    With a consumer, added/removed/modified are the changes since that
+    consumer last rendered (mark_rendered), across every extraction since.
+    """
+    changeset = read_changeset_file(bu_key)
+    if changeset is None or consumer is None:
+        return changeset
+
+    baseline = changeset.get('rendered', {}).get(consumer, changeset.get('base', {}))
+    return {'bu': changeset['bu'], 'generated_at': changeset['generated_at'],
+            **diff_hashes(baseline, changeset['hashes'])}
+
+
+def mark_rendered(bu_key, consumer, hashes=None):
+    """Record the customer hashes a consumer has rendered (default: the latest extraction's)."""
+    changeset = read_changeset_file(bu_key)
+    if changeset is None:
+        return
+    changeset.setdefault('rendered', {})[consumer] = changeset['hashes'] if hashes is None else hashes
+    save_changeset(bu_key, changeset)
+
+
+def has_changes(changeset):
+    return bool(changeset and (changeset['added'] or changeset['removed'] or changeset['modified']))
+
+
+def select_customers_to_render(bu_key, customers, consumer):
+    """Pick the customers a per-customer page generator must re-render.
+
+    Returns (customers_to_render, removed_names, hashes): added and modified
+    customers since the consumer last rendered, the removed ones whose pages
+    should be deleted, and the hashes to pass to mark_rendered() once done.
+    Without a changeset every customer is returned (and hashes is None).
+    """
+    changeset = load_changeset(bu_key, consumer)
+    if changeset is None:
+        return customers, [], None
+
+    changed = set(changeset['added']) | set(changeset['modified'])
+    return [c for c in customers if c['customer_name'] in changed], changeset['removed'], changeset['hashes']
+
+
+def any_changes(bu_keys, consumer):
+    """True if any of the BUs has changes the consumer has not rendered (or no changeset at all)."""
+    for bu_key in bu_keys:
+        changeset = load_changeset(bu_key, consumer)
+        if changeset is None or has_changes(changeset):
+            return True
+    return False
+
+
+def main():
+    bu_keys = sys.argv[1:] or ['cloudsense', 'kandy', 'stl', 'newnet']
+    for bu_key in bu_keys:
+        changeset = load_changeset(bu_key)
+        if changeset is None:
+            print(f"{bu_key:<12} no changeset")
+            continue
+        print(f"{bu_key:<12} +{len(changeset['added'])} -{len(changeset['removed'])} "
+              f"~{len(changeset['modified'])} ={changeset['unchanged_count']} "
+              f"({changeset['generated_at']})")
+        for consumer in CONSUMERS:
+            pending = load_changeset(bu_key, consumer)
+            print(f"  {consumer:<14} pending: +{len(pending['added'])} -{len(pending['removed'])} "
+                  f"~{len(pending['modified'])}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Customer name forms shared by the scripts.
+
+Each kind of per-customer file spells the customer name its own way. These
+helpers are the single definition of every spelling, with no dependencies
+beyond the standard library, so generators can name and join files without
+loading the customer registry (customer_registry.py), which maps all of the
+forms back to one customer ID:
+
+    file_stem        'AT&T_SERVICES,_INC.'        dashboards, news, intelligence reports
+    account_slug     'atandt-services-inc'        data/account-plans/*
+    url_name         'AT%26T%20SERVICES%2C...'    accounts/<url_name>.html
+    prompt_filename  'AT&T SERVICES, INC.'        intelligence prompts (unsafe characters -> '_')
+    loose_key        'attservicesinc'             suffix- and punctuation-free, for loose matching
+"""
+
+import os
+import re
+import sys
+import urllib.parse
+
+sys.path.insert(0, os.path.dirname(__file__))
+from report_index import normalize, report_key, strip_suffix
+
+
+def file_stem(name):
+    """Stem of per-customer files: dashboards, news, intelligence reports."""
+    return report_key(name)
+
+
+def account_slug(name):
+    """Kebab-case slug of data/account-plans/* (slugifyCustomerName in the app)."""
+    slug = name.lower().replace('&', 'and').replace('/', '-')
+    slug = re.sub(r'[,.()\[\]]', '', slug)
+    slug = re.sub(r'\s+', '-', slug)
+    slug = re.sub(r'-+', '-', slug)
+    return slug.strip('-')
+
+
+def url_name(name):
+    """URL-encoded account page name (accounts/<url_name>.html)."""
+    return urllib.parse.quote(name.replace('/', '-').replace('\\', '-').replace(':', '-'), safe='')
+
+
+def prompt_filename(name):
+    """Customer name with filesystem-unsafe characters replaced by '_'."""
+    for char in '/\\:*?"<>|':
+        name = name.replace(char, '_')
+    return name
+
+
+def loose_key(name):
+    """Suffix-free, punctuation-free form for loose matching ('AT&T Inc.' -> 'att')."""
+    return normalize(strip_suffix(name))
+
+
+_spaced_indexes = {}
+
+
+def find_by_stem(customer_name, keyed):
+    """Value for a customer in a mapping keyed by file stem, or None.
+
+    Tries the exact stem, then the key whose spaced, lowercased form
+    ('Telstra_Corp' -> 'telstra corp') equals the customer name's. The
+    spaced-key index is built once per mapping instead of scanning its keys
+    on every miss.
+    """
+    key = file_stem(customer_name)
+    if key in keyed:
+        return keyed[key]
+
+    entry = _spaced_indexes.get(id(keyed))
+    if entry is None or entry[0] is not keyed or entry[2] != len(keyed):
+        index = {}
+        for existing in keyed:
+            index.setdefault(existing.replace('_', ' ').lower(), existing)
+        entry = (keyed, index, len(keyed))
+        _spaced_indexes[id(keyed)] = entry
+
+    match = entry[1].get(customer_name.replace('/', ' ').replace('  ', ' ').lower())
+    return keyed[match] if match is not None else None
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Shared customer selector options for customer account plan pages.
+
+Every customer page has a "Select Customer Account..." dropdown listing all
+of its BU's customers. Instead of inlining that list into each page (O(n)
+markup per page, O(n²) per BU), generators write it once per BU output
+directory as customer-options.js and each page only carries an empty
+<select> plus a deferred <script> tag:
+
+    <select class="global-nav-select" onchange="..." data-customer-options data-current="Acme.html">
+        <option value="">Select Customer Account...</option>
+    </select>
+    <script src="customer-options.js" defer></script>
+
+The script appends one <option> per customer to every select marked with
+data-customer-options and selects the entry matching data-current. It is a
+plain script (not fetched JSON), so pages still work when opened from disk.
+"""
+
+import html
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_names import file_stem
+from parallel_render import write_atomic
+
+OPTIONS_SCRIPT = 'customer-options.js'
+
+# %s is replaced with the JSON [[filename, label], ...] list
+LOADER_JS = """(function (OPTIONS) {
+  var selects = document.querySelectorAll('select[data-customer-options]');
+  for (var i = 0; i < selects.length; i++) {
+    var current = selects[i].getAttribute('data-current');
+    for (var j = 0; j < OPTIONS.length; j++) {
+      var isCurrent = OPTIONS[j][0] === current;
+      selects[i].add(new Option(OPTIONS[j][1], OPTIONS[j][0], isCurrent, isCurrent));
+    }
+  }
+})(%s);
+"""
+
+
+def customer_page_filename(customer_name):
+    return file_stem(customer_name) + '.html'
+
+
+def option_label(customer):
+    return f'#{customer["rank"]} - {customer["customer_name"]} (${customer["total"]/1000000:.2f}M)'
+
+
+def build_options_script(customers):
+    """JS source that fills the customer selectors for one BU."""
+    options = [[customer_page_filename(c['customer_name']), option_label(c)] for c in customers]
+    header = f"// Customer selector options ({len(options)} customers), generated by scripts/customer_options.py\n"
+    return header + LOADER_JS % json.dumps(options, ensure_ascii=False)
+
+
+def write_options_script(output_dir, customers):
+    """Write output_dir/customer-options.js for a BU's customer list."""
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, OPTIONS_SCRIPT)
+    write_atomic(path, build_options_script(customers))
+    return path
+
+
+def select_attributes(current_customer_name):
+    """Attributes marking a <select> for filling, with the current page preselected."""
+    current = html.escape(customer_page_filename(current_customer_name), quote=True)
+    return f'data-customer-options data-current="{current}"'
+
+
+def options_script_tag():
+    return f'<script src="{OPTIONS_SCRIPT}" defer></script>'
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Canonical customer identity registry shared by the scripts.
+
+Customer names reach the scripts in many spellings, each with its own
+munging: file stems ('AT&T_SERVICES,_INC.' for dashboards, news and
+reports), kebab-case slugs ('atandt-services-inc' for
+data/account-plans/*), URL-encoded account page names, sanitized prompt
+filenames and loosely normalized names for fuzzy report matching (all
+defined in customer_names.py). The registry is built once from the
+workbook's customer list and maps every one of those forms to a single
+customer ID in precomputed hash maps:
+
+    data/customer_registry.json
+        customers   id -> {name, bus, stem, slug, report, account_plan}
+        aliases     any name form -> id
+
+The ID is the customer's account-plan slug (suffixed '-2', '-3' on a
+clash). Intelligence reports are matched once at build time
+(report_index's fuzzy rules), so joining a customer to its report, news
+file, account plan or dashboard page is a dictionary lookup. The registry
+is rebuilt when its sources (workbook or BU extracts, reports directory,
+account plans) or report_index's matching rules change.
+
+Usage:
+  from customer_registry import get_customer_registry
+  registry = get_customer_registry()
+  customer_id = registry.resolve('AT&T SERVICES, INC.')   # also 'AT&T_SERVICES,_INC.', 'atandt-services-inc', ...
+  registry.customer(customer_id)['report']
+
+  from customer_registry import customer_report, find_customer_entry
+  customer_report('AT&T SERVICES, INC.')              # report markdown via the registry
+
+  python3 scripts/customer_registry.py [--rebuild] [--lookup NAME]
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_names import account_slug, file_stem, find_by_stem, loose_key, prompt_filename, url_name
+from parallel_render import write_atomic
+from report_index import REPORTS_DIR, get_report_index, rules_version
+
+REGISTRY_FILE = Path('data/customer_registry.json')
+REGISTRY_VERSION = 1
+ACCOUNT_PLANS_DIR = Path('data/account-plans')
+
+# BU -> all-customer extract of the workbook (used when the workbook itself is not present)
+BU_CUSTOMER_FILES = {
+    'Cloudsense': 'data/customers_cloudsense_all.json',
+    'Kandy': 'data/customers_kandy_all.json',
+    'STL': 'data/customers_stl_all.json',
+    'NewNet': 'data/customers_newnet_all.json',
+}
+
+
+# Exact forms are registered before loose ones, so an exact spelling always wins
+EXACT_FORMS = (file_stem, account_slug, url_name, prompt_filename)
+
+
+# Sources
+
+def workbook_path():
+    """Budget workbook path, or None if it (or openpyxl, needed to read it) is unavailable."""
+    # Imported here: budget_workbook pulls in openpyxl, which plain lookups do not need
+    try:
+        from budget_workbook import EXCEL_FILE
+    except ImportError:
+        return None
+    return EXCEL_FILE if os.path.exists(EXCEL_FILE) else None
+
+
+def workbook_customer_names():
+    """BU -> customer names, from the (cached) workbook, else from the BU extracts."""
+    excel_file = workbook_path()
+    if excel_file:
+        # Imported here: the columnar cache needs numpy, which plain lookups do not
+        from budget_workbook import extract_customers_by_bu
+        from workbook_cache import open_budget_workbook
+        wb = open_budget_workbook(excel_file, sheets=['RR Input', 'NRR Input'])
+        return {bu: [c['customer_name'] for c in customers]
+                for bu, customers in extract_customers_by_bu(wb).items()}
+
+    names = {}
+    for bu, filepath in BU_CUSTOMER_FILES.items():
+        if os.path.exists(filepath):
+            with open(filepath, 'r') as f:
+                names[bu] = [c['customer_name'] for c in json.load(f)['customers']]
+    return names
+
+
+def source_stamp():
+    """(size, mtime) of every registry input and the report matching rules, to detect a stale registry."""
+    excel_file = workbook_path()
+    paths = [excel_file] if excel_file else list(BU_CUSTOMER_FILES.values())
+    paths += [str(REPORTS_DIR)] + sorted(str(p) for p in ACCOUNT_PLANS_DIR.glob('*') if p.is_dir())
+    stamp = {}
+    for path in paths:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            stamp[path] = [stat.st_size, stat.st_mtime_ns]
+    stamp['report_rules'] = rules_version()
+    return stamp
+
+
+def account_plan_slugs():
+    slugs = set()
+    for plan_dir in ACCOUNT_PLANS_DIR.glob('*'):
+        if plan_dir.is_dir():
+            slugs.update(p.stem for p in plan_dir.glob('*.json'))
+    return slugs
+
+
+def build_registry(bu_names):
+    """Registry data (customers, aliases) for BU -> customer names."""
+    report_index = get_report_index()
+    plan_slugs = account_plan_slugs()
+    customers = {}
+    ids_by_name = {}
+
+    for bu, names in bu_names.items():
+        for name in names:
+            if not isinstance(name, str) or not name:
+                continue
+            if name in ids_by_name:
+                customers[ids_by_name[name]]['bus'].append(bu)
+                continue
+
+            slug = account_slug(name) or file_stem(name)
+            customer_id, n = slug, 1
+            while customer_id in customers:
+                n += 1
+                customer_id = f"{slug}-{n}"
+
+            report = report_index.resolve(name)
+            ids_by_name[name] = customer_id
+            customers[customer_id] = {
+                'name': name,
+                'bus': [bu],
+                'stem': file_stem(name),
+                'slug': slug,
+                'report': report[:-3] if report else None,
+                'account_plan': slug if slug in plan_slugs else None,
+            }
+    report_index.save()
+
+    aliases = {}
+    for customer_id in customers:
+        aliases.setdefault(customer_id, customer_id)
+    for customer_id, record in customers.items():
+        aliases.setdefault(record['name'], customer_id)
+    for form in EXACT_FORMS:
+        for customer_id, record in customers.items():
+            aliases.setdefault(form(record['name']), customer_id)
+    for customer_id, record in customers.items():
+        if record['report']:
+            aliases.setdefault(record['report'], customer_id)
+    for customer_id, record in customers.items():
+        aliases.setdefault(loose_key(record['name']), customer_id)
+
+    return {'customers': customers, 'aliases': aliases}
+
+
+class CustomerRegistry:
+    """Customer ID lookups over the precomputed alias maps."""
+
+    def __init__(self, data):
+        self.customers = data['customers']
+        self.aliases = data['aliases']
+
+    def resolve(self, name):
+        """Customer ID for any known spelling of a customer, or None."""
+        if not name:
+            return None
+        customer_id = self.aliases.get(name)
+        if customer_id is None:
+            for form in (file_stem, account_slug, loose_key):
+                customer_id = self.aliases.get(form(name))
+                if customer_id is not None:
+                    break
+        return customer_id
+
+    def customer(self, customer_id):
+        """Record (name, bus, stem, slug, report, account_plan) for an ID, or None."""
+        return self.customers.get(customer_id)
+
+    def lookup(self, name):
+        """Record for any spelling of a customer, or None."""
+        return self.customers.get(self.resolve(name))
+
+    def report_stem(self, name):
+        """Intelligence report stem matched to a registered customer, or None."""
+        record = self.lookup(name)
+        return record['report'] if record else None
+
+
+def load_registry(registry_path=REGISTRY_FILE, rebuild=False):
+    """Registry from disk, rebuilt first if missing or older than its sources."""
+    stamp = source_stamp()
+    if not rebuild:
+        try:
+            with open(registry_path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == REGISTRY_VERSION and data.get('sources') == stamp:
+                return CustomerRegistry(data)
+        except (OSError, ValueError):
+            pass
+
+    data = build_registry(workbook_customer_names())
+    data = {'version': REGISTRY_VERSION, 'sources': stamp, **data}
+    try:
+        write_atomic(str(registry_path), json.dumps(data, indent=1, ensure_ascii=False))
+    except OSError as e:
+        print(f"Warning: could not save customer registry: {e}", file=sys.stderr)
+    return CustomerRegistry(data)
+
+
+_registry = None
+
+
+def get_customer_registry():
+    """Process-wide CustomerRegistry."""
+    global _registry
+    if _registry is None:
+        _registry = load_registry()
+    return _registry
+
+
+def resolve_customer(name):
+    return get_customer_registry().resolve(name)
+
+
+# Joins: the generators look customers' files up through the registry, so
+# any spelling of a registered customer reaches the same files. Names the
+# registry does not know fall back to the per-name rules.
+
+def customer_stem(name):
+    """File stem of a customer's dashboard and news files."""
+    record = get_customer_registry().lookup(name)
+    return record['stem'] if record else file_stem(name)
+
+
+def customer_report_stem(name, reports_dir=REPORTS_DIR):
+    """Intelligence report stem for a customer, or None if it has none.
+
+    Registered customers use the report matched when the registry was
+    built; other names are resolved by the report index.
+    """
+    record = get_customer_registry().lookup(name)
+    if record is not None:
+        return record['report']
+    filename = get_report_index(reports_dir).resolve(name)
+    return filename[:-3] if filename else None
+
+
+def customer_report(name, reports_dir=REPORTS_DIR):
+    """Intelligence report markdown for a customer, or None if it has none."""
+    stem = customer_report_stem(name, reports_dir)
+    if stem is None:
+        return None
+    try:
+        with open(Path(reports_dir) / f"{stem}.md", 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def find_customer_entry(name, keyed):
+    """Value for a customer in a mapping keyed by report or file stem, or None."""
+    record = get_customer_registry().lookup(name)
+    if record:
+        for key in (record['report'], record['stem']):
+            if key and key in keyed:
+                return keyed[key]
+    return find_by_stem(name, keyed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the canonical customer registry')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild even if the registry is current')
+    parser.add_argument('--lookup', action='append', default=[], help='Resolve a name (repeatable)')
+    args = parser.parse_args()
+
+    registry = load_registry(rebuild=args.rebuild)
+    with_report = sum(1 for record in registry.customers.values() if record['report'])
+    with_plan = sum(1 for record in registry.customers.values() if record['account_plan'])
+    print(f"{len(registry.customers)} customers, {len(registry.aliases)} aliases in {REGISTRY_FILE}")
+    print(f"  {with_report} matched to intelligence reports, {with_plan} to account plans")
+
+    for name in args.lookup:
+        customer_id = registry.resolve(name)
+        print(f"\n{name!r} -> {customer_id}")
+        if customer_id:
+            print(json.dumps(registry.customer(customer_id), indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,15 +4,16 @@ Enhanced DM Data Extraction Script
 Extracts comprehensive revenue, pricing, and contract data from Excel for DM analysis
 """
 
+import os
 import sys
 import json
 from pathlib import Path
-from openpyxl import load_workbook
 from datetime import datetime, timedelta
 import random
 
-# File path
-EXCEL_FILE = "2025-12-11 Skyvera - Budget - Q1'26 - For Todd.xlsx"
+sys.path.insert(0, os.path.dirname(__file__))
+from budget_workbook import EXCEL_FILE, PNL_SHEETS
+from workbook_cache import open_budget_workbook
 
 def extract_enhanced_dm_data():
     """Extract comprehensive revenue and contract data for DM analysis"""
@@ -25,7 +26,7 @@ def extract_enhanced_dm_data():
             raise FileNotFoundError(f"Excel file not found: {file_path}")
 
         print("Loading workbook...", file=sys.stderr)
-        wb = load_workbook(file_path, data_only=True)
+        wb = open_budget_workbook(file_path, PNL_SHEETS)
 
         # Load existing customer data from JSON files
         customer_data_by_bu = {}
@@ -5,14 +5,15 @@ DM% = (Current Year Revenue / Prior Year Revenue) × 100
 Target: ≥90% (retain at least 90% of last year's revenue)
 """
 
+import os
 import sys
 import json
 from pathlib import Path
-from openpyxl import load_workbook
 from datetime import datetime
 
-# File path
-EXCEL_FILE = "2025-12-11 Skyvera - Budget - Q1'26 - For Todd.xlsx"
+sys.path.insert(0, os.path.dirname(__file__))
+from budget_workbook import EXCEL_FILE, PNL_SHEETS
+from workbook_cache import open_budget_workbook
 
 def extract_dm_data():
     """Extract revenue data and calculate DM% for each BU"""
@@ -23,8 +24,8 @@ def extract_dm_data():
         if not file_path.exists():
             raise FileNotFoundError(f"Excel file not found: {file_path}")
 
-        # Load workbook (data_only=True for calculated values)
-        wb = load_workbook(file_path, data_only=True)
+        # Load calculated values via the columnar cache (openpyxl only on a miss)
+        wb = open_budget_workbook(file_path, ["RR Summary"] + PNL_SHEETS)
 
         # We need to extract data from RR Summary sheet which contains:
         # - Current period revenue (Q1'26 Plan)
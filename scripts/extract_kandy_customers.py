@@ -1,115 +1,29 @@
 """Extract top 80% Kandy customers by total revenue (RR+NRR)."""
 import json
-from openpyxl import load_workbook
-from datetime import datetime
-import re
+import os
+import sys
 
-def extract_kandy_rr():
-    """Extract Kandy RR from RR Input sheet."""
-    wb = load_workbook("2025-12-11 Skyvera - Budget - Q1'26 - For Todd.xlsx", data_only=True)
-    ws = wb['RR Input']
-
-    customers = {}
-
-    for row in ws.iter_rows(min_row=11, values_only=True):
-        company = row[0]  # Column A
-        customer_name = row[1]  # Column B
-        sub_id = row[3]  # Column D
-        arr = row[6]  # Column G
-        renewal_qtr = row[8]  # Column I
-        will_renew = row[9]  # Column J
-        upsell_pct = row[10]  # Column K
-        projected_arr = row[11]  # Column L
-
-        if company != 'Kandy' or not customer_name:
-            continue
-
-        if customer_name not in customers:
-            customers[customer_name] = {
-                'customer_name': customer_name,
-                'rr': 0,
-                'nrr': 0,
-                'subscriptions': []
-            }
-
-        customers[customer_name]['rr'] += arr if arr else 0
-        customers[customer_name]['subscriptions'].append({
-            'sub_id': sub_id,
-            'arr': arr,
-            'renewal_qtr': renewal_qtr,
-            'will_renew': will_renew,
-            'projected_arr': projected_arr
-        })
-
-    return customers
-
-def extract_kandy_nrr():
-    """Extract Kandy NRR from NRR Input sheet."""
-    wb = load_workbook("2025-12-11 Skyvera - Budget - Q1'26 - For Todd.xlsx", data_only=True)
-    ws = wb['NRR Input']
-
-    customers = {}
-
-    for row in ws.iter_rows(min_row=6, values_only=True):
-        customer_name = row[1]  # Column B
-        class_col = row[2]  # Column C
-        q1_26 = row[8] if len(row) > 8 else 0  # Column I
-        q2_26 = row[9] if len(row) > 9 else 0  # Column J
-        q3_26 = row[10] if len(row) > 10 else 0  # Column K
-        q4_26 = row[11] if len(row) > 11 else 0  # Column L
-
-        if not class_col or 'Kandy' not in class_col:
-            continue
-
-        # Handle "New Sales Ps - <Customer>" pattern
-        match = re.search(r'<(.+?)>', customer_name) if customer_name else None
-        if match:
-            customer_name = match.group(1).strip()
-
-        if not customer_name:
-            continue
-
-        fy26_nrr = (q1_26 or 0) + (q2_26 or 0) + (q3_26 or 0) + (q4_26 or 0)
-
-        if customer_name not in customers:
-            customers[customer_name] = 0
-        customers[customer_name] += fy26_nrr
-
-    return customers
+sys.path.insert(0, os.path.dirname(__file__))
+from budget_workbook import EXCEL_FILE, scan_rr_input, scan_nrr_input, merge_bu_customers
+from workbook_cache import open_budget_workbook
 
 def main():
     print("="*100)
     print("EXTRACTING KANDY CUSTOMER DATA")
     print("="*100)
 
+    wb = open_budget_workbook(EXCEL_FILE, ['RR Input', 'NRR Input'])
+
     # Get RR data
-    rr_customers = extract_kandy_rr()
+    rr_customers = scan_rr_input(wb, ['Kandy'])['Kandy']
     print(f"\nFound {len(rr_customers)} Kandy customers with RR")
 
     # Get NRR data
-    nrr_data = extract_kandy_nrr()
+    nrr_data = scan_nrr_input(wb, ['Kandy'])['Kandy']
     print(f"Found {len(nrr_data)} Kandy customers with NRR")
 
-    # Merge RR and NRR
-    all_customer_names = set(rr_customers.keys()) | set(nrr_data.keys())
-
-    customers = []
-    for name in all_customer_names:
-        rr = rr_customers.get(name, {}).get('rr', 0)
-        nrr = nrr_data.get(name, 0)
-        total = rr + nrr
-
-        customer = {
-            'customer_name': name,
-            'rr': rr,
-            'nrr': nrr,
-            'total': total,
-            'subscriptions': rr_customers.get(name, {}).get('subscriptions', [])
-        }
-        customers.append(customer)
-
-    # Sort by total revenue descending
-    customers.sort(key=lambda x: x['total'], reverse=True)
+    # Merge RR and NRR (sorted by total revenue, ranked)
+    customers = merge_bu_customers(rr_customers, nrr_data)
 
     # Calculate top 80%
     total_revenue = sum(c['total'] for c in customers)
@@ -122,11 +36,6 @@ def main():
         if cumulative >= total_revenue * 0.8:
             break
 
-    # Add rank and percentage
-    for i, customer in enumerate(top_80_customers, 1):
-        customer['rank'] = i
-        customer['pct_of_total'] = (customer['total'] / total_revenue * 100) if total_revenue > 0 else 0
-
     # Save to JSON
     output = {
         'total_revenue': total_revenue,
@@ -6,6 +6,10 @@ import json
 import os
 from urllib.parse import quote_plus
 import re
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_names import file_stem
 
 class CustomerNewsFetcher:
     def __init__(self):
@@ -125,7 +129,7 @@ def main():
             'articles': articles
         }
 
-        filename = f"{customer_name.replace('/', '-').replace(' ', '_')}_news.json"
+        filename = f"{file_stem(customer_name)}_news.json"
         filepath = f"data/news/{filename}"
 
         with open(filepath, 'w') as f:
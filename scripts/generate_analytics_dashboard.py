@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 """Generate master analytics dashboard with embedded customer data."""
 
+import argparse
 import json
+import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_changeset import any_changes, mark_rendered
+from customer_names import file_stem
+
 def load_all_customers():
     """Load and aggregate customer data from all BUs (100% of customers)."""
     data_dir = Path(__file__).parent.parent / 'data'
@@ -39,7 +46,7 @@ def load_all_customers():
                 customer_with_bu['bu'] = bu_name
 
                 # Check if dashboard exists for this customer
-                dashboard_filename = customer['customer_name'].replace('/', '-').replace(' ', '_') + '.html'
+                dashboard_filename = file_stem(customer['customer_name']) + '.html'
                 dashboard_path = output_dir / bu_paths[bu_name] / dashboard_filename
                 customer_with_bu['has_dashboard'] = dashboard_path.exists()
                 customer_with_bu['dashboard_url'] = bu_paths[bu_name] + dashboard_filename if customer_with_bu['has_dashboard'] else None
@@ -582,6 +589,16 @@ def generate_html(customers_data):
     return html
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate master analytics dashboard')
+    parser.add_argument('--changed-only', action='store_true',
+                        help='Skip regeneration when no customer changed since the last analytics render')
+    args = parser.parse_args()
+
+    bu_keys = ['cloudsense', 'kandy', 'stl', 'newnet']
+    if args.changed_only and not any_changes(bu_keys, 'analytics'):
+        print("No customer changes in any BU - analytics dashboard unchanged")
+        return
+
     print("Generating master analytics dashboard...")
 
     customers, bu_data = load_all_customers()
@@ -597,6 +614,8 @@ def main():
     output_path = Path(__file__).parent.parent / 'output' / 'analytics.html'
     with open(output_path, 'w') as f:
         f.write(html)
+    for bu_key in bu_keys:
+        mark_rendered(bu_key, 'analytics')
 
     print(f"\n✅ Analytics dashboard generated: {output_path}")
     print(f"   File size: {len(html) / 1024:.1f} KB")
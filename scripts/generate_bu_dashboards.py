@@ -0,0 +1,788 @@
+#!/usr/bin/env python3
+"""
+Generate HTML account plan dashboards for every business unit.
+
+One engine renders all four BUs in a single run: intelligence_html.json
+is opened once as a lazy per-customer store (intelligence_store.py), news
+directories are listed once and read on demand, intelligence reports are
+resolved through the report index (report_index.py), and each BU's page
+chrome (styles and BU navigation) is built once and reused for every
+customer page in that BU. With --jobs N, pages are rendered by a pool of N
+processes that each load those inputs once.
+
+The per-BU scripts (generate_dashboards.py, generate_dashboards_kandy.py, ...)
+are thin wrappers around this module.
+
+Usage:
+  python3 scripts/generate_bu_dashboards.py                 # all BUs
+  python3 scripts/generate_bu_dashboards.py --bu kandy --bu stl
+  python3 scripts/generate_bu_dashboards.py --changed-only
+  python3 scripts/generate_bu_dashboards.py --jobs 8       # render in 8 processes
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_changeset import mark_rendered, select_customers_to_render
+from customer_names import file_stem
+from customer_options import options_script_tag, select_attributes, write_options_script
+from customer_registry import customer_report, customer_stem, find_customer_entry, get_customer_registry
+from intelligence_store import open_intelligence_store
+from parallel_render import add_jobs_argument, resolve_jobs, run_jobs, write_atomic
+from report_cache import cached_parse
+from report_highlights import HIGHLIGHTS_NAMESPACE, parse_report_highlights
+
+
+# BU key -> page configuration. 'root' is the relative path from the BU's
+# output directory back to output/.
+BU_DASHBOARDS = {
+    'cloudsense': {
+        'label': 'CloudSense',
+        'data_file': 'data/customers_cloudsense_all.json',
+        'news_dir': 'data/news',
+        'output_dir': 'output',
+        'root': '',
+        'accent': '#c84b31',
+        'highlight': '#ecdbba',
+        'bu_selector_width': '250px',
+    },
+    'kandy': {
+        'label': 'Kandy',
+        'data_file': 'data/customers_kandy_all.json',
+        'news_dir': 'data/news/kandy',
+        'output_dir': 'output/kandy',
+        'root': '../',
+        'accent': '#e65100',
+        'highlight': '#fff3e0',
+        'bu_selector_width': '200px',
+    },
+    'stl': {
+        'label': 'STL',
+        'data_file': 'data/customers_stl_all.json',
+        'news_dir': 'data/news/stl',
+        'output_dir': 'output/stl',
+        'root': '../',
+        'accent': '#1976d2',
+        'highlight': '#e3f2fd',
+        'bu_selector_width': '200px',
+    },
+    'newnet': {
+        'label': 'NewNet',
+        'data_file': 'data/customers_newnet_all.json',
+        'news_dir': 'data/news/newnet',
+        'output_dir': 'output/newnet',
+        'root': '../',
+        'accent': '#388e3c',
+        'highlight': '#e8f5e9',
+        'bu_selector_width': '200px',
+    },
+}
+
+
+def load_customers(bu):
+    with open(bu['data_file'], 'r') as f:
+        return json.load(f)
+
+
+def load_intelligence_data():
+    """Pregenerated intelligence HTML as a lazy per-customer mapping (see intelligence_store.py)."""
+    return open_intelligence_store()
+
+
+def list_files(directory):
+    return set(os.listdir(directory)) if os.path.isdir(directory) else set()
+
+
+class DashboardInputs:
+    """Inputs shared by every BU, loaded once per process."""
+
+    def __init__(self):
+        self.intelligence_data = load_intelligence_data()
+        self.news_files = {}
+        self.chrome = {}
+
+    def load_customer_news(self, news_dir, customer_name):
+        """Load news data for customer if available."""
+        if news_dir not in self.news_files:
+            self.news_files[news_dir] = list_files(news_dir)
+
+        filename = f"{customer_stem(customer_name)}_news.json"
+        if filename in self.news_files[news_dir]:
+            with open(os.path.join(news_dir, filename), 'r') as f:
+                return json.load(f)
+        return None
+
+    def load_intelligence_report(self, customer_name):
+        """Load raw markdown intelligence report for parsing."""
+        return customer_report(customer_name)
+
+    def bu_chrome(self, bu_key):
+        """Styles and BU navigation for a BU's pages, built once per BU."""
+        if bu_key not in self.chrome:
+            self.chrome[bu_key] = build_bu_chrome(bu_key)
+        return self.chrome[bu_key]
+
+
+def get_customer_intelligence(customer_name, intelligence_data):
+    """Get intelligence HTML for customer if available."""
+    return find_customer_entry(customer_name, intelligence_data)
+
+
+def generate_news_widget(customer_name, news_data):
+    """Generate news widget HTML."""
+    if not news_data or news_data['article_count'] == 0:
+        return """
+        <div class="card">
+            <h2>📰 Recent News & Updates</h2>
+            <div style="text-align: center; padding: 3rem; color: var(--muted); font-style: italic;">
+                No recent news available for this customer
+            </div>
+        </div>
+        """
+
+    articles_html = ''
+    for article in news_data['articles']:
+        relevance_class = 'relevance-high' if article['relevance_score'] >= 0.7 else 'relevance-medium'
+        relevance_label = 'High Relevance' if article['relevance_score'] >= 0.7 else 'Medium Relevance'
+
+        articles_html += f"""
+        <div class="news-article">
+            <div class="news-title">
+                <a href="{article['url']}" target="_blank" rel="noopener">{article['title']}</a>
+            </div>
+            <div class="news-meta">
+                <span class="news-source">{article['source']}</span>
+                <span>•</span>
+                <span>{article['published']}</span>
+                <span>•</span>
+                <span class="news-relevance {relevance_class}">{relevance_label}</span>
+            </div>
+            {f'<div class="news-summary">{article["summary"]}</div>' if article.get('summary') else ''}
+        </div>
+        """
+
+    widget_html = f"""
+    <div class="card">
+        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem;">
+            <h2 style="margin: 0;">📰 Recent News & Updates</h2>
+            <div style="font-size: 0.85rem; color: var(--muted);">
+                Last updated: {news_data['last_updated']}
+            </div>
+        </div>
+
+        <div class="news-articles">
+            {articles_html}
+        </div>
+    </div>
+
+    <style>
+        .news-article {{
+            padding: 1.25rem;
+            margin-bottom: 1rem;
+            background: white;
+            border-left: 4px solid var(--accent);
+            border: 1px solid var(--border);
+            transition: all 0.3s ease;
+        }}
+        .news-article:hover {{
+            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+            transform: translateX(4px);
+        }}
+        .news-title {{
+            font-size: 1.1rem;
+            font-weight: 600;
+            margin-bottom: 0.5rem;
+        }}
+        .news-title a {{
+            color: var(--secondary);
+            text-decoration: none;
+        }}
+        .news-title a:hover {{
+            color: var(--accent);
+            text-decoration: underline;
+        }}
+        .news-meta {{
+            display: flex;
+            gap: 0.5rem;
+            font-size: 0.85rem;
+            color: var(--muted);
+            margin-bottom: 0.5rem;
+            flex-wrap: wrap;
+        }}
+        .news-source {{
+            font-weight: 600;
+        }}
+        .news-relevance {{
+            display: inline-block;
+            padding: 0.25rem 0.5rem;
+            border-radius: 3px;
+            font-size: 0.75rem;
+            font-weight: 600;
+        }}
+        .relevance-high {{
+            background: rgba(76, 175, 80, 0.2);
+            color: #2e7d32;
+        }}
+        .relevance-medium {{
+            background: rgba(255, 152, 0, 0.2);
+            color: #e65100;
+        }}
+        .news-summary {{
+            font-size: 0.95rem;
+            line-height: 1.6;
+            color: var(--ink);
+        }}
+    </style>
+    """
+
+    return widget_html
+
+
+def build_bu_chrome(bu_key):
+    """Render the BU-constant parts of a customer page (styles, BU selector)."""
+    bu = BU_DASHBOARDS[bu_key]
+    root = bu['root']
+
+    style = f"""    <style>
+        :root {{
+            --ink: #1a1a1a;
+            --paper: #fafaf8;
+            --accent: {bu['accent']};
+            --secondary: #2d4263;
+            --muted: #8b8b8b;
+            --border: #e8e6e1;
+            --highlight: {bu['highlight']};
+        }}
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        body {{ font-family: 'DM Sans', sans-serif; background: var(--paper); color: var(--ink); line-height: 1.6; }}
+        h1, h2 {{ font-family: 'Cormorant Garamond', serif; }}
+
+        .global-nav {{
+            background: var(--ink);
+            color: var(--paper);
+            padding: 1rem 2rem;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            flex-wrap: wrap;
+            gap: 1rem;
+        }}
+        .global-nav-logo {{
+            font-size: 1.5rem;
+            font-weight: 700;
+            color: var(--accent);
+            text-decoration: none;
+        }}
+        .global-nav-controls {{
+            display: flex;
+            gap: 1rem;
+            flex-wrap: wrap;
+            align-items: center;
+        }}
+        .global-nav-bu-selector {{
+            padding: 0.75rem 1.5rem;
+            font-size: 0.95rem;
+            border: 1px solid var(--border);
+            border-radius: 4px;
+            background: white;
+            cursor: pointer;
+            min-width: {bu['bu_selector_width']};
+        }}
+        .global-nav-select {{
+            padding: 0.75rem 1.5rem;
+            font-size: 1rem;
+            border: 1px solid var(--border);
+            border-radius: 4px;
+            background: white;
+            cursor: pointer;
+            min-width: 400px;
+        }}
+
+        .header {{
+            background: linear-gradient(135deg, var(--secondary) 0%, #1a2332 100%);
+            color: var(--paper);
+            padding: 4rem 2rem 3rem;
+        }}
+        .header-content {{
+            max-width: 1400px;
+            margin: 0 auto;
+        }}
+        .header h1 {{
+            font-size: 3.5rem;
+            font-weight: 300;
+            margin-bottom: 1rem;
+        }}
+        .header-stats {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 2rem;
+            margin-top: 2rem;
+        }}
+        .stat-card {{
+            background: rgba(255, 255, 255, 0.1);
+            padding: 1.5rem;
+            border-radius: 4px;
+        }}
+        .stat-label {{
+            font-size: 0.85rem;
+            text-transform: uppercase;
+            opacity: 0.8;
+            margin-bottom: 0.5rem;
+        }}
+        .stat-value {{
+            font-size: 2rem;
+            font-weight: 700;
+        }}
+
+        .container {{
+            max-width: 1400px;
+            margin: 3rem auto;
+            padding: 0 2rem;
+        }}
+        .card {{
+            background: white;
+            border: 1px solid var(--border);
+            padding: 2rem;
+            margin-bottom: 2rem;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.05);
+        }}
+        .back-link {{
+            display: inline-block;
+            margin: 1rem 2rem;
+            padding: 0.75rem 1.5rem;
+            background: var(--secondary);
+            color: white;
+            text-decoration: none;
+            border-radius: 4px;
+        }}
+        .back-link:hover {{
+            background: var(--accent);
+        }}
+
+        .metrics-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 1.5rem;
+            margin: 2rem 0;
+        }}
+        .metric-box {{
+            background: var(--highlight);
+            padding: 1.5rem;
+            border-left: 3px solid var(--accent);
+        }}
+        .metric-box .label {{
+            font-size: 0.85rem;
+            color: var(--muted);
+            margin-bottom: 0.5rem;
+            text-transform: uppercase;
+        }}
+        .metric-box .value {{
+            font-size: 1.8rem;
+            font-family: 'Cormorant Garamond', serif;
+            font-weight: 600;
+            color: var(--secondary);
+        }}
+
+        .pending-notice {{
+            background: rgba(255, 152, 0, 0.1);
+            border-left: 4px solid #ff9800;
+            padding: 2rem;
+            margin: 2rem 0;
+        }}
+
+        /* Alert Banner */
+        .alert-banner {{
+            background: linear-gradient(135deg, var(--accent) 0%, #b33a26 100%);
+            color: white;
+            padding: 1.5rem 2rem;
+            margin: 0 0 2rem;
+            border-left: 4px solid #8b1a1a;
+            box-shadow: 0 4px 12px rgba(200, 75, 49, 0.3);
+            border-radius: 4px;
+        }}
+
+        .alert-banner h3 {{
+            color: white;
+            margin-bottom: 0.75rem;
+            font-size: 1.3rem;
+        }}
+
+        .alert-banner p {{
+            margin: 0.5rem 0 0;
+            line-height: 1.6;
+            opacity: 0.95;
+        }}
+
+        .keys-to-success {{
+            background: linear-gradient(135deg, rgba(76, 175, 80, 0.08) 0%, rgba(76, 175, 80, 0.02) 100%);
+            border: 1px solid rgba(76, 175, 80, 0.2);
+            padding: 2rem;
+            margin: 0 0 2rem;
+            border-radius: 4px;
+        }}
+
+        .keys-to-success h2 {{
+            color: #2e7d32;
+            margin-bottom: 1.5rem;
+        }}
+
+        .priority-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+            gap: 1.5rem;
+        }}
+
+        .priority-card {{
+            background: white;
+            padding: 1.5rem;
+            border-left: 4px solid #4caf50;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+            border-radius: 4px;
+        }}
+
+        .priority-card .priority-label {{
+            font-size: 0.85rem;
+            font-weight: 700;
+            text-transform: uppercase;
+            color: #4caf50;
+            margin-bottom: 0.75rem;
+            letter-spacing: 0.5px;
+        }}
+
+        .priority-card .priority-action {{
+            font-size: 1.15rem;
+            font-family: 'Cormorant Garamond', serif;
+            font-weight: 600;
+            color: var(--secondary);
+            line-height: 1.4;
+        }}
+
+        .footer {{
+            background: var(--secondary);
+            color: var(--paper);
+            text-align: center;
+            padding: 2rem;
+            margin-top: 4rem;
+        }}
+    </style>"""
+
+    bu_options = ['<option value="">Navigate to...</option>']
+    for key, other in BU_DASHBOARDS.items():
+        if key == bu_key:
+            bu_options.append(f'<option value="index.html" selected>{other["label"]} Overview</option>')
+        else:
+            target = 'index.html' if key == 'cloudsense' else f'{key}/index.html'
+            bu_options.append(f'<option value="{root}{target}">{other["label"]} Overview</option>')
+    bu_options.append(f'<option value="{root}analytics.html">📊 Master Analytics</option>')
+
+    return {
+        'style': style,
+        'bu_options': '\n                '.join(bu_options),
+    }
+
+
+def create_simple_dashboard(bu_key, customer, all_customers, inputs):
+    """Create a simplified dashboard for customers without full intelligence."""
+    bu = BU_DASHBOARDS[bu_key]
+    chrome = inputs.bu_chrome(bu_key)
+    label = bu['label']
+    root = bu['root']
+
+    customer_name = customer['customer_name']
+    news_data = inputs.load_customer_news(bu['news_dir'], customer_name)
+    news_widget = generate_news_widget(customer_name, news_data)
+
+    # Load intelligence HTML if available
+    intelligence_html = get_customer_intelligence(customer_name, inputs.intelligence_data)
+
+    # Load raw intelligence report for action items and alerts
+    intelligence_report = inputs.load_intelligence_report(customer_name)
+    highlights = cached_parse(HIGHLIGHTS_NAMESPACE, intelligence_report, parse_report_highlights) if intelligence_report else {}
+    action_items = highlights.get('action_items', [])
+    critical_alerts = highlights.get('critical_alerts', [])
+
+    # Generate alert banners HTML
+    alerts_html = ''
+    for alert in critical_alerts:
+        alert_title = alert["text"][:80] + ('...' if len(alert["text"]) > 80 else '')
+        alerts_html += f'''
+        <div class="alert-banner">
+            <h3>🚨 {alert["severity"].upper()}: {alert_title}</h3>
+            <p>{alert["text"]}</p>
+        </div>
+        '''
+
+    # Generate keys to success HTML
+    keys_html = ''
+    if action_items:
+        priority_cards = ''
+        for action in action_items:
+            priority_cards += f'''
+                <div class="priority-card">
+                    <div class="priority-label">Priority #{action["priority"]}</div>
+                    <div class="priority-action">{action["action"]}</div>
+                </div>
+            '''
+
+        keys_html = f'''
+        <div class="keys-to-success">
+            <h2>🎯 Keys to Success in Next 90 Days</h2>
+            <div class="priority-grid">
+                {priority_cards}
+            </div>
+        </div>
+        '''
+
+
+    html = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{customer_name} Account Plan | Skyvera {label}</title>
+    <link href="https://fonts.googleapis.com/css2?family=Cormorant+Garamond:wght@300;400;600;700&family=DM+Sans:wght@400;500;700&display=swap" rel="stylesheet">
+{chrome['style']}
+</head>
+<body>
+    <div class="global-nav">
+        <a href="{root}index.html" class="global-nav-logo">SKYVERA</a>
+        <div class="global-nav-controls">
+            <select class="global-nav-bu-selector" onchange="window.location.href=this.value">
+                {chrome['bu_options']}
+            </select>
+            <select class="global-nav-select" onchange="window.location.href=this.value" {select_attributes(customer_name)}>
+                <option value="">Select Customer Account...</option>
+            </select>
+            {options_script_tag()}
+        </div>
+    </div>
+
+    <a href="index.html" class="back-link">← Back to Customer Overview</a>
+
+    <div class="header">
+        <div class="header-content">
+            <h1>{customer_name}</h1>
+            <div style="font-size: 1.1rem; opacity: 0.85; margin-top: 1rem;">
+                Strategic Account Plan | {label} Business Unit | Q1 2026
+            </div>
+
+            <div class="header-stats">
+                <div class="stat-card">
+                    <div class="stat-label">Total Revenue</div>
+                    <div class="stat-value">${customer['total']/1000000:.2f}M</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-label">Recurring Revenue</div>
+                    <div class="stat-value">${customer['rr']/1000000:.2f}M</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-label">Non-Recurring Revenue</div>
+                    <div class="stat-value">${customer['nrr']/1000000:.2f}M</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-label">Customer Rank</div>
+                    <div class="stat-value">#{customer['rank']}</div>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <div class="container">
+        {alerts_html}
+        {keys_html}
+
+        {f'''
+        <!-- Customer Intelligence Section -->
+        {intelligence_html}
+        ''' if intelligence_html else f'''
+        <div class="pending-notice">
+            <h2 style="margin-bottom: 1rem;">⏳ Account Intelligence In Progress</h2>
+            <p>Comprehensive account plan intelligence (executives, pain points, competitive analysis, opportunities) will be populated here once customer research is complete.</p>
+            <p style="margin-top: 1rem;"><strong>Status:</strong> Awaiting customer-intelligence-analyst research for {customer_name}</p>
+        </div>
+        '''}
+
+        <div class="card">
+            <h2>Account Overview</h2>
+            <div class="metrics-grid">
+                <div class="metric-box">
+                    <div class="label">Business Unit</div>
+                    <div class="value" style="font-size: 1.2rem;">{label}</div>
+                </div>
+                <div class="metric-box">
+                    <div class="label">Active Subscriptions</div>
+                    <div class="value">{len(customer['subscriptions'])}</div>
+                </div>
+                <div class="metric-box">
+                    <div class="label">% of {label}</div>
+                    <div class="value">{customer['pct_of_total']:.1f}%</div>
+                </div>
+                <div class="metric-box">
+                    <div class="label">Revenue Mix</div>
+                    <div class="value" style="font-size: 1rem;">
+                        {(customer['rr']/customer['total']*100) if customer['total'] > 0 else 0:.0f}% RR /
+                        {(customer['nrr']/customer['total']*100) if customer['total'] > 0 else 0:.0f}% NRR
+                    </div>
+                </div>
+            </div>
+        </div>
+
+        <div class="card">
+            <h2>Revenue Breakdown</h2>
+            <table style="width: 100%; border-collapse: collapse;">
+                <tr style="border-bottom: 2px solid var(--border);">
+                    <th style="text-align: left; padding: 1rem;">Component</th>
+                    <th style="text-align: right; padding: 1rem;">Amount</th>
+                    <th style="text-align: right; padding: 1rem;">% of Total</th>
+                </tr>
+                <tr style="border-bottom: 1px solid var(--border);">
+                    <td style="padding: 1rem;"><strong>Recurring Revenue (ARR)</strong></td>
+                    <td style="text-align: right; padding: 1rem;">${customer['rr']:,.0f}</td>
+                    <td style="text-align: right; padding: 1rem;">{(customer['rr']/customer['total']*100) if customer['total'] > 0 else 0:.1f}%</td>
+                </tr>
+                <tr style="border-bottom: 1px solid var(--border);">
+                    <td style="padding: 1rem;"><strong>Non-Recurring Revenue (FY26)</strong></td>
+                    <td style="text-align: right; padding: 1rem;">${customer['nrr']:,.0f}</td>
+                    <td style="text-align: right; padding: 1rem;">{(customer['nrr']/customer['total']*100) if customer['total'] > 0 else 0:.1f}%</td>
+                </tr>
+                <tr style="background: var(--highlight); font-weight: 700;">
+                    <td style="padding: 1rem;"><strong>TOTAL REVENUE</strong></td>
+                    <td style="text-align: right; padding: 1rem;">${customer['total']:,.0f}</td>
+                    <td style="text-align: right; padding: 1rem;">100.0%</td>
+                </tr>
+            </table>
+        </div>
+
+        {news_widget}
+    </div>
+
+    <div class="footer">
+        <p><strong>{customer_name} Strategic Account Plan</strong> | {label} Business Unit | Skyvera</p>
+        <p style="margin-top: 0.5rem;">Generated: {datetime.now().strftime('%B %d, %Y')} | Confidential - Internal Use Only</p>
+    </div>
+</body>
+</html>"""
+
+    return html
+
+
+# Per-process render state, filled by init_render_worker()
+_worker = {}
+
+
+def init_render_worker(bu_keys):
+    """Load shared inputs and every BU's customer list once per process."""
+    _worker['inputs'] = DashboardInputs()
+    _worker['customers'] = {bu_key: load_customers(BU_DASHBOARDS[bu_key])['customers']
+                            for bu_key in bu_keys}
+
+
+def render_customer_page(item):
+    """Render and atomically write one customer page.
+
+    Args:
+        item (tuple): (bu_key, index into the BU's customer list)
+
+    Returns:
+        tuple: (filename, has_intelligence)
+    """
+    bu_key, index = item
+    inputs = _worker['inputs']
+    customers = _worker['customers'][bu_key]
+    customer = customers[index]
+
+    filename = file_stem(customer['customer_name']) + '.html'
+    html = create_simple_dashboard(bu_key, customer, customers, inputs)
+    write_atomic(f"{BU_DASHBOARDS[bu_key]['output_dir']}/{filename}", html)
+
+    return filename, get_customer_intelligence(customer['customer_name'], inputs.intelligence_data) is not None
+
+
+def plan_bu(bu_key, changed_only=False):
+    """Pick the customers of one BU to render.
+
+    Returns:
+        tuple: (all customers, indexes to render, removed customer names,
+                changeset hashes to mark rendered, None for the latest extraction's)
+    """
+    customers = load_customers(BU_DASHBOARDS[bu_key])['customers']
+
+    to_render, removed, hashes = customers, [], None
+    if changed_only:
+        to_render, removed, hashes = select_customers_to_render(bu_key, customers, 'bu_dashboards')
+
+    selected = {c['customer_name'] for c in to_render}
+    indexes = [i for i, c in enumerate(customers) if c['customer_name'] in selected]
+    return customers, indexes, removed, hashes
+
+
+def main(default_bus=None):
+    """CLI entry point; default_bus restricts the run for the per-BU wrapper scripts."""
+    parser = argparse.ArgumentParser(description='Generate customer account plan dashboards')
+    parser.add_argument('--bu', action='append', choices=list(BU_DASHBOARDS),
+                        help='Business unit to render (repeatable, default: all)')
+    parser.add_argument('--changed-only', action='store_true',
+                        help='Re-render only customers changed since the last dashboard render')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    bu_keys = args.bu or default_bus or list(BU_DASHBOARDS)
+    plans = {bu_key: plan_bu(bu_key, args.changed_only) for bu_key in bu_keys}
+
+    # Customer selector options are shared per BU, so they are refreshed on
+    # every run (including --changed-only runs)
+    for bu_key in bu_keys:
+        write_options_script(BU_DASHBOARDS[bu_key]['output_dir'], plans[bu_key][0])
+
+    # Every BU's pages go through one pool; shared inputs load once per worker
+    items = [(bu_key, index) for bu_key in bu_keys for index in plans[bu_key][1]]
+    # Build (or refresh) the customer registry once, before the workers read it
+    get_customer_registry()
+    pages = run_jobs(render_customer_page, items, jobs=args.jobs,
+                     initializer=init_render_worker, initargs=(bu_keys,))
+    print(f"Rendering {len(items)} pages ({resolve_jobs(args.jobs)} job(s))\n")
+
+    total = 0
+    for bu_key in bu_keys:
+        bu = BU_DASHBOARDS[bu_key]
+        label = bu['label']
+        output_dir = bu['output_dir']
+        customers, indexes, removed, hashes = plans[bu_key]
+
+        print("="*100)
+        print(f"GENERATING {label.upper()} CUSTOMER ACCOUNT PLAN DASHBOARDS")
+        print("="*100)
+        print(f"\nTotal customers: {len(customers)} ({len(indexes)} to render)\n")
+
+        for name in removed:
+            stale = f"{output_dir}/{file_stem(name)}.html"
+            if os.path.exists(stale):
+                os.remove(stale)
+                print(f"Removed {stale}")
+
+        for index in indexes:
+            customer = customers[index]
+            filename, has_intelligence = next(pages)
+
+            # Indicate if intelligence is available
+            has_intel = '📊' if has_intelligence else '  '
+            print(f"#{customer['rank']:<3} {has_intel} {customer['customer_name'][:50]:<50} → {filename}")
+
+        print("\n" + "="*100)
+        mark_rendered(bu_key, 'bu_dashboards', hashes)
+        print(f"✅ Generated {len(indexes)} {label} customer dashboards")
+        print(f"📁 Saved to: {output_dir}/")
+        print("="*100)
+        print()
+        total += len(indexes)
+
+    if len(bu_keys) > 1:
+        print(f"✅ Generated {total} dashboards across {len(bu_keys)} business units")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,10 @@
 """Generate customer intelligence prompts for AI agents."""
 import json
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_names import file_stem
 
 def load_customers():
     with open('data/customers_top80.json', 'r') as f:
@@ -152,7 +156,7 @@ def main():
 
     for customer in customers:
         customer_name = customer['customer_name']
-        filename = f"{customer_name.replace('/', '-').replace(' ', '_')}.txt"
+        filename = f"{file_stem(customer_name)}.txt"
         filepath = f"data/intelligence/prompts/{filename}"
 
         prompt = generate_prompt(customer)
@@ -1,7 +1,14 @@
 """Generate STL BU index page with customer selector."""
+import argparse
 import json
+import os
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_changeset import any_changes, mark_rendered
+from customer_names import file_stem
+
 def load_customers():
     with open('data/customers_stl_top80.json', 'r') as f:
         return json.load(f)
@@ -10,7 +17,7 @@ def generate_customer_cards(customers):
     """Generate HTML cards for each customer."""
     cards = []
     for customer in customers:
-        filename = customer['customer_name'].replace('/', '-').replace(' ', '_') + '.html'
+        filename = file_stem(customer['customer_name']) + '.html'
 
         # Determine tier badge
         if customer['rank'] <= 3:
@@ -316,11 +323,21 @@ def generate_index_html(data):
     return html
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate BU index page')
+    parser.add_argument('--changed-only', action='store_true',
+                        help='Skip regeneration when no customer changed since the last index render')
+    args = parser.parse_args()
+
+    if args.changed_only and not any_changes(['stl'], 'index'):
+        print("No customer changes for this BU - index unchanged")
+        return
+
     data = load_customers()
     html = generate_index_html(data)
 
     with open('output/stl/index.html', 'w') as f:
         f.write(html)
+    mark_rendered('stl', 'index')
 
     print("="*100)
     print("✅ STL BU index page generated")
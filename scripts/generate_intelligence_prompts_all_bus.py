@@ -6,6 +6,10 @@ Reads customer data from JSON files and creates comprehensive research prompts
 
 import json
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_names import prompt_filename
 
 # Define paths
 BASE_DIR = "/Users/RAZER/Documents/projects/Skyvera"
@@ -32,14 +36,6 @@ BU_CONFIGS = {
     }
 }
 
-def sanitize_filename(name):
-    """Sanitize customer name for use in filename"""
-    # Replace problematic characters
-    sanitized = name.replace("/", "_").replace("\\", "_").replace(":", "_")
-    sanitized = sanitized.replace("*", "_").replace("?", "_").replace('"', "_")
-    sanitized = sanitized.replace("<", "_").replace(">", "_").replace("|", "_")
-    return sanitized
-
 def generate_prompt(customer, bu_name, bu_description):
     """Generate intelligence research prompt for a customer"""
 
@@ -210,7 +206,7 @@ def main():
             prompt = generate_prompt(customer, bu_name, bu_description)
 
             # Create filename
-            sanitized_name = sanitize_filename(customer_name)
+            sanitized_name = prompt_filename(customer_name)
             filename = f"{sanitized_name}_{bu_name}.txt"
             filepath = os.path.join(PROMPTS_DIR, filename)
 
@@ -8,7 +8,9 @@ from datetime import datetime
 
 # Import the intelligence parser
 sys.path.insert(0, os.path.dirname(__file__))
-from parse_intelligence_for_tabs import parse_intelligence_report, markdown_to_html
+from customer_registry import customer_report
+from markdown_render import render_markdown
+from parse_intelligence_for_tabs import load_tab_sections
 
 def load_customers(bu):
     """Load customers for a specific BU."""
@@ -23,12 +25,15 @@ def load_customers(bu):
 
 def load_intelligence_report(customer_name):
     """Load raw markdown intelligence report."""
-    filename = f"{customer_name.replace('/', '-').replace(' ', '_')}.md"
-    filepath = f"data/intelligence/reports/{filename}"
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return f.read()
-    return None
+    return customer_report(customer_name)
+
+def markdown_to_html(md_text):
+    """Render a markdown fragment with the tabs converter, through the shared fragment cache."""
+    return render_markdown(md_text, 'tabs')
+
+def load_intelligence_sections(customer_name):
+    """Parsed tab sections for a customer, or None if there is no report."""
+    return load_tab_sections(customer_name)
 
 def generate_executives_tab_html(executives, org_structure):
     """Generate HTML for Key Executives tab."""
@@ -15,6 +15,13 @@ import sys
 from datetime import datetime
 from typing import Dict, List
 
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_registry import customer_report, find_customer_entry
+from intelligence_store import open_intelligence_store
+from report_cache import load_parsed_report
+from report_sections import parse_report
+from report_tables import EXECUTIVE_FIELDS, RISK_FIELDS, extract_action_tables, strip_bold, table_records
+
 def load_customers(bu):
     """Load customers for a specific BU."""
     bu_files = {
@@ -28,33 +35,19 @@ def load_customers(bu):
 
 def load_intelligence_html():
     """Load pregenerated intelligence HTML (for Overview tab)."""
-    filepath = 'data/intelligence_html.json'
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    return {}
+    return open_intelligence_store()
 
 def load_intelligence_report(customer_name):
     """Load raw markdown intelligence report."""
-    filename = f"{customer_name.replace('/', '-').replace(' ', '_')}.md"
-    filepath = f"data/intelligence/reports/{filename}"
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return f.read()
-    return None
+    return customer_report(customer_name)
+
+def load_intelligence_sections(customer_name):
+    """Parsed intelligence sections (via the parsed-report cache), or None if there is no report."""
+    return load_parsed_report(customer_name, 'premium', parse_intelligence_report)
 
 def get_customer_intelligence_html(customer_name, intelligence_data):
     """Get pregenerated intelligence HTML for Overview tab."""
-    customer_key = customer_name.replace('/', '-').replace(' ', '_')
-    if customer_key in intelligence_data:
-        return intelligence_data[customer_key]
-    
-    customer_key_no_underscore = customer_name.replace('/', ' ').replace('  ', ' ')
-    for key in intelligence_data.keys():
-        if key.replace('_', ' ').lower() == customer_key_no_underscore.lower():
-            return intelligence_data[key]
-    
-    return None
+    return find_customer_entry(customer_name, intelligence_data)
 
 # Intelligence parsing functions
 def parse_intelligence_report(report_text):
@@ -78,18 +71,15 @@ def parse_intelligence_report(report_text):
 def extract_executives(text):
     """Extract executive leadership information."""
     executives = []
-    csuite_pattern = r'### C-Suite and Key Decision Makers\s*\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(csuite_pattern, text, re.DOTALL)
+    table_text = parse_report(text).section('C-Suite and Key Decision Makers')
     
-    if match:
-        table_text = match.group(1)
-        rows = re.findall(r'\| \*\*(.+?)\*\* \| (.+?) \| (.+?) \| (.+?) \|', table_text)
-        for role, name, background, tenure in rows:
+    if table_text is not None:
+        for row in table_records(table_text, EXECUTIVE_FIELDS):
             executives.append({
-                'role': role.strip(),
-                'name': name.strip(),
-                'background': background.strip(),
-                'tenure': tenure.strip()
+                'role': strip_bold(row['role']),
+                'name': row['name'],
+                'background': row['background'],
+                'tenure': row['tenure']
             })
     
     return executives
@@ -97,27 +87,24 @@ def extract_executives(text):
 def extract_org_structure(text):
     """Extract organizational structure information."""
     sections = []
+    report = parse_report(text)
     
-    stakeholder_pattern = r'### Key Stakeholders for.*?\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(stakeholder_pattern, text, re.DOTALL)
-    if match:
-        sections.append(match.group(1).strip())
+    body = report.section('Key Stakeholders for', how='prefix')
+    if body is not None:
+        sections.append(body.strip())
     
-    org_changes_pattern = r'### Organizational Changes to Monitor\s*\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(org_changes_pattern, text, re.DOTALL)
-    if match:
-        sections.append("\n\n**Organizational Changes to Monitor:**\n\n" + match.group(1).strip())
+    body = report.section('Organizational Changes to Monitor')
+    if body is not None:
+        sections.append("\n\n**Organizational Changes to Monitor:**\n\n" + body.strip())
     
     return "\n\n".join(sections) if sections else ""
 
 def extract_pain_points(text):
     """Extract pain points and challenges."""
     pain_points = []
-    risk_pattern = r'### Detailed Risk Analysis\s*\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(risk_pattern, text, re.DOTALL)
+    risk_text = parse_report(text).section('Detailed Risk Analysis')
     
-    if match:
-        risk_text = match.group(1)
+    if risk_text is not None:
         risks = re.findall(r'\*\*Risk \d+: (.+?)\*\* \(Severity: (.+?)\)\s*\n(.+?)(?=\n\*\*Risk|\Z)', risk_text, re.DOTALL)
         for title, severity, description in risks:
             pain_points.append({
@@ -131,145 +118,76 @@ def extract_pain_points(text):
 def extract_competitive(text):
     """Extract competitive analysis."""
     sections = []
+    report = parse_report(text)
     
-    comp_pattern = r'### C\. Competitive Quick Reference\s*\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(comp_pattern, text, re.DOTALL)
-    if match:
-        sections.append(match.group(1).strip())
+    body = report.section('C. Competitive Quick Reference')
+    if body is not None:
+        sections.append(body.strip())
     
-    market_pattern = r'### Market Position\s*\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(market_pattern, text, re.DOTALL)
-    if match:
-        sections.append("\n\n**Market Position:**\n\n" + match.group(1).strip())
+    body = report.section('Market Position')
+    if body is not None:
+        sections.append("\n\n**Market Position:**\n\n" + body.strip())
     
     return "\n\n".join(sections) if sections else ""
 
 def extract_action_plan(text):
     """Extract action plan with immediate, short-term, and strategic actions."""
-    actions = {'immediate': [], 'short_term': [], 'strategic': []}
-    
-    # Immediate Actions
-    immediate_pattern = r'### Immediate Actions \(0-30 Days\)\s*\n\n.*?\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(immediate_pattern, text, re.DOTALL)
-    if match:
-        rows = re.findall(r'\| (\d+) \| \*\*(.+?)\*\* - (.+?) \| (.+?) \| (.+?) \|', match.group(1))
-        for priority, title, detail, owner, metric in rows:
-            actions['immediate'].append({
-                'priority': int(priority),
-                'title': title.strip(),
-                'detail': detail.strip(),
-                'owner': owner.strip(),
-                'metric': metric.strip()
-            })
-    
-    # Short-Term Actions
-    shortterm_pattern = r'### Short-Term Actions \(30-90 Days\)\s*\n\n.*?\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(shortterm_pattern, text, re.DOTALL)
-    if match:
-        rows = re.findall(r'\| (\d+) \| \*\*(.+?)\*\* - (.+?) \| (.+?) \| (.+?) \|', match.group(1))
-        for priority, title, detail, owner, metric in rows:
-            actions['short_term'].append({
-                'priority': int(priority),
-                'title': title.strip(),
-                'detail': detail.strip(),
-                'owner': owner.strip(),
-                'metric': metric.strip()
-            })
-    
-    # Strategic Actions
-    strategic_pattern = r'### Strategic Actions \(90\+ Days\)\s*\n\n.*?\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(strategic_pattern, text, re.DOTALL)
-    if match:
-        rows = re.findall(r'\| (\d+) \| \*\*(.+?)\*\* - (.+?) \| (.+?) \| (.+?) \|', match.group(1))
-        for priority, title, detail, owner, metric in rows:
-            actions['strategic'].append({
-                'priority': int(priority),
-                'title': title.strip(),
-                'detail': detail.strip(),
-                'owner': owner.strip(),
-                'metric': metric.strip()
-            })
-    
-    return actions
+    return extract_action_tables(text)
 
 def extract_financial(text):
     """Extract financial analysis."""
     financial = {'recent_performance': '', 'guidance': '', 'summary': ''}
+    report = parse_report(text)
     
     # Recent Financial Performance
-    perf_pattern = r'### Recent Financial Performance\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(perf_pattern, text, re.DOTALL)
-    if match:
-        financial['recent_performance'] = match.group(1).strip()[:1000]
+    body = report.section('Recent Financial Performance', stop=(3,))
+    if body is not None:
+        financial['recent_performance'] = body.strip()[:1000]
     
     # Financial Guidance
-    guidance_pattern = r'###.*?Guidance\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(guidance_pattern, text, re.DOTALL)
-    if match:
-        financial['guidance'] = match.group(1).strip()[:1000]
+    body = report.section('Guidance', how='suffix', stop=(3,))
+    if body is not None:
+        financial['guidance'] = body.strip()[:1000]
     
     # Enterprise Division Performance
-    enterprise_pattern = r'### Enterprise Division Performance.*?\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(enterprise_pattern, text, re.DOTALL)
-    if match:
-        financial['summary'] = match.group(1).strip()[:1000]
+    body = report.section('Enterprise Division Performance', how='prefix', stop=(3,))
+    if body is not None:
+        financial['summary'] = body.strip()[:1000]
     
     return financial
 
 def extract_strategic_direction(text):
     """Extract strategic direction."""
-    pattern = r'### Connected Future 30 Strategic Pillars\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(pattern, text, re.DOTALL)
-    if match:
-        return match.group(1).strip()[:1500]
-    
-    pattern = r'### Evolution of Corporate Strategy\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(pattern, text, re.DOTALL)
-    if match:
-        return match.group(1).strip()[:1500]
+    report = parse_report(text)
+    for title in ('Connected Future 30 Strategic Pillars', 'Evolution of Corporate Strategy'):
+        body = report.section(title, stop=(3,))
+        if body is not None:
+            return body.strip()[:1500]
     
     return ""
 
 def extract_risks(text):
     """Extract risk assessment."""
     risks = []
-    risk_pattern = r'### Risk Assessment Matrix\s*\n\n.*?\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(risk_pattern, text, re.DOTALL)
+    body = parse_report(text).section('Risk Assessment Matrix', stop=(3,))
     
-    if match:
-        rows = re.findall(r'\| \*\*(.+?)\*\* \| (.+?) \| (.+?) \| (.+?) \| (.+?) \|', match.group(1))
-        for risk, probability, impact, severity, mitigation in rows:
+    if body is not None:
+        for row in table_records(body, RISK_FIELDS):
             risks.append({
-                'risk': risk.strip(),
-                'probability': probability.strip(),
-                'impact': impact.strip(),
-                'severity': severity.strip(),
-                'mitigation': mitigation.strip()[:100]
+                'risk': strip_bold(row['risk']),
+                'probability': row['probability'],
+                'impact': row['impact'],
+                'severity': row['severity'],
+                'mitigation': row['mitigation'][:100]
             })
     
     return risks
 
 def extract_action_items_short(text):
     """Extract top 3 action items for Keys to Success."""
-    actions = []
-    immediate_pattern = r'### Immediate Actions.*?\n\n.*?\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(immediate_pattern, text, re.DOTALL)
-    if match:
-        rows = re.findall(r'\| (\d+) \| \*\*(.+?)\*\*.*?\|', match.group(1))
-        for priority, action in rows[:3]:
-            clean_action = action.strip().replace('**', '')
-            actions.append({'priority': int(priority), 'action': clean_action})
-    
-    if len(actions) < 3:
-        shortterm_pattern = r'### Short-Term Actions.*?\n\n.*?\n\n(.*?)(?=\n### |\Z)'
-        match = re.search(shortterm_pattern, text, re.DOTALL)
-        if match:
-            rows = re.findall(r'\| (\d+) \| \*\*(.+?)\*\*.*?\|', match.group(1))
-            for priority, action in rows[:3-len(actions)]:
-                clean_action = action.strip().replace('**', '')
-                actions.append({'priority': int(priority), 'action': clean_action})
-    
-    return actions[:3]
+    actions = extract_action_tables(text)
+    return [{'priority': action['priority'], 'action': action['title'].replace('**', '')}
+            for action in (actions['immediate'] + actions['short_term'])[:3]]
 
 def extract_critical_alerts(text):
     """Extract critical alerts."""
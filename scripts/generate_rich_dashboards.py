@@ -1,11 +1,30 @@
 #!/usr/bin/env python3
 """Generate rich, top-tier account plan dashboards with full intelligence in all tabs."""
 
+import argparse
 import json
 import os
 import re
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_names import file_stem
+from customer_options import options_script_tag, select_attributes, write_options_script
+from customer_registry import customer_report, find_customer_entry, get_customer_registry
+from intelligence_store import open_intelligence_store
+from markdown_render import register_renderer, render_markdown
+from parallel_render import add_jobs_argument, resolve_jobs, run_jobs, write_atomic
+from report_cache import cached_parse
+from report_sections import parse_report
+
+BU_OUTPUT_DIRS = {
+    'CloudSense': 'output',
+    'Kandy': 'output/kandy',
+    'STL': 'output/stl',
+    'NewNet': 'output/newnet'
+}
+
 def load_customers(bu):
     bu_files = {
         'CloudSense': 'data/customers_cloudsense_all.json',
@@ -17,32 +36,19 @@ def load_customers(bu):
         return json.load(f)['customers']
 
 def load_intelligence_report(customer_name):
-    filename = f"{customer_name.replace('/', '-').replace(' ', '_')}.md"
-    filepath = f"data/intelligence/reports/{filename}"
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return f.read()
-    return None
+    return customer_report(customer_name)
 
 def load_intelligence_html():
-    filepath = 'data/intelligence_html.json'
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    return {}
+    return open_intelligence_store()
 
 def get_intelligence_html(customer_name, intelligence_data):
-    customer_key = customer_name.replace('/', '-').replace(' ', '_')
-    if customer_key in intelligence_data:
-        return intelligence_data[customer_key]
-    
-    customer_key_no_underscore = customer_name.replace('/', ' ').replace('  ', ' ')
-    for key in intelligence_data.keys():
-        if key.replace('_', ' ').lower() == customer_key_no_underscore.lower():
-            return intelligence_data[key]
-    return None
+    return find_customer_entry(customer_name, intelligence_data)
 
 def md_to_html(text):
+    """Render a markdown fragment through the shared fragment cache."""
+    return render_markdown(text, 'rich')
+
+def quick_markdown_html(text):
     """Quick markdown to HTML converter."""
     if not text:
         return ""
@@ -54,17 +60,18 @@ def md_to_html(text):
     html = re.sub(r'<p>(<li>.*?</li>)+</p>', r'<ul>\1</ul>', html, flags=re.DOTALL)
     return html
 
+register_renderer('rich', quick_markdown_html)
+
 def parse_section(text, section_name):
     """Extract a markdown section by heading name."""
-    pattern = f'## {re.escape(section_name)}\\s*\\n(.*?)(?=\\n## |\\Z)'
-    match = re.search(pattern, text, re.DOTALL)
-    return match.group(1).strip() if match else ""
+    # Deeper headings with the same title count too (reports vary in heading depth)
+    body = parse_report(text).section(section_name, level=(2, 3, 4, 5, 6), stop=(2,))
+    return body.strip() if body is not None else ""
 
 def parse_subsection(text, subsection_name):
     """Extract a markdown subsection by heading name."""
-    pattern = f'### {re.escape(subsection_name)}\\s*\\n(.*?)(?=\\n### |\\n## |\\Z)'
-    match = re.search(pattern, text, re.DOTALL)
-    return match.group(1).strip() if match else ""
+    body = parse_report(text).section(subsection_name, level=3)
+    return body.strip() if body is not None else ""
 
 def extract_executives(text):
     """Extract executives from table."""
@@ -113,7 +120,40 @@ def extract_actions(text, section_name):
         })
     return actions
 
-def generate_complete_dashboard(customer, all_customers, bu_name, intelligence_html_data):
+def parse_rich_report(intelligence_report):
+    """Parse everything the rich dashboard shows from one intelligence report."""
+    exec_section = parse_section(intelligence_report, "Executive Leadership")
+    executives = extract_executives(exec_section)
+    
+    risk_assessment = parse_subsection(intelligence_report, "Risk Assessment Matrix")
+    risks = extract_risks(risk_assessment)
+    
+    immediate_actions = extract_actions(intelligence_report, "Immediate Actions (0-30 Days)")
+    shortterm_actions = extract_actions(intelligence_report, "Short-Term Actions (30-90 Days)")
+    strategic_actions = extract_actions(intelligence_report, "Strategic Actions (90+ Days)")
+    
+    # Extract alerts and keys to success
+    alerts = []
+    findings = re.findall(r'\d+\.\s+\*\*(CAUTION|CRITICAL|RISK):\*\*\s+(.+?)(?=\n\d+\.|\n\n|\Z)', intelligence_report, re.DOTALL)
+    for severity, text in findings[:2]:
+        alerts.append({'severity': severity, 'text': text.strip()})
+    
+    return {
+        'executives': executives,
+        'pain_section': parse_section(intelligence_report, "Pain Points & Challenges"),
+        'comp_section': parse_section(intelligence_report, "Competitive Landscape"),
+        'strategic_section': parse_section(intelligence_report, "Strategic Direction"),
+        'financial_section': parse_section(intelligence_report, "Financial Analysis"),
+        'risks': risks,
+        'immediate_actions': immediate_actions,
+        'shortterm_actions': shortterm_actions,
+        'strategic_actions': strategic_actions,
+        'org_structure': parse_subsection(intelligence_report, "Key Stakeholders for CloudSense Relationship"),
+        'alerts': alerts,
+        'keys_to_success': (immediate_actions + shortterm_actions)[:3],
+    }
+
+def generate_complete_dashboard(customer, bu_name, intelligence_html_data):
     """Generate complete dashboard with all tabs populated."""
     customer_name = customer['customer_name']
     
@@ -122,34 +162,21 @@ def generate_complete_dashboard(customer, all_customers, bu_name, intelligence_h
     intelligence_report = load_intelligence_report(customer_name)
     has_intelligence = intelligence_report is not None
     
-    # Parse intelligence sections
+    # Parse intelligence sections (cached per report text)
     if has_intelligence:
-        exec_section = parse_section(intelligence_report, "Executive Leadership")
-        executives = extract_executives(exec_section)
-        
-        pain_section = parse_section(intelligence_report, "Pain Points & Challenges")
-        comp_section = parse_section(intelligence_report, "Competitive Landscape")
-        strategic_section = parse_section(intelligence_report, "Strategic Direction")
-        financial_section = parse_section(intelligence_report, "Financial Analysis")
-        
-        risk_assessment = parse_subsection(intelligence_report, "Risk Assessment Matrix")
-        risks = extract_risks(risk_assessment)
-        
-        immediate_actions = extract_actions(intelligence_report, "Immediate Actions (0-30 Days)")
-        shortterm_actions = extract_actions(intelligence_report, "Short-Term Actions (30-90 Days)")
-        strategic_actions = extract_actions(intelligence_report, "Strategic Actions (90+ Days)")
-        
-        org_structure = parse_subsection(intelligence_report, "Key Stakeholders for CloudSense Relationship")
-        
-        # Extract alerts and keys to success
-        alerts = []
-        findings = re.findall(r'\d+\.\s+\*\*(CAUTION|CRITICAL|RISK):\*\*\s+(.+?)(?=\n\d+\.|\n\n|\Z)', intelligence_report, re.DOTALL)
-        for severity, text in findings[:2]:
-            alerts.append({'severity': severity, 'text': text.strip()})
-        
-        keys_to_success = []
-        for action in (immediate_actions + shortterm_actions)[:3]:
-            keys_to_success.append(action)
+        parsed = cached_parse('rich', intelligence_report, parse_rich_report)
+        executives = parsed['executives']
+        pain_section = parsed['pain_section']
+        comp_section = parsed['comp_section']
+        strategic_section = parsed['strategic_section']
+        financial_section = parsed['financial_section']
+        risks = parsed['risks']
+        immediate_actions = parsed['immediate_actions']
+        shortterm_actions = parsed['shortterm_actions']
+        strategic_actions = parsed['strategic_actions']
+        org_structure = parsed['org_structure']
+        alerts = parsed['alerts']
+        keys_to_success = parsed['keys_to_success']
     else:
         executives = []
         pain_section = comp_section = strategic_section = financial_section = ""
@@ -171,7 +198,7 @@ def generate_complete_dashboard(customer, all_customers, bu_name, intelligence_h
     {generate_css()}
 </head>
 <body>
-    {generate_nav(all_customers, customer_name, bu_name)}
+    {generate_nav(customer_name, bu_name)}
     {generate_header(customer, bu_name)}
     {generate_tabs()}
     
@@ -266,19 +293,12 @@ def generate_css():
     .footer { background: var(--secondary); color: var(--paper); text-align: center; padding: 2rem; margin-top: 4rem; }
     </style>"""
 
-def generate_nav(all_customers, current, bu):
-    options = []
-    for c in all_customers:
-        filename = c['customer_name'].replace('/', '-').replace(' ', '_') + '.html'
-        selected = ' selected' if c['customer_name'] == current else ''
-        options.append(f'<option value="{filename}"{selected}>#{c["rank"]} - {c["customer_name"]} (${c["total"]/1000000:.2f}M)</option>')
-    
+def generate_nav(current, bu):
     return f"""<div class="global-nav">
         <a href="../index.html" class="global-nav-logo">SKYVERA</a>
-        <div><select class="global-nav-select" onchange="window.location.href=this.value">
+        <div><select class="global-nav-select" onchange="window.location.href=this.value" {select_attributes(current)}>
             <option value="">Select Customer...</option>
-            {''.join(options)}
-        </select></div>
+        </select>{options_script_tag()}</div>
     </div>"""
 
 def generate_header(customer, bu):
@@ -501,41 +521,60 @@ def generate_javascript():
     }
     </script>'''
 
+# Per-process render state, filled by init_render_worker()
+_worker = {}
+
+def init_render_worker():
+    """Load intelligence HTML and every BU's customer list once per process."""
+    _worker['intelligence_html_data'] = load_intelligence_html()
+    _worker['customers'] = {bu_name: load_customers(bu_name) for bu_name in BU_OUTPUT_DIRS}
+
+def render_customer_page(item):
+    """Render and atomically write one dashboard; item is (bu_name, customer index)."""
+    bu_name, index = item
+    customers = _worker['customers'][bu_name]
+    customer = customers[index]
+
+    filename = file_stem(customer['customer_name']) + '.html'
+    html = generate_complete_dashboard(customer, bu_name, _worker['intelligence_html_data'])
+    write_atomic(f"{BU_OUTPUT_DIRS[bu_name]}/{filename}", html)
+
+    report = load_intelligence_report(customer['customer_name'])
+    return filename, report is not None
+
 def main():
+    parser = argparse.ArgumentParser(description='Generate rich account plan dashboards')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
     print("="*100)
     print("GENERATING PREMIUM ACCOUNT PLAN DASHBOARDS WITH RICH CONTENT")
     print("="*100)
     
-    bus = {
-        'CloudSense': 'output',
-        'Kandy': 'output/kandy',
-        'STL': 'output/stl',
-        'NewNet': 'output/newnet'
-    }
-    
     intelligence_html_data = load_intelligence_html()
     print(f"Loaded intelligence HTML for {len(intelligence_html_data)} customers\n")
     
+    customers_by_bu = {bu_name: load_customers(bu_name) for bu_name in BU_OUTPUT_DIRS}
+    items = [(bu_name, index) for bu_name, customers in customers_by_bu.items()
+             for index in range(len(customers))]
+    # Build (or refresh) the customer registry once, before the workers read it
+    get_customer_registry()
+    print(f"Rendering {len(items)} pages ({resolve_jobs(args.jobs)} job(s))")
+
+    for bu_name, output_dir in BU_OUTPUT_DIRS.items():
+        write_options_script(output_dir, customers_by_bu[bu_name])
+
+    pages = run_jobs(render_customer_page, items, jobs=args.jobs, initializer=init_render_worker)
     total = 0
-    for bu_name, output_dir in bus.items():
+    for bu_name, customers in customers_by_bu.items():
         print(f"\n{bu_name}:")
         print("-" * 80)
         
-        customers = load_customers(bu_name)
-        os.makedirs(output_dir, exist_ok=True)
-        
         for customer in customers:
             customer_name = customer['customer_name']
-            filename = customer_name.replace('/', '-').replace(' ', '_') + '.html'
-            filepath = f"{output_dir}/{filename}"
-            
-            html = generate_complete_dashboard(customer, customers, bu_name, intelligence_html_data)
-            
-            with open(filepath, 'w') as f:
-                f.write(html)
+            filename, has_report = next(pages)
             
-            report = load_intelligence_report(customer_name)
-            has_intel = '📊' if report else '  '
+            has_intel = '📊' if has_report else '  '
             print(f"  #{customer['rank']:<3} {has_intel} {customer_name[:60]:<60} → {filename}")
             total += 1
         
@@ -1,10 +1,28 @@
 #!/usr/bin/env python3
 """Generate tabbed account plan dashboards using the template structure."""
 
+import argparse
 import json
 import os
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_names import file_stem
+from customer_options import options_script_tag, select_attributes, write_options_script
+from customer_registry import customer_report, find_customer_entry, get_customer_registry
+from intelligence_store import open_intelligence_store
+from parallel_render import add_jobs_argument, resolve_jobs, run_jobs, write_atomic
+from report_cache import cached_parse
+from report_highlights import HIGHLIGHTS_NAMESPACE, parse_report_highlights
+
+BU_OUTPUT_DIRS = {
+    'CloudSense': 'output',
+    'Kandy': 'output/kandy',
+    'STL': 'output/stl',
+    'NewNet': 'output/newnet'
+}
+
 def load_customers(bu):
     """Load customers for a specific BU."""
     bu_files = {
@@ -18,105 +36,27 @@ def load_customers(bu):
         return json.load(f)['customers']
 
 def load_intelligence_data():
-    """Load pregenerated intelligence HTML."""
-    filepath = 'data/intelligence_html.json'
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    return {}
+    """Pregenerated intelligence HTML as a lazy per-customer mapping."""
+    return open_intelligence_store()
 
 def load_intelligence_report(customer_name):
     """Load raw markdown intelligence report."""
-    filename = f"{customer_name.replace('/', '-').replace(' ', '_')}.md"
-    filepath = f"data/intelligence/reports/{filename}"
-
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return f.read()
-    return None
-
-def parse_action_items(report_text):
-    """Extract top 3 action items from intelligence report."""
-    if not report_text:
-        return []
-
-    actions = []
-    import re
-
-    # Parse immediate actions (0-30 days)
-    immediate_section = re.search(r'### Immediate Actions.*?\n\n(.*?)(?=\n### |\n## |\Z)', report_text, re.DOTALL)
-    if immediate_section:
-        rows = re.findall(r'\| (\d+) \| \*\*(.+?)\*\*.*?\|', immediate_section.group(1))
-        for priority, action in rows[:3]:
-            clean_action = action.strip().replace('**', '')
-            actions.append({'priority': int(priority), 'action': clean_action})
-
-    # If we need more, get from short-term
-    if len(actions) < 3:
-        shortterm_section = re.search(r'### Short-Term Actions.*?\n\n(.*?)(?=\n### |\n## |\Z)', report_text, re.DOTALL)
-        if shortterm_section:
-            rows = re.findall(r'\| (\d+) \| \*\*(.+?)\*\*.*?\|', shortterm_section.group(1))
-            for priority, action in rows[:3-len(actions)]:
-                clean_action = action.strip().replace('**', '')
-                actions.append({'priority': int(priority), 'action': clean_action})
-
-    return actions[:3]
-
-def parse_critical_alerts(report_text):
-    """Extract critical risks from intelligence report."""
-    if not report_text:
-        return []
-
-    alerts = []
-    import re
-
-    # Look for "CAUTION:" or "CRITICAL" in key findings
-    findings = re.findall(r'\d+\.\s+\*\*(CAUTION|CRITICAL|RISK):\*\*\s+(.+?)(?=\n\d+\.|\n\n|\Z)', report_text, re.DOTALL)
-    for severity, text in findings[:2]:
-        alerts.append({'severity': severity, 'text': text.strip()})
-
-    # Also check risk table for CRITICAL severity
-    risk_matches = re.findall(r'\|\s+\*\*(.+?)\*\*\s+\|[^\|]+\|[^\|]+\|\s+(Critical|HIGH)\s+\|', report_text, re.IGNORECASE)
-    for risk, severity in risk_matches[:1]:
-        if not any(r['text'].lower().find(risk.lower()[:20]) >= 0 for r in alerts):
-            alerts.append({'severity': 'CRITICAL', 'text': f"{risk} identified as critical risk"})
-
-    return alerts[:2]
+    return customer_report(customer_name)
 
 def get_customer_intelligence(customer_name, intelligence_data):
     """Get intelligence HTML for customer."""
-    customer_key = customer_name.replace('/', '-').replace(' ', '_')
-    if customer_key in intelligence_data:
-        return intelligence_data[customer_key]
-
-    # Try without underscores
-    customer_key_no_underscore = customer_name.replace('/', ' ').replace('  ', ' ')
-    for key in intelligence_data.keys():
-        if key.replace('_', ' ').lower() == customer_key_no_underscore.lower():
-            return intelligence_data[key]
-
-    return None
-
-def generate_customer_dropdown(all_customers, current_customer_name, bu):
-    """Generate customer dropdown options."""
-    options = []
-    for customer in all_customers:
-        filename = customer['customer_name'].replace('/', '-').replace(' ', '_') + '.html'
-        selected = ' selected' if customer['customer_name'] == current_customer_name else ''
-        options.append(
-            f'<option value="{filename}"{selected}>#{customer["rank"]} - {customer["customer_name"]} (${customer["total"]/1000000:.2f}M)</option>'
-        )
-    return '\n'.join(options)
-
-def create_tabbed_dashboard(customer, all_customers, bu_name, intelligence_data):
+    return find_customer_entry(customer_name, intelligence_data)
+
+def create_tabbed_dashboard(customer, bu_name, intelligence_data):
     """Create a full tabbed dashboard for a customer."""
     customer_name = customer['customer_name']
 
     # Load intelligence
     intelligence_html = get_customer_intelligence(customer_name, intelligence_data)
     intelligence_report = load_intelligence_report(customer_name)
-    action_items = parse_action_items(intelligence_report) if intelligence_report else []
-    critical_alerts = parse_critical_alerts(intelligence_report) if intelligence_report else []
+    highlights = cached_parse(HIGHLIGHTS_NAMESPACE, intelligence_report, parse_report_highlights) if intelligence_report else {}
+    action_items = highlights.get('action_items', [])
+    critical_alerts = highlights.get('critical_alerts', [])
 
     has_intelligence = intelligence_html is not None
 
@@ -154,13 +94,13 @@ def create_tabbed_dashboard(customer, all_customers, bu_name, intelligence_data)
 
     # Generate the full HTML (continues in next message due to length)
     html = generate_html_structure(
-        customer, all_customers, bu_name, intelligence_html,
+        customer, bu_name, intelligence_html,
         alerts_html, keys_html, has_intelligence
     )
 
     return html
 
-def generate_html_structure(customer, all_customers, bu_name, intelligence_html, alerts_html, keys_html, has_intelligence):
+def generate_html_structure(customer, bu_name, intelligence_html, alerts_html, keys_html, has_intelligence):
     """Generate the complete HTML structure with all tabs."""
     customer_name = customer['customer_name']
 
@@ -188,7 +128,7 @@ def generate_html_structure(customer, all_customers, bu_name, intelligence_html,
     {generate_css()}
 </head>
 <body>
-    {generate_global_nav(all_customers, customer_name, bu_name)}
+    {generate_global_nav(customer_name, bu_name)}
     {generate_header(customer, bu_name)}
     {generate_tab_nav()}
 
@@ -577,7 +517,7 @@ def generate_css():
     </style>
     """
 
-def generate_global_nav(all_customers, current_customer, bu_name):
+def generate_global_nav(current_customer, bu_name):
     """Generate global navigation bar."""
     return f"""
     <div class="global-nav">
@@ -591,10 +531,10 @@ def generate_global_nav(all_customers, current_customer, bu_name):
                 <option value="../newnet/index.html"{' selected' if bu_name == 'NewNet' else ''}>NewNet Overview</option>
                 <option value="../analytics.html">📊 Master Analytics</option>
             </select>
-            <select class="global-nav-select" onchange="window.location.href=this.value">
+            <select class="global-nav-select" onchange="window.location.href=this.value" {select_attributes(current_customer)}>
                 <option value="">Select Customer Account...</option>
-                {generate_customer_dropdown(all_customers, current_customer, bu_name)}
             </select>
+            {options_script_tag()}
         </div>
     </div>
     """
@@ -732,42 +672,62 @@ def generate_javascript():
     </script>
     """
 
+# Per-process render state, filled by init_render_worker()
+_worker = {}
+
+def init_render_worker():
+    """Load intelligence and every BU's customer list once per process."""
+    _worker['intelligence_data'] = load_intelligence_data()
+    _worker['customers'] = {bu_name: load_customers(bu_name) for bu_name in BU_OUTPUT_DIRS}
+
+def render_customer_page(item):
+    """Render and atomically write one dashboard; item is (bu_name, customer index)."""
+    bu_name, index = item
+    intelligence_data = _worker['intelligence_data']
+    customers = _worker['customers'][bu_name]
+    customer = customers[index]
+
+    filename = file_stem(customer['customer_name']) + '.html'
+    html = create_tabbed_dashboard(customer, bu_name, intelligence_data)
+    write_atomic(f"{BU_OUTPUT_DIRS[bu_name]}/{filename}", html)
+
+    return filename, get_customer_intelligence(customer['customer_name'], intelligence_data) is not None
+
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description='Generate tabbed account plan dashboards')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
     print("="*100)
     print("GENERATING TABBED ACCOUNT PLAN DASHBOARDS")
     print("="*100)
 
-    bus = {
-        'CloudSense': 'output',
-        'Kandy': 'output/kandy',
-        'STL': 'output/stl',
-        'NewNet': 'output/newnet'
-    }
-
     intelligence_data = load_intelligence_data()
     print(f"Loaded intelligence for {len(intelligence_data)} customers\n")
 
+    customers_by_bu = {bu_name: load_customers(bu_name) for bu_name in BU_OUTPUT_DIRS}
+    items = [(bu_name, index) for bu_name, customers in customers_by_bu.items()
+             for index in range(len(customers))]
+    # Build (or refresh) the customer registry once, before the workers read it
+    get_customer_registry()
+    print(f"Rendering {len(items)} pages ({resolve_jobs(args.jobs)} job(s))")
+
+    for bu_name, output_dir in BU_OUTPUT_DIRS.items():
+        write_options_script(output_dir, customers_by_bu[bu_name])
+
+    pages = run_jobs(render_customer_page, items, jobs=args.jobs, initializer=init_render_worker)
     total_generated = 0
 
-    for bu_name, output_dir in bus.items():
+    for bu_name, customers in customers_by_bu.items():
         print(f"\n{bu_name}:")
         print("-" * 80)
 
-        customers = load_customers(bu_name)
-        os.makedirs(output_dir, exist_ok=True)
-
         for customer in customers:
             customer_name = customer['customer_name']
-            filename = customer_name.replace('/', '-').replace(' ', '_') + '.html'
-            filepath = f"{output_dir}/{filename}"
-
-            html = create_tabbed_dashboard(customer, customers, bu_name, intelligence_data)
-
-            with open(filepath, 'w') as f:
-                f.write(html)
+            filename, has_intelligence = next(pages)
 
-            has_intel = '📊' if get_customer_intelligence(customer_name, intelligence_data) else '  '
+            has_intel = '📊' if has_intelligence else '  '
             print(f"  #{customer['rank']:<3} {has_intel} {customer_name[:60]:<60} → {filename}")
             total_generated += 1
 
@@ -6,44 +6,31 @@ Parses markdown intelligence reports and generates HTML sections.
 
 import re
 import os
+import sys
 from pathlib import Path
-import markdown2
-from openpyxl import load_workbook
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(__file__))
+from intelligence_store import write_store
+from markdown_render import render_batch
+from parallel_render import write_atomic
+from report_cache import cached_parse
+from report_index import report_key
+from report_metrics import scan_report, write_metrics_table
+from workbook_cache import load_renewal_index
+
 def load_renewal_dates():
-    """Extract renewal dates from Excel budget file."""
+    """Renewal date, quarter and status per customer (report_key -> RenewalInfo).
+
+    Read from the cached 'RR Input' extraction (workbook_cache), so the
+    workbook itself is only parsed when it has changed.
+    """
     renewal_data = {}
 
     try:
-        wb = load_workbook("2025-12-11 Skyvera - Budget - Q1'26 - For Todd.xlsx", data_only=True)
-        ws = wb['RR Input']
-
-        # Skip header rows (first 10 rows)
-        for row in ws.iter_rows(min_row=11, values_only=True):
-            if not row[1]:  # Skip if no customer name
-                continue
-
-            customer_name = row[1]  # Column B
-            renewal_date = row[7]  # Column H
-            renewal_qtr = row[8]    # Column I
-            will_renew = row[9]      # Column J
-
-            if customer_name and customer_name not in ['SUM', 'SUBTOTAL']:
-                # Normalize customer name for matching
-                customer_key = customer_name.replace('/', '-').replace(' ', '_')
-
-                renewal_info = {
-                    'renewal_date': renewal_date,
-                    'renewal_qtr': renewal_qtr,
-                    'will_renew': will_renew
-                }
-
-                renewal_data[customer_key] = renewal_info
-                # Also store with spaces for alternate matching
-                renewal_data[customer_name] = renewal_info
-
-        print(f"✅ Loaded renewal data for {len(set(renewal_data.keys()))} customers")
+        # Keyed like the report files the renewals are joined to
+        renewal_data = {report_key(name): info for name, info in load_renewal_index().items()}
+        print(f"✅ Loaded renewal data for {len(renewal_data)} customers")
     except Exception as e:
         print(f"⚠️  Could not load renewal dates: {e}")
 
@@ -54,6 +41,14 @@ def parse_intelligence_report(filepath):
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
 
+    report_data = dict(cached_parse('integrate', content, parse_intelligence_markdown))
+    report_data['raw_content'] = content
+    # Health score, key findings and renewal rows in one pass over the lines
+    report_data['metrics'] = scan_report(content.split('\n'))
+    return report_data
+
+def parse_intelligence_markdown(content):
+    """Customer name and ## sections of a report (cached by report_cache)."""
     # Extract customer name from first heading
     customer_match = re.search(r'^#\s*(.+?)(?:\n|$)', content, re.MULTILINE)
     customer_name = customer_match.group(1) if customer_match else "Unknown"
@@ -69,67 +64,25 @@ def parse_intelligence_report(filepath):
 
     return {
         'customer_name': customer_name,
-        'sections': sections,
-        'raw_content': content
+        'sections': sections
     }
 
-def extract_health_score(content):
-    """Extract strategic health score from anywhere in document."""
-    score_match = re.search(r'(?:Strategic Health Score|Health Score):\s*(\d+\.?\d*)\s*/\s*10', content, re.IGNORECASE)
-    if score_match:
-        return float(score_match.group(1))
-    return None
-
-def extract_key_findings(content):
-    """Extract key findings from executive summary or key findings section."""
-    # Try to find Key Findings Summary or similar sections
-    findings_section = re.search(r'###\s*Key Findings.*?\n+(.*?)(?=\n---|\n##|\Z)', content, re.DOTALL)
-    if findings_section:
-        findings_text = findings_section.group(1).strip()
-        # Extract numbered findings with bold titles
-        findings = re.findall(r'\d+\.\s+\*\*(.+?)\*\*[:\s]*(.+?)(?=\n\d+\.|\Z)', findings_text, re.DOTALL)
-        return [{'title': f[0].strip(':'), 'description': f[1].strip()} for f in findings]
-    
-    # Alternative: Look for numbered points in EXECUTIVE SUMMARY
-    exec_summary = re.search(r'##\s*EXECUTIVE SUMMARY\s*\n(.*?)(?=\n##|\Z)', content, re.DOTALL)
-    if exec_summary:
-        summary_text = exec_summary.group(1)
-        findings = re.findall(r'(?:^|\n)(\d+)\.\s+\*\*(.+?)\*\*[:\s]*(.+?)(?=\n\d+\.|\n##|\Z)', summary_text, re.DOTALL)
-        return [{'title': f[1].strip(':'), 'description': f[2].strip()[:200]} for f in findings[:4]]
-    
-    return []
-
-def markdown_to_html(md_content):
-    """Convert markdown to HTML with tables and formatting."""
-    html = markdown2.markdown(
-        md_content,
-        extras=['tables', 'fenced-code-blocks', 'header-ids']
-    )
-
-    # Add CSS class to tables for proper styling
-    html = html.replace('<table>', '<table class="data-table">')
-
-    # Ensure proper paragraph spacing in list items
-    html = html.replace('<li><p>', '<li>').replace('</p></li>', '</li>')
-
-    return html
-
 def generate_intelligence_html(report_data, renewal_info=None):
     """Generate HTML section for intelligence data."""
     sections = report_data['sections']
-    raw_content = report_data['raw_content']
+    metrics = report_data.get('metrics') or scan_report(report_data['raw_content'].split('\n'))
 
     # Extract components
-    health_score = extract_health_score(raw_content)
-    key_findings = extract_key_findings(raw_content)
+    health_score = metrics['health_score']
+    key_findings = metrics['key_findings']
 
     html_parts = []
 
     # Renewal Information Banner
     if renewal_info:
-        renewal_date = renewal_info.get('renewal_date')
-        renewal_qtr = renewal_info.get('renewal_qtr')
-        will_renew = renewal_info.get('will_renew')
+        renewal_date = renewal_info.renewal_date
+        renewal_qtr = renewal_info.renewal_qtr
+        will_renew = renewal_info.will_renew
 
         # Format renewal date
         if isinstance(renewal_date, datetime):
@@ -219,9 +172,16 @@ def generate_intelligence_html(report_data, renewal_info=None):
     
     # Look for pain points, competitive, opportunities sections (flexible matching)
     pain_points_keys = [k for k in sections.keys() if 'PAIN POINT' in k.upper() or 'CHALLENGE' in k.upper() or 'STRATEGIC INIT' in k.upper()]
+    competitive_keys = [k for k in sections.keys() if 'COMPETITIVE' in k.upper()]
+    opportunity_keys = [k for k in sections.keys() if 'OPPORTUNIT' in k.upper() or 'GROWTH' in k.upper() or 'EXPANSION' in k.upper()]
+    strategy_keys = [k for k in sections.keys() if 'STRATEGY' in k.upper() or 'ACTION PLAN' in k.upper() or 'NEXT STEPS' in k.upper()]
+
+    # Render the chosen sections in one batch through the shared fragment cache
+    section_keys = [keys[0] for keys in (pain_points_keys, competitive_keys, opportunity_keys, strategy_keys) if keys]
+    section_html = dict(zip(section_keys, render_batch([sections[k] for k in section_keys])))
+
     if pain_points_keys:
-        pain_points_md = sections[pain_points_keys[0]]
-        pain_points_html = markdown_to_html(pain_points_md)
+        pain_points_html = section_html[pain_points_keys[0]]
         html_parts.append(f'''
         <div class="card">
             <h2>⚠️ Pain Points & Strategic Initiatives</h2>
@@ -232,10 +192,8 @@ def generate_intelligence_html(report_data, renewal_info=None):
         ''')
     
     # Competitive Landscape
-    competitive_keys = [k for k in sections.keys() if 'COMPETITIVE' in k.upper()]
     if competitive_keys:
-        competitive_md = sections[competitive_keys[0]]
-        competitive_html = markdown_to_html(competitive_md)
+        competitive_html = section_html[competitive_keys[0]]
         html_parts.append(f'''
         <div class="card">
             <h2>🏆 Competitive Landscape</h2>
@@ -246,10 +204,8 @@ def generate_intelligence_html(report_data, renewal_info=None):
         ''')
     
     # Opportunities
-    opportunity_keys = [k for k in sections.keys() if 'OPPORTUNIT' in k.upper() or 'GROWTH' in k.upper() or 'EXPANSION' in k.upper()]
     if opportunity_keys:
-        opportunities_md = sections[opportunity_keys[0]]
-        opportunities_html = markdown_to_html(opportunities_md)
+        opportunities_html = section_html[opportunity_keys[0]]
         html_parts.append(f'''
         <div class="card">
             <h2>🚀 Opportunities & Growth Potential</h2>
@@ -260,10 +216,8 @@ def generate_intelligence_html(report_data, renewal_info=None):
         ''')
     
     # Account Strategy
-    strategy_keys = [k for k in sections.keys() if 'STRATEGY' in k.upper() or 'ACTION PLAN' in k.upper() or 'NEXT STEPS' in k.upper()]
     if strategy_keys:
-        strategy_md = sections[strategy_keys[0]]
-        strategy_html = markdown_to_html(strategy_md)
+        strategy_html = section_html[strategy_keys[0]]
         html_parts.append(f'''
         <div class="card" style="background: var(--highlight);">
             <h2>📋 Account Strategy & Next Steps</h2>
@@ -296,6 +250,7 @@ def main():
     # Process each report
     report_files = list(reports_dir.glob('*.md'))
     intelligence_data = {}
+    metrics_table = {}
 
     for report_file in report_files:
         customer_key = report_file.stem
@@ -306,28 +261,33 @@ def main():
             customer_name = report_data['customer_name']
 
             # Get renewal info for this customer
-            renewal_info = renewal_data.get(customer_key) or renewal_data.get(customer_name)
+            renewal_info = renewal_data.get(customer_key) or renewal_data.get(report_key(customer_name))
 
             html_content = generate_intelligence_html(report_data, renewal_info)
             intelligence_data[customer_key] = html_content
+            metrics_table[customer_key] = report_data['metrics']
             print(f"   ✅ Successfully parsed ({len(html_content)} chars)")
             if renewal_info:
-                print(f"   📅 Renewal: {renewal_info.get('renewal_qtr')} - {renewal_info.get('will_renew')}")
+                print(f"   📅 Renewal: {renewal_info.renewal_qtr} - {renewal_info.will_renew}")
         except Exception as e:
             print(f"   ❌ Error: {e}")
             import traceback
             traceback.print_exc()
             continue
     
-    # Save to JSON for dashboard generators to load
+    # Save to JSON for dashboard generators to load (rebuilt from cached fragments each run)
     import json
     output_file = 'data/intelligence_html.json'
-    with open(output_file, 'w') as f:
-        json.dump(intelligence_data, f, indent=2)
+    write_atomic(output_file, json.dumps(intelligence_data, indent=2))
+    # Per-customer random-access copy the dashboard generators read from
+    write_store(intelligence_data, output_file)
+    # Health scores, key findings and renewal rows for consumers that skip the markdown
+    write_metrics_table(dict(sorted(metrics_table.items())))
     
     print()
     print(f"✅ Processed {len(intelligence_data)} intelligence reports")
     print(f"📁 Saved to: {output_file}")
+    print(f"📊 Metrics table: data/report_metrics.json")
     print()
     
     # List what's available
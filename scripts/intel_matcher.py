@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Indexed company-name matcher for the OSINT intelligence databases.
+
+populate_osint.get_intel_for_company and
+osint_update_accounts.find_intelligence used to scan every database key
+per account: a bidirectional substring test, then (for the researched intel)
+a word-overlap pass. IntelMatcher precomputes, once per database:
+
+    automaton     Aho-Corasick automaton over the lowercased keys; one scan
+                  of a company name finds every key contained in it
+    suffixes      sorted suffixes of the lowercased keys; a binary search
+                  finds every key that contains the company name
+    tokens        inverted index token -> keys over the significant words
+                  (longer than 3 characters, stopwords removed)
+
+match() returns the best IntelMatch(key, score, kind). Exact matches rank
+above containment, and containment ranks above token overlap. Within a
+kind the higher score wins:
+
+    exact      1.0
+    contains   length of the shorter name / length of the longer
+    tokens     shared significant words / all significant words of both (Jaccard)
+
+Ties go to the key listed first in the database, so results are
+deterministic.
+
+Usage:
+  from intel_matcher import IntelMatcher
+  matcher = IntelMatcher(open_intel_database('intelligence_db'))
+  matcher.match('AT&T SERVICES, INC.')   # IntelMatch(key='AT&T SERVICES, INC.', score=1.0, kind='exact')
+"""
+
+import bisect
+from collections import deque, namedtuple
+
+IntelMatch = namedtuple('IntelMatch', 'key score kind')
+
+# Words shared by too many company names to identify one: legal forms and
+# generic industry terms ('Masergy Communications' is not 'Tata Communications')
+STOPWORDS = frozenset([
+    'inc', 'ltd', 'limited', 'the', 'services', 'group', 'company',
+    'corp', 'corporation', 'holdings', 'international', 'private', 'public',
+    'communications', 'telecom', 'telecommunications', 'telephone', 'media',
+    'networks', 'systems', 'solutions', 'technologies', 'digital',
+])
+MIN_TOKEN_LENGTH = 4
+
+KIND_RANK = {'exact': 3, 'contains': 2, 'tokens': 1}
+
+
+def significant_tokens(name):
+    """Words of a company name that can identify it ('AT&T Mobility, Inc.' -> {'mobility'})."""
+    words = name.lower().replace(',', '').replace('.', '').split()
+    return {w for w in words if len(w) >= MIN_TOKEN_LENGTH and w not in STOPWORDS}
+
+
+class AhoCorasick:
+    """Multi-pattern substring automaton: which patterns occur in a text."""
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(index)
+
+        # Breadth-first failure links; each state also reports its fallback's patterns
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def search(self, text):
+        """Indexes of the patterns occurring in text."""
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            found.update(self.output[state])
+        return found
+
+
+class IntelMatcher:
+    """Best database key for a company name, from indexes built once."""
+
+    def __init__(self, keys, token_overlap=True):
+        """
+        Args:
+            keys: Database keys (company names) in priority order (e.g. a dict)
+            token_overlap: Also match on shared significant words
+        """
+        self.keys = list(keys)
+        self.lowered = [key.lower() for key in self.keys]
+        self.exact = {}
+        for index, key in enumerate(self.lowered):
+            self.exact.setdefault(key, index)
+
+        self.automaton = AhoCorasick(self.lowered)
+        self.suffixes = sorted((key[start:], index)
+                               for index, key in enumerate(self.lowered) for start in range(len(key)))
+
+        self.token_overlap = token_overlap
+        self.key_tokens = [significant_tokens(key) for key in self.keys]
+        self.tokens = {}
+        for index, tokens in enumerate(self.key_tokens):
+            for token in tokens:
+                self.tokens.setdefault(token, []).append(index)
+
+    def containing(self, name):
+        """Indexes of the keys that contain name (lowercased)."""
+        found = set()
+        position = bisect.bisect_left(self.suffixes, (name,))
+        while position < len(self.suffixes) and self.suffixes[position][0].startswith(name):
+            found.add(self.suffixes[position][1])
+            position += 1
+        return found
+
+    def candidates(self, company_name):
+        """(kind, score, index) for every key that matches company_name."""
+        name = company_name.lower()
+        if not name:
+            return []
+        if name in self.exact:
+            return [('exact', 1.0, self.exact[name])]
+
+        found = [('contains', min(len(name), len(self.lowered[index])) / max(len(name), len(self.lowered[index])), index)
+                 for index in self.automaton.search(name) | self.containing(name)]
+        if found or not self.token_overlap:
+            return found
+
+        name_tokens = significant_tokens(company_name)
+        shared = {}
+        for token in name_tokens:
+            for index in self.tokens.get(token, ()):
+                shared[index] = shared.get(index, 0) + 1
+        return [('tokens', count / len(name_tokens | self.key_tokens[index]), index)
+                for index, count in shared.items()]
+
+    def matches(self, company_name):
+        """All matches for a company name, best first."""
+        ranked = sorted(self.candidates(company_name), key=lambda c: (-KIND_RANK[c[0]], -c[1], c[2]))
+        return [IntelMatch(self.keys[index], round(score, 4), kind) for kind, score, index in ranked]
+
+    def match(self, company_name):
+        """Best IntelMatch for a company name, or None."""
+        ranked = self.matches(company_name)
+        return ranked[0] if ranked else None
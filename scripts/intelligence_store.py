@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Random-access store for pregenerated intelligence HTML.
+
+data/intelligence_html.json maps customer keys to rendered intelligence HTML
+and grows with the report corpus. Rather than json.load the whole blob into
+every generator process, the generators open a lazy read-only mapping backed
+by two derived files:
+
+    data/intelligence_html.jsonl        one ["key", "html"] record per line
+    data/intelligence_html.index.json   key -> [byte offset, length] plus the
+                                        source JSON's size/mtime
+
+Only the index (keys and offsets) is held in memory; each lookup seeks to
+one line and decodes that customer's HTML. integrate_intelligence_reports.py
+writes the store alongside the JSON; if the JSON is newer than the store
+(edited or pulled from git), open_intelligence_store() rebuilds the store
+from it once.
+
+Usage:
+  from intelligence_store import open_intelligence_store
+  intelligence_data = open_intelligence_store()
+  html = intelligence_data.get('Telstra_Corporation_Limited')
+
+  python3 scripts/intelligence_store.py [--rebuild]
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from parallel_render import write_atomic
+
+INTELLIGENCE_HTML_FILE = Path('data/intelligence_html.json')
+STORE_FILE = Path('data/intelligence_html.jsonl')
+INDEX_FILE = Path('data/intelligence_html.index.json')
+
+
+class IntelligenceStore(Mapping):
+    """Read-only customer key -> intelligence HTML mapping that reads records on demand."""
+
+    def __init__(self, store_path, offsets):
+        self.store_path = Path(store_path)
+        self._offsets = offsets
+        self._file = None
+        self._pid = None
+
+    def _handle(self):
+        # Reopen after a fork so process-pool workers never share a file position
+        if self._file is None or self._pid != os.getpid():
+            self._file = open(self.store_path, 'rb')
+            self._pid = os.getpid()
+        return self._file
+
+    def __getitem__(self, key):
+        offset, length = self._offsets[key]
+        f = self._handle()
+        f.seek(offset)
+        return json.loads(f.read(length).decode('utf-8'))[1]
+
+    def __contains__(self, key):
+        return key in self._offsets
+
+    def __iter__(self):
+        return iter(self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def source_stamp(json_path):
+    stat = os.stat(json_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def write_store(data, source_path=INTELLIGENCE_HTML_FILE, store_path=STORE_FILE, index_path=INDEX_FILE):
+    """Write the JSONL store and its offset index for a key -> HTML dict.
+
+    The index records source_path's size and mtime, so call this after the
+    source JSON has been written.
+    """
+    lines = []
+    offsets = {}
+    position = 0
+    for key, html in data.items():
+        line = json.dumps([key, html], ensure_ascii=False).encode('utf-8') + b'\n'
+        offsets[key] = [position, len(line)]
+        position += len(line)
+        lines.append(line)
+
+    tmp_store = f"{store_path}.tmp-{os.getpid()}"
+    with open(tmp_store, 'wb') as f:
+        f.writelines(lines)
+    os.replace(tmp_store, store_path)
+
+    # Index last: a store is only used once its index points at it
+    index = {
+        'source': source_stamp(source_path) if os.path.exists(source_path) else None,
+        'offsets': offsets,
+    }
+    write_atomic(str(index_path), json.dumps(index))
+    return index
+
+
+def read_index(index_path=INDEX_FILE):
+    try:
+        with open(index_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def rebuild_store(source_path=INTELLIGENCE_HTML_FILE, store_path=STORE_FILE, index_path=INDEX_FILE):
+    """Convert the source JSON into the JSONL store (loads the JSON once)."""
+    with open(source_path, 'r') as f:
+        data = json.load(f)
+    return write_store(data, source_path, store_path, index_path)
+
+
+def open_intelligence_store(source_path=INTELLIGENCE_HTML_FILE, store_path=STORE_FILE, index_path=INDEX_FILE):
+    """Lazy mapping of customer key -> intelligence HTML (empty if there is no data)."""
+    if not os.path.exists(source_path):
+        return {}
+
+    index = read_index(index_path)
+    if index is None or index.get('source') != source_stamp(source_path) or not os.path.exists(store_path):
+        index = rebuild_store(source_path, store_path, index_path)
+    return IntelligenceStore(store_path, index['offsets'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the random-access intelligence HTML store')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild even if the store is current')
+    args = parser.parse_args()
+
+    if not INTELLIGENCE_HTML_FILE.exists():
+        print(f"ERROR: {INTELLIGENCE_HTML_FILE} not found", file=sys.stderr)
+        sys.exit(1)
+
+    if args.rebuild:
+        rebuild_store()
+    store = open_intelligence_store()
+    print(f"{len(store)} customers indexed in {STORE_FILE}")
+
+
+if __name__ == '__main__':
+    main()
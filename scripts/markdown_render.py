@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Shared markdown-to-HTML rendering with fragment caching.
+
+The generators convert the same report sections to HTML over and over
+(integrate_intelligence_reports per section, the rich and premium
+generators per page). Rendering goes through this module instead: each
+distinct fragment is converted once per renderer, memoized in an in-process
+LRU keyed by content hash, and (for the markdown2 renderer) persisted as
+
+    data/intelligence/.html_cache/<renderer>/<fragment sha1>.json
+
+so later runs and other scripts read the HTML back instead of re-rendering.
+render_batch() renders a list of fragments in one call, converting each
+distinct fragment at most once.
+
+Renderers are registered by name. 'markdown' is the markdown2 converter
+(tables, fenced code, header ids); generators with their own lightweight
+converters register them so those fragments share the LRU as well:
+
+    register_renderer('rich', md_to_html, persist=False)
+    html = render_markdown(section, 'rich')
+
+Usage:
+  python3 scripts/markdown_render.py [--clear]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from report_cache import ReportCache, content_hash, parser_version
+
+HTML_CACHE_DIR = Path('data/intelligence/.html_cache')
+LRU_SIZE = 4096
+
+
+def markdown2_html(md_content):
+    """Convert markdown to HTML with tables and formatting (markdown2)."""
+    import markdown2
+
+    html = markdown2.markdown(
+        md_content,
+        extras=['tables', 'fenced-code-blocks', 'header-ids']
+    )
+
+    # Add CSS class to tables for proper styling
+    html = html.replace('<table>', '<table class="data-table">')
+
+    # Ensure proper paragraph spacing in list items
+    html = html.replace('<li><p>', '<li>').replace('</p></li>', '</li>')
+
+    return html
+
+
+def markdown2_version():
+    import markdown2
+    return f"{parser_version(markdown2_html)}-{markdown2.__version__}"
+
+
+# name -> (render function, persist to disk, version function)
+RENDERERS = {
+    'markdown': (markdown2_html, True, markdown2_version),
+}
+
+
+def register_renderer(name, render, persist=False):
+    """Register a markdown converter under a name (persist=True also caches on disk)."""
+    RENDERERS[name] = (render, persist, lambda: parser_version(render))
+
+
+class MarkdownRenderer:
+    """Fragment renderer with an LRU in front of the on-disk HTML cache."""
+
+    def __init__(self, cache_dir=HTML_CACHE_DIR, lru_size=LRU_SIZE):
+        self.store = ReportCache(cache_dir, memoize=False)
+        self.lru_size = lru_size
+        self._lru = OrderedDict()
+        self._versions = {}
+
+    def _version(self, renderer):
+        if renderer not in self._versions:
+            self._versions[renderer] = RENDERERS[renderer][2]()
+        return self._versions[renderer]
+
+    def render(self, fragment, renderer='markdown'):
+        """HTML for one markdown fragment ('' for an empty fragment)."""
+        if not fragment:
+            return ''
+        key = (renderer, content_hash(fragment))
+        if key in self._lru:
+            self._lru.move_to_end(key)
+            return self._lru[key]
+
+        render, persist, _ = RENDERERS[renderer]
+        if persist:
+            html = self.store.get(renderer, fragment, render, self._version(renderer))
+        else:
+            html = render(fragment)
+
+        self._lru[key] = html
+        if len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+        return html
+
+    def render_batch(self, fragments, renderer='markdown'):
+        """HTML for each fragment, in order; duplicates are rendered once."""
+        rendered = {}
+        for fragment in fragments:
+            if fragment not in rendered:
+                rendered[fragment] = self.render(fragment, renderer)
+        return [rendered[fragment] for fragment in fragments]
+
+
+_renderer = None
+
+
+def get_markdown_renderer():
+    """Process-wide MarkdownRenderer."""
+    global _renderer
+    if _renderer is None:
+        _renderer = MarkdownRenderer()
+    return _renderer
+
+
+def render_markdown(fragment, renderer='markdown'):
+    return get_markdown_renderer().render(fragment, renderer)
+
+
+def render_batch(fragments, renderer='markdown'):
+    return get_markdown_renderer().render_batch(fragments, renderer)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Maintain the rendered markdown fragment cache')
+    parser.add_argument('--clear', action='store_true', help='Delete the whole cache')
+    args = parser.parse_args()
+
+    if args.clear:
+        shutil.rmtree(HTML_CACHE_DIR, ignore_errors=True)
+        print(f"Cleared {HTML_CACHE_DIR}")
+        return
+
+    for renderer_dir in sorted(p for p in HTML_CACHE_DIR.glob('*') if p.is_dir()):
+        print(f"  {renderer_dir.name}: {len(list(renderer_dir.glob('*.json')))} fragments")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Versioned on-disk store of the OSINT intelligence databases.
+
+populate_osint.py and osint_update_accounts.py used to embed their
+databases as Python literals (~2,400 lines), so every import paid for
+building all of them and updating intel meant editing code. The data now
+lives in one JSON Lines file, with one record per company (or industry
+template):
+
+    data/osint_intel.jsonl          header {"osint_intel_version": 1}, then
+                                    {"db": ..., "id": ..., "name": ..., "data": {...}} per line
+    data/osint_intel.index.json     db -> [[id, name, byte offset, length], ...] plus
+                                    the store's size/mtime (derived, rebuilt when stale)
+
+Databases:
+    company_intel        COMPANY_INTEL of populate_osint (company name -> intel)
+    industry_templates   INDUSTRY_TEMPLATES of populate_osint (industry -> template)
+    intelligence_db      INTELLIGENCE_DB of osint_update_accounts (researched intel)
+
+Record IDs are customer-registry style slugs of the name
+('AT&T SERVICES, INC.' -> 'atandt-services-inc'). Opening a database reads
+only the index; a record is decoded from its line on first access, so a run
+costs only the records it touches.
+
+Usage:
+  from osint_intel import open_intel_database
+  research = open_intel_database('intelligence_db')
+  research['AT&T SERVICES, INC.']          # by name
+  research.record('atandt-services-inc')   # by ID
+
+  python3 scripts/osint_intel.py [--rebuild-index] [--show NAME] [--import DB FILE.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_names import account_slug
+
+INTEL_STORE_FILE = Path('data/osint_intel.jsonl')
+INTEL_INDEX_FILE = Path('data/osint_intel.index.json')
+INTEL_STORE_VERSION = 1
+
+DATABASES = ('company_intel', 'industry_templates', 'intelligence_db')
+
+
+class IntelDatabase(Mapping):
+    """Read-only name -> record mapping over one database of the store, read on demand."""
+
+    def __init__(self, store_path, entries):
+        self.store_path = Path(store_path)
+        self.ids = {}
+        self._spans = {}
+        for company_id, name, offset, length in entries:
+            self.ids.setdefault(name, company_id)
+            self._spans[company_id] = (offset, length)
+        self._records = {}
+        self._file = None
+        self._pid = None
+
+    def _handle(self):
+        # Reopen after a fork so process-pool workers never share a file position
+        if self._file is None or self._pid != os.getpid():
+            self._file = open(self.store_path, 'rb')
+            self._pid = os.getpid()
+        return self._file
+
+    def record(self, company_id):
+        """Intel record for a company ID (KeyError if unknown)."""
+        if company_id not in self._records:
+            offset, length = self._spans[company_id]
+            f = self._handle()
+            f.seek(offset)
+            self._records[company_id] = json.loads(f.read(length).decode('utf-8'))['data']
+        return self._records[company_id]
+
+    def has_record(self, company_id):
+        return company_id in self._spans
+
+    def __getitem__(self, name):
+        return self.record(self.ids[name])
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def record_id(name, taken=()):
+    """Slug ID for a record name, suffixed '-2', '-3' on a clash."""
+    slug = account_slug(name) or name
+    candidate, n = slug, 1
+    while candidate in taken:
+        n += 1
+        candidate = f"{slug}-{n}"
+    return candidate
+
+
+def replace_file(path, data):
+    """Write bytes through a temp file and rename, so readers never see a partial file.
+
+    (parallel_render.write_atomic does the same for text, but importing it
+    pulls in the process-pool machinery that reading the store does not need.)
+    """
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def source_stamp(store_path):
+    stat = os.stat(store_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def read_records(store_path=INTEL_STORE_FILE):
+    """db -> {name: record} for the whole store, in file order."""
+    databases = {db: {} for db in DATABASES}
+    with open(store_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            entry = json.loads(line)
+            if 'db' in entry:
+                databases.setdefault(entry['db'], {})[entry['name']] = entry['data']
+    return databases
+
+
+def write_intel_store(databases, store_path=INTEL_STORE_FILE, index_path=INTEL_INDEX_FILE):
+    """Write the store (db -> {name: record}) and its index.
+
+    IDs already assigned to a name in the current store are kept, so
+    re-writing the store does not renumber clashing slugs.
+    """
+    old_index = read_index(index_path) if os.path.exists(store_path) else None
+    old_ids = {}
+    for db, entries in ((old_index or {}).get('databases') or {}).items():
+        for company_id, name, _, _ in entries:
+            old_ids[(db, name)] = company_id
+
+    lines = [json.dumps({'osint_intel_version': INTEL_STORE_VERSION}).encode('utf-8') + b'\n']
+    for db, records in databases.items():
+        taken = set()
+        for name, data in records.items():
+            company_id = old_ids.get((db, name))
+            if company_id is None or company_id in taken:
+                company_id = record_id(name, taken)
+            taken.add(company_id)
+            lines.append(json.dumps({'db': db, 'id': company_id, 'name': name, 'data': data},
+                                    ensure_ascii=False).encode('utf-8') + b'\n')
+
+    replace_file(store_path, b''.join(lines))
+    return rebuild_index(store_path, index_path)
+
+
+def read_index(index_path=INTEL_INDEX_FILE):
+    try:
+        with open(index_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def rebuild_index(store_path=INTEL_STORE_FILE, index_path=INTEL_INDEX_FILE):
+    """Scan the store once and write db -> [[id, name, offset, length], ...]."""
+    databases = {db: [] for db in DATABASES}
+    position = 0
+    with open(store_path, 'rb') as f:
+        header = f.readline()
+        if json.loads(header).get('osint_intel_version') != INTEL_STORE_VERSION:
+            raise ValueError(f"{store_path}: unsupported OSINT intel store version")
+        position += len(header)
+        for line in f:
+            entry = json.loads(line)
+            databases.setdefault(entry['db'], []).append([entry['id'], entry['name'], position, len(line)])
+            position += len(line)
+
+    index = {'version': INTEL_STORE_VERSION, 'source': source_stamp(store_path), 'databases': databases}
+    try:
+        replace_file(index_path, json.dumps(index).encode('utf-8'))
+    except OSError as e:
+        print(f"Warning: could not save OSINT intel index: {e}", file=sys.stderr)
+    return index
+
+
+def load_index(store_path=INTEL_STORE_FILE, index_path=INTEL_INDEX_FILE):
+    """Index of the store, rebuilt first if missing or older than the store."""
+    index = read_index(index_path)
+    if (index is None or index.get('version') != INTEL_STORE_VERSION
+            or index.get('source') != source_stamp(store_path)):
+        index = rebuild_index(store_path, index_path)
+    return index
+
+
+_databases = {}
+
+
+def open_intel_database(db, store_path=INTEL_STORE_FILE, index_path=INTEL_INDEX_FILE):
+    """Lazy IntelDatabase for one database of the store (shared per process)."""
+    key = (db, str(store_path))
+    if key not in _databases:
+        index = load_index(store_path, index_path)
+        _databases[key] = IntelDatabase(store_path, index['databases'].get(db, []))
+    return _databases[key]
+
+
+def import_records(db, records, store_path=INTEL_STORE_FILE, index_path=INTEL_INDEX_FILE):
+    """Add or replace records (name -> data) in one database of the store."""
+    databases = read_records(store_path) if os.path.exists(store_path) else {name: {} for name in DATABASES}
+    databases.setdefault(db, {}).update(records)
+    index = write_intel_store(databases, store_path, index_path)
+    _databases.pop((db, str(store_path)), None)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or update the OSINT intelligence store')
+    parser.add_argument('--rebuild-index', action='store_true', help='Rebuild the index even if it is current')
+    parser.add_argument('--show', action='append', default=[], help='Print the records for a name or ID (repeatable)')
+    parser.add_argument('--import', dest='import_args', nargs=2, metavar=('DB', 'FILE'),
+                        help='Add or replace records from a JSON file of name -> record')
+    args = parser.parse_args()
+
+    if args.import_args:
+        db, path = args.import_args
+        if db not in DATABASES:
+            parser.error(f"unknown database {db!r} (choose from {', '.join(DATABASES)})")
+        with open(path, 'r') as f:
+            records = json.load(f)
+        import_records(db, records)
+        print(f"Imported {len(records)} records into {db}")
+
+    index = rebuild_index() if args.rebuild_index else load_index()
+    for db in DATABASES:
+        print(f"{db}: {len(index['databases'].get(db, []))} records")
+    print(f"Store: {INTEL_STORE_FILE} ({index['source']['size']:,} bytes, version {INTEL_STORE_VERSION})")
+
+    for name in args.show:
+        for db in DATABASES:
+            database = open_intel_database(db)
+            company_id = database.ids.get(name, name)
+            if database.has_record(company_id):
+                print(f"\n{db} / {company_id}:")
+                print(json.dumps(database.record(company_id), indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
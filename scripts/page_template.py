@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Page templates compiled once into static chunks and slots.
+
+The account page generators used to build each page as one large f-string,
+so every page re-formatted (and re-wrote) the same stylesheet, scripts and
+boilerplate around a few customer-specific values. A PageTemplate is the
+page markup with {{slot}} markers, split once at import time:
+
+    chunks   the static text between the markers (len(slots) + 1 strings)
+    slots    the marker names, in page order
+
+render() only fills the slots and joins the prebuilt list, so per-page
+work is proportional to the dynamic content. Styles and scripts shared by
+every page live in one linked asset per output directory, written by
+write_asset() (skipped when the file is already current):
+
+    <link rel="stylesheet" href="account-plan.css">
+    <script src="account-plan.js"></script>
+
+Usage:
+  from page_template import PageTemplate, write_asset
+  page = PageTemplate('<h1>{{customer_name}}</h1>')
+  page.render({'customer_name': 'AT&T'})
+"""
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+from parallel_render import write_atomic
+
+SLOT = re.compile(r'\{\{(\w+)\}\}')
+
+
+class PageTemplate:
+    """Template source compiled into static chunks around named slots."""
+
+    def __init__(self, source):
+        self.source = source
+        parts = SLOT.split(source)
+        self.chunks = parts[0::2]
+        self.slots = parts[1::2]
+        self._parts = parts
+
+    def render(self, values):
+        """Page text with every slot filled from values (KeyError if one is missing)."""
+        parts = self._parts[:]
+        parts[1::2] = [str(values[slot]) for slot in self.slots]
+        return ''.join(parts)
+
+    def static_size(self):
+        """Characters of static text each rendered page carries."""
+        return sum(len(chunk) for chunk in self.chunks)
+
+
+def write_asset(output_dir, name, content):
+    """Write a shared asset into output_dir unless it already has this content.
+
+    Returns:
+        bool: True if the file was (re)written
+    """
+    path = os.path.join(output_dir, name)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    os.makedirs(output_dir, exist_ok=True)
+    write_atomic(path, content)
+    return True
+
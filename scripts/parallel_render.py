@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Process-pool helpers for the per-customer page generators.
+
+run_jobs() maps a module-level render function over picklable work items,
+either in-process (jobs=1) or across a ProcessPoolExecutor. Shared
+read-only inputs are loaded by an initializer once per worker process (or
+once in-process for serial runs), so items stay small: typically
+(bu, customer index) tuples. Results come back in item order, which keeps
+the generators' console output identical to a serial run.
+
+write_atomic() writes each page to a temp file in the target directory and
+renames it into place, so a killed or failed run never leaves a truncated
+page behind.
+"""
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+# mkstemp creates 0600 files; pages get the mode a plain open() would give
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def resolve_jobs(jobs):
+    """Worker count for a --jobs value (0 or less means one per CPU core)."""
+    if jobs is None or jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def add_jobs_argument(parser):
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Render pages in N worker processes (0 = one per CPU core, default: 1)')
+
+
+def run_jobs(render, items, jobs=1, initializer=None, initargs=()):
+    """Yield render(item) for every item, in order.
+
+    Args:
+        render: Module-level function taking one item
+        items (list): Picklable work items
+        jobs (int): Worker processes; 1 renders in this process
+        initializer: Called once per worker (or once here when serial) to
+            load shared inputs
+        initargs (tuple): Arguments for initializer
+    """
+    items = list(items)
+    jobs = min(resolve_jobs(jobs), max(len(items), 1))
+
+    if jobs == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for item in items:
+            yield render(item)
+        return
+
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=initargs) as pool:
+        yield from pool.map(render, items, chunksize=chunksize)
+
+
+def write_atomic(filepath, content):
+    """Write text to filepath via a temp file and rename."""
+    directory = os.path.dirname(filepath) or '.'
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, filepath)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
@@ -5,160 +5,42 @@ Extracts customer data and financial summaries from Skyvera budget file.
 
 Usage:
   python3 parse_excel_to_json.py --type customers|financials|all
+  python3 parse_excel_to_json.py --serve [--socket PATH]
 
 Output: JSON to stdout (progress messages to stderr)
+
+Worker mode (--serve) keeps the workbook loaded and answers line-delimited
+JSON requests such as {"id": 1, "type": "all"} on stdin/stdout, or on a Unix
+socket when --socket is given. The workbook is reloaded only when the file's
+mtime changes.
 """
 
+import os
 import sys
 import json
 import argparse
-import re
+import socketserver
+import threading
 from pathlib import Path
-from openpyxl import load_workbook
 
-# Excel file path relative to project root
-EXCEL_FILE = "2025-12-11 Skyvera - Budget - Q1'26 - For Todd.xlsx"
+sys.path.insert(0, os.path.dirname(__file__))
+from budget_workbook import EXCEL_FILE, BU_CONFIGS
+from rr_aggregation import aggregate_customers_by_bu
+from workbook_cache import open_budget_workbook
 
 def log(message):
     """Log progress to stderr (so it doesn't contaminate JSON output)"""
     print(message, file=sys.stderr)
 
-def extract_rr_customers(wb, company_filter):
-    """Extract RR customers from 'RR Input' sheet for a specific company."""
-    try:
-        ws = wb['RR Input']
-    except KeyError:
-        log(f"Warning: 'RR Input' sheet not found")
-        return {}
-
-    customers = {}
-
-    for row in ws.iter_rows(min_row=11, values_only=True):
-        if not row or not row[0]:
-            continue
-
-        company = row[0]
-        customer_name = row[1]
-        sub_id = row[3] if len(row) > 3 else None
-        arr = row[6] if len(row) > 6 else 0
-        renewal_qtr = row[8] if len(row) > 8 else None
-        will_renew = row[9] if len(row) > 9 else None
-        projected_arr = row[11] if len(row) > 11 else None
-
-        if company != company_filter or not customer_name:
-            continue
-
-        if customer_name not in customers:
-            customers[customer_name] = {
-                'customer_name': customer_name,
-                'rr': 0,
-                'nrr': 0,
-                'subscriptions': []
-            }
-
-        customers[customer_name]['rr'] += arr if arr else 0
-        customers[customer_name]['subscriptions'].append({
-            'sub_id': sub_id,
-            'arr': arr if arr else 0,
-            'renewal_qtr': renewal_qtr,
-            'will_renew': will_renew,
-            'projected_arr': projected_arr
-        })
-
-    return customers
-
-def extract_nrr_customers(wb, class_filter):
-    """Extract NRR customers from 'NRR Input' sheet for a specific class."""
-    try:
-        ws = wb['NRR Input']
-    except KeyError:
-        log(f"Warning: 'NRR Input' sheet not found")
-        return {}
-
-    customers = {}
-
-    for row in ws.iter_rows(min_row=6, values_only=True):
-        if not row or not row[1]:
-            continue
-
-        customer_name = row[1]
-        class_col = row[2] if len(row) > 2 else None
-        q1_26 = row[8] if len(row) > 8 else 0
-        q2_26 = row[9] if len(row) > 9 else 0
-        q3_26 = row[10] if len(row) > 10 else 0
-        q4_26 = row[11] if len(row) > 11 else 0
-
-        if not class_col or class_filter not in class_col:
-            continue
-
-        # Extract customer name from <name> format
-        match = re.search(r'<(.+?)>', customer_name) if customer_name else None
-        if match:
-            customer_name = match.group(1).strip()
-
-        if not customer_name:
-            continue
-
-        fy26_nrr = (q1_26 or 0) + (q2_26 or 0) + (q3_26 or 0) + (q4_26 or 0)
-
-        if customer_name not in customers:
-            customers[customer_name] = 0
-        customers[customer_name] += fy26_nrr
-
-    return customers
-
-def extract_bu_customers(wb, bu_name, company_filter, class_filter):
-    """Extract all customers for a BU, combining RR and NRR data."""
-    log(f"Extracting {bu_name}...")
-
-    rr_customers = extract_rr_customers(wb, company_filter)
-    nrr_data = extract_nrr_customers(wb, class_filter)
-
-    # Merge RR and NRR data
-    all_customer_names = set(rr_customers.keys()) | set(nrr_data.keys())
-
-    customers = []
-    for name in all_customer_names:
-        rr = rr_customers.get(name, {}).get('rr', 0)
-        nrr = nrr_data.get(name, 0)
-        total = rr + nrr
-
-        customer = {
-            'customer_name': name,
-            'rr': rr,
-            'nrr': nrr,
-            'total': total,
-            'subscriptions': rr_customers.get(name, {}).get('subscriptions', [])
-        }
-        customers.append(customer)
-
-    # Sort by total revenue descending
-    customers.sort(key=lambda x: x['total'], reverse=True)
-
-    # Add rank and percentage
-    total_revenue = sum(c['total'] for c in customers)
-    for i, customer in enumerate(customers, 1):
-        customer['rank'] = i
-        customer['pct_of_total'] = (customer['total'] / total_revenue * 100) if total_revenue > 0 else 0
-
-    log(f"  ✓ {len(customers)} customers, ${total_revenue:,.0f} total revenue")
-
-    return customers
-
 def extract_all_customers(wb):
-    """Extract customers from all BUs."""
-    bu_configs = [
-        ('Cloudsense', 'Cloudsense', 'Cloudsense'),
-        ('Kandy', 'Kandy', 'Kandy'),
-        ('STL', 'STL', 'Stl'),
-        ('NewNet', 'NewNet', 'Newnet')
-    ]
+    """Extract customers from all BUs (vectorized over the input sheet columns)."""
+    log("Extracting customers for " + ", ".join(bu for bu, _, _ in BU_CONFIGS) + "...")
 
-    customers_by_bu = {}
+    customers_by_bu = aggregate_customers_by_bu(wb, BU_CONFIGS, fill_missing_arr=True)
 
-    for bu_name, company_filter, class_filter in bu_configs:
-        customers = extract_bu_customers(wb, bu_name, company_filter, class_filter)
-        customers_by_bu[bu_name] = customers
+    for bu_name, customers in customers_by_bu.items():
+        total_revenue = sum(c['total'] for c in customers)
+        log(f"  ✓ {bu_name}: {len(customers)} customers, ${total_revenue:,.0f} total revenue")
 
     return customers_by_bu
 
@@ -257,12 +139,13 @@ def _read_bu_pnl(wb, sheet_name, bu_name):
     }
 
 
-def extract_financials(wb):
+def extract_financials(wb, customers_by_bu=None):
     """Extract actual financial data from BU-specific P&L sheets.
 
     Reads directly from the 'P&Ls - <BU>' sheets instead of estimating
     costs with hardcoded ratios.  Also enriches each BU record with
-    customer count from the RR/NRR input sheets.
+    customer count from the RR/NRR input sheets (pass customers_by_bu to
+    reuse an extraction that has already been done).
     """
     log("Extracting financial summaries from P&L sheets...")
 
@@ -274,7 +157,8 @@ def extract_financials(wb):
     }
 
     # Get customer counts per BU (reuse existing extraction logic)
-    customers_by_bu = extract_all_customers(wb)
+    if customers_by_bu is None:
+        customers_by_bu = extract_all_customers(wb)
 
     financials_by_bu = {}
 
@@ -304,45 +188,147 @@ def extract_financials(wb):
 
     return financials_by_bu
 
+def build_result(wb, data_type):
+    """Build the JSON payload for a --type value from a loaded workbook."""
+    result = {}
+
+    if data_type in ['customers', 'all']:
+        result['customers'] = extract_all_customers(wb)
+
+    if data_type in ['financials', 'all']:
+        result['financials'] = extract_financials(wb, result.get('customers'))
+
+    return result
+
+
+class WorkbookWorker:
+    """Keeps the budget workbook in memory and serves --type queries.
+
+    Results are memoized per type and dropped together with the workbook
+    whenever the file's mtime changes.
+    """
+
+    def __init__(self, excel_path):
+        self.excel_path = Path(excel_path)
+        self.wb = None
+        self.mtime = None
+        self.results = {}
+        self.lock = threading.Lock()
+
+    def ensure_loaded(self):
+        mtime = os.stat(self.excel_path).st_mtime_ns
+        if self.wb is not None and mtime == self.mtime:
+            return
+
+        log(f"Loading workbook: {self.excel_path}")
+        self.wb = open_budget_workbook(self.excel_path)
+        self.mtime = mtime
+        self.results = {}
+        log("✓ Workbook loaded")
+
+    def query(self, data_type):
+        if data_type not in ('customers', 'financials', 'all'):
+            raise ValueError(f"Unsupported type: {data_type}")
+
+        with self.lock:
+            self.ensure_loaded()
+            if data_type not in self.results:
+                self.results[data_type] = build_result(self.wb, data_type)
+            return self.results[data_type]
+
+    def handle_line(self, line):
+        """Answer one request line; always returns a single JSON response line."""
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            data = self.query(request.get('type', 'all'))
+            response = {'id': request_id, 'ok': True, 'data': data}
+        except Exception as e:
+            response = {'id': request_id, 'ok': False, 'error': str(e)}
+        return json.dumps(response) + '\n'
+
+
+def serve_stdio(worker):
+    """Serve requests from stdin, one JSON object per line, until EOF."""
+    log("✓ Worker ready (stdio)")
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        sys.stdout.write(worker.handle_line(line))
+        sys.stdout.flush()
+
+
+def serve_socket(worker, socket_path):
+    """Serve line-delimited JSON requests on a Unix socket."""
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode('utf-8')
+                if not line.strip():
+                    continue
+                self.wfile.write(worker.handle_line(line).encode('utf-8'))
+                self.wfile.flush()
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    with socketserver.ThreadingUnixStreamServer(socket_path, Handler) as server:
+        log(f"✓ Worker ready (socket {socket_path})")
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(socket_path)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Parse Skyvera Excel budget file to JSON')
-    parser.add_argument('--type', choices=['customers', 'financials', 'all'], required=True,
+    parser.add_argument('--type', choices=['customers', 'financials', 'all'],
                         help='Type of data to extract')
+    parser.add_argument('--serve', action='store_true',
+                        help='Run as a long-lived worker answering line-delimited JSON requests')
+    parser.add_argument('--socket',
+                        help='Unix socket path for --serve (default: stdin/stdout)')
     args = parser.parse_args()
 
+    if not args.serve and not args.type:
+        parser.error('--type is required unless --serve is given')
+
     # Check if Excel file exists
     excel_path = Path(EXCEL_FILE)
     if not excel_path.exists():
         log(f"ERROR: Excel file not found: {EXCEL_FILE}")
         sys.exit(1)
 
+    if args.serve:
+        worker = WorkbookWorker(excel_path)
+        try:
+            worker.ensure_loaded()
+        except Exception as e:
+            log(f"ERROR: Failed to load workbook: {e}")
+            sys.exit(1)
+
+        if args.socket:
+            serve_socket(worker, args.socket)
+        else:
+            serve_stdio(worker)
+        return
+
     log(f"Loading workbook: {EXCEL_FILE}")
     log("This may take 10-15 seconds...")
 
     try:
-        # Load workbook with data_only=True to get calculated values
-        wb = load_workbook(EXCEL_FILE, data_only=True)
+        # Memory-mapped columnar cache; falls back to streaming the projected
+        # sheets/columns with openpyxl when the workbook changed
+        wb = open_budget_workbook(EXCEL_FILE)
         log("✓ Workbook loaded")
     except Exception as e:
         log(f"ERROR: Failed to load workbook: {e}")
         sys.exit(1)
 
     # Extract data based on type
-    result = {}
-
-    if args.type in ['customers', 'all']:
-        customers = extract_all_customers(wb)
-        if args.type == 'customers':
-            result = {'customers': customers}
-        else:
-            result['customers'] = customers
-
-    if args.type in ['financials', 'all']:
-        financials = extract_financials(wb)
-        if args.type == 'financials':
-            result = {'financials': financials}
-        else:
-            result['financials'] = financials
+    result = build_result(wb, args.type)
 
     # Output JSON to stdout
     log("\n✓ Extraction complete, outputting JSON...")
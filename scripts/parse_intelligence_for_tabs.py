@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 """Parse intelligence markdown reports and extract content for all dashboard tabs."""
 
+import os
 import re
+import sys
 from typing import Dict, List, Optional
 
+sys.path.insert(0, os.path.dirname(__file__))
+from markdown_render import register_renderer
+from report_cache import load_parsed_report
+from report_sections import parse_report
+from report_tables import EXECUTIVE_FIELDS, RISK_FIELDS, extract_action_tables, strip_bold, table_records
+
 def parse_intelligence_report(report_text: str) -> Dict:
     """Parse a complete intelligence report into structured sections."""
     if not report_text:
@@ -24,32 +32,29 @@ def parse_intelligence_report(report_text: str) -> Dict:
 
     return sections
 
+def load_tab_sections(customer_name: str) -> Optional[Dict]:
+    """Parsed tab sections for a customer's report (via the parsed-report cache), or None."""
+    return load_parsed_report(customer_name, 'tabs', parse_intelligence_report)
+
 def extract_executive_summary(text: str) -> str:
     """Extract executive summary section."""
-    pattern = r'## Executive Summary\s*\n(.*?)(?=\n## |\Z)'
-    match = re.search(pattern, text, re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    return ""
+    body = parse_report(text).section('Executive Summary', level=2)
+    return body.strip() if body is not None else ""
 
 def extract_executives(text: str) -> List[Dict]:
     """Extract executive leadership information."""
     executives = []
 
     # Find C-Suite table
-    csuite_pattern = r'### C-Suite and Key Decision Makers\s*\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(csuite_pattern, text, re.DOTALL)
-
-    if match:
-        table_text = match.group(1)
-        # Parse table rows
-        rows = re.findall(r'\| \*\*(.+?)\*\* \| (.+?) \| (.+?) \| (.+?) \|', table_text)
-        for role, name, background, tenure in rows:
+    table_text = parse_report(text).section('C-Suite and Key Decision Makers')
+
+    if table_text is not None:
+        for row in table_records(table_text, EXECUTIVE_FIELDS):
             executives.append({
-                'role': role.strip(),
-                'name': name.strip(),
-                'background': background.strip(),
-                'tenure': tenure.strip()
+                'role': strip_bold(row['role']),
+                'name': row['name'],
+                'background': row['background'],
+                'tenure': row['tenure']
             })
 
     return executives
@@ -57,18 +62,17 @@ def extract_executives(text: str) -> List[Dict]:
 def extract_org_structure(text: str) -> str:
     """Extract organizational structure information."""
     sections = []
+    report = parse_report(text)
 
     # Key Stakeholders
-    stakeholder_pattern = r'### Key Stakeholders for.*?\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(stakeholder_pattern, text, re.DOTALL)
-    if match:
-        sections.append(match.group(1).strip())
+    body = report.section('Key Stakeholders for', how='prefix')
+    if body is not None:
+        sections.append(body.strip())
 
     # Organizational Changes
-    org_changes_pattern = r'### Organizational Changes to Monitor\s*\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(org_changes_pattern, text, re.DOTALL)
-    if match:
-        sections.append("\n\n### Organizational Changes to Monitor\n\n" + match.group(1).strip())
+    body = report.section('Organizational Changes to Monitor')
+    if body is not None:
+        sections.append("\n\n### Organizational Changes to Monitor\n\n" + body.strip())
 
     return "\n\n".join(sections)
 
@@ -77,11 +81,9 @@ def extract_pain_points(text: str) -> List[Dict]:
     pain_points = []
 
     # Look for challenges, risks, pain points
-    risk_pattern = r'### Detailed Risk Analysis\s*\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(risk_pattern, text, re.DOTALL)
+    risk_text = parse_report(text).section('Detailed Risk Analysis')
 
-    if match:
-        risk_text = match.group(1)
+    if risk_text is not None:
         # Extract each risk
         risks = re.findall(r'\*\*Risk \d+: (.+?)\*\* \(Severity: (.+?)\)\s*\n(.+?)(?=\n\*\*Risk|\Z)', risk_text, re.DOTALL)
         for title, severity, description in risks:
@@ -96,75 +98,23 @@ def extract_pain_points(text: str) -> List[Dict]:
 def extract_competitive(text: str) -> str:
     """Extract competitive analysis."""
     sections = []
+    report = parse_report(text)
 
     # Competitive Quick Reference
-    comp_pattern = r'### C\. Competitive Quick Reference\s*\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(comp_pattern, text, re.DOTALL)
-    if match:
-        sections.append(match.group(1).strip())
+    body = report.section('C. Competitive Quick Reference')
+    if body is not None:
+        sections.append(body.strip())
 
     # Market Position
-    market_pattern = r'### Market Position\s*\n\n(.*?)(?=\n### |\n## |\Z)'
-    match = re.search(market_pattern, text, re.DOTALL)
-    if match:
-        sections.append("\n\n### Market Position\n\n" + match.group(1).strip())
+    body = report.section('Market Position')
+    if body is not None:
+        sections.append("\n\n### Market Position\n\n" + body.strip())
 
     return "\n\n".join(sections)
 
 def extract_action_plan(text: str) -> Dict:
     """Extract action plan with immediate, short-term, and strategic actions."""
-    actions = {
-        'immediate': [],
-        'short_term': [],
-        'strategic': []
-    }
-
-    # Immediate Actions (0-30 days)
-    immediate_pattern = r'### Immediate Actions \(0-30 Days\)\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(immediate_pattern, text, re.DOTALL)
-    if match:
-        table_text = match.group(1)
-        rows = re.findall(r'\| (\d+) \| \*\*(.+?)\*\* - (.+?) \| (.+?) \| (.+?) \|', table_text)
-        for priority, title, detail, owner, metric in rows:
-            actions['immediate'].append({
-                'priority': int(priority),
-                'title': title.strip(),
-                'detail': detail.strip(),
-                'owner': owner.strip(),
-                'metric': metric.strip()
-            })
-
-    # Short-Term Actions (30-90 days)
-    shortterm_pattern = r'### Short-Term Actions \(30-90 Days\)\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(shortterm_pattern, text, re.DOTALL)
-    if match:
-        table_text = match.group(1)
-        rows = re.findall(r'\| (\d+) \| \*\*(.+?)\*\* - (.+?) \| (.+?) \| (.+?) \|', table_text)
-        for priority, title, detail, owner, metric in rows:
-            actions['short_term'].append({
-                'priority': int(priority),
-                'title': title.strip(),
-                'detail': detail.strip(),
-                'owner': owner.strip(),
-                'metric': metric.strip()
-            })
-
-    # Strategic Actions (90+ days)
-    strategic_pattern = r'### Strategic Actions \(90\+ Days\)\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(strategic_pattern, text, re.DOTALL)
-    if match:
-        table_text = match.group(1)
-        rows = re.findall(r'\| (\d+) \| \*\*(.+?)\*\* - (.+?) \| (.+?) \| (.+?) \|', table_text)
-        for priority, title, detail, owner, metric in rows:
-            actions['strategic'].append({
-                'priority': int(priority),
-                'title': title.strip(),
-                'detail': detail.strip(),
-                'owner': owner.strip(),
-                'metric': metric.strip()
-            })
-
-    return actions
+    return extract_action_tables(text)
 
 def extract_financial(text: str) -> Dict:
     """Extract financial analysis and data."""
@@ -174,43 +124,37 @@ def extract_financial(text: str) -> Dict:
         'summary': ''
     }
 
+    report = parse_report(text)
+
     # Recent Financial Performance
-    perf_pattern = r'### Recent Financial Performance\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(perf_pattern, text, re.DOTALL)
-    if match:
-        financial['recent_performance'] = match.group(1).strip()
+    body = report.section('Recent Financial Performance', stop=(3,))
+    if body is not None:
+        financial['recent_performance'] = body.strip()
 
     # Financial Guidance
-    guidance_pattern = r'### .*?Guidance\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(guidance_pattern, text, re.DOTALL)
-    if match:
-        financial['guidance'] = match.group(1).strip()
+    body = report.section('Guidance', how='suffix', stop=(3,))
+    if body is not None:
+        financial['guidance'] = body.strip()
 
     # Financial Summary (from appendix)
-    summary_pattern = r'### B\. Financial Summary\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(summary_pattern, text, re.DOTALL)
-    if match:
-        financial['summary'] = match.group(1).strip()
+    body = report.section('B. Financial Summary', stop=(3,))
+    if body is not None:
+        financial['summary'] = body.strip()
 
     return financial
 
 def extract_strategic_direction(text: str) -> str:
     """Extract strategic direction and priorities."""
-    pattern = r'## Strategic Direction\s*\n\n(.*?)(?=\n## |\Z)'
-    match = re.search(pattern, text, re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    return ""
+    body = parse_report(text).section('Strategic Direction', level=2)
+    return body.strip() if body is not None else ""
 
 def extract_opportunities(text: str) -> List[Dict]:
     """Extract strategic opportunities."""
     opportunities = []
 
-    opp_pattern = r'### Strategic Opportunities\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(opp_pattern, text, re.DOTALL)
+    opp_text = parse_report(text).section('Strategic Opportunities', stop=(3,))
 
-    if match:
-        opp_text = match.group(1)
+    if opp_text is not None:
         # Extract opportunities
         opps = re.findall(r'\*\*Opportunity \d+: (.+?)\*\*\s*\n(.+?)(?=\n\*\*Opportunity|\n###|\Z)', opp_text, re.DOTALL)
         for title, description in opps:
@@ -226,19 +170,16 @@ def extract_risks(text: str) -> List[Dict]:
     risks = []
 
     # Risk Assessment Matrix
-    risk_pattern = r'### Risk Assessment Matrix\s*\n\n(.*?)(?=\n### |\Z)'
-    match = re.search(risk_pattern, text, re.DOTALL)
+    table_text = parse_report(text).section('Risk Assessment Matrix', stop=(3,))
 
-    if match:
-        table_text = match.group(1)
-        rows = re.findall(r'\| \*\*(.+?)\*\* \| (.+?) \| (.+?) \| (.+?) \| (.+?) \|', table_text)
-        for risk, probability, impact, severity, mitigation in rows:
+    if table_text is not None:
+        for row in table_records(table_text, RISK_FIELDS):
             risks.append({
-                'risk': risk.strip(),
-                'probability': probability.strip(),
-                'impact': impact.strip(),
-                'severity': severity.strip(),
-                'mitigation': mitigation.strip()
+                'risk': strip_bold(row['risk']),
+                'probability': row['probability'],
+                'impact': row['impact'],
+                'severity': row['severity'],
+                'mitigation': row['mitigation']
             })
 
     return risks
@@ -302,6 +243,8 @@ def markdown_to_html(md_text: str) -> str:
 
     return html
 
+register_renderer('tabs', markdown_to_html)
+
 if __name__ == '__main__':
     # Test with Telstra report
     with open('data/intelligence/reports/Telstra_Corporation_Limited.md', 'r') as f:
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of parsed intelligence reports.
+
+Every generator turns the same data/intelligence/reports/*.md files into
+structured data (executives, pain points, action plans, risks, ...). This
+module stores each parser's output as JSON keyed by the SHA-1 of the report
+text, so an unchanged report is parsed once and then read back by every
+script and every later run:
+
+    data/intelligence/.parsed_cache/<namespace>/<report sha1>.json
+
+A namespace is one parser (e.g. 'tabs' for
+parse_intelligence_for_tabs.parse_intelligence_report). Each entry records
+the parser version, which defaults to a hash of the parser's module source
+plus every local module it imports (transitively), so editing an extractor
+or a helper it uses invalidates its entries without any manual version
+bump. Entries are written atomically, so process-pool workers can fill the
+cache concurrently.
+
+Usage:
+  from report_cache import load_parsed_report
+  parsed = load_parsed_report(customer_name, 'tabs', parse_intelligence_report)
+
+  python3 scripts/report_cache.py [--prune] [--clear]
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from customer_registry import customer_report
+from report_index import REPORTS_DIR
+
+CACHE_DIR = Path('data/intelligence/.parsed_cache')
+
+
+def content_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def local_imports(path, search_dirs):
+    """Source files of the local modules a module imports, transitively (including itself)."""
+    found = []
+    pending = [path]
+    while pending:
+        path = pending.pop()
+        if path in found:
+            continue
+        found.append(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                for directory in search_dirs:
+                    candidate = os.path.join(directory, name.split('.')[0] + '.py')
+                    if os.path.exists(candidate):
+                        pending.append(candidate)
+                        break
+    return sorted(found)
+
+
+@lru_cache(maxsize=None)
+def parser_version(parse):
+    """Hash of the source files a parser's output depends on.
+
+    Covers the parser's module and every local module (scripts/ or the
+    parser's own directory) it imports, directly or through other local
+    modules, so editing a shared helper such as report_tables.py
+    invalidates the entries too.
+    """
+    digest = hashlib.sha1()
+    module_file = getattr(sys.modules.get(parse.__module__), '__file__', None)
+    if module_file and os.path.exists(module_file):
+        module_file = os.path.abspath(module_file)
+        search_dirs = [os.path.dirname(module_file), os.path.dirname(os.path.abspath(__file__))]
+        for path in local_imports(module_file, search_dirs):
+            digest.update(os.path.basename(path).encode('utf-8'))
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    digest.update(parse.__qualname__.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+class ReportCache:
+    """Parsed-report store for one cache directory."""
+
+    def __init__(self, cache_dir=CACHE_DIR, memoize=True):
+        self.cache_dir = Path(cache_dir)
+        self.memoize = memoize
+        self._memory = {}
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, namespace, key):
+        return self.cache_dir / namespace / f'{key}.json'
+
+    def get(self, namespace, text, parse, version=None):
+        """Parsed result for a report text, parsing and storing it on a miss.
+
+        Args:
+            namespace (str): Cache namespace of the parser
+            text (str): Report markdown
+            parse: Function taking the report text, returning JSON-serializable data
+            version (str): Parser version (default: parser_version(parse))
+
+        Returns:
+            The parse result (as read back from JSON on a hit)
+        """
+        version = version or parser_version(parse)
+        key = content_hash(text)
+        memory_key = (namespace, key, version)
+        if memory_key in self._memory:
+            return self._memory[memory_key]
+
+        path = self.entry_path(namespace, key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            if entry.get('version') == version:
+                self.hits += 1
+                if self.memoize:
+                    self._memory[memory_key] = entry['result']
+                return entry['result']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        self.misses += 1
+        result = parse(text)
+        self._store(path, {'version': version, 'result': result})
+        # Hand back the JSON round-trip so hits and misses look the same to callers
+        result = json.loads(json.dumps(result))
+        if self.memoize:
+            self._memory[memory_key] = result
+        return result
+
+    def _store(self, path, entry):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Warning: could not write parsed-report cache entry {path}: {e}", file=sys.stderr)
+
+    def prune(self, reports_dir=REPORTS_DIR):
+        """Delete entries whose report text no longer exists. Returns the count removed."""
+        live = set()
+        for report_file in Path(reports_dir).glob('*.md'):
+            with open(report_file, 'r') as f:
+                live.add(content_hash(f.read()))
+
+        removed = 0
+        for entry in self.cache_dir.glob('*/*.json'):
+            if entry.stem not in live:
+                entry.unlink()
+                removed += 1
+        return removed
+
+
+_cache = None
+
+
+def get_report_cache():
+    """Process-wide ReportCache."""
+    global _cache
+    if _cache is None:
+        _cache = ReportCache()
+    return _cache
+
+
+def cached_parse(namespace, text, parse, version=None):
+    """Parse report text through the shared cache."""
+    return get_report_cache().get(namespace, text, parse, version)
+
+
+def load_parsed_report(customer_name, namespace, parse, version=None):
+    """Load and parse a customer's report through the shared cache, or None if it has no report."""
+    text = customer_report(customer_name)
+    if text is None:
+        return None
+    return cached_parse(namespace, text, parse, version)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Maintain the parsed intelligence report cache')
+    parser.add_argument('--prune', action='store_true', help='Delete entries for reports that no longer exist')
+    parser.add_argument('--clear', action='store_true', help='Delete the whole cache')
+    args = parser.parse_args()
+
+    cache = get_report_cache()
+    if args.clear:
+        shutil.rmtree(cache.cache_dir, ignore_errors=True)
+        print(f"Cleared {cache.cache_dir}")
+        return
+    if args.prune:
+        print(f"Pruned {cache.prune()} stale entries")
+
+    for namespace_dir in sorted(p for p in cache.cache_dir.glob('*') if p.is_dir()):
+        print(f"  {namespace_dir.name}: {len(list(namespace_dir.glob('*.json')))} entries")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Action items and critical alerts shown on customer dashboard pages.
+
+The BU and tabbed dashboard generators show the same highlights from a
+customer's intelligence report:
+
+    action_items      top 3 '| <n> | **Action** |' rows from the Immediate
+                      Actions table, topped up from Short-Term Actions
+    critical_alerts   up to 2 CAUTION/CRITICAL/RISK key findings, plus the
+                      first Critical/HIGH row of the risk table
+
+Both parse through one report_cache namespace (HIGHLIGHTS_NAMESPACE), so an
+unchanged report is parsed once for every generator:
+
+    highlights = cached_parse(HIGHLIGHTS_NAMESPACE, report_text, parse_report_highlights)
+"""
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+from report_sections import parse_report
+
+HIGHLIGHTS_NAMESPACE = 'highlights'
+
+ACTION_ROW = re.compile(r'\| (\d+) \| \*\*(.+?)\*\*.*?\|')
+ALERT_FINDING = re.compile(r'\d+\.\s+\*\*(CAUTION|CRITICAL|RISK):\*\*\s+(.+?)(?=\n\d+\.|\n\n|\Z)', re.DOTALL)
+CRITICAL_RISK_ROW = re.compile(r'\|\s+\*\*(.+?)\*\*\s+\|[^\|]+\|[^\|]+\|\s+(Critical|HIGH)\s+\|', re.IGNORECASE)
+
+
+def parse_action_items(report_text):
+    """Extract top 3 action items from intelligence report."""
+    if not report_text:
+        return []
+
+    actions = []
+
+    # Parse immediate actions (0-30 days)
+    report = parse_report(report_text)
+    immediate_section = report.section('Immediate Actions', how='prefix')
+    if immediate_section is not None:
+        for priority, action in ACTION_ROW.findall(immediate_section)[:3]:
+            # Clean up action text - remove markdown
+            clean_action = action.strip().replace('**', '')
+            actions.append({'priority': int(priority), 'action': clean_action})
+
+    # If we need more actions, get from short-term
+    if len(actions) < 3:
+        shortterm_section = report.section('Short-Term Actions', how='prefix')
+        if shortterm_section is not None:
+            for priority, action in ACTION_ROW.findall(shortterm_section)[:3-len(actions)]:
+                clean_action = action.strip().replace('**', '')
+                actions.append({'priority': int(priority), 'action': clean_action})
+
+    return actions[:3]
+
+
+def parse_critical_alerts(report_text):
+    """Extract critical risks and cautions from intelligence report."""
+    if not report_text:
+        return []
+
+    alerts = []
+
+    # Look for "CAUTION:" or "CRITICAL" in key findings
+    for severity, text in ALERT_FINDING.findall(report_text)[:2]:  # Top 2 critical items
+        alerts.append({'severity': severity, 'text': text.strip()})
+
+    # Also check risk table for CRITICAL severity
+    for risk, severity in CRITICAL_RISK_ROW.findall(report_text)[:1]:  # Top 1 from risk table
+        if not any(r['text'].lower().find(risk.lower()[:20]) >= 0 for r in alerts):
+            alerts.append({'severity': 'CRITICAL', 'text': f"{risk} identified as critical risk"})
+
+    return alerts[:2]  # Max 2 alerts
+
+
+def parse_report_highlights(report_text):
+    """Action items and critical alerts shown on a customer page."""
+    return {
+        'action_items': parse_action_items(report_text),
+        'critical_alerts': parse_critical_alerts(report_text),
+    }
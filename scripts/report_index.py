@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Indexed resolver for customer intelligence reports.
+
+Customer names in the BU extracts rarely match report filenames exactly
+("British Telecommunications plc" vs British_Telecommunications.md), so
+report lookup tries, in order:
+
+  1. REPORT_ALIASES (explicit customer name -> report stem)
+  2. the exact filename key ("/" -> "-", " " -> "_")
+  3. the key with a legal-entity suffix (Ltd, Inc., plc, ...) stripped
+  4. the normalized name (lowercase, no punctuation or separators)
+  5. a normalized substring match in either direction
+
+Steps 1-4 are dictionary lookups against an index built from one directory
+listing. Step 5 scans the in-memory index and its result is memoized. The
+index (including resolved names) is persisted next to the reports directory
+as data/intelligence/.reports_index.json and rebuilt when the directory's
+mtime changes (a report is added, removed or renamed) or the matching
+rules below (REPORT_SUFFIXES, REPORT_ALIASES) are edited.
+
+The customer registry (customer_registry.py) resolves every workbook
+customer through this index once, when it is built; the generators read
+reports through customer_registry.customer_report(), which falls back to
+load_report() for names the registry does not know. resolve_reports()
+persists the resolutions of a batch of names.
+
+Usage:
+  from report_index import load_report
+  report_text = load_report(customer_name)
+
+  python3 scripts/report_index.py [--rebuild] [customer ...]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+REPORTS_DIR = Path('data/intelligence/reports')
+INDEX_VERSION = 1
+
+# Legal-entity suffixes stripped before matching (first match only)
+REPORT_SUFFIXES = [' plc', ' Ltd', ' Limited', ', Inc.', ' Inc.', ' Inc', ' Sdn Bhd', ' AG.', ' AG', ' US',
+                   ' Pty Limited', ' Pty Ltd', ' BV', ' NV/SA', ' GmbH & Co. OHG', ' - Go Get', ' - Ges(a)']
+
+# Customer name -> report stem, for names the rules above cannot match
+REPORT_ALIASES = {}
+
+
+def rules_version():
+    """Hash of the matching rules; resolutions saved under other rules are stale."""
+    rules = json.dumps([REPORT_SUFFIXES, REPORT_ALIASES], sort_keys=True)
+    return hashlib.sha1(rules.encode('utf-8')).hexdigest()
+
+
+def report_key(name):
+    """Report filename stem for a customer name."""
+    return name.replace('/', '-').replace(' ', '_')
+
+
+def strip_suffix(name):
+    for suffix in REPORT_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def normalize(name):
+    """Lowercase and drop separators and punctuation for loose matching."""
+    return (name.lower().replace('&', '').replace(',', '').replace('.', '')
+            .replace(' ', '').replace('_', '').replace('-', ''))
+
+
+class ReportIndex:
+    """Report stem/normalized-name index for one reports directory."""
+
+    def __init__(self, reports_dir=REPORTS_DIR):
+        self.reports_dir = Path(reports_dir)
+        # Kept outside the reports directory so writing it leaves that directory's mtime alone
+        self.index_path = self.reports_dir.parent / f'.{self.reports_dir.name}_index.json'
+        self.stems = {}
+        self.normalized = {}
+        self.resolved = {}
+        self.dir_mtime_ns = None
+        self.dirty = False
+        self._texts = {}
+        self.load()
+
+    def load(self, rebuild=False):
+        """Load the persisted index, rebuilding it if the directory or the matching rules changed."""
+        if not self.reports_dir.is_dir():
+            return
+        mtime_ns = self.reports_dir.stat().st_mtime_ns
+
+        if not rebuild and self.index_path.exists():
+            try:
+                with open(self.index_path, 'r') as f:
+                    data = json.load(f)
+                if (data.get('version') == INDEX_VERSION and data.get('dir_mtime_ns') == mtime_ns
+                        and data.get('rules') == rules_version()):
+                    self.stems = data['stems']
+                    self.normalized = data['normalized']
+                    self.resolved = data['resolved']
+                    self.dir_mtime_ns = mtime_ns
+                    return
+            except (OSError, ValueError, KeyError):
+                pass
+
+        self.build(mtime_ns)
+
+    def build(self, mtime_ns):
+        """Index every *.md report from one directory listing."""
+        self.stems = {}
+        self.normalized = {}
+        for filename in sorted(os.listdir(self.reports_dir)):
+            if not filename.endswith('.md'):
+                continue
+            stem = filename[:-3]
+            self.stems[stem] = filename
+            self.normalized.setdefault(normalize(stem), filename)
+
+        self.resolved = {}
+        self.dir_mtime_ns = mtime_ns
+        self.dirty = True
+
+    def save(self):
+        """Persist the index (atomically) if it changed since loading."""
+        if not self.dirty or self.dir_mtime_ns is None:
+            return
+        data = {
+            'version': INDEX_VERSION,
+            'dir_mtime_ns': self.dir_mtime_ns,
+            'rules': rules_version(),
+            'stems': self.stems,
+            'normalized': self.normalized,
+            'resolved': self.resolved,
+        }
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.index_path.parent, prefix='.tmp-')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.index_path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: could not save report index: {e}", file=sys.stderr)
+
+    def resolve(self, customer_name):
+        """Report filename for a customer, or None."""
+        if customer_name in self.resolved:
+            return self.resolved[customer_name]
+
+        filename = self._match(customer_name)
+        self.resolved[customer_name] = filename
+        self.dirty = True
+        return filename
+
+    def _match(self, customer_name):
+        alias = REPORT_ALIASES.get(customer_name)
+        if alias and alias in self.stems:
+            return self.stems[alias]
+
+        key = report_key(customer_name)
+        if key in self.stems:
+            return self.stems[key]
+
+        base_name = strip_suffix(customer_name)
+        key = report_key(base_name)
+        if key in self.stems:
+            return self.stems[key]
+
+        base_normalized = normalize(base_name)
+        if base_normalized in self.normalized:
+            return self.normalized[base_normalized]
+
+        for file_normalized, filename in self.normalized.items():
+            if (len(base_normalized) > 5 and file_normalized in base_normalized) or \
+               (len(file_normalized) > 5 and base_normalized in file_normalized):
+                return filename
+        return None
+
+    def path(self, customer_name):
+        filename = self.resolve(customer_name)
+        return self.reports_dir / filename if filename else None
+
+    def read(self, customer_name):
+        """Report markdown for a customer (each file read at most once), or None."""
+        filename = self.resolve(customer_name)
+        if filename is None:
+            return None
+        if filename not in self._texts:
+            with open(self.reports_dir / filename, 'r') as f:
+                self._texts[filename] = f.read()
+        return self._texts[filename]
+
+
+_indexes = {}
+
+
+def get_report_index(reports_dir=REPORTS_DIR):
+    """Process-wide ReportIndex for a reports directory."""
+    key = str(reports_dir)
+    if key not in _indexes:
+        _indexes[key] = ReportIndex(reports_dir)
+    return _indexes[key]
+
+
+def load_report(customer_name, reports_dir=REPORTS_DIR):
+    """Load a customer's intelligence report markdown, or None."""
+    return get_report_index(reports_dir).read(customer_name)
+
+
+def resolve_reports(customer_names, reports_dir=REPORTS_DIR):
+    """Resolve a batch of customer names and persist the index.
+
+    Returns:
+        dict: customer name -> report filename (or None)
+    """
+    index = get_report_index(reports_dir)
+    resolved = {name: index.resolve(name) for name in customer_names}
+    index.save()
+    return resolved
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the intelligence report index')
+    parser.add_argument('customers', nargs='*', help='Customer names to resolve')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild the index from the directory')
+    args = parser.parse_args()
+
+    index = get_report_index()
+    if args.rebuild:
+        index.load(rebuild=True)
+
+    print(f"{len(index.stems)} reports indexed in {index.reports_dir}")
+    for name in args.customers:
+        print(f"  {name} → {index.resolve(name) or '(no report)'}")
+    index.save()
+
+
+if __name__ == '__main__':
+    main()
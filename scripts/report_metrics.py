@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Per-customer metrics table extracted from the intelligence reports in one sweep.
+
+integrate_intelligence_reports used to run a separate IGNORECASE/DOTALL
+regex over each whole report for the health score, then again for the key
+findings. scan_report() reads a report line by line, once, and picks up:
+
+    health_score          'Health Score: 6.5/10' (first occurrence, 0-10)
+    account_health_score  '**Account Health Score:** 63/100' (first occurrence, 0-100)
+    key_findings          numbered '**Title**: description' items under
+                          '### Key Findings...', else the first four in
+                          '## EXECUTIVE SUMMARY'
+    renewal               '| **Renewal Quarter** | ... |' style table rows
+                          (Renewal Quarter, Renewal Date, Will Renew, Renewal Risk)
+
+Only the key findings block is buffered; the finding regexes then run over
+that block instead of the whole report. build_metrics_table() sweeps every
+report and writes data/report_metrics.json, so the analytics dashboard and
+DM tracker can read the metrics without parsing markdown:
+
+    {"generated_at": ..., "fields": [...], "customers": {"<report stem>": {...}, ...}}
+
+Usage:
+  python3 scripts/report_metrics.py [--csv data/report_metrics.csv]
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from parallel_render import write_atomic
+from report_index import REPORTS_DIR
+
+METRICS_FILE = Path('data/report_metrics.json')
+
+HEALTH_SCORE = re.compile(r'(?:Strategic Health Score|Health Score):\s*(\d+\.?\d*)\s*/\s*10', re.IGNORECASE)
+ACCOUNT_HEALTH_SCORE = re.compile(r'Health Score:?\**:?\s*(\d+)\s*/\s*100\b', re.IGNORECASE)
+KEY_FINDINGS_HEADING = re.compile(r'###\s*Key Findings')
+EXECUTIVE_SUMMARY_HEADING = re.compile(r'##\s*EXECUTIVE SUMMARY\s*$')
+RENEWAL_ROW = re.compile(r'^\|\s*\*\*(Renewal Quarter|Renewal Date|Will Renew|Renewal Risk)\*\*\s*\|\s*(.*?)\s*\|')
+
+# Numbered '**Title**: description' items within a findings block
+FINDING = re.compile(r'\d+\.\s+\*\*(.+?)\*\*[:\s]*(.+?)(?=\n\d+\.|\Z)', re.DOTALL)
+SUMMARY_FINDING = re.compile(r'(?:^|\n)(\d+)\.\s+\*\*(.+?)\*\*[:\s]*(.+?)(?=\n\d+\.|\n##|\Z)', re.DOTALL)
+
+FIELDS = ['health_score', 'account_health_score', 'renewal_quarter', 'renewal_date', 'will_renew',
+          'renewal_risk', 'key_findings']
+
+
+def scan_report(lines):
+    """Extract the report metrics in a single pass over its lines.
+
+    Args:
+        lines: Iterable of report lines (an open file, or text.split('\\n'))
+
+    Returns:
+        dict: health_score, account_health_score, key_findings and renewal fields
+    """
+    health_score = None
+    account_health_score = None
+    renewal = {}
+    findings_lines = summary_lines = None
+    in_findings = in_summary = False
+
+    for line in lines:
+        line = line.rstrip('\n')
+
+        # Block bodies end at the next '##' (any deeper level too) heading, findings also at '---'
+        if in_findings:
+            if line.startswith('##') or line.startswith('---'):
+                in_findings = False
+            else:
+                findings_lines.append(line)
+        if in_summary:
+            if line.startswith('##'):
+                in_summary = False
+            else:
+                summary_lines.append(line)
+
+        if findings_lines is None and KEY_FINDINGS_HEADING.search(line):
+            findings_lines = []
+            in_findings = True
+        if summary_lines is None and EXECUTIVE_SUMMARY_HEADING.search(line):
+            summary_lines = []
+            in_summary = True
+
+        if (health_score is None or account_health_score is None) and 'health' in line.lower():
+            match = health_score is None and HEALTH_SCORE.search(line)
+            if match:
+                health_score = float(match.group(1))
+            match = account_health_score is None and ACCOUNT_HEALTH_SCORE.search(line)
+            if match:
+                account_health_score = int(match.group(1))
+        if line.startswith('|') and 'enew' in line:
+            match = RENEWAL_ROW.match(line)
+            if match:
+                renewal.setdefault(match.group(1).lower().replace(' ', '_'), match.group(2).strip('* '))
+
+    return {
+        'health_score': health_score,
+        'account_health_score': account_health_score,
+        'renewal_quarter': renewal.get('renewal_quarter'),
+        'renewal_date': renewal.get('renewal_date'),
+        'will_renew': renewal.get('will_renew'),
+        'renewal_risk': renewal.get('renewal_risk'),
+        'key_findings': key_findings(findings_lines, summary_lines),
+    }
+
+
+def key_findings(findings_lines, summary_lines):
+    """Findings from the Key Findings block, else the first four from the executive summary."""
+    if findings_lines is not None:
+        text = '\n'.join(findings_lines).strip()
+        return [{'title': title.strip(':'), 'description': description.strip()}
+                for title, description in FINDING.findall(text)]
+
+    if summary_lines is not None:
+        while summary_lines and not summary_lines[0].strip():
+            summary_lines = summary_lines[1:]
+        text = '\n'.join(summary_lines)
+        findings = SUMMARY_FINDING.findall(text)
+        return [{'title': title.strip(':'), 'description': description.strip()[:200]}
+                for _, title, description in findings[:4]]
+
+    return []
+
+
+def extract_report_metrics(report_path):
+    """Metrics for one report file, streamed from disk."""
+    with open(report_path, 'r', encoding='utf-8') as f:
+        return scan_report(f)
+
+
+def build_metrics_table(reports_dir=REPORTS_DIR):
+    """Report stem -> metrics for every report in reports_dir."""
+    return {report_file.stem: extract_report_metrics(report_file)
+            for report_file in sorted(Path(reports_dir).glob('*.md'))}
+
+
+def write_metrics_table(metrics, metrics_path=METRICS_FILE):
+    """Write a metrics table (from build_metrics_table) as compact JSON."""
+    write_atomic(str(metrics_path), json.dumps({
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'fields': FIELDS,
+        'customers': metrics,
+    }, ensure_ascii=False, separators=(',', ':')))
+
+
+def load_metrics_table(metrics_path=METRICS_FILE):
+    """Report stem -> metrics from the last sweep ({} if it has not been built)."""
+    try:
+        with open(metrics_path, 'r') as f:
+            return json.load(f)['customers']
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def metrics_csv(metrics):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(['customer'] + FIELDS[:-1] + ['key_findings'])
+    for stem, row in metrics.items():
+        writer.writerow([stem] + [row[field] for field in FIELDS[:-1]]
+                        + [' | '.join(finding['title'] for finding in row['key_findings'])])
+    return out.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract the per-customer report metrics table')
+    parser.add_argument('--dir', default=str(REPORTS_DIR), help='Reports directory')
+    parser.add_argument('--output', default=str(METRICS_FILE), help='Metrics JSON path')
+    parser.add_argument('--csv', help='Also write the table (finding titles only) as CSV')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    metrics = build_metrics_table(args.dir)
+    elapsed = time.perf_counter() - start
+
+    write_metrics_table(metrics, args.output)
+    if args.csv:
+        write_atomic(args.csv, metrics_csv(metrics))
+
+    scored = sum(1 for row in metrics.values() if row['health_score'] is not None)
+    account_scored = sum(1 for row in metrics.values() if row['account_health_score'] is not None)
+    with_renewal = sum(1 for row in metrics.values() if row['renewal_quarter'] or row['will_renew'])
+    with_findings = sum(1 for row in metrics.values() if row['key_findings'])
+    print(f"✅ {len(metrics)} reports swept in {elapsed * 1000:.0f}ms → {args.output}")
+    print(f"   Health score (/10): {scored}  Account health (/100): {account_scored}  "
+          f"Renewal info: {with_renewal}  Key findings: {with_findings}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Single-pass section tokenizer for intelligence report markdown.
+
+The report extractors used to locate each section with its own DOTALL
+regex ('### Title\\s*\\n\\n(.*?)(?=\\n### |\\n## |\\Z)') over the whole report,
+so every lookup rescanned the text. parse_report() walks the report once,
+records every heading line (level, title, offsets), and answers section
+lookups from that heading list:
+
+    sections = parse_report(report_text)
+    table = sections.section('C-Suite and Key Decision Makers')          # ### body
+    summary = sections.section('Executive Summary', level=2)             # ## body
+    actions = sections.section('Immediate Actions', how='prefix')
+    matrix = sections.section('Risk Assessment Matrix', stop=(3,))       # ignore ## breaks
+
+A section body runs from the line after its heading to the next heading
+whose level is in `stop` (default: the section's own level or higher, i.e.
+'### ' stops at '### ' or '## ', '## ' stops at '## '). parse_report() is
+memoized on the report text, so the extractors for one report share one
+tokenization.
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})[ \t]+(.*?)[ \t]*$', re.MULTILINE)
+
+# level, title, offset of the heading line, offset of the body (line after heading)
+Heading = namedtuple('Heading', 'level title start body_start')
+
+
+class ReportSections:
+    """Heading list of one markdown report with section lookups."""
+
+    def __init__(self, text):
+        self.text = text
+        self.headings = []
+        for match in HEADING_PATTERN.finditer(text):
+            end = match.end()
+            body_start = end + 1 if end < len(text) else end
+            self.headings.append(Heading(len(match.group(1)), match.group(2), match.start(), body_start))
+
+    def titles(self, level):
+        """Titles of every heading at one level, in document order."""
+        return [h.title for h in self.headings if h.level == level]
+
+    def find(self, title, level=3, how='exact', ignore_case=False):
+        """Index of the first matching heading, or None.
+
+        Args:
+            title (str): Heading text to look for
+            level (int or tuple): Heading level(s) to consider
+            how (str): 'exact', 'prefix', 'suffix' or 'contains'
+            ignore_case (bool): Case-insensitive comparison
+        """
+        levels = level if isinstance(level, tuple) else (level,)
+        wanted = title.lower() if ignore_case else title
+
+        for i, heading in enumerate(self.headings):
+            if heading.level not in levels:
+                continue
+            candidate = heading.title.lower() if ignore_case else heading.title
+            if how == 'exact':
+                found = candidate == wanted
+            elif how == 'prefix':
+                found = candidate.startswith(wanted)
+            elif how == 'suffix':
+                found = candidate.endswith(wanted)
+            else:
+                found = wanted in candidate
+            if found:
+                return i
+        return None
+
+    def body(self, index, stop=None):
+        """Body text of heading `index` up to the next heading with a level in `stop`."""
+        heading = self.headings[index]
+        if stop is None:
+            stop = tuple(range(1, heading.level + 1))
+
+        end = len(self.text)
+        for following in self.headings[index + 1:]:
+            if following.level in stop:
+                end = following.start - 1  # drop the newline before the heading
+                break
+        return self.text[heading.body_start:max(end, heading.body_start)]
+
+    def section(self, title, level=3, how='exact', stop=None, ignore_case=False):
+        """Body of the first matching section, or None if there is none."""
+        index = self.find(title, level=level, how=how, ignore_case=ignore_case)
+        if index is None:
+            return None
+        return self.body(index, stop=stop)
+
+
+@lru_cache(maxsize=256)
+def parse_report(text):
+    """Tokenize a report once; repeated calls with the same text reuse the result."""
+    return ReportSections(text or '')
+
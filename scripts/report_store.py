@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+SQLite store of intelligence report sections with full-text search.
+
+Section lookups used to run heading regexes over every report file, once
+per alternate heading name ('EXECUTIVE LEADERSHIP', 'KEY EXECUTIVES',
+'LEADERSHIP', ...). ingest() tokenizes each report once (report_sections)
+and stores it in data/intelligence/reports.sqlite:
+
+    reports        stem, sha1, text
+    sections       report, ordinal, level, title, key (normalized heading),
+                   body offsets (to the next heading of the same or a higher
+                   level, and to the next '## ' heading)
+    section_text   FTS5 index over section titles and bodies
+
+Ingestion is incremental: unchanged reports (same SHA-1) are skipped and
+deleted reports are dropped. Lookups are then indexed queries:
+
+    store = ReportStore()
+    store.ingest()
+    store.first_section('Telstra_Corporation_Limited', TAB_SECTION_HEADINGS['competitive'])
+    store.search('Twilio', section_key='compet')   # reports naming Twilio in a competitive section
+
+Usage:
+  python3 scripts/report_store.py ingest
+  python3 scripts/report_store.py search "Twilio" [--section compet]
+  python3 scripts/report_store.py sections Telstra_Corporation_Limited
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+from report_index import REPORTS_DIR
+from report_sections import ReportSections, parse_report
+
+DB_PATH = Path('data/intelligence/reports.sqlite')
+SCHEMA_VERSION = 1
+
+# Dashboard tab -> heading names to try, in order (each exact, then as a substring)
+TAB_SECTION_HEADINGS = {
+    'exec_summary': ['EXECUTIVE SUMMARY', 'Executive Summary'],
+    'company_intel': [
+        'COMPANY INTELLIGENCE', 'Company Intelligence', 'COMPANY PROFILE',
+        '1. CUSTOMER PROFILE',  # Spotify format
+    ],
+    'executives': [
+        'EXECUTIVE LEADERSHIP', 'KEY EXECUTIVES', 'LEADERSHIP', 'Key Executives',
+        'COMPANY OVERVIEW',  # Some reports have leadership in company overview
+    ],
+    'org_structure': [
+        'ORGANIZATIONAL STRUCTURE',
+        '2. ORGANIZATIONAL STRUCTURE',  # Spotify format
+        'ORG STRUCTURE', 'ORGANIZATION', 'CORPORATE STRUCTURE', 'BUSINESS SEGMENTS',
+        'KEY STAKEHOLDERS', 'COMPANY PROFILE', 'PARENT COMPANY', 'CORPORATE TRANSFORMATION',  # DPLAY
+        'COMPANY OVERVIEW',  # HCL, New Sales Ps, One Albania
+        'STRATEGIC CONTEXT',
+        'STRATEGIC DIRECTION',  # Thryv
+        'STRATEGIC INTELLIGENCE',  # HCL
+        'STRATEGIC ANALYSIS',  # New Sales Ps
+        'FINANCIAL ANALYSIS',  # Fallback for company context
+    ],
+    'pain_points': [
+        'PAIN POINTS & CHALLENGES', 'PAIN POINTS', 'PAIN POINT', 'CHALLENGES',
+        'STRATEGIC INITIATIVES', 'RISK ASSESSMENT', 'RISKS',
+    ],
+    'competitive': [
+        'COMPETITIVE LANDSCAPE',
+        '7. COMPETITIVE LANDSCAPE',  # Spotify format
+        'COMPETITIVE', 'COMPETITION',
+        'COMPETITIVE THREAT',  # HCL
+        'MARKET CONTEXT', 'STRATEGIC CONTEXT',
+        'STRATEGIC ANALYSIS',  # New Sales Ps
+        'ROOT CAUSE ANALYSIS',  # One Albania (has competitive info in root cause)
+    ],
+    'opportunities': [
+        'OPPORTUNITY ANALYSIS', 'OPPORTUNITY ASSESSMENT', 'OPPORTUNITIES',
+        '6. EXPANSION OPPORTUNITIES',  # Spotify format
+        'OPPORTUNIT', 'GROWTH', 'EXPANSION',
+        'STRATEGIC INTELLIGENCE',  # HCL (has opportunities in strategic intelligence)
+        'STRATEGIC OPTIONS',  # One Albania
+    ],
+    'action_plan': [
+        'ACCOUNT STRATEGY RECOMMENDATIONS', 'RECOMMENDED ACTIONS',
+        'RECOMMENDED ACTION PLAN',  # One Albania
+        'ACCOUNT STRATEGY', 'STRATEGY RECOMMENDATIONS', 'ACTION PLAN',
+        '8. RELATIONSHIP STRATEGY',  # Spotify
+        'RELATIONSHIP STRATEGY', 'NEXT STEPS', 'RECOMMENDATIONS',
+    ],
+}
+
+SECTION_LEVELS = (2, 3, 4, 5, 6)
+
+
+def find_section(report, name):
+    """Body (to the next '## ' heading) of the first level 2-6 heading titled `name`
+    (case-insensitive), else of the first heading containing it; None if neither exists."""
+    for how in ('exact', 'contains'):
+        body = report.section(name, level=SECTION_LEVELS, how=how, stop=(2,), ignore_case=True)
+        if body is not None:
+            return body.strip()
+    return None
+
+
+def extract_tab_sections(text, report=None):
+    """Every dashboard tab's section text from report markdown, without the database.
+
+    Same lookups as ReportStore.tab_sections(): each tab takes the first
+    non-empty section among its TAB_SECTION_HEADINGS names.
+    """
+    report = report or parse_report(text)
+    sections = {}
+    for tab, names in TAB_SECTION_HEADINGS.items():
+        body = None
+        for name in names:
+            body = find_section(report, name)
+            if body:
+                break
+        sections[tab] = body
+    return sections
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    stem TEXT UNIQUE NOT NULL,
+    sha1 TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY,
+    report_id INTEGER NOT NULL REFERENCES reports(id) ON DELETE CASCADE,
+    ordinal INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    title_lower TEXT NOT NULL,
+    key TEXT NOT NULL,
+    body_start INTEGER NOT NULL,
+    body_end INTEGER NOT NULL,
+    block_end INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sections_report ON sections(report_id, ordinal);
+CREATE INDEX IF NOT EXISTS sections_title ON sections(report_id, title_lower);
+CREATE INDEX IF NOT EXISTS sections_key ON sections(key);
+CREATE VIRTUAL TABLE IF NOT EXISTS section_text USING fts5(title, body);
+"""
+
+HEADING_NUMBER = re.compile(r'^(?:[0-9]+(?:\.[0-9]+)*|[A-Z])[.)]\s+|^[0-9]+(?:\.[0-9]+)+\s+')
+NON_WORD = re.compile(r'[^a-z0-9]+')
+
+
+def heading_key(title):
+    """Normalized heading: no numbering ('7.', '3.1', 'B.'), lowercase, '&' -> 'and', single spaces."""
+    title = HEADING_NUMBER.sub('', title.strip())
+    return NON_WORD.sub(' ', title.lower().replace('&', ' and ')).strip()
+
+
+class ReportStore:
+    """Connection to the report sections database."""
+
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self._create_schema()
+
+    def _create_schema(self):
+        row = None
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE name = 'schema_version'").fetchone()
+        except sqlite3.OperationalError:
+            pass
+        if row is not None and row[0] != str(SCHEMA_VERSION):
+            self.conn.executescript('DROP TABLE IF EXISTS section_text; DROP TABLE IF EXISTS sections; '
+                                    'DROP TABLE IF EXISTS reports; DROP TABLE IF EXISTS meta;')
+        self.conn.executescript(SCHEMA)
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # Ingestion
+
+    def ingest(self, reports_dir=REPORTS_DIR, timings=None):
+        """Sync the database with reports_dir/*.md.
+
+        Args:
+            reports_dir: Directory of report markdown files
+            timings (dict): If given, filled with stem -> seconds spent reading,
+                hashing and (if changed) tokenizing and storing each report
+
+        Returns:
+            tuple: (reports added or updated, reports removed)
+        """
+        known = dict(self.conn.execute('SELECT stem, sha1 FROM reports'))
+        seen = set()
+        updated = 0
+
+        with self.conn:
+            for report_file in sorted(Path(reports_dir).glob('*.md')):
+                start = time.perf_counter()
+                stem = report_file.stem
+                seen.add(stem)
+                text = report_file.read_text(encoding='utf-8')
+                sha1 = hashlib.sha1(text.encode('utf-8')).hexdigest()
+                if known.get(stem) != sha1:
+                    self._delete(stem)
+                    self._insert(stem, sha1, text)
+                    updated += 1
+                if timings is not None:
+                    timings[stem] = time.perf_counter() - start
+
+            removed = [stem for stem in known if stem not in seen]
+            for stem in removed:
+                self._delete(stem)
+
+        return updated, len(removed)
+
+    def _delete(self, stem):
+        row = self.conn.execute('SELECT id FROM reports WHERE stem = ?', (stem,)).fetchone()
+        if row is None:
+            return
+        self.conn.execute('DELETE FROM section_text WHERE rowid IN (SELECT id FROM sections WHERE report_id = ?)', row)
+        self.conn.execute('DELETE FROM sections WHERE report_id = ?', row)
+        self.conn.execute('DELETE FROM reports WHERE id = ?', row)
+
+    def _insert(self, stem, sha1, text):
+        report_id = self.conn.execute('INSERT INTO reports (stem, sha1, text) VALUES (?, ?, ?)',
+                                      (stem, sha1, text)).lastrowid
+        report = ReportSections(text)
+        for ordinal, heading in enumerate(report.headings):
+            body = report.body(ordinal)
+            block = report.body(ordinal, stop=(2,))
+            section_id = self.conn.execute(
+                'INSERT INTO sections (report_id, ordinal, level, title, title_lower, key, '
+                'body_start, body_end, block_end) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (report_id, ordinal, heading.level, heading.title, heading.title.lower(), heading_key(heading.title),
+                 heading.body_start, heading.body_start + len(body), heading.body_start + len(block))
+            ).lastrowid
+            self.conn.execute('INSERT INTO section_text (rowid, title, body) VALUES (?, ?, ?)',
+                              (section_id, heading.title, body))
+
+    # Queries
+
+    def stems(self):
+        return [row[0] for row in self.conn.execute('SELECT stem FROM reports ORDER BY stem')]
+
+    def has_report(self, stem):
+        return self.conn.execute('SELECT 1 FROM reports WHERE stem = ?', (stem,)).fetchone() is not None
+
+    def titles(self, stem, level):
+        """Heading titles at one level of a report, in document order."""
+        return [row[0] for row in self.conn.execute(
+            'SELECT s.title FROM sections s JOIN reports r ON r.id = s.report_id '
+            'WHERE r.stem = ? AND s.level = ? ORDER BY s.ordinal', (stem, level))]
+
+    def section(self, stem, name):
+        """Indexed equivalent of find_section() for a stored report."""
+        name = name.lower()
+        row = None
+        for condition in ('s.title_lower = ?', 'instr(s.title_lower, ?) > 0'):
+            row = self.conn.execute(
+                'SELECT substr(r.text, s.body_start + 1, s.block_end - s.body_start) '
+                'FROM sections s JOIN reports r ON r.id = s.report_id '
+                f'WHERE r.stem = ? AND s.level >= 2 AND {condition} ORDER BY s.ordinal LIMIT 1',
+                (stem, name)).fetchone()
+            if row is not None:
+                break
+        return row[0].strip() if row is not None else None
+
+    def first_section(self, stem, names):
+        """First non-empty section among alternate heading names (see TAB_SECTION_HEADINGS)."""
+        for name in names:
+            body = self.section(stem, name)
+            if body:
+                return body
+        return None
+
+    def tab_sections(self, stem):
+        """Every dashboard tab's section text for a report (None where missing)."""
+        return {tab: self.first_section(stem, names) for tab, names in TAB_SECTION_HEADINGS.items()}
+
+    def search(self, query, section_key=None, limit=100):
+        """Full-text search over section titles and bodies.
+
+        Args:
+            query (str): FTS5 query ('Twilio', '"digital transformation"', 'Twilio OR Vonage')
+            section_key (str): Only sections whose normalized heading contains this
+            limit (int): Maximum rows
+
+        Returns:
+            list: (report stem, section title, snippet) tuples, best match first
+        """
+        sql = ('SELECT r.stem, s.title, snippet(section_text, 1, \'[\', \']\', \'...\', 12) '
+               'FROM section_text JOIN sections s ON s.id = section_text.rowid '
+               'JOIN reports r ON r.id = s.report_id WHERE section_text MATCH ?')
+        params = [query]
+        if section_key:
+            sql += ' AND instr(s.key, ?) > 0'
+            params.append(section_key.lower())
+        sql += ' ORDER BY rank LIMIT ?'
+        params.append(limit)
+        return self.conn.execute(sql, params).fetchall()
+
+
+def open_report_store(db_path=DB_PATH, reports_dir=REPORTS_DIR):
+    """ReportStore synced with the reports directory."""
+    store = ReportStore(db_path)
+    store.ingest(reports_dir)
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Intelligence report section store')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('ingest', help='Sync the database with the reports directory')
+    search_parser = subparsers.add_parser('search', help='Full-text search across all reports')
+    search_parser.add_argument('query', help='FTS5 query')
+    search_parser.add_argument('--section', help='Only sections whose heading contains this (e.g. compet)')
+    search_parser.add_argument('--limit', type=int, default=50)
+    sections_parser = subparsers.add_parser('sections', help='List the headings of one report')
+    sections_parser.add_argument('stem', help='Report filename without .md')
+    args = parser.parse_args()
+
+    store = ReportStore()
+    updated, removed = store.ingest()
+
+    if args.command == 'ingest':
+        print(f"{len(store.stems())} reports in {store.db_path} ({updated} updated, {removed} removed)")
+    elif args.command == 'search':
+        rows = store.search(args.query, section_key=args.section, limit=args.limit)
+        for stem, title, snippet in rows:
+            print(f"{stem} — {title}\n    {snippet}")
+        print(f"\n{len(rows)} matching sections")
+    else:
+        for level in range(1, 7):
+            for title in store.titles(args.stem, level):
+                print(f"{'#' * level} {title}")
+
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Pipe-table parser for intelligence report markdown.
+
+The report extractors used to pull table rows out with one regex per table
+shape ('\\| (\\d+) \\| \\*\\*(.+?)\\*\\* - (.+?) \\| (.+?) \\| (.+?) \\|' for action
+plans), compiled on every call. Those patterns backtrack on long rows and
+silently drop rows that differ slightly from the expected shape (an action
+without " - detail", an unbolded role, a four-column risk matrix) or shift
+columns when a table has an extra one.
+
+This module splits each table row into cells once and maps cells to fields
+by header name, so column order and extra columns do not matter:
+
+    for row in table_records(section_text, EXECUTIVE_FIELDS):
+        row['role'], row['name'], ...
+
+extract_action_tables() collects the immediate, short-term and strategic
+action tables in a single pass over the report's heading list.
+"""
+
+import os
+import re
+import sys
+from collections import namedtuple
+
+sys.path.insert(0, os.path.dirname(__file__))
+from report_sections import HEADING_PATTERN, parse_report
+
+SEPARATOR_CELL = re.compile(r'^:?-{3,}:?$')
+CELL_SPLIT = re.compile(r'(?<!\\)\|')
+BOLD_LEAD = re.compile(r'^\*\*(.+?)\*\*\s*(?:[-–—:]\s*)?(.*)$', re.DOTALL)
+INTEGER = re.compile(r'\d+')
+
+# Field -> accepted header names (lowercase, first present column wins)
+ACTION_FIELDS = {
+    'priority': ('priority', '#'),
+    'action': ('action',),
+    'owner': ('owner',),
+    'metric': ('success metric', 'metric', 'success criteria', 'objective'),
+}
+EXECUTIVE_FIELDS = {
+    'role': ('role', 'position', 'title'),
+    'name': ('name',),
+    'background': ('background',),
+    'tenure': ('tenure',),
+}
+RISK_FIELDS = {
+    'risk': ('risk',),
+    'probability': ('probability', 'likelihood'),
+    'impact': ('impact',),
+    'severity': ('severity', 'score', 'rating'),
+    'mitigation': ('mitigation',),
+}
+
+# ### heading prefix -> action plan bucket
+ACTION_SECTIONS = {
+    'Immediate Actions': 'immediate',
+    'Short-Term Actions': 'short_term',
+    'Strategic Actions': 'strategic',
+}
+ACTION_HEADING = re.compile('|'.join(re.escape(prefix) for prefix in ACTION_SECTIONS))
+
+# section: title of the enclosing heading (see iter_tables); header: cell list; rows: list of cell lists
+Table = namedtuple('Table', 'section header rows')
+
+
+def split_row(line):
+    """Cells of one '| a | b |' table line (escaped '\\|' stays inside a cell)."""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    if '\\|' not in line:
+        return [cell.strip() for cell in line.split('|')]
+    return [cell.strip().replace('\\|', '|') for cell in CELL_SPLIT.split(line)]
+
+
+def _is_separator(cells):
+    return bool(cells) and all(SEPARATOR_CELL.match(cell.replace(' ', '')) for cell in cells)
+
+
+def _build_table(section, lines):
+    if len(lines) < 2:
+        return None
+    separator = split_row(lines[1])
+    if not _is_separator(separator):
+        return None
+    return Table(section, split_row(lines[0]), [split_row(line) for line in lines[2:]])
+
+
+def iter_tables(text, level=3):
+    """Yield every pipe table in text, in one pass over its lines.
+
+    Args:
+        text (str): Markdown
+        level (int): Heading level whose title is reported as Table.section;
+            a heading above that level clears it (None outside any section)
+    """
+    section = None
+    lines = []
+    for line in text.split('\n'):
+        if line.lstrip().startswith('|'):
+            lines.append(line)
+            continue
+
+        if lines:
+            table = _build_table(section, lines)
+            if table is not None:
+                yield table
+            lines = []
+
+        if line.startswith('#'):
+            match = HEADING_PATTERN.match(line)
+            if match and len(match.group(1)) <= level:
+                section = match.group(2) if len(match.group(1)) == level else None
+
+    if lines:
+        table = _build_table(section, lines)
+        if table is not None:
+            yield table
+
+
+def strip_bold(cell):
+    """Cell text without a '**...**' wrapper around the whole cell."""
+    if cell.startswith('**') and cell.endswith('**') and len(cell) > 4:
+        return cell[2:-2].strip()
+    return cell
+
+
+def split_bold_lead(cell):
+    """'**Title** - detail' -> ('Title', 'detail'); unbolded text is all title.
+
+    Text after the bold lead is the detail with or without a separator
+    ('**Schedule CTO meeting** with ...' -> detail 'with ...').
+    """
+    match = BOLD_LEAD.match(cell)
+    if match:
+        return match.group(1).strip(), (match.group(2) or '').strip()
+    return cell, ''
+
+
+def parse_int(cell):
+    match = INTEGER.search(cell)
+    return int(match.group()) if match else None
+
+
+def column_map(header, fields):
+    """Field -> column index (None if absent) for a table header, computed once per table."""
+    columns = [name.lower().strip('* ') for name in header]
+    return {field: next((columns.index(name) for name in names if name in columns), None)
+            for field, names in fields.items()}
+
+
+def map_row(columns, row):
+    """Row cells keyed by field name ('' for fields the table lacks)."""
+    return {field: row[index] if index is not None and index < len(row) else ''
+            for field, index in columns.items()}
+
+
+def table_records(text, fields):
+    """Rows of every table in text as field dicts, skipping rows with no mapped cells."""
+    records = []
+    for table in iter_tables(text):
+        columns = column_map(table.header, fields)
+        for row in table.rows:
+            record = map_row(columns, row)
+            if any(record.values()):
+                records.append(record)
+    return records
+
+
+def action_records(rows):
+    """Typed action dicts from (column map, row) pairs; rows without a numeric priority are skipped."""
+    actions = []
+    for columns, row in rows:
+        record = map_row(columns, row)
+        priority = parse_int(record['priority'])
+        if priority is None:
+            continue
+        title, detail = split_bold_lead(record['action'])
+        actions.append({
+            'priority': priority,
+            'title': title,
+            'detail': detail,
+            'owner': record['owner'],
+            'metric': record['metric'],
+        })
+    return actions
+
+
+def extract_action_tables(text):
+    """Immediate, short-term and strategic action rows from one pass over the report's headings.
+
+    Tables are taken from the first ### section whose title starts with each
+    ACTION_SECTIONS prefix (the section runs to the next ### heading).
+
+    Returns:
+        dict: {'immediate': [...], 'short_term': [...], 'strategic': [...]}
+    """
+    report = parse_report(text)
+    rows = {bucket: [] for bucket in ACTION_SECTIONS.values()}
+    found = set()
+    for index, heading in enumerate(report.headings):
+        if heading.level != 3:
+            continue
+        match = ACTION_HEADING.match(heading.title)
+        if match is None or match.group() in found:
+            continue
+        found.add(match.group())
+        bucket = ACTION_SECTIONS[match.group()]
+        for table in iter_tables(report.body(index, stop=(3,))):
+            columns = column_map(table.header, ACTION_FIELDS)
+            rows[bucket].extend((columns, row) for row in table.rows)
+        if len(found) == len(ACTION_SECTIONS):
+            break
+    return {bucket: action_records(bucket_rows) for bucket, bucket_rows in rows.items()}
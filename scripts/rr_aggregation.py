@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Vectorized RR/NRR aggregation over the columnar budget workbook.
+
+Loads the 'RR Input' / 'NRR Input' columns as NumPy arrays, factorizes
+customer names and computes per-customer RR sums, subscription groups and
+FY26 NRR with grouped reductions (np.unique / np.bincount). Per-row Python
+work is limited to building the subscription records themselves, and the
+"<Customer>" name regex runs once per distinct NRR name rather than per row.
+Customer cells of any non-empty kind are grouped (a numeric account name
+becomes a customer, as in the row engine); only the rare non-text ones are
+decoded in Python.
+
+Output matches budget_workbook.extract_customers_by_bu() (the
+customers_<bu>_all.json customer schema).
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+from budget_workbook import BU_CONFIGS, NRR_NAME_PATTERN, RR_COLUMNS, NRR_COLUMNS
+from workbook_cache import ColumnarSheet, KIND_NONE, KIND_INT, KIND_FLOAT, KIND_STR, encode_sheet
+
+
+def as_columnar(ws, columns):
+    """Return ws as a ColumnarSheet (encoding ProjectedSheet rows in memory if needed)."""
+    if isinstance(ws, ColumnarSheet):
+        return ws
+    strings = []
+    kinds, nums, strs = encode_sheet(ws, sorted(columns), {}, strings)
+    return ColumnarSheet(ws.title, sorted(columns), kinds, nums, strs, strings)
+
+
+def decode_values(sheet, index, rows):
+    """Decode one column at the given row positions into Python values.
+
+    Strings, ints and floats are decoded with array operations; only rare
+    kinds (bools, datetimes) fall back to per-cell decoding.
+    """
+    kinds, nums, strs = sheet.column(index)
+    kinds, nums, strs = np.asarray(kinds[rows]), np.asarray(nums[rows]), np.asarray(strs[rows])
+    values = np.full(len(rows), None, dtype=object)
+
+    is_str = kinds == KIND_STR
+    if is_str.any():
+        values[is_str] = string_table(sheet)[strs[is_str]]
+    is_int = kinds == KIND_INT
+    if is_int.any():
+        values[is_int] = nums[is_int].astype(np.int64).tolist()
+    is_float = kinds == KIND_FLOAT
+    if is_float.any():
+        values[is_float] = nums[is_float].tolist()
+
+    for i in np.flatnonzero(kinds > KIND_STR).tolist():
+        values[i] = sheet._decode(int(kinds[i]), float(nums[i]), int(strs[i]))
+
+    return values.tolist()
+
+
+def string_table(sheet):
+    """The sheet's string dictionary as an object array (built once per sheet)."""
+    table = getattr(sheet, '_string_table', None)
+    if table is None:
+        table = np.empty(len(sheet.strings), dtype=object)
+        table[:] = sheet.strings
+        sheet._string_table = table
+    return table
+
+
+def numeric(sheet, index, start):
+    """(values, is_float) arrays for a column from row `start`; non-numbers read as 0."""
+    kinds, nums, _ = sheet.column(index)
+    kinds, nums = np.asarray(kinds[start:]), np.asarray(nums[start:])
+    is_number = (kinds == KIND_INT) | (kinds == KIND_FLOAT)
+    return np.where(is_number, nums, 0.0), kinds == KIND_FLOAT
+
+
+def name_keys(sheet, index, start):
+    """Per-row name key: string id for text, -1 for empty cells or empty strings."""
+    kinds, _, strs = sheet.column(index)
+    kinds, strs = np.asarray(kinds[start:]), np.asarray(strs[start:])
+    keys = np.where(kinds == KIND_STR, strs, -1)
+    empty = [i for i, s in enumerate(sheet.strings) if s == '']
+    if empty:
+        keys[np.isin(keys, empty)] = -1
+    return keys
+
+
+def value_keys(sheet, index, start):
+    """Per-row group key for a column of any cell kinds, with each key's value.
+
+    Keys compare like the decoded values would as dict keys in the row
+    engine: text cells keep their string id, and every other non-empty cell
+    (numbers, bools, datetimes) gets an id after the string table, one per
+    distinct value, decoded with ColumnarSheet._decode. Falsy values (empty
+    cells, '', 0, False) get -1.
+
+    Returns:
+        tuple: (key per row, list of the value of each key)
+    """
+    kinds, nums, _ = sheet.column(index)
+    kinds, nums = np.asarray(kinds[start:]), np.asarray(nums[start:])
+    keys = name_keys(sheet, index, start).astype(np.int64)
+    values = list(sheet.strings)
+
+    other = np.flatnonzero((kinds != KIND_NONE) & (kinds != KIND_STR))
+    if len(other):
+        # Decode each distinct (kind, number) pair once
+        pairs, inverse = np.unique(np.stack([kinds[other].astype(np.float64), nums[other]], axis=1),
+                                   axis=0, return_inverse=True)
+        ids = {}
+        pair_keys = []
+        for kind, num in pairs.tolist():
+            value = sheet._decode(int(kind), num, -1)
+            if not value:
+                pair_keys.append(-1)
+                continue
+            if value not in ids:
+                ids[value] = len(values)
+                values.append(value)
+            pair_keys.append(ids[value])
+        keys[other] = np.array(pair_keys, dtype=np.int64)[inverse.reshape(-1)]
+
+    return keys, values
+
+
+def factorize(keys):
+    """Map keys to group numbers 0..n-1 in order of first appearance.
+
+    Returns:
+        tuple: (unique keys in first-seen order, group number per row)
+    """
+    uniques, first_seen, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first_seen, kind='stable')
+    remap = np.empty_like(order)
+    remap[order] = np.arange(len(order))
+    return uniques[order], remap[inverse.reshape(-1)]
+
+
+def as_numbers(values, has_float):
+    """Python numbers from a float array: int where every summand was an int."""
+    numbers = values.tolist()
+    for i in np.flatnonzero(~has_float).tolist():
+        numbers[i] = int(numbers[i])
+    return numbers
+
+
+def aggregate_rr(sheet, company_filters, fill_missing_arr=False):
+    """Grouped RR aggregation per company.
+
+    Returns:
+        dict: company -> (names, rr_values, rr_has_float, subscriptions_per_name)
+    """
+    start = 10  # data starts at row 11
+    company_keys = name_keys(sheet, 0, start)
+    customer_keys, customer_values = value_keys(sheet, 1, start)
+    arr, arr_is_float = numeric(sheet, 6, start)
+
+    # Only the handful of distinct company values need a string lookup
+    company_ids = {sheet.strings[k]: k for k in np.unique(company_keys[company_keys >= 0]).tolist()}
+    result = {}
+
+    for company in company_filters:
+        company_id = company_ids.get(company, -2)
+        rows = np.flatnonzero((company_keys == company_id) & (customer_keys >= 0))
+
+        uniques, groups = factorize(customer_keys[rows])
+
+        # bincount accumulates in row order, matching sequential Python sums
+        rr = np.bincount(groups, weights=arr[rows], minlength=len(uniques))
+        has_float = np.bincount(groups, weights=arr_is_float[rows], minlength=len(uniques)) > 0
+
+        absolute_rows = rows + start
+        sub_ids = decode_values(sheet, 3, absolute_rows)
+        arrs = decode_values(sheet, 6, absolute_rows)
+        renewal_qtrs = decode_values(sheet, 8, absolute_rows)
+        will_renews = decode_values(sheet, 9, absolute_rows)
+        projected = decode_values(sheet, 11, absolute_rows)
+
+        subscriptions = [[] for _ in range(len(uniques))]
+        for g, sub_id, row_arr, qtr, renew, proj in zip(groups.tolist(), sub_ids, arrs,
+                                                         renewal_qtrs, will_renews, projected):
+            subscriptions[g].append({
+                'sub_id': sub_id,
+                'arr': (row_arr if row_arr else 0) if fill_missing_arr else row_arr,
+                'renewal_qtr': qtr,
+                'will_renew': renew,
+                'projected_arr': proj
+            })
+
+        names = [customer_values[k] for k in uniques.tolist()]
+        result[company] = (names, rr, has_float, subscriptions)
+
+    return result
+
+
+def aggregate_nrr(sheet, class_filters):
+    """Grouped FY26 NRR (Q1..Q4'26) aggregation per class filter.
+
+    Returns:
+        dict: class_filter -> (names, nrr_values, nrr_has_float)
+    """
+    start = 5  # data starts at row 6
+    raw_name_keys, raw_names = value_keys(sheet, 1, start)
+    class_keys = name_keys(sheet, 2, start)
+
+    quarters = [numeric(sheet, col, start) for col in (8, 9, 10, 11)]
+    fy26 = quarters[0][0] + quarters[1][0] + quarters[2][0] + quarters[3][0]
+    fy26_is_float = quarters[0][1] | quarters[1][1] | quarters[2][1] | quarters[3][1]
+
+    # Resolve "<Customer>" names once per distinct value
+    distinct = np.unique(raw_name_keys[raw_name_keys >= 0])
+    resolved = {}
+    for key in distinct.tolist():
+        name = raw_names[key]
+        match = NRR_NAME_PATTERN.search(name) if isinstance(name, str) else None
+        if match:
+            name = match.group(1).strip()
+        resolved[key] = name or None
+
+    resolved_ids = {}
+    resolved_names = []
+    key_map = np.full(len(raw_names) + 1, -1, dtype=np.int64)
+    for key, name in resolved.items():
+        if name is None:
+            continue
+        if name not in resolved_ids:
+            resolved_ids[name] = len(resolved_names)
+            resolved_names.append(name)
+        key_map[key] = resolved_ids[name]
+    customer_ids = key_map[raw_name_keys]
+
+    distinct_classes = np.unique(class_keys[class_keys >= 0]).tolist()
+    result = {}
+
+    for class_filter in class_filters:
+        matching = [k for k in distinct_classes if class_filter in sheet.strings[k]]
+        rows = np.flatnonzero(np.isin(class_keys, matching) & (customer_ids >= 0))
+
+        uniques, groups = factorize(customer_ids[rows])
+
+        nrr = np.bincount(groups, weights=fy26[rows], minlength=len(uniques))
+        has_float = np.bincount(groups, weights=fy26_is_float[rows], minlength=len(uniques)) > 0
+
+        names = [resolved_names[k] for k in uniques.tolist()]
+        result[class_filter] = (names, nrr, has_float)
+
+    return result
+
+
+def merge_aggregates(rr_group, nrr_group):
+    """Join RR and NRR groups by customer name and rank by total revenue."""
+    rr_names, rr_values, rr_float, subscriptions = rr_group
+    nrr_names, nrr_values, nrr_float = nrr_group
+
+    index = {name: i for i, name in enumerate(rr_names)}
+    names = list(rr_names)
+    for name in nrr_names:
+        if name not in index:
+            index[name] = len(names)
+            names.append(name)
+
+    n = len(names)
+    rr = np.zeros(n)
+    rr[:len(rr_names)] = rr_values
+    nrr = np.zeros(n)
+    is_float_rr = np.zeros(n, dtype=bool)
+    is_float_rr[:len(rr_names)] = rr_float
+    is_float_nrr = np.zeros(n, dtype=bool)
+    if nrr_names:
+        positions = np.array([index[name] for name in nrr_names])
+        nrr[positions] = nrr_values
+        is_float_nrr[positions] = nrr_float
+
+    total = rr + nrr
+    order = np.argsort(-total, kind='stable')
+    rr_numbers = as_numbers(rr, is_float_rr)
+    nrr_numbers = as_numbers(nrr, is_float_nrr)
+
+    customers = []
+    for i in order.tolist():
+        rr_value = rr_numbers[i]
+        nrr_value = nrr_numbers[i]
+        customers.append({
+            'customer_name': names[i],
+            'rr': rr_value,
+            'nrr': nrr_value,
+            'total': rr_value + nrr_value,
+            'subscriptions': subscriptions[i] if i < len(subscriptions) else []
+        })
+
+    total_revenue = sum(c['total'] for c in customers)
+    for rank, customer in enumerate(customers, 1):
+        customer['rank'] = rank
+        customer['pct_of_total'] = (customer['total'] / total_revenue * 100) if total_revenue > 0 else 0
+
+    return customers
+
+
+def aggregate_customers_by_bu(wb, bu_configs=BU_CONFIGS, fill_missing_arr=False):
+    """Vectorized equivalent of budget_workbook.extract_customers_by_bu().
+
+    Returns:
+        dict: BU name -> list of ranked customer records
+    """
+    companies = [company for _, company, _ in bu_configs]
+    classes = [class_filter for _, _, class_filter in bu_configs]
+
+    if 'RR Input' in wb:
+        rr_groups = aggregate_rr(as_columnar(wb['RR Input'], RR_COLUMNS), companies, fill_missing_arr)
+    else:
+        rr_groups = {company: ([], np.zeros(0), np.zeros(0, dtype=bool), []) for company in companies}
+
+    if 'NRR Input' in wb:
+        nrr_groups = aggregate_nrr(as_columnar(wb['NRR Input'], NRR_COLUMNS), classes)
+    else:
+        nrr_groups = {class_filter: ([], np.zeros(0), np.zeros(0, dtype=bool)) for class_filter in classes}
+
+    return {
+        bu_name: merge_aggregates(rr_groups[company], nrr_groups[class_filter])
+        for bu_name, company, class_filter in bu_configs
+    }
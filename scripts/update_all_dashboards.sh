@@ -7,6 +7,13 @@ set -e
 REPO_DIR="/Users/RAZER/Documents/projects/Skyvera"
 cd "$REPO_DIR"
 
+# Pass --changed-only to re-render only customers in the extraction changeset
+# (data/changesets/); news-only updates still need a full run.
+RENDER_FLAGS=""
+if [ "$1" = "--changed-only" ]; then
+    RENDER_FLAGS="--changed-only"
+fi
+
 echo "==================================================================="
 echo "SKYVERA MASTER DASHBOARD UPDATE - $(date)"
 echo "==================================================================="
@@ -108,20 +115,12 @@ echo "[STEP 4/7] REGENERATING ALL DASHBOARDS - $(date '+%H:%M:%S')"
 echo "==================================================================="
 echo ""
 
-echo "→ Generating CloudSense dashboards..."
-python3 scripts/generate_dashboards.py
-echo ""
-
-echo "→ Generating Kandy dashboards..."
-python3 scripts/generate_dashboards_kandy.py
-echo ""
-
-echo "→ Generating STL dashboards..."
-python3 scripts/generate_dashboards_stl.py
+echo "→ Rebuilding intelligence HTML (data/intelligence_html.json) and report metrics (data/report_metrics.json)..."
+python3 scripts/integrate_intelligence_reports.py
 echo ""
 
-echo "→ Generating NewNet dashboards..."
-python3 scripts/generate_dashboards_newnet.py
+echo "→ Generating CloudSense, Kandy, STL and NewNet dashboards..."
+python3 scripts/generate_bu_dashboards.py $RENDER_FLAGS
 echo ""
 
 echo "✅ All dashboards regenerated"
@@ -136,19 +135,19 @@ echo "==================================================================="
 echo ""
 
 echo "→ Generating CloudSense index..."
-python3 scripts/generate_index.py
+python3 scripts/generate_index.py $RENDER_FLAGS
 echo ""
 
 echo "→ Generating Kandy index..."
-python3 scripts/generate_index_kandy.py
+python3 scripts/generate_index_kandy.py $RENDER_FLAGS
 echo ""
 
 echo "→ Generating STL index..."
-python3 scripts/generate_index_stl.py
+python3 scripts/generate_index_stl.py $RENDER_FLAGS
 echo ""
 
 echo "→ Generating NewNet index..."
-python3 scripts/generate_index_newnet.py
+python3 scripts/generate_index_newnet.py $RENDER_FLAGS
 echo ""
 
 echo "✅ All index pages regenerated"
@@ -163,7 +162,7 @@ echo "==================================================================="
 echo ""
 
 echo "→ Generating analytics dashboard with ALL customers..."
-python3 scripts/generate_analytics_dashboard.py
+python3 scripts/generate_analytics_dashboard.py $RENDER_FLAGS
 echo ""
 
 echo "✅ Master analytics dashboard regenerated"
@@ -2,147 +2,157 @@
 """
 Verify that all dashboard tabs have content.
 Checks each intelligence report and identifies missing sections.
+
+By default the reports are synced into the report store (report_store.py,
+--db) and every dashboard tab is looked up there, with the same queries
+create_full_dashboard.py uses (report_store.TAB_SECTION_HEADINGS). Only new
+or changed reports are tokenized; each report's time is its ingest step
+(read, hash and, if changed, tokenize) plus its tab queries. --no-store
+checks the files directly instead, in a worker pool (--jobs), one task per
+report: each task reads the file, tokenizes it once and extracts every
+tab. Besides the console report, the customer x tab coverage matrix can be
+written for CI and the app:
+
+    --json PATH   {"tabs": [...], "summary": {...}, "reports": [{customer, file, seconds,
+                   coverage: {tab: chars}, missing: [...], sections: [...]}, ...]}
+    --csv PATH    one row per report: customer, file, seconds, missing, <tab chars>...
+
+Usage:
+  python3 scripts/verify_dashboard_completeness.py [--db PATH] [--json PATH] [--csv PATH] [--slowest 10]
+  python3 scripts/verify_dashboard_completeness.py --no-store [--jobs 0] ...
 """
 
-import re
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
 from pathlib import Path
 
-def extract_section_from_markdown(md_content, section_name):
-    """Extract a specific section from markdown content."""
-    if not md_content:
-        return None
-
-    # Try exact match first
-    pattern = rf'##\s+{re.escape(section_name)}\s*\n(.*?)(?=\n##\s+|\Z)'
-    match = re.search(pattern, md_content, re.DOTALL | re.IGNORECASE)
+sys.path.insert(0, os.path.dirname(__file__))
+from parallel_render import add_jobs_argument, resolve_jobs, run_jobs, write_atomic
+from report_index import REPORTS_DIR
+from report_sections import ReportSections
+from report_store import DB_PATH, TAB_SECTION_HEADINGS, ReportStore, extract_tab_sections
 
-    if match:
-        return match.group(1).strip()
+TABS = list(TAB_SECTION_HEADINGS)
+MIN_SECTION_CHARS = 50  # Less than 50 chars is essentially empty
 
-    # Try partial match
-    pattern = rf'##\s+[^\n]*{re.escape(section_name)}[^\n]*\n(.*?)(?=\n##\s+|\Z)'
-    match = re.search(pattern, md_content, re.DOTALL | re.IGNORECASE)
+def section_result(stem, all_sections, sections, seconds):
+    """Coverage of one report's tabs."""
+    # Characters of content per tab; 0 means missing
+    coverage = {tab: len(value.strip()) if value else 0 for tab, value in sections.items()}
+    missing = [tab for tab, chars in coverage.items() if chars < MIN_SECTION_CHARS]
 
-    if match:
-        return match.group(1).strip()
-
-    return None
+    return {
+        'customer': stem.replace('_', ' '),
+        'file': f"{stem}.md",
+        'seconds': round(seconds, 6),
+        'all_sections': all_sections,
+        'coverage': coverage,
+        'extracted': {tab: chars >= MIN_SECTION_CHARS for tab, chars in coverage.items()},
+        'missing': missing
+    }
 
 def check_customer_sections(report_path):
     """Check which sections are available in a customer report."""
+    start = time.perf_counter()
     with open(report_path, 'r') as f:
         content = f.read()
 
-    # Get all section headers
-    all_sections = re.findall(r'^##\s+(.+?)$', content, re.MULTILINE)
-
-    # Check for required sections
-    sections = {
-        'exec_summary': (
-            extract_section_from_markdown(content, 'EXECUTIVE SUMMARY') or
-            extract_section_from_markdown(content, 'Executive Summary')
-        ),
-        'company_intel': (
-            extract_section_from_markdown(content, 'COMPANY INTELLIGENCE') or
-            extract_section_from_markdown(content, 'Company Intelligence') or
-            extract_section_from_markdown(content, 'COMPANY PROFILE') or
-            extract_section_from_markdown(content, 'COMPANY OVERVIEW')
-        ),
-        'executives': (
-            extract_section_from_markdown(content, 'EXECUTIVE LEADERSHIP') or
-            extract_section_from_markdown(content, 'KEY EXECUTIVES') or
-            extract_section_from_markdown(content, 'LEADERSHIP') or
-            extract_section_from_markdown(content, 'COMPANY OVERVIEW')
-        ),
-        'org_structure': (
-            extract_section_from_markdown(content, 'ORGANIZATIONAL STRUCTURE') or
-            extract_section_from_markdown(content, '2. ORGANIZATIONAL STRUCTURE') or
-            extract_section_from_markdown(content, 'ORG STRUCTURE') or
-            extract_section_from_markdown(content, 'ORGANIZATION') or
-            extract_section_from_markdown(content, 'CORPORATE STRUCTURE') or
-            extract_section_from_markdown(content, 'BUSINESS SEGMENTS') or
-            extract_section_from_markdown(content, 'KEY STAKEHOLDERS') or
-            extract_section_from_markdown(content, 'COMPANY PROFILE') or
-            extract_section_from_markdown(content, 'PARENT COMPANY') or
-            extract_section_from_markdown(content, 'CORPORATE TRANSFORMATION') or
-            extract_section_from_markdown(content, 'COMPANY OVERVIEW') or
-            extract_section_from_markdown(content, 'STRATEGIC CONTEXT') or
-            extract_section_from_markdown(content, 'STRATEGIC DIRECTION') or
-            extract_section_from_markdown(content, 'STRATEGIC INTELLIGENCE') or
-            extract_section_from_markdown(content, 'STRATEGIC ANALYSIS') or
-            extract_section_from_markdown(content, 'FINANCIAL ANALYSIS')
-        ),
-        'pain_points': (
-            extract_section_from_markdown(content, 'PAIN POINTS & CHALLENGES') or
-            extract_section_from_markdown(content, 'PAIN POINTS') or
-            extract_section_from_markdown(content, 'CHALLENGES') or
-            extract_section_from_markdown(content, 'RISK ASSESSMENT') or
-            extract_section_from_markdown(content, 'RISKS')
-        ),
-        'competitive': (
-            extract_section_from_markdown(content, 'COMPETITIVE LANDSCAPE') or
-            extract_section_from_markdown(content, '7. COMPETITIVE LANDSCAPE') or
-            extract_section_from_markdown(content, 'COMPETITIVE') or
-            extract_section_from_markdown(content, 'COMPETITION') or
-            extract_section_from_markdown(content, 'COMPETITIVE THREAT') or
-            extract_section_from_markdown(content, 'MARKET CONTEXT') or
-            extract_section_from_markdown(content, 'STRATEGIC CONTEXT') or
-            extract_section_from_markdown(content, 'STRATEGIC ANALYSIS') or
-            extract_section_from_markdown(content, 'ROOT CAUSE ANALYSIS')
-        ),
-        'opportunities': (
-            extract_section_from_markdown(content, 'OPPORTUNITY ANALYSIS') or
-            extract_section_from_markdown(content, 'OPPORTUNITY ASSESSMENT') or
-            extract_section_from_markdown(content, 'OPPORTUNITIES') or
-            extract_section_from_markdown(content, '6. EXPANSION OPPORTUNITIES') or
-            extract_section_from_markdown(content, 'OPPORTUNIT') or
-            extract_section_from_markdown(content, 'GROWTH') or
-            extract_section_from_markdown(content, 'EXPANSION') or
-            extract_section_from_markdown(content, 'STRATEGIC INTELLIGENCE') or
-            extract_section_from_markdown(content, 'STRATEGIC OPTIONS')
-        ),
-        'action_plan': (
-            extract_section_from_markdown(content, 'ACCOUNT STRATEGY RECOMMENDATIONS') or
-            extract_section_from_markdown(content, 'RECOMMENDED ACTIONS') or
-            extract_section_from_markdown(content, 'RECOMMENDED ACTION PLAN') or
-            extract_section_from_markdown(content, 'ACCOUNT STRATEGY') or
-            extract_section_from_markdown(content, 'STRATEGY RECOMMENDATIONS') or
-            extract_section_from_markdown(content, 'ACTION PLAN') or
-            extract_section_from_markdown(content, '8. RELATIONSHIP STRATEGY') or
-            extract_section_from_markdown(content, 'RELATIONSHIP STRATEGY') or
-            extract_section_from_markdown(content, 'NEXT STEPS') or
-            extract_section_from_markdown(content, 'RECOMMENDATIONS')
-        )
-    }
-
-    # Determine which are missing
-    missing = []
-    for key, value in sections.items():
-        if not value or len(value.strip()) < 50:  # Less than 50 chars is essentially empty
-            missing.append(key)
-
-    return {
-        'all_sections': all_sections,
-        'extracted': {k: bool(v and len(v.strip()) >= 50) for k, v in sections.items()},
-        'missing': missing
-    }
+    # Tokenize once; both the header list and the tab lookups use it
+    report = ReportSections(content)
+    all_sections = report.titles(2)
+    sections = extract_tab_sections(content, report)
+
+    return section_result(Path(report_path).stem, all_sections, sections, time.perf_counter() - start)
+
+def check_store_sections(store, reports_dir):
+    """Sync the report store with reports_dir and check every report's tabs with store queries.
+
+    Returns:
+        list: section_result() per report, in filename order
+    """
+    timings = {}
+    store.ingest(reports_dir, timings=timings)
+
+    results = []
+    for stem, ingest_seconds in timings.items():
+        start = time.perf_counter()
+        all_sections = store.titles(stem, 2)
+        sections = store.tab_sections(stem)
+        results.append(section_result(stem, all_sections, sections,
+                                      ingest_seconds + time.perf_counter() - start))
+    return results
+
+def coverage_json(results, elapsed):
+    complete = sum(1 for result in results if not result['missing'])
+    return json.dumps({
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'tabs': TABS,
+        'min_section_chars': MIN_SECTION_CHARS,
+        'summary': {
+            'reports': len(results),
+            'complete': complete,
+            'incomplete': len(results) - complete,
+            'missing_by_tab': {tab: sum(1 for r in results if tab in r['missing']) for tab in TABS},
+            'elapsed_seconds': round(elapsed, 3),
+        },
+        'reports': [{
+            'customer': result['customer'],
+            'file': result['file'],
+            'seconds': result['seconds'],
+            'coverage': result['coverage'],
+            'missing': result['missing'],
+            'sections': result['all_sections'],
+        } for result in results],
+    }, indent=2)
+
+def coverage_csv(results):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(['customer', 'file', 'seconds', 'missing'] + TABS)
+    for result in results:
+        writer.writerow([result['customer'], result['file'], result['seconds'], ' '.join(result['missing'])]
+                        + [result['coverage'][tab] for tab in TABS])
+    return out.getvalue()
 
 def main():
     """Check all intelligence reports."""
-    reports_dir = Path('data/intelligence/reports')
+    parser = argparse.ArgumentParser(description='Verify dashboard tab coverage of the intelligence reports')
+    parser.add_argument('--dir', default=str(REPORTS_DIR), help='Reports directory')
+    parser.add_argument('--store', action=argparse.BooleanOptionalAction, default=True,
+                        help='Check through the report store (default); --no-store reads the files in a worker pool')
+    parser.add_argument('--db', default=str(DB_PATH), help='Report store database (with --store)')
+    parser.add_argument('--json', help='Write the coverage matrix as JSON to this path')
+    parser.add_argument('--csv', help='Write the coverage matrix as CSV to this path')
+    parser.add_argument('--slowest', type=int, default=10, help='List the N slowest reports (0 to skip)')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
 
     print("=" * 100)
     print("DASHBOARD COMPLETENESS VERIFICATION")
     print("=" * 100)
     print()
 
-    all_reports = sorted(reports_dir.glob('*.md'))
+    start = time.perf_counter()
+    if args.store:
+        store = ReportStore(args.db)
+        results = check_store_sections(store, args.dir)
+        store.close()
+        checked_with = f"report store {args.db}"
+    else:
+        all_reports = sorted(str(path) for path in Path(args.dir).glob('*.md'))
+        results = list(run_jobs(check_customer_sections, all_reports, jobs=args.jobs))
+        checked_with = f"{resolve_jobs(args.jobs)} worker(s)"
+    elapsed = time.perf_counter() - start
 
     issues_found = {}
 
-    for report_path in all_reports:
-        customer_name = report_path.stem.replace('_', ' ')
-        result = check_customer_sections(report_path)
+    for result in results:
+        customer_name = result['customer']
 
         if result['missing']:
             issues_found[customer_name] = result
@@ -155,8 +165,9 @@ def main():
 
     print()
     print("=" * 100)
-    print(f"SUMMARY: {len(all_reports) - len(issues_found)}/{len(all_reports)} customers complete")
+    print(f"SUMMARY: {len(results) - len(issues_found)}/{len(results)} customers complete")
     print(f"Issues found in {len(issues_found)} customers")
+    print(f"Checked in {elapsed:.2f}s ({checked_with})")
     print("=" * 100)
 
     if issues_found:
@@ -168,5 +179,17 @@ def main():
                 print(f"    - {section}")
             print(f"  Missing tabs: {', '.join(result['missing'])}")
 
+    if args.slowest > 0 and results:
+        print(f"\nSLOWEST REPORTS:")
+        for result in sorted(results, key=lambda r: r['seconds'], reverse=True)[:args.slowest]:
+            print(f"  {result['seconds'] * 1000:8.1f}ms  {result['file']}")
+
+    if args.json:
+        write_atomic(args.json, coverage_json(results, elapsed))
+        print(f"\nCoverage matrix written to {args.json}")
+    if args.csv:
+        write_atomic(args.csv, coverage_csv(results))
+        print(f"Coverage matrix written to {args.csv}")
+
 if __name__ == '__main__':
     main()
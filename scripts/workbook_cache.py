@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Columnar on-disk cache of the Skyvera budget workbook.
+
+The first run streams the projected sheets ('RR Input', 'NRR Input',
+'RR Summary' and the 'P&Ls - <BU>' sheets) with load_budget_workbook() and
+writes each one as three NumPy arrays (cell kind, numeric value, string id)
+plus a shared string dictionary. Later runs with an unchanged workbook
+memory-map those arrays and never touch openpyxl.
+
+Layout:
+  .cache/workbook/<key>/manifest.json
+  .cache/workbook/<key>/strings.json
+  .cache/workbook/<key>/<sheet>.kinds.npy | .nums.npy | .strs.npy
+
+<key> is derived from the workbook's SHA-256 content hash and the sheet
+projections, so editing the workbook (or the projections) invalidates it.
+
+Usage:
+  python3 scripts/workbook_cache.py [--rebuild]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+from budget_workbook import (EXCEL_FILE, SHEET_PROJECTIONS, CellValue, ProjectedWorkbook, load_budget_workbook,
+                             scan_renewal_dates)
+
+CACHE_VERSION = 1
+CACHE_DIR = Path(__file__).parent.parent / '.cache' / 'workbook'
+
+# Cell kinds stored in <sheet>.kinds.npy
+KIND_NONE, KIND_INT, KIND_FLOAT, KIND_STR, KIND_BOOL, KIND_DATETIME = range(6)
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def log(message):
+    print(message, file=sys.stderr)
+
+
+def file_hash(path):
+    """SHA-256 of the workbook bytes."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(path, projections=SHEET_PROJECTIONS):
+    """Cache key from the workbook content hash, projections and format version."""
+    spec = json.dumps({name: cols and list(cols) for name, cols in projections.items()}, sort_keys=True)
+    spec_hash = hashlib.sha256(f"{CACHE_VERSION}:{spec}".encode('utf-8')).hexdigest()
+    return f"{file_hash(path)[:24]}-{spec_hash[:8]}"
+
+
+def _sheet_file(name):
+    """Filesystem-safe stem for a sheet name ('P&Ls - Kandy' -> 'P_Ls_-_Kandy')."""
+    return ''.join(c if c.isalnum() or c in '-_' else '_' for c in name)
+
+
+class ColumnarSheet:
+    """Memory-mapped sheet with the same iter_rows()/cell() API as ProjectedSheet.
+
+    kinds/nums/strs are (rows x stored columns) arrays; `columns` maps each
+    stored column to its 0-based sheet column.
+    """
+
+    def __init__(self, title, columns, kinds, nums, strs, strings):
+        self.title = title
+        self.columns = columns
+        self.kinds = kinds
+        self.nums = nums
+        self.strs = strs
+        self.strings = strings
+        self.width = (max(columns) + 1) if columns else 0
+        self.position = {col: i for i, col in enumerate(columns)}
+
+    @property
+    def max_row(self):
+        return self.kinds.shape[0]
+
+    def _decode(self, kind, num, sid):
+        if kind == KIND_NONE:
+            return None
+        if kind == KIND_INT:
+            return int(num)
+        if kind == KIND_FLOAT:
+            return num
+        if kind == KIND_STR:
+            return self.strings[sid]
+        if kind == KIND_BOOL:
+            return bool(num)
+        return EPOCH + timedelta(seconds=num)
+
+    def iter_rows(self, min_row=1, max_row=None, values_only=True):
+        start, stop = min_row - 1, max_row
+        kinds = self.kinds[start:stop].tolist()
+        nums = self.nums[start:stop].tolist()
+        strs = self.strs[start:stop].tolist()
+
+        for row_kinds, row_nums, row_strs in zip(kinds, nums, strs):
+            row = [None] * self.width
+            for i, col in enumerate(self.columns):
+                if row_kinds[i]:
+                    row[col] = self._decode(row_kinds[i], row_nums[i], row_strs[i])
+            yield tuple(row)
+
+    def cell(self, row, column):
+        i = self.position.get(column - 1)
+        if i is None or not 1 <= row <= self.max_row:
+            return CellValue(None)
+        r = row - 1
+        return CellValue(self._decode(int(self.kinds[r, i]), float(self.nums[r, i]), int(self.strs[r, i])))
+
+    def column(self, index):
+        """Raw (kinds, nums, strs) arrays for one 0-based sheet column."""
+        i = self.position[index]
+        return self.kinds[:, i], self.nums[:, i], self.strs[:, i]
+
+
+def encode_sheet(sheet, columns, string_ids, strings):
+    """Encode a ProjectedSheet into (kinds, nums, strs) arrays over `columns`."""
+    n_rows, n_cols = len(sheet.rows), len(columns)
+    kinds = np.zeros((n_rows, n_cols), dtype=np.int8)
+    nums = np.zeros((n_rows, n_cols), dtype=np.float64)
+    strs = np.full((n_rows, n_cols), -1, dtype=np.int32)
+
+    for r, row in enumerate(sheet.rows):
+        for i, col in enumerate(columns):
+            value = row[col] if col < len(row) else None
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                kinds[r, i], nums[r, i] = KIND_BOOL, float(value)
+            elif isinstance(value, int):
+                kinds[r, i], nums[r, i] = KIND_INT, float(value)
+            elif isinstance(value, float):
+                kinds[r, i], nums[r, i] = KIND_FLOAT, value
+            elif isinstance(value, datetime):
+                kinds[r, i], nums[r, i] = KIND_DATETIME, (value.replace(tzinfo=None) - EPOCH).total_seconds()
+            else:
+                text = value if isinstance(value, str) else str(value)
+                if text not in string_ids:
+                    string_ids[text] = len(strings)
+                    strings.append(text)
+                kinds[r, i], strs[r, i] = KIND_STR, string_ids[text]
+
+    return kinds, nums, strs
+
+
+def write_cache(wb, cache_path, source_hash_key):
+    """Write a ProjectedWorkbook to cache_path atomically (temp dir + rename)."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=cache_path.parent, prefix='.tmp-'))
+
+    try:
+        strings, string_ids = [], {}
+        manifest = {'version': CACHE_VERSION, 'key': source_hash_key, 'sheets': {}}
+
+        for name in wb.sheetnames:
+            sheet = wb[name]
+            columns = SHEET_PROJECTIONS.get(name)
+            if columns is None:
+                columns = range(max((len(row) for row in sheet.rows), default=0))
+            columns = sorted(columns)
+
+            kinds, nums, strs = encode_sheet(sheet, columns, string_ids, strings)
+            stem = _sheet_file(name)
+            np.save(tmp / f"{stem}.kinds.npy", kinds)
+            np.save(tmp / f"{stem}.nums.npy", nums)
+            np.save(tmp / f"{stem}.strs.npy", strs)
+            manifest['sheets'][name] = {'file': stem, 'columns': columns, 'rows': len(sheet.rows)}
+
+        with open(tmp / 'strings.json', 'w') as f:
+            json.dump(strings, f)
+        with open(tmp / 'manifest.json', 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        if cache_path.exists():
+            shutil.rmtree(cache_path)
+        os.rename(tmp, cache_path)
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    # Drop caches of previous workbook versions
+    for stale in cache_path.parent.iterdir():
+        if stale != cache_path and not stale.name.startswith('.tmp-'):
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+def read_cache(cache_path, sheets=None):
+    """Memory-map a cache directory into a ProjectedWorkbook of ColumnarSheets."""
+    with open(cache_path / 'manifest.json') as f:
+        manifest = json.load(f)
+    with open(cache_path / 'strings.json') as f:
+        strings = json.load(f)
+
+    loaded = {}
+    for name, meta in manifest['sheets'].items():
+        if sheets is not None and name not in sheets:
+            continue
+        stem = meta['file']
+        loaded[name] = ColumnarSheet(
+            name,
+            meta['columns'],
+            np.load(cache_path / f"{stem}.kinds.npy", mmap_mode='r'),
+            np.load(cache_path / f"{stem}.nums.npy", mmap_mode='r'),
+            np.load(cache_path / f"{stem}.strs.npy", mmap_mode='r'),
+            strings,
+        )
+    return ProjectedWorkbook(loaded)
+
+
+def open_budget_workbook(path=EXCEL_FILE, sheets=None, rebuild=False):
+    """Open the budget workbook through the columnar cache.
+
+    Returns a ProjectedWorkbook backed by memory-mapped arrays when the cache
+    matches the workbook's content hash; otherwise parses the workbook once
+    with load_budget_workbook(), writes the cache and returns that.
+    """
+    key = cache_key(path)
+    cache_path = CACHE_DIR / key
+
+    if not rebuild and (cache_path / 'manifest.json').exists():
+        log(f"✓ Workbook cache hit ({key})")
+        return read_cache(cache_path, sheets)
+
+    log(f"Workbook cache miss ({key}), parsing with openpyxl...")
+    wb = load_budget_workbook(path)
+    try:
+        write_cache(wb, cache_path, key)
+        log(f"✓ Workbook cache written to {cache_path}")
+    except OSError as e:
+        log(f"Warning: could not write workbook cache: {e}")
+        if sheets is not None:
+            return ProjectedWorkbook({name: wb[name] for name in sheets if name in wb})
+        return wb
+
+    return read_cache(cache_path, sheets)
+
+
+@lru_cache(maxsize=None)
+def load_renewal_index(path=EXCEL_FILE):
+    """Renewal columns per customer from the cached 'RR Input' sheet.
+
+    Returns:
+        dict: customer name -> RenewalInfo, one entry per customer
+    """
+    wb = open_budget_workbook(path, sheets=['RR Input'])
+    return scan_renewal_dates(wb)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the columnar budget workbook cache')
+    parser.add_argument('--file', default=EXCEL_FILE, help='Workbook path')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild even if the cache is current')
+    args = parser.parse_args()
+
+    if not Path(args.file).exists():
+        log(f"ERROR: Excel file not found: {args.file}")
+        sys.exit(1)
+
+    wb = open_budget_workbook(args.file, rebuild=args.rebuild)
+    for name in wb.sheetnames:
+        log(f"  {name}: {wb[name].max_row} rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,16 @@
 /**
  * ExcelAdapter - parses Skyvera budget file via Python bridge
  * Loads data once at connect(), serves from memory, validates all records
+ * The Python parser runs as a persistent worker shared across connects
  */
 
-import { execFile } from 'child_process'
-import { promisify } from 'util'
 import { join } from 'path'
 import type { DataAdapter, AdapterQuery, DataResult } from '../base'
 import { ok, err, type Result } from '@/lib/types/result'
 import { CustomerSchema, type Customer } from '@/lib/types/customer'
 import { DataValidator } from '@/lib/semantic/validator'
 import type { BU } from '@/lib/types/financial'
-
-const execFileAsync = promisify(execFile)
+import { getParserWorker } from './worker'
 
 /**
  * Financial metrics extracted from Excel
@@ -62,23 +60,12 @@ export class ExcelAdapter implements DataAdapter {
    */
   async connect(): Promise<Result<void, Error>> {
     try {
-      console.log('[ExcelAdapter] Connecting - parsing Excel file via Python...')
+      console.log('[ExcelAdapter] Connecting - querying Python parser worker...')
       const startTime = Date.now()
 
-      // Run Python parser
-      const { stdout, stderr } = await execFileAsync('python3', [
-        this.scriptPath,
-        '--type',
-        'all',
-      ])
-
-      // Log Python stderr (progress messages)
-      if (stderr) {
-        console.log('[ExcelAdapter] Python parser output:', stderr.trim())
-      }
-
-      // Parse JSON output
-      const parsed: ParsedData = JSON.parse(stdout)
+      // Query persistent Python worker (workbook stays loaded between connects)
+      const worker = getParserWorker(this.scriptPath, this.projectRoot)
+      const parsed = (await worker.request('all')) as ParsedData
 
       // Validate and store customer data
       let totalValidated = 0
@@ -0,0 +1,135 @@
+/**
+ * ParserWorker - long-lived parse_excel_to_json.py --serve process
+ * Speaks line-delimited JSON over stdin/stdout so each data load skips
+ * interpreter startup and workbook parsing
+ */
+
+import { spawn, type ChildProcessWithoutNullStreams } from 'child_process'
+import { createInterface } from 'readline'
+
+type ParseType = 'customers' | 'financials' | 'all'
+
+interface WorkerResponse {
+  id: number
+  ok: boolean
+  data?: unknown
+  error?: string
+}
+
+interface PendingRequest {
+  child: ChildProcessWithoutNullStreams
+  resolve: (data: unknown) => void
+  reject: (error: Error) => void
+}
+
+export class ParserWorker {
+  private child: ChildProcessWithoutNullStreams | null = null
+  private pending: Map<number, PendingRequest> = new Map()
+  private nextId = 1
+
+  constructor(
+    private scriptPath: string,
+    private cwd: string
+  ) {}
+
+  /**
+   * Send a --type query to the worker, starting it on first use
+   */
+  request(type: ParseType): Promise<unknown> {
+    const child = this.ensureStarted()
+    const id = this.nextId++
+
+    return new Promise((resolve, reject) => {
+      this.pending.set(id, { child, resolve, reject })
+      child.stdin.write(JSON.stringify({ id, type }) + '\n')
+    })
+  }
+
+  /**
+   * Stop the worker process and fail any in-flight requests
+   */
+  stop(): void {
+    if (this.child) {
+      this.child.kill()
+      this.child = null
+    }
+    this.failPending(new Error('Parser worker stopped'))
+  }
+
+  private ensureStarted(): ChildProcessWithoutNullStreams {
+    if (this.child) {
+      return this.child
+    }
+
+    const child = spawn('python3', [this.scriptPath, '--serve'], { cwd: this.cwd })
+
+    createInterface({ input: child.stdout }).on('line', (line) => {
+      let response: WorkerResponse
+      try {
+        response = JSON.parse(line)
+      } catch {
+        console.warn('[ParserWorker] Ignoring non-JSON output:', line.slice(0, 200))
+        return
+      }
+
+      const pending = this.pending.get(response.id)
+      if (!pending) return
+      this.pending.delete(response.id)
+
+      if (response.ok) {
+        pending.resolve(response.data)
+      } else {
+        pending.reject(new Error(response.error || 'Parser worker request failed'))
+      }
+    })
+
+    child.stderr.on('data', (chunk: Buffer) => {
+      console.log('[ParserWorker]', chunk.toString().trim())
+    })
+
+    // A stopped or crashed child may exit after its replacement has started:
+    // only clear the current child, and only fail this child's requests
+    child.on('error', (error) => {
+      if (this.child === child) this.child = null
+      this.failPending(error, child)
+    })
+
+    child.on('exit', (code) => {
+      if (this.child === child) this.child = null
+      this.failPending(new Error(`Parser worker exited with code ${code}`), child)
+    })
+
+    this.child = child
+    return child
+  }
+
+  /**
+   * Reject in-flight requests: all of them, or only those sent to one child
+   */
+  private failPending(error: Error, child?: ChildProcessWithoutNullStreams): void {
+    for (const [id, pending] of this.pending) {
+      if (child && pending.child !== child) continue
+      this.pending.delete(id)
+      pending.reject(error)
+    }
+  }
+}
+
+const globalForWorker = globalThis as unknown as {
+  parserWorkers: Map<string, ParserWorker> | undefined
+}
+
+/**
+ * Shared worker per script path, kept across hot reloads in development
+ */
+export function getParserWorker(scriptPath: string, cwd: string): ParserWorker {
+  const workers = globalForWorker.parserWorkers ?? new Map<string, ParserWorker>()
+  globalForWorker.parserWorkers = workers
+
+  let worker = workers.get(scriptPath)
+  if (!worker) {
+    worker = new ParserWorker(scriptPath, cwd)
+    workers.set(scriptPath, worker)
+  }
+  return worker
+}